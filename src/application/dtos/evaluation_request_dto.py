@@ -4,11 +4,18 @@ Evaluation Request Data Transfer Object
 Pydantic model for evaluation request parameters.
 """
 
+from datetime import datetime
 from typing import List, Optional
+from uuid import uuid4
 
 from pydantic import BaseModel, Field
 
 
+def generate_run_id() -> str:
+    """Generate a sortable, unique run ID (e.g., 20260101-120000-a1b2c3)."""
+    return f"{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}-{uuid4().hex[:6]}"
+
+
 class EvaluationRequestDTO(BaseModel):
     """
     DTO for evaluation request.
@@ -38,6 +45,15 @@ class EvaluationRequestDTO(BaseModel):
     )
     top_p: float = Field(default=0.9, ge=0.0, le=1.0, description="Top-p sampling")
     top_k: int = Field(default=40, ge=1, description="Top-k sampling")
+    max_concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Max test evaluations in flight (if None, uses configured max_concurrent_evaluations)"
+    )
+    run_id: str = Field(
+        default_factory=generate_run_id,
+        description="Run ID used to journal results and resume interrupted runs"
+    )
     save_results: bool = Field(default=True, description="Save results to disk")
     results_dir: Optional[str] = Field(None, description="Results output directory")
 
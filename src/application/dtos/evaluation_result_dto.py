@@ -38,6 +38,10 @@ class EvaluationResultDTO(BaseModel):
     evaluator_notes: str = Field(default="", description="Additional notes")
     tokens_used: int = Field(default=0, description="Tokens in response")
     latency_ms: int = Field(default=0, description="Response latency")
+    server_timings: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Backend timing breakdown (total/load/prompt_eval/eval; durations in ns)"
+    )
     evaluated_at: datetime = Field(default_factory=datetime.utcnow, description="Evaluation timestamp")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional metadata")
 
@@ -75,6 +79,11 @@ class EvaluationSummaryDTO(BaseModel):
     total_tests: int = Field(..., ge=0, description="Total number of tests")
     passed_tests: int = Field(..., ge=0, description="Number of passed tests")
     failed_tests: int = Field(..., ge=0, description="Number of failed tests")
+    errored_tests: int = Field(
+        0,
+        ge=0,
+        description="Failed tests whose generation errored (scored 0, re-run by --resume)"
+    )
     overall_score: float = Field(..., ge=0.0, le=1.0, description="Overall score")
     by_benchmark: Dict[str, Dict[str, Any]] = Field(
         default_factory=dict,
@@ -88,6 +97,15 @@ class EvaluationSummaryDTO(BaseModel):
     evaluation_completed_at: datetime
     total_duration_seconds: float = Field(..., ge=0.0, description="Total evaluation duration")
     results: List[EvaluationResultDTO] = Field(default_factory=list, description="Individual results")
+    run_id: Optional[str] = Field(None, description="Run ID (journal key for --resume)")
+    performance: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Latency p50/p95/p99 and prefill/decode tokens/sec (also per benchmark/difficulty)"
+    )
+    scheduling: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Scheduler statistics (concurrency, queue-wait and service-time percentiles)"
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -112,3 +130,42 @@ class EvaluationSummaryDTO(BaseModel):
             }
         }
     }
+
+
+class RescoreSummaryDTO(BaseModel):
+    """
+    DTO for a re-scored evaluation run.
+
+    Compares saved scores against scores from the current ScoringService.
+    """
+
+    source_file: str = Field(..., description="Result file that was re-scored")
+    output_file: Optional[str] = Field(None, description="New run file (if saved)")
+    summary: EvaluationSummaryDTO = Field(..., description="Summary of the re-scored run")
+    previous_overall_score: float = Field(..., ge=0.0, le=1.0, description="Saved overall score")
+    skipped_tests: int = Field(
+        default=0,
+        ge=0,
+        description="Saved results without a matching test case (not re-scored)"
+    )
+    score_diff: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Per-benchmark previous/current score and pass counts, delta, flipped tests"
+    )
+
+
+class ArchiveRescoreSummaryDTO(BaseModel):
+    """
+    DTO for several saved runs re-scored together.
+
+    Holds each run's re-scored summary plus per-benchmark totals over all runs.
+    """
+
+    runs: List[RescoreSummaryDTO] = Field(default_factory=list, description="Re-scored runs")
+    total_tests: int = Field(..., ge=0, description="Re-scored results across all runs")
+    workers: int = Field(..., ge=1, description="Worker processes used for Tier 1 scoring")
+    by_benchmark: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Per-benchmark previous/current score and pass counts over all runs"
+    )
+    total_duration_seconds: float = Field(..., ge=0.0, description="Total duration")
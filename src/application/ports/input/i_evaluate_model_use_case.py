@@ -5,9 +5,14 @@ Abstract interface for model evaluation use case.
 """
 
 from abc import ABC, abstractmethod
+from typing import List, Optional
 
 from application.dtos.evaluation_request_dto import EvaluationRequestDTO
-from application.dtos.evaluation_result_dto import EvaluationSummaryDTO
+from application.dtos.evaluation_result_dto import (
+    ArchiveRescoreSummaryDTO,
+    EvaluationSummaryDTO,
+    RescoreSummaryDTO,
+)
 
 
 class IEvaluateModelUseCase(ABC):
@@ -32,3 +37,74 @@ class IEvaluateModelUseCase(ABC):
             EvaluationError: If evaluation fails
         """
         pass
+
+    @abstractmethod
+    async def resume(
+        self,
+        run_id: str,
+        max_concurrency: Optional[int] = None
+    ) -> EvaluationSummaryDTO:
+        """
+        Resume an interrupted evaluation run from its journal.
+
+        Args:
+            run_id: ID of the run to resume
+            max_concurrency: Optional override of the run's concurrency
+
+        Returns:
+            Evaluation summary covering journaled and newly evaluated tests
+
+        Raises:
+            FileNotFoundError: If no journal exists for the run
+        """
+        pass
+
+    @abstractmethod
+    async def rescore(
+        self,
+        result_file: str,
+        save_results: bool = True
+    ) -> RescoreSummaryDTO:
+        """
+        Re-score a saved evaluation run with the current scoring service.
+
+        Saved responses are replayed (no generation), so scoring changes can
+        be evaluated without re-running the model.
+
+        Args:
+            result_file: Path of a saved evaluation run file
+            save_results: Save the re-scored run as a new run file
+
+        Returns:
+            Re-scored summary with a per-benchmark score diff
+
+        Raises:
+            FileNotFoundError: If the result file does not exist
+        """
+        pass
+
+    @abstractmethod
+    async def rescore_many(
+        self,
+        result_files: List[str],
+        save_results: bool = True,
+        workers: Optional[int] = None
+    ) -> ArchiveRescoreSummaryDTO:
+        """
+        Re-score many saved evaluation runs at once.
+
+        Scoring is spread across worker processes; each run is summarized
+        and saved as with rescore().
+
+        Args:
+            result_files: Paths of saved evaluation run files
+            save_results: Save each re-scored run as a new run file
+            workers: Worker processes (None: the configured default)
+
+        Returns:
+            Per-run re-scored summaries and per-benchmark totals across runs
+
+        Raises:
+            FileNotFoundError: If a result file does not exist
+        """
+        pass
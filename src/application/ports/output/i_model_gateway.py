@@ -11,6 +11,10 @@ from typing import Dict, Optional
 from domain.entities.model_response import ModelResponse
 
 
+class ModelGatewayError(Exception):
+    """Raised when a model gateway cannot serve a request."""
+
+
 class IModelGateway(ABC):
     """
     Port (interface) for model inference operations.
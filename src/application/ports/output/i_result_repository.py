@@ -9,6 +9,7 @@ from typing import Dict, List, Optional
 from uuid import UUID
 
 from domain.entities.evaluation_result import EvaluationResult
+from domain.entities.test_case import TestCase
 
 
 class IResultRepository(ABC):
@@ -65,6 +66,114 @@ class IResultRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_run_journal(self, run_id: str, request: Dict[str, any]) -> str:
+        """
+        Create an append-only journal for an evaluation run.
+
+        Idempotent: an existing journal for the run is left untouched.
+
+        Args:
+            run_id: Evaluation run identifier
+            request: Serialized evaluation request (used to resume the run)
+
+        Returns:
+            Filepath of the journal
+
+        Raises:
+            RepositoryError: If the journal cannot be created
+        """
+        pass
+
+    @abstractmethod
+    async def append_to_run_journal(self, run_id: str, result: EvaluationResult) -> None:
+        """
+        Append a finished evaluation result to the run journal.
+
+        Args:
+            run_id: Evaluation run identifier
+            result: Finalized evaluation result
+
+        Raises:
+            RepositoryError: If the journal does not exist or writing fails
+        """
+        pass
+
+    @abstractmethod
+    async def load_run_request(self, run_id: str) -> Dict[str, any]:
+        """
+        Load the evaluation request recorded when the run journal was created.
+
+        Args:
+            run_id: Evaluation run identifier
+
+        Returns:
+            Serialized evaluation request
+
+        Raises:
+            FileNotFoundError: If no journal exists for the run
+        """
+        pass
+
+    @abstractmethod
+    async def load_run_results(
+        self,
+        run_id: str,
+        test_cases: List[TestCase]
+    ) -> List[EvaluationResult]:
+        """
+        Rebuild journaled results for a run.
+
+        Args:
+            run_id: Evaluation run identifier
+            test_cases: Test cases of the run (journal entries are matched by test_id)
+
+        Returns:
+            Journaled evaluation results (one per test_id, latest entry wins)
+
+        Raises:
+            FileNotFoundError: If no journal exists for the run
+        """
+        pass
+
+    @abstractmethod
+    async def load_evaluation_run_metadata(self, filepath: str) -> Dict[str, any]:
+        """
+        Load the metadata section of a saved evaluation run.
+
+        Args:
+            filepath: Path of a file written by save_evaluation_run
+
+        Returns:
+            Evaluation run metadata
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        pass
+
+    @abstractmethod
+    async def load_evaluation_run(
+        self,
+        filepath: str,
+        test_cases: List[TestCase]
+    ) -> List[EvaluationResult]:
+        """
+        Rebuild the results of a saved evaluation run.
+
+        Args:
+            filepath: Path of a file written by save_evaluation_run
+            test_cases: Test cases to attach (results are matched by test_id;
+                results without a matching test case are skipped)
+
+        Returns:
+            Evaluation results with their saved scores, in file order
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        pass
+
     @abstractmethod
     async def load_by_id(self, result_id: UUID) -> Optional[EvaluationResult]:
         """
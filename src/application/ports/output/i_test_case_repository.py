@@ -9,6 +9,8 @@ from typing import List, Optional
 
 from domain.entities.test_case import TestCase
 from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.ccop_section import CCoPSection
+from domain.value_objects.difficulty_level import DifficultyLevel
 
 
 class ITestCaseRepository(ABC):
@@ -79,6 +81,70 @@ class ITestCaseRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def load_by_difficulty(self, difficulty: DifficultyLevel) -> List[TestCase]:
+        """
+        Load test cases of a difficulty level.
+
+        Args:
+            difficulty: Difficulty level to filter by
+
+        Returns:
+            List of matching test cases
+
+        Raises:
+            RepositoryError: If loading fails
+        """
+        pass
+
+    @abstractmethod
+    async def load_by_section(self, section: CCoPSection) -> List[TestCase]:
+        """
+        Load test cases of a CCoP section.
+
+        Args:
+            section: Section to filter by
+
+        Returns:
+            List of matching test cases
+
+        Raises:
+            RepositoryError: If loading fails
+        """
+        pass
+
+    @abstractmethod
+    async def load_by_clause(self, clause_reference: str) -> List[TestCase]:
+        """
+        Load test cases citing a clause reference.
+
+        Args:
+            clause_reference: Clause reference (exact match, e.g. "5.1.5")
+
+        Returns:
+            List of matching test cases
+
+        Raises:
+            RepositoryError: If loading fails
+        """
+        pass
+
+    @abstractmethod
+    async def load_by_domain(self, domain: str) -> List[TestCase]:
+        """
+        Load test cases of a metadata domain.
+
+        Args:
+            domain: Domain to filter by (e.g., "IT/OT")
+
+        Returns:
+            List of matching test cases
+
+        Raises:
+            RepositoryError: If loading fails
+        """
+        pass
+
     @abstractmethod
     async def count(self) -> int:
         """
@@ -0,0 +1,247 @@
+"""
+Evaluation Pipeline
+
+Two-stage generate -> score pipeline for evaluation runs.
+
+Stage 1 (generation) stays on the event loop, bounded by the
+EvaluationScheduler. Generated outputs are handed to stage 2 through a
+bounded asyncio.Queue, and scoring runs in a thread pool so blocking
+work (sentence-transformer encodes, judge subprocesses) never stalls
+in-flight generations. With a batch scorer, each worker drains up to
+`scoring_batch_size` queued outputs at once so vectorized scorers
+(sentence-transformer encodes) see large batches whenever scoring lags.
+"""
+
+import asyncio
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, Sequence, TypeVar
+
+from application.services.evaluation_scheduler import (
+    EvaluationScheduler,
+    ScheduledResult,
+    TaskTiming,
+)
+
+T = TypeVar("T")
+G = TypeVar("G")
+R = TypeVar("R")
+
+_STOP = object()
+
+
+@dataclass
+class _StageClock:
+    """Mutable per-task stage timings collected while the pipeline runs."""
+
+    queue_wait_ms: float = 0.0
+    generation_ms: float = 0.0
+    backpressure_ms: float = 0.0
+    score_wait_ms: float = 0.0
+    score_time_ms: float = 0.0
+
+
+@dataclass
+class PipelineStats(Generic[R]):
+    """Pipeline output: ordered results plus run-level counters."""
+
+    results: List[ScheduledResult[R]] = field(default_factory=list)
+    peak_queue_depth: int = 0
+
+
+class EvaluationPipeline:
+    """
+    Pipelined generation and scoring with bounded queues.
+
+    The scoring queue is bounded so memory cannot grow without limit; size
+    it above the number of scoring workers so generation only blocks
+    (backpressure) when scoring falls persistently behind.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 1,
+        scoring_workers: int = 1,
+        scoring_queue_size: int = 16,
+        executor: Optional[Executor] = None,
+        scoring_batch_size: int = 1,
+    ) -> None:
+        """
+        Initialize pipeline.
+
+        Args:
+            max_concurrency: Maximum generations in flight
+            scoring_workers: Number of scoring workers (thread pool size)
+            scoring_queue_size: Maximum generated outputs waiting for scoring
+            executor: Optional executor for scoring (default: private thread pool)
+            scoring_batch_size: Maximum outputs per batch-scorer call
+
+        Raises:
+            ValueError: If scoring_workers, scoring_queue_size or
+                scoring_batch_size is less than 1
+        """
+        if scoring_workers < 1:
+            raise ValueError(f"scoring_workers must be >= 1, got {scoring_workers}")
+        if scoring_queue_size < 1:
+            raise ValueError(f"scoring_queue_size must be >= 1, got {scoring_queue_size}")
+        if scoring_batch_size < 1:
+            raise ValueError(f"scoring_batch_size must be >= 1, got {scoring_batch_size}")
+
+        self._scheduler = EvaluationScheduler(max_concurrency=max_concurrency)
+        self._scoring_workers = scoring_workers
+        self._scoring_queue_size = scoring_queue_size
+        self._executor = executor
+        self._scoring_batch_size = scoring_batch_size
+
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum generations in flight."""
+        return self._scheduler.max_concurrency
+
+    @property
+    def scoring_workers(self) -> int:
+        """Number of scoring workers."""
+        return self._scoring_workers
+
+    @property
+    def scoring_batch_size(self) -> int:
+        """Maximum outputs per batch-scorer call."""
+        return self._scoring_batch_size
+
+    async def run(
+        self,
+        items: Sequence[T],
+        generate: Callable[[int, T], Awaitable[G]],
+        score: Callable[[T, G], R],
+        on_result: Optional[Callable[[ScheduledResult[R]], Awaitable[None]]] = None,
+        score_batch: Optional[Callable[[List[T], List[G]], List[R]]] = None,
+    ) -> PipelineStats[R]:
+        """
+        Run generation and scoring over all items.
+
+        Args:
+            items: Work items (e.g., test cases)
+            generate: Coroutine function called as generate(index, item)
+            score: Blocking function called as score(item, generated) in the pool
+            on_result: Optional coroutine called as each item finishes scoring
+                (completion order), e.g., to checkpoint results
+            score_batch: Optional blocking function called as
+                score_batch(items, generated) with up to scoring_batch_size
+                queued outputs; used instead of `score` when given. Batched
+                items all report the batch's scoring time
+
+        Returns:
+            PipelineStats with results in the same order as `items`
+
+        Raises:
+            Exception: The first exception raised by either stage. A scoring
+                error cancels all outstanding work; a generation error stops
+                new generations but lets already generated outputs finish
+                scoring first
+        """
+        stats: PipelineStats[R] = PipelineStats()
+        if not items:
+            return stats
+
+        loop = asyncio.get_running_loop()
+        owns_executor = self._executor is None
+        executor = self._executor or ThreadPoolExecutor(
+            max_workers=self._scoring_workers,
+            thread_name_prefix="ccop-scoring",
+        )
+
+        run_started = time.perf_counter()
+        score_queue: asyncio.Queue = asyncio.Queue(maxsize=self._scoring_queue_size)
+        clocks: Dict[int, _StageClock] = {i: _StageClock() for i in range(len(items))}
+        finished: List[Optional[ScheduledResult[R]]] = [None] * len(items)
+
+        async def generation_stage(index: int, item: T) -> None:
+            started = time.perf_counter()
+            clocks[index].queue_wait_ms = (started - run_started) * 1000
+            generated = await generate(index, item)
+            generated_at = time.perf_counter()
+            clocks[index].generation_ms = (generated_at - started) * 1000
+            await score_queue.put((index, item, generated, generated_at))
+            clocks[index].backpressure_ms = (time.perf_counter() - generated_at) * 1000
+            stats.peak_queue_depth = max(stats.peak_queue_depth, score_queue.qsize())
+
+        async def produce() -> None:
+            try:
+                await self._scheduler.run(items, generation_stage)
+            except Exception:
+                # Outputs already generated still get scored (and reported to
+                # on_result) before the generation error propagates
+                for _ in consumers:
+                    await score_queue.put(_STOP)
+                await asyncio.gather(*consumers)
+                raise
+            for _ in consumers:
+                await score_queue.put(_STOP)
+
+        def score_entries(entries: List[tuple]) -> List[R]:
+            if score_batch is None:
+                return [score(item, generated) for _, item, generated, _ in entries]
+            return score_batch(
+                [item for _, item, _, _ in entries],
+                [generated for _, _, generated, _ in entries],
+            )
+
+        async def consume() -> None:
+            while True:
+                entry = await score_queue.get()
+                if entry is _STOP:
+                    return
+                entries = [entry]
+                stopping = False
+                batch_size = self._scoring_batch_size if score_batch is not None else 1
+                while len(entries) < batch_size and not score_queue.empty():
+                    entry = score_queue.get_nowait()
+                    if entry is _STOP:
+                        stopping = True
+                        break
+                    entries.append(entry)
+
+                started = time.perf_counter()
+                values = await loop.run_in_executor(executor, score_entries, entries)
+                score_time_ms = (time.perf_counter() - started) * 1000
+                for (index, _, _, generated_at), value in zip(entries, values):
+                    clock = clocks[index]
+                    clock.score_wait_ms = (started - generated_at) * 1000
+                    clock.score_time_ms = score_time_ms
+                    finished[index] = ScheduledResult(
+                        value=value,
+                        timing=TaskTiming(
+                            index=index,
+                            queue_wait_ms=clock.queue_wait_ms,
+                            service_time_ms=clock.generation_ms,
+                            backpressure_ms=clock.backpressure_ms,
+                            score_wait_ms=clock.score_wait_ms,
+                            score_time_ms=clock.score_time_ms,
+                        ),
+                    )
+                    if on_result is not None:
+                        await on_result(finished[index])
+                if stopping:
+                    return
+
+        consumers = [asyncio.create_task(consume()) for _ in range(self._scoring_workers)]
+        producer = asyncio.create_task(produce())
+        tasks = [producer, *consumers]
+
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            if owns_executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        stats.results = [result for result in finished if result is not None]
+        return stats
@@ -0,0 +1,184 @@
+"""
+Evaluation Scheduler
+
+Bounded-concurrency scheduler for per-test evaluation coroutines.
+Keeps up to N evaluations in flight and returns results in input order.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Generic, List, Sequence, TypeVar
+
+from domain.services.statistics import percentile
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class TaskTiming:
+    """
+    Timing for a single scheduled task.
+
+    Attributes:
+        index: Position of the task in the input sequence
+        queue_wait_ms: Time spent waiting for a free worker slot
+        service_time_ms: Time spent executing the task once dispatched
+        backpressure_ms: Time a generation slot was held waiting for scoring queue space
+        score_wait_ms: Time the generated output waited for a scoring worker
+        score_time_ms: Time spent scoring the generated output
+    """
+
+    index: int
+    queue_wait_ms: float
+    service_time_ms: float
+    backpressure_ms: float = 0.0
+    score_wait_ms: float = 0.0
+    score_time_ms: float = 0.0
+
+
+@dataclass(frozen=True)
+class ScheduledResult(Generic[R]):
+    """Result of a scheduled task together with its timing."""
+
+    value: R
+    timing: TaskTiming
+
+
+class EvaluationScheduler:
+    """
+    Runs async work items with at most `max_concurrency` in flight.
+
+    Items are enqueued up front and drained by a fixed pool of worker
+    coroutines, so queue-wait reflects how long a test waited for a slot
+    and service time reflects how long the backend took to serve it.
+    """
+
+    def __init__(self, max_concurrency: int = 1) -> None:
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrency: Maximum number of tasks in flight (>= 1)
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        self._max_concurrency = max_concurrency
+
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum number of tasks in flight."""
+        return self._max_concurrency
+
+    async def run(
+        self,
+        items: Sequence[T],
+        worker: Callable[[int, T], Awaitable[R]],
+    ) -> List[ScheduledResult[R]]:
+        """
+        Run `worker` over all items with bounded concurrency.
+
+        Args:
+            items: Work items (e.g., test cases)
+            worker: Coroutine function called as worker(index, item)
+
+        Returns:
+            Scheduled results in the same order as `items`
+
+        Raises:
+            Exception: The first exception raised by a worker; remaining
+                in-flight tasks are cancelled
+        """
+        if not items:
+            return []
+
+        queue: asyncio.Queue = asyncio.Queue()
+        enqueued_at = time.perf_counter()
+        for index, item in enumerate(items):
+            queue.put_nowait((index, item))
+
+        results: List[ScheduledResult[R] | None] = [None] * len(items)
+
+        async def drain() -> None:
+            while True:
+                try:
+                    index, item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                dispatched_at = time.perf_counter()
+                value = await worker(index, item)
+                finished_at = time.perf_counter()
+                results[index] = ScheduledResult(
+                    value=value,
+                    timing=TaskTiming(
+                        index=index,
+                        queue_wait_ms=(dispatched_at - enqueued_at) * 1000,
+                        service_time_ms=(finished_at - dispatched_at) * 1000,
+                    ),
+                )
+
+        worker_count = min(self._max_concurrency, len(items))
+        tasks = [asyncio.create_task(drain()) for _ in range(worker_count)]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        return [r for r in results if r is not None]
+
+
+def summarize_timings(
+    timings: Sequence[TaskTiming],
+    max_concurrency: int,
+    wall_clock_ms: float,
+) -> Dict[str, Any]:
+    """
+    Aggregate per-task timings into scheduler statistics.
+
+    Utilization is total service time divided by the slot-time available
+    (wall clock x concurrency); values well below 1.0 suggest N is larger
+    than the backend can actually serve in parallel.
+
+    Args:
+        timings: Per-task timings
+        max_concurrency: Concurrency limit used for the run
+        wall_clock_ms: Elapsed time of the whole scheduled run
+
+    Returns:
+        Dictionary of scheduler statistics
+    """
+    service_times = [t.service_time_ms for t in timings]
+    total_service_ms = sum(service_times)
+
+    return {
+        "max_concurrency": max_concurrency,
+        "tasks": len(timings),
+        "wall_clock_ms": wall_clock_ms,
+        "queue_wait_ms": _distribution([t.queue_wait_ms for t in timings]),
+        "service_time_ms": _distribution(service_times),
+        "backpressure_ms": _distribution([t.backpressure_ms for t in timings]),
+        "score_wait_ms": _distribution([t.score_wait_ms for t in timings]),
+        "score_time_ms": _distribution([t.score_time_ms for t in timings]),
+        "utilization": (
+            total_service_ms / (wall_clock_ms * max_concurrency)
+            if wall_clock_ms > 0 else 0.0
+        ),
+    }
+
+
+def _distribution(values: Sequence[float]) -> Dict[str, float]:
+    """Summarize a sample as mean/p50/p95/max."""
+    return {
+        "mean": sum(values) / len(values) if values else 0.0,
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "max": max(values, default=0.0),
+    }
+
@@ -0,0 +1,147 @@
+"""
+Parallel Rescorer
+
+Scores the saved responses of many archived runs across a process pool.
+
+Tier 1 (rule-based) scoring is pure Python, so threads serialize on the
+GIL; those pairs are sharded across worker processes. Each worker receives
+the compiled test-case index once, through the pool initializer, and its
+tasks carry only (test ID, response) pairs. Tier 2 and Tier 3 pairs are
+scored in the parent while the workers run: one embedding model and one
+batched encode across all archives (reference embeddings from the
+memory-mapped EmbeddingCache), and one judge dispatch with its verdict
+cache, rather than one model and judge pool per worker.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.services.scoring_service import SCORERS, ScoringService
+from domain.value_objects.evaluation_metric import EvaluationMetric
+
+# Test-case index of a worker process (set once by the pool initializer)
+_worker_index: Dict[str, TestCase] = {}
+
+
+def _init_worker(index: Dict[str, TestCase]) -> None:
+    """Install the test-case index shipped to a worker process."""
+    global _worker_index
+    _worker_index = index
+
+
+def _score_shard(shard: List[Tuple[str, ModelResponse]]) -> List[List[EvaluationMetric]]:
+    """Score a shard of (test ID, response) pairs against the worker's index."""
+    return [
+        ScoringService.score_response(_worker_index[test_id], response)
+        for test_id, response in shard
+    ]
+
+
+class ParallelRescorer:
+    """Scores (test case, response) pairs with a process pool for Tier 1."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        shard_size: int = 64,
+        batch_size: int = 64,
+    ) -> None:
+        """
+        Initialize rescorer.
+
+        Args:
+            workers: Worker processes (None or 0: one per CPU; 1: score in-process)
+            shard_size: Tier 1 pairs per worker task
+            batch_size: Encoder batch size for Tier 2
+
+        Raises:
+            ValueError: If workers is negative or a size is not positive
+        """
+        if workers is not None and workers < 0:
+            raise ValueError(f"workers must be non-negative, got {workers}")
+        if shard_size < 1:
+            raise ValueError(f"shard_size must be >= 1, got {shard_size}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+
+        self._workers = workers or os.cpu_count() or 1
+        self._shard_size = shard_size
+        self._batch_size = batch_size
+
+    @property
+    def workers(self) -> int:
+        """Number of worker processes."""
+        return self._workers
+
+    def score(
+        self,
+        pairs: Sequence[Tuple[TestCase, ModelResponse]]
+    ) -> List[List[EvaluationMetric]]:
+        """
+        Score pairs, Tier 1 in the process pool and Tier 2/3 in this process.
+
+        Args:
+            pairs: (test case, model response) pairs (test IDs must identify
+                one test case, as in a single test suite)
+
+        Returns:
+            List of evaluation metrics per pair (same order)
+
+        Raises:
+            NotImplementedError: If a benchmark has no scorer
+        """
+        rule_based = []
+        batched = []
+        for spec, indices in SCORERS.group(pairs):
+            (rule_based if spec.tier == 1 else batched).extend(indices)
+
+        shards = [
+            rule_based[start:start + self._shard_size]
+            for start in range(0, len(rule_based), self._shard_size)
+        ]
+        if self._workers <= 1 or len(shards) <= 1:
+            return ScoringService.score_responses(pairs, self._batch_size)
+
+        results: List[List[EvaluationMetric]] = [[] for _ in pairs]
+        with ProcessPoolExecutor(
+            max_workers=min(self._workers, len(shards)),
+            initializer=_init_worker,
+            initargs=(self._build_index(pairs[i][0] for i in rule_based),),
+        ) as pool:
+            futures = [
+                pool.submit(_score_shard, [(pairs[i][0].test_id, pairs[i][1]) for i in shard])
+                for shard in shards
+            ]
+            # Tier 2/3 run here while the workers score Tier 1
+            self._score_in_process(pairs, batched, results)
+            for shard, future in zip(shards, futures):
+                for i, metrics in zip(shard, future.result()):
+                    results[i] = metrics
+
+        return results
+
+    def _score_in_process(
+        self,
+        pairs: Sequence[Tuple[TestCase, ModelResponse]],
+        indices: List[int],
+        results: List[List[EvaluationMetric]]
+    ) -> None:
+        """Score the pairs at the given indices into results."""
+        if not indices:
+            return
+        scored = ScoringService.score_responses([pairs[i] for i in indices], self._batch_size)
+        for i, metrics in zip(indices, scored):
+            results[i] = metrics
+
+    @staticmethod
+    def _build_index(test_cases: Iterable[TestCase]) -> Dict[str, TestCase]:
+        """Index test cases by ID, compiling their scoring artifacts before shipping."""
+        index: Dict[str, TestCase] = {}
+        for test_case in test_cases:
+            if test_case.test_id not in index:
+                test_case.scoring_artifacts
+                index[test_case.test_id] = test_case
+        return index
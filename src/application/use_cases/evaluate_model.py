@@ -4,25 +4,44 @@ Evaluate Model Use Case
 Orchestrates model evaluation across test cases.
 """
 
+import asyncio
+import time
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional
 
 from application.dtos.evaluation_request_dto import EvaluationRequestDTO
 from application.dtos.evaluation_result_dto import (
+    ArchiveRescoreSummaryDTO,
     EvaluationResultDTO,
     EvaluationSummaryDTO,
     MetricDTO,
+    RescoreSummaryDTO,
 )
 from application.ports.input.i_evaluate_model_use_case import IEvaluateModelUseCase
 from application.ports.output.i_logger import ILogger
 from application.ports.output.i_model_gateway import IModelGateway
 from application.ports.output.i_result_repository import IResultRepository
 from application.ports.output.i_test_case_repository import ITestCaseRepository
+from application.services.evaluation_pipeline import EvaluationPipeline
+from application.services.evaluation_scheduler import ScheduledResult, summarize_timings
+from application.services.parallel_rescorer import ParallelRescorer
 from domain.entities.evaluation_result import EvaluationResult
+from domain.entities.model_response import ModelResponse
 from domain.entities.test_case import TestCase
 from domain.services.scoring_service import ScoringService
+from domain.services.statistics import percentile
 from domain.value_objects.benchmark_type import BenchmarkType
 from domain.value_objects.evaluation_category import EvaluationCategory
+from domain.value_objects.evaluation_metric import EvaluationMetric
+
+
+@dataclass(frozen=True)
+class _GenerationFailure:
+    """Stands in for a model response whose generation raised."""
+
+    error: str
+    error_type: str
 
 
 class EvaluateModelUseCase(IEvaluateModelUseCase):
@@ -42,37 +61,354 @@ class EvaluateModelUseCase(IEvaluateModelUseCase):
         test_case_repository: ITestCaseRepository,
         result_repository: IResultRepository,
         logger: ILogger,
+        max_concurrent_evaluations: int = 1,
+        max_scoring_workers: int = 1,
+        scoring_queue_size: int = 16,
+        scoring_batch_size: int = 1,
+        rescore_workers: int = 0,
     ) -> None:
         self._model_gateway = model_gateway
         self._test_case_repository = test_case_repository
         self._result_repository = result_repository
         self._logger = logger
+        self._max_concurrent_evaluations = max_concurrent_evaluations
+        self._max_scoring_workers = max_scoring_workers
+        self._scoring_queue_size = scoring_queue_size
+        self._scoring_batch_size = scoring_batch_size
+        self._rescore_workers = rescore_workers
+        self._reported_missing_fields: set = set()
 
     async def execute(self, request: EvaluationRequestDTO) -> EvaluationSummaryDTO:
         """Execute model evaluation."""
+        return await self._run(request)
+
+    async def resume(
+        self,
+        run_id: str,
+        max_concurrency: Optional[int] = None
+    ) -> EvaluationSummaryDTO:
+        """
+        Resume an interrupted evaluation run from its journal.
+
+        The original request is restored from the journal header; test cases
+        with a journaled result are skipped and only the rest are evaluated.
+
+        Args:
+            run_id: ID of the run to resume
+            max_concurrency: Optional override of the run's concurrency
+
+        Returns:
+            Evaluation summary covering journaled and newly evaluated tests
+
+        Raises:
+            FileNotFoundError: If no journal exists for the run
+        """
+        stored_request = await self._result_repository.load_run_request(run_id)
+        request = EvaluationRequestDTO(**stored_request)
+        if max_concurrency is not None:
+            request = request.model_copy(update={"max_concurrency": max_concurrency})
+
+        self._logger.info(f"Resuming evaluation run: {run_id}")
+        return await self._run(request, resume=True)
+
+    async def rescore(
+        self,
+        result_file: str,
+        save_results: bool = True
+    ) -> RescoreSummaryDTO:
+        """
+        Re-score a saved evaluation run with the current scoring service.
+
+        Saved responses are replayed through the scoring pool against the
+        current test cases; the model is not called. The pass threshold and
+        phase of the original run are kept so score changes come only from
+        the scorers.
+
+        Args:
+            result_file: Path of a saved evaluation run file
+            save_results: Save the re-scored run as a new run file
+
+        Returns:
+            Re-scored summary with a per-benchmark score diff
+
+        Raises:
+            FileNotFoundError: If the result file does not exist
+        """
+        start_time = datetime.utcnow()
+        request, saved_metadata, previous, skipped = await self._load_saved_run(
+            result_file, save_results
+        )
+        results, scheduling = await self._rescore_results(previous, request)
+        return await self._finish_rescore(
+            result_file, request, previous, results, skipped, start_time, scheduling
+        )
+
+    async def rescore_many(
+        self,
+        result_files: List[str],
+        save_results: bool = True,
+        workers: Optional[int] = None
+    ) -> ArchiveRescoreSummaryDTO:
+        """
+        Re-score many saved runs at once across a process pool.
+
+        Saved responses of all runs are scored together by a
+        ParallelRescorer: Tier 1 in worker processes, Tier 2/3 in one
+        batched pass here. Each run gets the same per-run summary, diff and
+        saved file as rescore(); per-benchmark totals across runs are
+        computed from the individual results, not averaged from per-run
+        scores.
+
+        Args:
+            result_files: Paths of saved evaluation run files
+            save_results: Save each re-scored run as a new run file
+            workers: Worker processes (None: the configured rescore_workers)
+
+        Returns:
+            Per-run re-scored summaries and per-benchmark totals across runs
+
+        Raises:
+            FileNotFoundError: If a result file does not exist
+        """
+        start_time = datetime.utcnow()
+        rescorer = ParallelRescorer(self._rescore_workers if workers is None else workers)
+
+        test_cases_by_benchmarks: Dict[tuple, List[TestCase]] = {}
+        runs = []
+        for result_file in result_files:
+            runs.append(await self._load_saved_run(
+                result_file, save_results, test_cases_by_benchmarks
+            ))
+
+        # Errored results had nothing generated, so there is nothing to re-score
+        owners = [
+            (run_index, result_index)
+            for run_index, (_, _, previous, _) in enumerate(runs)
+            for result_index, result in enumerate(previous)
+            if not result.metadata.get("errored")
+        ]
+        self._logger.info(
+            f"Re-scoring {len(owners)} responses from {len(runs)} runs "
+            f"({rescorer.workers} worker processes)"
+        )
+
+        saved_results = [runs[run_index][2][result_index] for run_index, result_index in owners]
+
+        run_started = time.perf_counter()
+        all_metrics = await asyncio.to_thread(
+            rescorer.score, [(saved.test_case, saved.model_response) for saved in saved_results]
+        )
+        wall_clock_ms = (time.perf_counter() - run_started) * 1000
+
+        rescored = [list(previous) for _, _, previous, _ in runs]
+        for (run_index, result_index), saved, metrics in zip(owners, saved_results, all_metrics):
+            request = runs[run_index][0]
+            result = self._finalize_result(
+                saved.test_case, saved.model_response, metrics, self._get_threshold(request)
+            )
+            result.add_metadata("previous_score", saved.overall_score)
+            result.add_metadata("previous_passed", saved.passed)
+            rescored[run_index][result_index] = result
+
+        scheduling = {"rescore_workers": rescorer.workers, "wall_clock_ms": wall_clock_ms}
+        summaries = []
+        for result_file, (request, _, previous, skipped), results in zip(result_files, runs, rescored):
+            summaries.append(await self._finish_rescore(
+                result_file, request, previous, results, skipped, start_time, scheduling
+            ))
+
+        all_previous = [result for _, _, previous, _ in runs for result in previous]
+        all_results = [result for results in rescored for result in results]
+        flipped: Dict[str, int] = {}
+        for summary in summaries:
+            for benchmark, diff in summary.score_diff.items():
+                flipped[benchmark] = flipped.get(benchmark, 0) + len(diff["flipped_tests"])
+
+        before = self._group_by_benchmark(all_previous)
+        by_benchmark = {}
+        for benchmark, stats in self._group_by_benchmark(all_results).items():
+            prior = before.get(benchmark, {"score": 0.0, "passed": 0})
+            by_benchmark[benchmark] = {
+                "previous_score": prior["score"],
+                "score": stats["score"],
+                "delta": stats["score"] - prior["score"],
+                "previous_passed": prior["passed"],
+                "passed": stats["passed"],
+                "total": stats["total"],
+                "flipped": flipped.get(benchmark, 0),
+            }
+
+        duration = (datetime.utcnow() - start_time).total_seconds()
+        self._logger.info(
+            f"Re-scored {len(runs)} runs in {duration:.1f}s",
+            rescored=len(owners),
+            workers=rescorer.workers
+        )
+
+        return ArchiveRescoreSummaryDTO(
+            runs=summaries,
+            total_tests=len(all_results),
+            workers=rescorer.workers,
+            by_benchmark=by_benchmark,
+            total_duration_seconds=duration,
+        )
+
+    async def _load_saved_run(
+        self,
+        result_file: str,
+        save_results: bool,
+        test_cases_by_benchmarks: Optional[Dict[tuple, List[TestCase]]] = None
+    ) -> tuple[EvaluationRequestDTO, Dict[str, any], List[EvaluationResult], int]:
+        """
+        Load a saved run and rebuild its request for re-scoring.
+
+        The pass threshold and phase of the original run are kept so score
+        changes come only from the scorers.
+
+        Args:
+            result_file: Path of a saved evaluation run file
+            save_results: Save the re-scored run as a new run file
+            test_cases_by_benchmarks: Test cases already loaded, keyed by the
+                run's benchmark list (filled in on a miss)
+
+        Returns:
+            Tuple of (request, saved metadata, saved results, skipped count)
+
+        Raises:
+            FileNotFoundError: If the result file does not exist
+        """
+        saved_metadata = await self._result_repository.load_evaluation_run_metadata(result_file)
+
+        request_fields = {
+            "model_name": saved_metadata.get("model_name", "unknown"),
+            "temperature": saved_metadata.get("temperature", 0.7),
+            "evaluation_phase": saved_metadata.get("evaluation_phase", "baseline"),
+            "pass_threshold": saved_metadata.get("pass_threshold"),
+            "save_results": save_results,
+        }
+        if saved_metadata.get("benchmarks"):
+            request_fields["benchmark_types"] = saved_metadata["benchmarks"]
+        request = EvaluationRequestDTO(**request_fields)
+
+        self._logger.info(f"Re-scoring saved run: {result_file}", model=request.model_name)
+
+        if test_cases_by_benchmarks is None:
+            test_cases = await self._load_test_cases(request)
+        else:
+            key = tuple(request.benchmark_types)
+            if key not in test_cases_by_benchmarks:
+                test_cases_by_benchmarks[key] = await self._load_test_cases(request)
+            test_cases = test_cases_by_benchmarks[key]
+
+        previous = await self._result_repository.load_evaluation_run(result_file, test_cases)
+        skipped = max(saved_metadata.get("total_tests", len(previous)) - len(previous), 0)
+        if skipped:
+            self._logger.warning(f"{skipped} saved results have no matching test case and were skipped")
+
+        return request, saved_metadata, previous, skipped
+
+    async def _finish_rescore(
+        self,
+        result_file: str,
+        request: EvaluationRequestDTO,
+        previous: List[EvaluationResult],
+        results: List[EvaluationResult],
+        skipped: int,
+        start_time: datetime,
+        scheduling: Dict[str, any]
+    ) -> RescoreSummaryDTO:
+        """Summarize a re-scored run against its saved results and save it if requested."""
+        end_time = datetime.utcnow()
+        summary = self._generate_summary(
+            request.model_name,
+            results,
+            start_time,
+            end_time,
+            scheduling=scheduling,
+        )
+        summary.run_id = request.run_id
+
+        previous_overall_score = self._calculate_category_weighted_score(previous)
+        score_diff = self._score_diff(previous, results)
+
+        output_file = None
+        if request.save_results and results:
+            metadata = self._build_evaluation_metadata(request, summary, start_time, end_time)
+            metadata["rescored_from"] = str(result_file)
+            metadata["previous_overall_score"] = previous_overall_score
+            metadata["score_diff"] = score_diff
+            output_file = await self._result_repository.save_evaluation_run(results, metadata)
+            self._logger.info(f"Saved {len(results)} re-scored results to {output_file}")
+
+        self._logger.info(
+            f"Re-scoring complete. Overall score: {previous_overall_score:.2%} -> {summary.overall_score:.2%}",
+            rescored=len(results),
+            skipped=skipped
+        )
+
+        return RescoreSummaryDTO(
+            source_file=str(result_file),
+            output_file=output_file,
+            summary=summary,
+            previous_overall_score=previous_overall_score,
+            skipped_tests=skipped,
+            score_diff=score_diff,
+        )
+
+    async def _run(
+        self,
+        request: EvaluationRequestDTO,
+        resume: bool = False
+    ) -> EvaluationSummaryDTO:
+        """Run (or resume) an evaluation, journaling each finished result."""
         start_time = datetime.utcnow()
         self._logger.info(
             f"Starting evaluation for model: {request.model_name}",
-            benchmarks=request.benchmark_types
+            benchmarks=request.benchmark_types,
+            run_id=request.run_id
         )
 
+        # Each run starts with the full retry budget (gateways without retries have none)
+        reset_retry_budget = getattr(self._model_gateway, "reset_retry_budget", None)
+        if reset_retry_budget is not None:
+            reset_retry_budget()
+
         # Load test cases
         test_cases = await self._load_test_cases(request)
         self._logger.info(f"Loaded {len(test_cases)} test cases")
 
-        # Verify model is available
-        is_available = await self._model_gateway.is_model_available(request.model_name)
-        if not is_available:
-            raise ValueError(f"Model '{request.model_name}' is not available")
-
-        # Evaluate each test case
-        results: List[EvaluationResult] = []
-        for i, test_case in enumerate(test_cases, 1):
+        # Restore results already journaled by an interrupted run
+        completed: Dict[str, EvaluationResult] = {}
+        if resume:
+            journaled = await self._result_repository.load_run_results(request.run_id, test_cases)
+            # Errored tests (generation failed) are re-run
+            completed = {
+                r.test_case.test_id: r for r in journaled
+                if not r.metadata.get("errored")
+            }
             self._logger.info(
-                f"Evaluating test case {i}/{len(test_cases)}: {test_case.test_id}"
+                f"Restored {len(completed)} journaled results; "
+                f"{len(test_cases) - len(completed)} test cases remaining"
+            )
+        elif request.save_results:
+            await self._result_repository.create_run_journal(
+                request.run_id,
+                request.model_dump(mode="json")
             )
-            result = await self._evaluate_test_case(test_case, request)
-            results.append(result)
+
+        pending = [tc for tc in test_cases if tc.test_id not in completed]
+
+        # Verify model is available (only needed if anything is left to generate)
+        if pending:
+            is_available = await self._model_gateway.is_model_available(request.model_name)
+            if not is_available:
+                raise ValueError(f"Model '{request.model_name}' is not available")
+
+        # Evaluate test cases with bounded concurrency (results keep test order)
+        new_results, scheduling = await self._evaluate_test_cases(pending, request)
+        for result in new_results:
+            completed[result.test_case.test_id] = result
+        results = [completed[tc.test_id] for tc in test_cases if tc.test_id in completed]
 
         # Generate summary
         end_time = datetime.utcnow()
@@ -80,12 +416,18 @@ class EvaluateModelUseCase(IEvaluateModelUseCase):
             request.model_name,
             results,
             start_time,
-            end_time
+            end_time,
+            scheduling=scheduling,
         )
+        summary.run_id = request.run_id
 
         # Save results if requested (with metadata)
         if request.save_results:
             metadata = self._build_evaluation_metadata(request, summary, start_time, end_time)
+            metadata["response_cache_mode"] = self._response_cache_mode()
+            if resume:
+                metadata["resumed"] = True
+                metadata["resumed_tests"] = len(test_cases) - len(pending)
             filepath = await self._result_repository.save_evaluation_run(results, metadata)
             self._logger.info(f"Saved {len(results)} results to {filepath}")
 
@@ -97,6 +439,225 @@ class EvaluateModelUseCase(IEvaluateModelUseCase):
 
         return summary
 
+    async def _evaluate_test_cases(
+        self,
+        test_cases: List[TestCase],
+        request: EvaluationRequestDTO
+    ) -> tuple[List[EvaluationResult], Dict[str, any]]:
+        """
+        Evaluate test cases through the generate -> score pipeline.
+
+        Generation keeps at most N requests in flight on the event loop (N
+        from the request override or max_concurrent_evaluations). Scoring
+        runs in a thread pool fed by a bounded queue, so blocking Tier 2/3
+        scoring never stalls in-flight generations. Each result records its
+        stage timings so N can be sized against the backend's parallelism
+        (e.g., Ollama's OLLAMA_NUM_PARALLEL).
+
+        Args:
+            test_cases: Test cases to evaluate
+            request: Evaluation request
+
+        Returns:
+            Tuple of (results in test order, scheduler statistics)
+        """
+        max_concurrency = request.max_concurrency or self._max_concurrent_evaluations
+        pipeline = EvaluationPipeline(
+            max_concurrency=max_concurrency,
+            scoring_workers=self._max_scoring_workers,
+            scoring_queue_size=self._scoring_queue_size,
+            scoring_batch_size=self._scoring_batch_size,
+        )
+        total = len(test_cases)
+
+        self._logger.info(
+            f"Dispatching {total} test cases (concurrency: {max_concurrency}, "
+            f"scoring workers: {pipeline.scoring_workers})"
+        )
+
+        async def generate(
+            index: int,
+            test_case: TestCase
+        ) -> ModelResponse | _GenerationFailure:
+            self._logger.info(
+                f"Evaluating test case {index + 1}/{total}: {test_case.test_id}"
+            )
+            try:
+                return await self._generate_response(test_case, request)
+            except Exception as e:
+                # One failed generation must not abort the run
+                self._logger.error(
+                    f"Generation failed for {test_case.test_id}: {e}",
+                    error_type=type(e).__name__
+                )
+                return _GenerationFailure(error=str(e), error_type=type(e).__name__)
+
+        threshold = self._get_threshold(request)
+
+        def score(
+            test_case: TestCase,
+            generated: ModelResponse | _GenerationFailure
+        ) -> EvaluationResult:
+            return score_batch([test_case], [generated])[0]
+
+        def score_batch(
+            batch: List[TestCase],
+            generated: List[ModelResponse | _GenerationFailure]
+        ) -> List[EvaluationResult]:
+            results: List[Optional[EvaluationResult]] = [None] * len(batch)
+            scorable = []
+            for i, (test_case, output) in enumerate(zip(batch, generated)):
+                if isinstance(output, _GenerationFailure):
+                    results[i] = self._errored_result(test_case, output, request, threshold)
+                else:
+                    scorable.append(i)
+
+            scored = self._score_test_cases(
+                [batch[i] for i in scorable],
+                [generated[i] for i in scorable],
+                threshold,
+            )
+            for i, result in zip(scorable, scored):
+                results[i] = result
+            return results
+
+        async def on_result(item: ScheduledResult[EvaluationResult]) -> None:
+            item.value.add_metadata("queue_wait_ms", round(item.timing.queue_wait_ms, 3))
+            item.value.add_metadata("service_time_ms", round(item.timing.service_time_ms, 3))
+            item.value.add_metadata("score_wait_ms", round(item.timing.score_wait_ms, 3))
+            item.value.add_metadata("score_time_ms", round(item.timing.score_time_ms, 3))
+            # Checkpoint as soon as each test finishes so a crash loses nothing scored
+            if request.save_results:
+                await self._result_repository.append_to_run_journal(request.run_id, item.value)
+
+        run_started = time.perf_counter()
+        stats = await pipeline.run(
+            test_cases, generate, score, on_result=on_result, score_batch=score_batch
+        )
+        wall_clock_ms = (time.perf_counter() - run_started) * 1000
+
+        results = [item.value for item in stats.results]
+
+        scheduling = summarize_timings(
+            [item.timing for item in stats.results],
+            max_concurrency=max_concurrency,
+            wall_clock_ms=wall_clock_ms,
+        )
+        scheduling["scoring_workers"] = pipeline.scoring_workers
+        scheduling["scoring_batch_size"] = pipeline.scoring_batch_size
+        scheduling["peak_scoring_queue_depth"] = stats.peak_queue_depth
+        self._logger.info(
+            "Scheduler statistics",
+            concurrency=max_concurrency,
+            queue_wait_p95_ms=round(scheduling["queue_wait_ms"]["p95"], 1),
+            service_time_p95_ms=round(scheduling["service_time_ms"]["p95"], 1),
+            score_time_p95_ms=round(scheduling["score_time_ms"]["p95"], 1),
+            backpressure_max_ms=round(scheduling["backpressure_ms"]["max"], 1),
+            utilization=round(scheduling["utilization"], 3),
+        )
+
+        return results, scheduling
+
+    async def _rescore_results(
+        self,
+        previous: List[EvaluationResult],
+        request: EvaluationRequestDTO
+    ) -> tuple[List[EvaluationResult], Dict[str, any]]:
+        """
+        Replay saved responses through the scoring pool.
+
+        Args:
+            previous: Saved results (their model responses are re-scored)
+            request: Evaluation request rebuilt from the saved run
+
+        Returns:
+            Tuple of (re-scored results in saved order, scheduler statistics)
+        """
+        pipeline = EvaluationPipeline(
+            scoring_workers=self._max_scoring_workers,
+            scoring_queue_size=self._scoring_queue_size,
+            scoring_batch_size=self._scoring_batch_size,
+        )
+        threshold = self._get_threshold(request)
+
+        async def replay(index: int, result: EvaluationResult) -> ModelResponse:
+            return result.model_response
+
+        def score(result: EvaluationResult, model_response: ModelResponse) -> EvaluationResult:
+            return score_batch([result], [model_response])[0]
+
+        def score_batch(
+            batch: List[EvaluationResult],
+            responses: List[ModelResponse]
+        ) -> List[EvaluationResult]:
+            # Errored results had nothing generated, so there is nothing to re-score
+            scorable = [i for i, result in enumerate(batch) if not result.metadata.get("errored")]
+            rescored = list(batch)
+            scored = self._score_test_cases(
+                [batch[i].test_case for i in scorable],
+                [responses[i] for i in scorable],
+                threshold,
+            )
+            for i, result in zip(scorable, scored):
+                result.add_metadata("previous_score", batch[i].overall_score)
+                result.add_metadata("previous_passed", batch[i].passed)
+                rescored[i] = result
+            return rescored
+
+        run_started = time.perf_counter()
+        stats = await pipeline.run(previous, replay, score, score_batch=score_batch)
+        wall_clock_ms = (time.perf_counter() - run_started) * 1000
+
+        scheduling = summarize_timings(
+            [item.timing for item in stats.results],
+            max_concurrency=pipeline.max_concurrency,
+            wall_clock_ms=wall_clock_ms,
+        )
+        scheduling["scoring_workers"] = pipeline.scoring_workers
+        scheduling["scoring_batch_size"] = pipeline.scoring_batch_size
+        scheduling["peak_scoring_queue_depth"] = stats.peak_queue_depth
+
+        return [item.value for item in stats.results], scheduling
+
+    def _score_diff(
+        self,
+        previous: List[EvaluationResult],
+        current: List[EvaluationResult]
+    ) -> Dict[str, Dict[str, any]]:
+        """
+        Compare saved and re-scored results per benchmark.
+
+        Args:
+            previous: Saved results
+            current: Re-scored results (same test cases)
+
+        Returns:
+            Dictionary mapping benchmark to previous/current score and pass
+            counts, score delta and the test IDs whose pass/fail flipped
+        """
+        before = self._group_by_benchmark(previous)
+        after = self._group_by_benchmark(current)
+        previous_passed = {r.test_case.test_id: r.passed for r in previous}
+
+        diff = {}
+        for benchmark, stats in after.items():
+            prior = before.get(benchmark, {"score": 0.0, "passed": 0})
+            diff[benchmark] = {
+                "previous_score": prior["score"],
+                "score": stats["score"],
+                "delta": stats["score"] - prior["score"],
+                "previous_passed": prior["passed"],
+                "passed": stats["passed"],
+                "total": stats["total"],
+                "flipped_tests": [
+                    r.test_case.test_id for r in current
+                    if r.test_case.benchmark_type.value == benchmark
+                    and previous_passed.get(r.test_case.test_id) != r.passed
+                ],
+            }
+
+        return diff
+
     async def _load_test_cases(
         self,
         request: EvaluationRequestDTO
@@ -142,17 +703,16 @@ class EvaluateModelUseCase(IEvaluateModelUseCase):
 
         return phase_thresholds.get(request.evaluation_phase, None)
 
-    async def _evaluate_test_case(
+    async def _generate_response(
         self,
         test_case: TestCase,
         request: EvaluationRequestDTO
-    ) -> EvaluationResult:
-        """Evaluate a single test case."""
+    ) -> ModelResponse:
+        """Generate the model response for a single test case."""
         # Determine max tokens
         max_tokens = request.max_tokens or test_case.get_max_tokens_for_response()
 
-        # Generate response
-        model_response = await self._model_gateway.generate_response(
+        return await self._model_gateway.generate_response(
             prompt=test_case.question,
             model_name=request.model_name,
             temperature=request.temperature,
@@ -162,9 +722,49 @@ class EvaluateModelUseCase(IEvaluateModelUseCase):
             system_prompt="You are a cybersecurity compliance expert specializing in Singapore's CCoP 2.0.",
         )
 
-        # Score response
-        metrics = ScoringService.score_response(test_case, model_response)
+    def _score_test_cases(
+        self,
+        test_cases: List[TestCase],
+        model_responses: List[ModelResponse],
+        threshold: Optional[float]
+    ) -> List[EvaluationResult]:
+        """
+        Score a batch of generated responses and finalize the results.
 
+        Tier 2 embeddings are computed for the whole batch at once.
+        Blocking (Tier 2 embeddings, Tier 3 judge); runs in the scoring pool.
+        """
+        if not test_cases:
+            return []
+
+        all_metrics = ScoringService.score_responses(
+            list(zip(test_cases, model_responses)),
+            on_missing_fields=self._warn_missing_fields,
+        )
+        return [
+            self._finalize_result(test_case, model_response, metrics, threshold)
+            for test_case, model_response, metrics in zip(test_cases, model_responses, all_metrics)
+        ]
+
+    def _warn_missing_fields(self, scorer: str, field_name: str, test_ids: List[str]) -> None:
+        """Warn once per scorer and field that test cases lack a field their scorer relies on."""
+        if (scorer, field_name) in self._reported_missing_fields:
+            return
+        self._reported_missing_fields.add((scorer, field_name))
+        examples = ", ".join(test_ids[:3]) + (", ..." if len(test_ids) > 3 else "")
+        self._logger.warning(
+            f"Test cases without '{field_name}' are scored by {scorer} with a weaker "
+            f"fallback: {examples}"
+        )
+
+    def _finalize_result(
+        self,
+        test_case: TestCase,
+        model_response: ModelResponse,
+        metrics: List[EvaluationMetric],
+        threshold: Optional[float]
+    ) -> EvaluationResult:
+        """Build an evaluation result from its metrics and apply the pass threshold."""
         # Create evaluation result
         result = EvaluationResult(
             test_case=test_case,
@@ -174,22 +774,50 @@ class EvaluateModelUseCase(IEvaluateModelUseCase):
 
         # Finalize (calculate score and pass/fail with configurable threshold)
         # Phase 2: Use threshold from request if provided, otherwise use phase-specific default
-        threshold = self._get_threshold(request)
         result.finalize(threshold=threshold)
 
         return result
 
+    def _errored_result(
+        self,
+        test_case: TestCase,
+        failure: _GenerationFailure,
+        request: EvaluationRequestDTO,
+        threshold: Optional[float]
+    ) -> EvaluationResult:
+        """
+        Record a test whose generation failed as an errored result.
+
+        The result scores 0.0 (so it counts as failed) and carries the error
+        in its metadata; --resume re-runs errored tests.
+        """
+        result = EvaluationResult(
+            test_case=test_case,
+            model_response=ModelResponse(model_name=request.model_name),
+            overall_score=0.0,
+            evaluator_notes=f"Generation failed ({failure.error_type}): {failure.error}",
+            metadata={
+                "errored": True,
+                "error": failure.error,
+                "error_type": failure.error_type,
+            },
+        )
+        result.finalize(threshold=threshold)
+        return result
+
     def _generate_summary(
         self,
         model_name: str,
         results: List[EvaluationResult],
         start_time: datetime,
-        end_time: datetime
+        end_time: datetime,
+        scheduling: Optional[Dict[str, any]] = None,
     ) -> EvaluationSummaryDTO:
         """Generate evaluation summary from results."""
         total_tests = len(results)
         passed_tests = sum(1 for r in results if r.passed)
         failed_tests = total_tests - passed_tests
+        errored_tests = sum(1 for r in results if r.metadata.get("errored"))
 
         # Calculate overall score using category-level weighting
         overall_score = self._calculate_category_weighted_score(results)
@@ -210,6 +838,7 @@ class EvaluateModelUseCase(IEvaluateModelUseCase):
             total_tests=total_tests,
             passed_tests=passed_tests,
             failed_tests=failed_tests,
+            errored_tests=errored_tests,
             overall_score=overall_score,
             by_benchmark=by_benchmark,
             by_difficulty=by_difficulty,
@@ -217,6 +846,8 @@ class EvaluateModelUseCase(IEvaluateModelUseCase):
             evaluation_completed_at=end_time,
             total_duration_seconds=duration,
             results=result_dtos,
+            performance=self._performance_stats(results),
+            scheduling=scheduling or {},
         )
 
     def _calculate_category_weighted_score(
@@ -282,6 +913,13 @@ class EvaluateModelUseCase(IEvaluateModelUseCase):
 
         return weighted_score
 
+    def _response_cache_mode(self) -> str:
+        """Effective response cache mode of the model gateway ("off" if it does not cache)."""
+        mode = getattr(self._model_gateway, "cache_mode", None)
+        if not isinstance(mode, str):
+            return "off"
+        return getattr(mode, "value", mode)
+
     def _build_evaluation_metadata(
         self,
         request: EvaluationRequestDTO,
@@ -311,13 +949,23 @@ class EvaluateModelUseCase(IEvaluateModelUseCase):
             "total_tests": summary.total_tests,
             "passed_tests": summary.passed_tests,
             "failed_tests": summary.failed_tests,
+            "errored_tests": summary.errored_tests,
             "overall_score": summary.overall_score,
             "evaluated_at": start_time.isoformat(),
             "completed_at": end_time.isoformat(),
             "duration_seconds": summary.total_duration_seconds,
             "temperature": request.temperature,
+            "run_id": request.run_id,
         }
 
+        # Add latency and throughput statistics
+        if summary.performance:
+            metadata["performance"] = summary.performance
+
+        # Add scheduler statistics (concurrency sizing)
+        if summary.scheduling:
+            metadata["scheduling"] = summary.scheduling
+
         # Add tier if used
         from domain.value_objects.evaluation_tier import EvaluationTier
         for tier in EvaluationTier.get_all_tiers():
@@ -394,7 +1042,9 @@ class EvaluateModelUseCase(IEvaluateModelUseCase):
                 "total": total,
                 "passed": passed,
                 "failed": total - passed,
+                "errored": sum(1 for r in bench_results if r.metadata.get("errored")),
                 "score": score,
+                "performance": self._performance_stats(bench_results),
             }
 
         return summary
@@ -423,10 +1073,75 @@ class EvaluateModelUseCase(IEvaluateModelUseCase):
                 "passed": passed,
                 "failed": total - passed,
                 "score": score,
+                "performance": self._performance_stats(diff_results),
             }
 
         return summary
 
+    def _performance_stats(
+        self,
+        results: List[EvaluationResult]
+    ) -> Dict[str, any]:
+        """
+        Aggregate latency percentiles and server-side throughput.
+
+        Load time and prefill/decode throughput come from the backend's
+        timing breakdown, which separates model-load stalls from slow
+        decoding. Throughput is token-weighted (total tokens / total time).
+        Time to first token is only known for streamed responses.
+
+        Errored results are left out: they have no latency to report.
+
+        Args:
+            results: Evaluation results
+
+        Returns:
+            Dictionary with latency_ms, ttft_ms and load_ms percentiles (p50/p95/p99)
+            and prefill/decode tokens per second (None if not reported)
+        """
+        results = [r for r in results if not r.metadata.get("errored")]
+        latencies = [r.model_response.latency_ms for r in results]
+        timings = [r.model_response.server_timings for r in results]
+        load_ms = [t["load_duration"] / 1e6 for t in timings if "load_duration" in t]
+        ttft_ms = [
+            r.model_response.metadata["streaming"]["ttft_ms"]
+            for r in results
+            if (r.model_response.metadata.get("streaming") or {}).get("ttft_ms") is not None
+        ]
+
+        return {
+            "latency_ms": self._percentiles(latencies),
+            "ttft_ms": self._percentiles(ttft_ms) if ttft_ms else None,
+            "load_ms": self._percentiles(load_ms) if load_ms else None,
+            "prefill_tokens_per_second": self._throughput(
+                timings, "prompt_eval_count", "prompt_eval_duration"
+            ),
+            "decode_tokens_per_second": self._throughput(timings, "eval_count", "eval_duration"),
+        }
+
+    def _percentiles(self, values: List[float]) -> Dict[str, float]:
+        """Summarize a sample as p50/p95/p99."""
+        return {
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+        }
+
+    def _throughput(
+        self,
+        timings: List[Dict[str, int]],
+        count_field: str,
+        duration_field: str
+    ) -> Optional[float]:
+        """Token-weighted tokens/sec over results that report both fields."""
+        reported = [t for t in timings if t.get(count_field) is not None and t.get(duration_field)]
+        if not reported:
+            return None
+
+        total_tokens = sum(t[count_field] for t in reported)
+        total_seconds = sum(t[duration_field] for t in reported) / 1e9
+        return total_tokens / total_seconds
+
     def _result_to_dto(self, result: EvaluationResult) -> EvaluationResultDTO:
         """Convert domain EvaluationResult to DTO."""
         metrics_dtos = [
@@ -452,6 +1167,7 @@ class EvaluateModelUseCase(IEvaluateModelUseCase):
             evaluator_notes=result.evaluator_notes,
             tokens_used=result.model_response.tokens_used,
             latency_ms=result.model_response.latency_ms,
+            server_timings=result.model_response.server_timings,
             evaluated_at=result.evaluated_at,
             metadata=result.metadata,
         )
@@ -155,6 +155,16 @@ class EvaluationResult:
         self._overall_score = None
         self._passed = None
 
+    def add_metadata(self, key: str, value: any) -> None:
+        """
+        Attach a metadata entry to the result.
+
+        Args:
+            key: Metadata key
+            value: Metadata value
+        """
+        self._metadata[key] = value
+
     def get_metric_by_name(self, name: str) -> Optional[EvaluationMetric]:
         """
         Get metric by name.
@@ -7,10 +7,22 @@ Entity with identity (response_id) and lifecycle.
 
 import re
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 from uuid import UUID, uuid4
 
 from domain.exceptions.validation_error import ValidationError
+from domain.value_objects.scoring_artifacts import WORD_PATTERN
+
+
+# Server-side timing fields reported by the inference backend (durations in ns)
+SERVER_TIMING_FIELDS = (
+    "total_duration",
+    "load_duration",
+    "prompt_eval_count",
+    "prompt_eval_duration",
+    "eval_count",
+    "eval_duration",
+)
 
 
 class ModelResponse:
@@ -34,6 +46,7 @@ class ModelResponse:
         temperature: float = 0.7,
         created_at: datetime | None = None,
         metadata: Dict[str, any] | None = None,
+        server_timings: Dict[str, int] | None = None,
     ) -> None:
         """
         Initialize ModelResponse entity.
@@ -47,6 +60,8 @@ class ModelResponse:
             temperature: Temperature parameter used for generation
             created_at: Timestamp of response creation
             metadata: Additional response metadata
+            server_timings: Backend timing breakdown (see SERVER_TIMING_FIELDS;
+                durations in nanoseconds, counts in tokens)
 
         Raises:
             ValidationError: If validation fails
@@ -59,6 +74,12 @@ class ModelResponse:
         self._temperature = temperature
         self._created_at = created_at or datetime.utcnow()
         self._metadata = metadata or {}
+        self._server_timings = {
+            key: value for key, value in (server_timings or {}).items()
+            if key in SERVER_TIMING_FIELDS and value is not None
+        }
+        self._normalized_content: Optional[str] = None
+        self._word_set: Optional[FrozenSet[str]] = None
 
         self._validate()
 
@@ -71,6 +92,7 @@ class ModelResponse:
         - tokens_used must be non-negative
         - latency_ms must be non-negative
         - temperature must be between 0.0 and 2.0
+        - server timings must be non-negative
         """
         if self._content and not self._content.strip():
             raise ValidationError("Response content cannot be empty", field="content")
@@ -93,6 +115,13 @@ class ModelResponse:
                 field="temperature"
             )
 
+        for key, value in self._server_timings.items():
+            if value < 0:
+                raise ValidationError(
+                    f"Server timing '{key}' must be non-negative",
+                    field="server_timings"
+                )
+
     # Business methods
 
     def extract_citations(self) -> List[str]:
@@ -182,6 +211,21 @@ class ModelResponse:
         ]
         return any(indicator in self._content for indicator in code_indicators)
 
+    def prefill_tokens_per_second(self) -> Optional[float]:
+        """Prompt processing throughput (None if not reported by the backend)."""
+        return self._rate("prompt_eval_count", "prompt_eval_duration")
+
+    def decode_tokens_per_second(self) -> Optional[float]:
+        """Generation throughput (None if not reported by the backend)."""
+        return self._rate("eval_count", "eval_duration")
+
+    def _rate(self, count_field: str, duration_field: str) -> Optional[float]:
+        count = self._server_timings.get(count_field)
+        duration_ns = self._server_timings.get(duration_field)
+        if count is None or not duration_ns:
+            return None
+        return count / (duration_ns / 1e9)
+
     # Properties (identity & attributes)
 
     @property
@@ -194,6 +238,20 @@ class ModelResponse:
         """Response text content."""
         return self._content
 
+    @property
+    def normalized_content(self) -> str:
+        """Lowercased content (computed once; shared by all scorers of this response)."""
+        if self._normalized_content is None:
+            self._normalized_content = self._content.lower()
+        return self._normalized_content
+
+    @property
+    def word_set(self) -> FrozenSet[str]:
+        """Lowercased word set of the content (tokenized once; used by lexical scorers)."""
+        if self._word_set is None:
+            self._word_set = frozenset(WORD_PATTERN.findall(self.normalized_content))
+        return self._word_set
+
     @property
     def model_name(self) -> str:
         """Name of the model."""
@@ -224,6 +282,11 @@ class ModelResponse:
         """Additional metadata."""
         return self._metadata.copy()
 
+    @property
+    def server_timings(self) -> Dict[str, int]:
+        """Backend timing breakdown (durations in ns, counts in tokens)."""
+        return self._server_timings.copy()
+
     # Equality based on identity
 
     def __eq__(self, other: object) -> bool:
@@ -6,12 +6,13 @@ Entity with identity (test_id) and comprehensive business logic.
 """
 
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from domain.exceptions.validation_error import ValidationError
 from domain.value_objects.benchmark_type import BenchmarkType
 from domain.value_objects.ccop_section import CCoPSection
 from domain.value_objects.difficulty_level import DifficultyLevel
+from domain.value_objects.scoring_artifacts import ScoringArtifacts
 
 
 class TestCase:
@@ -43,6 +44,7 @@ class TestCase:
         key_facts: list[str] | None = None,
         expected_label: str | None = None,
         forbidden_claims: list[str] | None = None,
+        scoring_artifacts: ScoringArtifacts | None = None,
     ) -> None:
         """
         Initialize TestCase entity.
@@ -60,6 +62,8 @@ class TestCase:
             key_facts: Phase 2 - List of atomic facts to check for completeness
             expected_label: Phase 2 - Expected classification label (for label-based scoring)
             forbidden_claims: Phase 2 - List of fabricated claims to penalize
+            scoring_artifacts: Precompiled scoring inputs (e.g., from a test-suite
+                snapshot); compiled on first use if None
 
         Raises:
             ValidationError: If validation fails
@@ -82,6 +86,9 @@ class TestCase:
         # Validate on creation (fail fast)
         self._validate()
 
+        # Compiled on first use unless precompiled (see scoring_artifacts)
+        self._scoring_artifacts: Optional[ScoringArtifacts] = scoring_artifacts
+
     def _validate(self) -> None:
         """
         Enforce all business rules and invariants.
@@ -291,6 +298,25 @@ class TestCase:
         """Phase 2: List of fabricated claims to penalize in grounding checks."""
         return self._forbidden_claims.copy()
 
+    @property
+    def scoring_artifacts(self) -> ScoringArtifacts:
+        """
+        Response-independent scoring inputs, compiled once per test case.
+
+        The entity's attributes never change after creation, so the artifacts
+        stay valid for its lifetime.
+        """
+        if self._scoring_artifacts is None:
+            self._scoring_artifacts = ScoringArtifacts.build(
+                expected_response=self._expected_response,
+                key_facts=self._key_facts,
+                expected_label=self._expected_label,
+                forbidden_claims=self._forbidden_claims,
+                key_terminology=self.get_key_terminology(),
+                expected_violations=self.get_expected_violations(),
+            )
+        return self._scoring_artifacts
+
     # Equality based on identity
 
     def __eq__(self, other: object) -> bool:
@@ -0,0 +1,216 @@
+"""
+Embedding Model Registry
+
+Holds the sentence-embedding models loaded by this process. Several models
+can be resident at once (e.g., to compare two embedding models in one run),
+up to an LRU cap, and every model is shared by all scoring threads.
+
+Each resident model serializes its encode calls with its own lock: encoders
+are not guaranteed to be thread-safe (HuggingFace fast tokenizers raise
+"Already borrowed" under concurrent use), and a torch forward pass already
+uses all configured intra-op threads, so a per-thread model copy would only
+multiply memory.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Protocol
+
+import numpy as np
+
+
+class EmbeddingEncoder(Protocol):
+    """Sentence-embedding model (see EmbeddingEncoderFactory for backends)."""
+
+    def encode(self, texts, batch_size: int = 32) -> np.ndarray:
+        ...
+
+
+def load_sentence_transformer(model_name: str) -> EmbeddingEncoder:
+    """Load a sentence-transformers model on PyTorch (the default factory)."""
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name)
+
+
+class LoadedEmbeddingModel:
+    """A resident embedding model with its encode lock and usage counters."""
+
+    def __init__(self, model_name: str, encoder: EmbeddingEncoder, load_seconds: float) -> None:
+        """
+        Initialize loaded model.
+
+        Args:
+            model_name: Model name it was loaded by
+            encoder: Loaded encoder
+            load_seconds: Wall-clock load time
+        """
+        self.model_name = model_name
+        self.encoder = encoder
+        self.load_seconds = load_seconds
+        # Embeddings of ONNX/quantized encoders are kept apart from PyTorch ones
+        self.cache_key: str = getattr(encoder, "cache_key", None) or model_name
+
+        self._lock = threading.Lock()
+        self.encode_calls = 0
+        self.encoded_texts = 0
+        self.encode_seconds = 0.0
+
+    def encode(self, texts, batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        Encode one text (1-D result) or a list of texts (2-D result).
+
+        Args:
+            texts: Text or list of texts
+            batch_size: Encoder batch size (None: encoder default)
+
+        Returns:
+            Embedding(s)
+        """
+        kwargs = {"batch_size": batch_size} if batch_size else {}
+        with self._lock:
+            start = time.perf_counter()
+            embeddings = self.encoder.encode(texts, **kwargs)
+            self.encode_seconds += time.perf_counter() - start
+            self.encode_calls += 1
+            self.encoded_texts += 1 if isinstance(texts, str) else len(texts)
+        return embeddings
+
+    def stats(self) -> Dict[str, any]:
+        """
+        Get usage counters.
+
+        Returns:
+            Dictionary with cache_key, load_seconds, encode_calls, encoded_texts and encode_seconds
+        """
+        return {
+            "cache_key": self.cache_key,
+            "load_seconds": self.load_seconds,
+            "encode_calls": self.encode_calls,
+            "encoded_texts": self.encoded_texts,
+            "encode_seconds": self.encode_seconds,
+        }
+
+
+class EmbeddingModelRegistry:
+    """
+    Thread-safe registry of resident embedding models with an LRU cap.
+
+    Models are loaded on first use and stay resident until evicted (the
+    least recently used model beyond max_models), unloaded or cleared.
+    Concurrent first uses of a model load it once; loading one model does
+    not block encoding with another.
+    """
+
+    def __init__(
+        self,
+        factory: Optional[Callable[[str], EmbeddingEncoder]] = None,
+        max_models: int = 2,
+    ) -> None:
+        """
+        Initialize registry.
+
+        Args:
+            factory: Called as factory(model_name) to load a model
+                (None: sentence-transformers on PyTorch)
+            max_models: Maximum number of resident models
+
+        Raises:
+            ValueError: If max_models is less than 1
+        """
+        if max_models < 1:
+            raise ValueError("max_models must be at least 1")
+
+        self._factory = factory or load_sentence_transformer
+        self._max_models = max_models
+        self._lock = threading.Lock()
+        self._models: "OrderedDict[str, LoadedEmbeddingModel]" = OrderedDict()
+        self._load_locks: Dict[str, threading.Lock] = {}
+
+        self.loads = 0
+        self.evictions = 0
+        self.load_seconds = 0.0
+
+    @property
+    def max_models(self) -> int:
+        """Maximum number of resident models."""
+        return self._max_models
+
+    @property
+    def resident_models(self) -> List[str]:
+        """Names of resident models, least recently used first."""
+        with self._lock:
+            return list(self._models)
+
+    def get(self, model_name: str) -> LoadedEmbeddingModel:
+        """
+        Get a model, loading it on first use.
+
+        Args:
+            model_name: Model name passed to the factory
+
+        Returns:
+            Loaded model (remains usable by the caller even if evicted meanwhile)
+        """
+        with self._lock:
+            model = self._models.get(model_name)
+            if model is not None:
+                self._models.move_to_end(model_name)
+                return model
+            load_lock = self._load_locks.setdefault(model_name, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                model = self._models.get(model_name)
+                if model is not None:  # Loaded by another thread meanwhile
+                    self._models.move_to_end(model_name)
+                    return model
+
+            start = time.perf_counter()
+            encoder = self._factory(model_name)
+            model = LoadedEmbeddingModel(model_name, encoder, time.perf_counter() - start)
+
+            with self._lock:
+                self._models[model_name] = model
+                self.loads += 1
+                self.load_seconds += model.load_seconds
+                while len(self._models) > self._max_models:
+                    self._models.popitem(last=False)
+                    self.evictions += 1
+            return model
+
+    def unload(self, model_name: str) -> bool:
+        """
+        Release a model.
+
+        Args:
+            model_name: Model name
+
+        Returns:
+            True if the model was resident
+        """
+        with self._lock:
+            return self._models.pop(model_name, None) is not None
+
+    def clear(self) -> None:
+        """Release all models."""
+        with self._lock:
+            self._models.clear()
+
+    def stats(self) -> Dict[str, any]:
+        """
+        Get load metrics.
+
+        Returns:
+            Dictionary with loads, evictions, load_seconds, max_models and
+            per-model counters under "models"
+        """
+        with self._lock:
+            return {
+                "loads": self.loads,
+                "evictions": self.evictions,
+                "load_seconds": self.load_seconds,
+                "max_models": self._max_models,
+                "models": {name: model.stats() for name, model in self._models.items()},
+            }
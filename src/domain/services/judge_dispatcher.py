@@ -0,0 +1,528 @@
+"""
+Judge Dispatcher
+
+Concurrent Tier 3 judging: judgements are dispatched to a bounded thread
+pool (the judge call itself blocks on a subprocess or judge session), paced
+by a token-bucket rate limiter, and their verdicts are cached by a hash of
+the judge model and the exact judge prompt, so re-scoring an unchanged test
+never pays for a second judgement.
+
+In batched mode (batch_size > 1) up to K responses sharing a rubric are
+judged in one call; measure_batch_agreement quantifies what that costs in
+agreement with single-item judging. Only verdicts of responses judged on
+their own are served from the cache, in either mode.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, NamedTuple, Optional, Protocol, Sequence, Tuple
+
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.services.llm_judge_service import JudgeEvaluation, LLMJudgeService
+
+
+class VerdictStore(Protocol):
+    """Persistent store of judge verdicts (see ResponseCache)."""
+
+    def get(self, key: str) -> Optional[Dict[str, any]]:
+        ...
+
+    def put(self, key: str, entry: Dict[str, any]) -> None:
+        ...
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at `rate_per_s` up to `burst`. A caller that
+    finds the bucket empty reserves the next token and sleeps until it is
+    due, so waiting callers are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        rate_per_s: float,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize token bucket.
+
+        Args:
+            rate_per_s: Sustained rate (tokens per second)
+            burst: Bucket capacity (requests allowed back-to-back)
+            clock: Monotonic clock (seconds)
+            sleep: Sleep function
+
+        Raises:
+            ValueError: If rate_per_s is not positive or burst is less than 1
+        """
+        if rate_per_s <= 0 or burst < 1:
+            raise ValueError("rate_per_s must be positive and burst at least 1")
+
+        self._rate = rate_per_s
+        self._burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+
+        self.waited_seconds = 0.0
+
+    def acquire(self) -> float:
+        """
+        Take one token, waiting for it if necessary.
+
+        Returns:
+            Seconds waited
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+            self.waited_seconds += wait
+
+        if wait:
+            self._sleep(wait)
+        return wait
+
+
+class _BatchItem(NamedTuple):
+    """A judgement waiting for a batched judge call."""
+
+    test_case: TestCase
+    response: ModelResponse
+    prompt: str
+    key: str
+    future: Future
+
+
+class JudgeDispatcher:
+    """
+    Dispatches Tier 3 judgements concurrently, rate-limited and cached.
+
+    Only successful verdicts of responses judged on their own are served
+    from the cache; a failed judgement scores with the judge's conservative
+    fallback and is retried on the next run. Identical
+    prompts in flight at the same time are judged once. With batch_size > 1,
+    items whose batched verdict is missing or malformed are re-judged on
+    their own.
+    """
+
+    _shared: Optional["JudgeDispatcher"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        judge: Optional[LLMJudgeService] = None,
+        max_concurrency: int = 4,
+        rate_per_minute: Optional[float] = None,
+        burst: int = 1,
+        verdict_store: Optional[VerdictStore] = None,
+        batch_size: int = 1,
+    ) -> None:
+        """
+        Initialize judge dispatcher.
+
+        Args:
+            judge: Judge service (default: LLMJudgeService())
+            max_concurrency: Maximum judgements in flight
+            rate_per_minute: Judgement rate limit (None: unlimited)
+            burst: Judgements allowed back-to-back under the rate limit
+            verdict_store: Persistent verdict cache (None: no caching)
+            batch_size: Responses judged per call by evaluate_many (1: one per call)
+
+        Raises:
+            ValueError: If max_concurrency or batch_size is less than 1
+        """
+        if max_concurrency < 1 or batch_size < 1:
+            raise ValueError("max_concurrency and batch_size must be at least 1")
+
+        self._judge = judge or LLMJudgeService()
+        self._max_concurrency = max_concurrency
+        self._rate_limiter = TokenBucket(rate_per_minute / 60.0, burst) if rate_per_minute else None
+        self._verdict_store = verdict_store
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: Dict[str, Future] = {}
+
+        self.judged = 0
+        self.cache_hits = 0
+        self.deduplicated = 0
+        self.errors = 0
+        self.batches = 0
+        self.batch_fallbacks = 0
+
+    @classmethod
+    def shared(cls) -> "JudgeDispatcher":
+        """
+        Get the process-wide dispatcher (created on first use).
+
+        Creation is locked so concurrent scoring threads share one
+        dispatcher (one thread pool, rate limiter and verdict cache).
+
+        Returns:
+            Dispatcher used by ScoringService
+        """
+        shared = cls._shared
+        if shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+                shared = cls._shared
+        return shared
+
+    @classmethod
+    def configure_shared(cls, dispatcher: Optional["JudgeDispatcher"]) -> None:
+        """
+        Set the process-wide dispatcher (None: a default uncached dispatcher).
+
+        Args:
+            dispatcher: Dispatcher with the configured limits and verdict cache
+        """
+        with cls._shared_lock:
+            cls._shared = dispatcher
+
+    @property
+    def batch_size(self) -> int:
+        """Responses judged per call by evaluate_many."""
+        return self._batch_size
+
+    def make_key(self, prompt: str) -> str:
+        """
+        Build the verdict cache key of a judge prompt.
+
+        Args:
+            prompt: Prompt from LLMJudgeService._build_judge_prompt
+
+        Returns:
+            SHA-256 hex digest of the judge model name and prompt
+        """
+        payload = f"judge\0{self._judge.model_name}\0{prompt}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def evaluate(
+        self,
+        test_case: TestCase,
+        response: ModelResponse,
+        rubric: Dict[str, str]
+    ) -> JudgeEvaluation:
+        """
+        Judge one response (through the cache and rate limiter).
+
+        Args:
+            test_case: Test case being evaluated
+            response: Model response to evaluate
+            rubric: Evaluation rubric
+
+        Returns:
+            JudgeEvaluation
+        """
+        return self.submit(test_case, response, rubric).result()
+
+    def evaluate_many(
+        self,
+        requests: Sequence[Tuple[TestCase, ModelResponse, Dict[str, str]]]
+    ) -> List[JudgeEvaluation]:
+        """
+        Judge many responses concurrently (batch_size per judge call).
+
+        Args:
+            requests: (test case, model response, rubric) triples
+
+        Returns:
+            JudgeEvaluation per request (same order)
+        """
+        if self._batch_size > 1 and len(requests) > 1:
+            futures = self._submit_batched(requests)
+        else:
+            futures = [self.submit(*request) for request in requests]
+        return [future.result() for future in futures]
+
+    def submit(
+        self,
+        test_case: TestCase,
+        response: ModelResponse,
+        rubric: Dict[str, str]
+    ) -> "Future[JudgeEvaluation]":
+        """
+        Start judging a response.
+
+        Args:
+            test_case: Test case being evaluated
+            response: Model response to evaluate
+            rubric: Evaluation rubric
+
+        Returns:
+            Future resolving to the JudgeEvaluation (already done on a cache hit)
+        """
+        prompt = self._judge._build_judge_prompt(test_case, response, rubric)
+        key = self.make_key(prompt)
+
+        cached = self._cached_verdict(key)
+        if cached is not None:
+            future: Future = Future()
+            future.set_result(cached)
+            return future
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.deduplicated += 1
+                return future
+            future = self._executor_locked().submit(self._judge_prompt, prompt, key)
+            self._in_flight[key] = future
+        # Outside the lock: the callback runs right away if the future is already done
+        future.add_done_callback(lambda done: self._forget(key, done))
+        return future
+
+    def stats(self) -> Dict[str, any]:
+        """
+        Get dispatcher counters.
+
+        Returns:
+            Dictionary with judged, cache_hits, deduplicated, errors, batches,
+            batch_fallbacks, batch_size, max_concurrency and rate_limited_seconds
+        """
+        with self._lock:
+            return {
+                "judged": self.judged,
+                "cache_hits": self.cache_hits,
+                "deduplicated": self.deduplicated,
+                "errors": self.errors,
+                "batches": self.batches,
+                "batch_fallbacks": self.batch_fallbacks,
+                "batch_size": self._batch_size,
+                "max_concurrency": self._max_concurrency,
+                "rate_limited_seconds": (
+                    self._rate_limiter.waited_seconds if self._rate_limiter else 0.0
+                ),
+            }
+
+    def close(self) -> None:
+        """Wait for in-flight judgements and stop the dispatch threads."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _executor_locked(self) -> ThreadPoolExecutor:
+        """Get the dispatch thread pool (caller holds the lock)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrency, thread_name_prefix="judge"
+            )
+        return self._executor
+
+    def _submit_batched(
+        self,
+        requests: Sequence[Tuple[TestCase, ModelResponse, Dict[str, str]]]
+    ) -> List[Future]:
+        """Start judging requests in calls of up to batch_size items sharing a rubric."""
+        futures: List[Future] = []
+        groups: Dict[str, List[_BatchItem]] = {}
+        rubrics: Dict[str, Dict[str, str]] = {}
+
+        for test_case, response, rubric in requests:
+            prompt = self._judge._build_judge_prompt(test_case, response, rubric)
+            key = self.make_key(prompt)
+            cached = self._cached_verdict(key)
+            if cached is not None:
+                future: Future = Future()
+                future.set_result(cached)
+                futures.append(future)
+                continue
+
+            with self._lock:
+                future = self._in_flight.get(key)
+                if future is not None:
+                    self.deduplicated += 1
+                else:
+                    future = Future()
+                    self._in_flight[key] = future
+                    future.add_done_callback(lambda done, key=key: self._forget(key, done))
+                    rubric_key = json.dumps(rubric, sort_keys=True)
+                    rubrics[rubric_key] = rubric
+                    groups.setdefault(rubric_key, []).append(
+                        _BatchItem(test_case, response, prompt, key, future)
+                    )
+            futures.append(future)
+
+        with self._lock:
+            executor = self._executor_locked()
+        for rubric_key, items in groups.items():
+            for start in range(0, len(items), self._batch_size):
+                executor.submit(self._judge_batch, items[start:start + self._batch_size], rubrics[rubric_key])
+        return futures
+
+    def _judge_batch(self, items: List[_BatchItem], rubric: Dict[str, str]) -> None:
+        """Judge a batch in one call, re-judging malformed items on their own."""
+        try:
+            if len(items) == 1:
+                items[0].future.set_result(self._judge_prompt(items[0].prompt, items[0].key))
+                return
+
+            if self._rate_limiter is not None:
+                self._rate_limiter.acquire()
+            try:
+                verdicts = self._judge.judge_batch(
+                    [(item.test_case, item.response) for item in items], rubric
+                )
+            except Exception as e:
+                with self._lock:
+                    self.batches += 1
+                    self.errors += len(items)
+                for item in items:
+                    item.future.set_result(self._judge.fallback_evaluation(e))
+                return
+
+            with self._lock:
+                self.batches += 1
+            for item, verdict in zip(items, verdicts):
+                if verdict is None:
+                    with self._lock:
+                        self.batch_fallbacks += 1
+                    verdict = self._judge_prompt(item.prompt, item.key)
+                else:
+                    # Not cached: the verdict depends on the other items in the batch
+                    with self._lock:
+                        self.judged += 1
+                item.future.set_result(verdict)
+        except BaseException as e:
+            for item in items:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            raise
+
+    def _cached_verdict(self, key: str) -> Optional[JudgeEvaluation]:
+        """Look up a cached verdict."""
+        if self._verdict_store is None:
+            return None
+        entry = self._verdict_store.get(key)
+        if entry is None:
+            return None
+        try:
+            evaluation = JudgeEvaluation(**entry)
+        except TypeError:
+            return None  # Written by an incompatible version; judge again
+        with self._lock:
+            self.cache_hits += 1
+        return evaluation
+
+    def _judge_prompt(self, prompt: str, key: str) -> JudgeEvaluation:
+        """Judge one prompt on a dispatch thread and cache a successful verdict."""
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        try:
+            evaluation = self._judge.judge(prompt)
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            return self._judge.fallback_evaluation(e)
+
+        with self._lock:
+            self.judged += 1
+        self._store(key, evaluation)
+        return evaluation
+
+    def _store(self, key: str, evaluation: JudgeEvaluation) -> None:
+        """Cache a successful verdict."""
+        if self._verdict_store is None:
+            return
+        try:
+            self._verdict_store.put(key, asdict(evaluation))
+        except OSError:
+            pass  # A read-only or full cache only costs a re-judgement next time
+
+    def _forget(self, key: str, future: Future) -> None:
+        """Drop a finished judgement from the in-flight map."""
+        with self._lock:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+
+@dataclass
+class JudgeAgreementReport:
+    """Agreement of batched judging with single-item judging on a calibration set."""
+
+    items: int
+    batch_size: int
+    exact_agreement: float  # All three scores identical
+    within_one: float  # All three scores within 1 point
+    criterion_agreement: Dict[str, float] = field(default_factory=dict)
+    mean_abs_score_diff: float = 0.0  # Overall score (0-1)
+    max_abs_score_diff: float = 0.0
+    excluded: int = 0  # Items where either judgement failed
+    batch_fallbacks: int = 0
+    single_calls: int = 0
+    batched_calls: int = 0
+
+
+def measure_batch_agreement(
+    single: JudgeDispatcher,
+    batched: JudgeDispatcher,
+    requests: Sequence[Tuple[TestCase, ModelResponse, Dict[str, str]]],
+) -> JudgeAgreementReport:
+    """
+    Judge a calibration set both ways and compare the verdicts.
+
+    Use dispatchers without a verdict store so both sides are judged fresh.
+
+    Args:
+        single: Dispatcher with batch_size 1 (the reference)
+        batched: Dispatcher with the batch size under test
+        requests: (test case, model response, rubric) calibration triples
+
+    Returns:
+        Agreement report (items where either side failed are excluded)
+
+    Raises:
+        ValueError: If the calibration set is empty
+    """
+    if not requests:
+        raise ValueError("Calibration set is empty")
+
+    reference = single.evaluate_many(requests)
+    candidate = batched.evaluate_many(requests)
+    compared = [
+        (ref, cand) for ref, cand in zip(reference, candidate)
+        if not ref.errored and not cand.errored
+    ]
+
+    criteria = ("accuracy_score", "completeness_score", "alignment_score")
+    score_diffs = [abs(ref.overall_score - cand.overall_score) for ref, cand in compared]
+    count = len(compared) or 1
+
+    single_stats = single.stats()
+    batched_stats = batched.stats()
+    return JudgeAgreementReport(
+        items=len(compared),
+        batch_size=batched.batch_size,
+        exact_agreement=sum(
+            all(getattr(ref, c) == getattr(cand, c) for c in criteria) for ref, cand in compared
+        ) / count,
+        within_one=sum(
+            all(abs(getattr(ref, c) - getattr(cand, c)) <= 1 for c in criteria) for ref, cand in compared
+        ) / count,
+        criterion_agreement={
+            c.replace("_score", ""): sum(getattr(ref, c) == getattr(cand, c) for ref, cand in compared) / count
+            for c in criteria
+        },
+        mean_abs_score_diff=sum(score_diffs) / count,
+        max_abs_score_diff=max(score_diffs, default=0.0),
+        excluded=len(requests) - len(compared),
+        batch_fallbacks=batched_stats["batch_fallbacks"],
+        single_calls=single_stats["judged"] + single_stats["errors"],
+        batched_calls=batched_stats["batches"] + batched_stats["batch_fallbacks"],
+    )
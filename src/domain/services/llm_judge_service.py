@@ -8,7 +8,7 @@ Uses Claude as an expert judge to evaluate complex compliance reasoning.
 import json
 import subprocess
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
 
 from domain.entities.model_response import ModelResponse
 from domain.entities.test_case import TestCase
@@ -25,6 +25,14 @@ class JudgeEvaluation:
     overall_score: float  # 0-1
     confidence: float  # 0-1
     raw_response: str  # Full judge response
+    errored: bool = False  # Conservative fallback after a judge failure
+
+
+class JudgeWorker(Protocol):
+    """Pre-started judge sessions (see JudgeWorkerPool)."""
+
+    def judge(self, prompt: str, timeout_s: Optional[float] = None) -> str:
+        ...
 
 
 class LLMJudgeService:
@@ -33,8 +41,12 @@ class LLMJudgeService:
 
     Uses Claude Agent SDK to evaluate subjective compliance reasoning.
     Avoids model self-evaluation by using external Claude instance.
+    Judgements go to a shared pool of pre-started judge sessions when one is
+    configured; otherwise each judgement starts its own `claude` process.
     """
 
+    _worker_pool: Optional[JudgeWorker] = None
+
     def __init__(self, model_name: str = "claude-sonnet-4") -> None:
         """
         Initialize LLM judge service.
@@ -44,6 +56,21 @@ class LLMJudgeService:
         """
         self._model = model_name
 
+    @property
+    def model_name(self) -> str:
+        """Judge model name."""
+        return self._model
+
+    @classmethod
+    def configure_worker_pool(cls, pool: Optional[JudgeWorker]) -> None:
+        """
+        Set the pre-started judge sessions (None: one process per judgement).
+
+        Args:
+            pool: Judge worker pool shared by all scoring threads
+        """
+        cls._worker_pool = pool
+
     def evaluate_response(
         self,
         test_case: TestCase,
@@ -65,25 +92,75 @@ class LLMJudgeService:
 
         # Use Claude Agent SDK via subprocess
         try:
-            judge_response = self._call_claude_agent(judge_prompt)
-            evaluation = self._parse_judge_response(judge_response)
-            evaluation.raw_response = judge_response
-            return evaluation
+            return self.judge(judge_prompt)
         except Exception as e:
-            # Fallback to conservative scoring on error
-            return JudgeEvaluation(
-                accuracy_score=3,
-                completeness_score=3,
-                alignment_score=3,
-                justification=f"Judge evaluation error: {str(e)}",
-                overall_score=0.6,
-                confidence=0.0,
-                raw_response=""
-            )
+            return self.fallback_evaluation(e)
+
+    def judge(self, prompt: str) -> JudgeEvaluation:
+        """
+        Get the judge's verdict for a built judge prompt.
+
+        Args:
+            prompt: Prompt from _build_judge_prompt
+
+        Returns:
+            Parsed JudgeEvaluation (with raw_response)
+
+        Raises:
+            Exception: If the judge call fails or its reply cannot be parsed
+        """
+        judge_response = self._call_claude_agent(prompt)
+        evaluation = self._parse_judge_response(judge_response)
+        evaluation.raw_response = judge_response
+        return evaluation
+
+    def judge_batch(
+        self,
+        items: Sequence[Tuple[TestCase, ModelResponse]],
+        rubric: Dict[str, str]
+    ) -> List[Optional[JudgeEvaluation]]:
+        """
+        Judge several responses (sharing one rubric) in a single judge call.
+
+        Args:
+            items: (test case, model response) pairs
+            rubric: Evaluation rubric shared by all items
+
+        Returns:
+            JudgeEvaluation per item (same order), None where the judge's
+            verdict is missing or malformed
+
+        Raises:
+            Exception: If the judge call fails
+        """
+        judge_response = self._call_claude_agent(self._build_batch_judge_prompt(items, rubric))
+        return self._parse_batch_judge_response(judge_response, len(items))
+
+    @staticmethod
+    def fallback_evaluation(error: Exception) -> JudgeEvaluation:
+        """
+        Conservative scoring used when the judge fails.
+
+        Args:
+            error: Judge failure
+
+        Returns:
+            Neutral JudgeEvaluation with zero confidence
+        """
+        return JudgeEvaluation(
+            accuracy_score=3,
+            completeness_score=3,
+            alignment_score=3,
+            justification=f"Judge evaluation error: {str(error)}",
+            overall_score=0.6,
+            confidence=0.0,
+            raw_response="",
+            errored=True
+        )
 
     def _call_claude_agent(self, prompt: str) -> str:
         """
-        Call Claude Agent SDK via subprocess.
+        Call Claude Agent SDK via the worker pool or a one-off subprocess.
 
         Args:
             prompt: Evaluation prompt
@@ -94,7 +171,12 @@ class LLMJudgeService:
         Raises:
             subprocess.CalledProcessError: If Claude call fails
             subprocess.TimeoutExpired: If call times out
+            TimeoutError: If a pooled judgement times out
         """
+        pool = self._worker_pool
+        if pool is not None:
+            return pool.judge(prompt)
+
         # Use Claude Agent SDK to get evaluation
         # This avoids using the same model being evaluated
         result = subprocess.run(
@@ -158,6 +240,123 @@ Provide your evaluation in JSON format:
 
 Only return the JSON, nothing else."""
 
+    def _build_batch_judge_prompt(
+        self,
+        items: Sequence[Tuple[TestCase, ModelResponse]],
+        rubric: Dict[str, str]
+    ) -> str:
+        """
+        Build a prompt asking for one verdict per item as a JSON array.
+
+        Args:
+            items: (test case, model response) pairs
+            rubric: Evaluation rubric shared by all items
+
+        Returns:
+            Formatted batch prompt for Claude judge
+        """
+        sections = "\n\n".join(
+            f"""### Item {number}
+
+**Test Question:**
+{test_case.question}
+
+**Model Response:**
+{response.content}
+
+**Expected Answer:**
+{test_case.expected_response}"""
+            for number, (test_case, response) in enumerate(items, 1)
+        )
+
+        return f"""You are an expert CCoP 2.0 compliance auditor evaluating {len(items)} model responses.
+Evaluate each item independently; do not compare items with each other.
+
+**Evaluation Rubric:**
+{json.dumps(rubric, indent=2)}
+
+{sections}
+
+**Instructions:**
+Rate each response on a 1-5 scale for each criterion:
+1. Accuracy: Technical correctness of compliance interpretation
+2. Completeness: Coverage of all relevant control requirements
+3. Alignment: Matches how a CSA auditor would evaluate this
+
+Provide your evaluation as a JSON array with one object per item, in item order:
+[
+  {{
+    "item": <item number>,
+    "accuracy_score": <1-5>,
+    "completeness_score": <1-5>,
+    "alignment_score": <1-5>,
+    "justification": "<2-3 sentence explanation>",
+    "confidence": <0.0-1.0>
+  }}
+]
+
+Only return the JSON array, nothing else."""
+
+    def _parse_batch_judge_response(
+        self,
+        response: str,
+        count: int
+    ) -> List[Optional[JudgeEvaluation]]:
+        """
+        Parse the JSON array reply to a batch prompt.
+
+        Args:
+            response: Raw response from Claude
+            count: Number of items in the batch
+
+        Returns:
+            JudgeEvaluation per item, None for missing, duplicate or malformed verdicts
+        """
+        evaluations: List[Optional[JudgeEvaluation]] = [None] * count
+        try:
+            data = json.loads(self._extract_json(response))
+        except json.JSONDecodeError:
+            return evaluations
+        if not isinstance(data, list):
+            return evaluations
+
+        seen = set()
+        for entry in data:
+            number = entry.get("item") if isinstance(entry, dict) else None
+            if not isinstance(number, int) or not 1 <= number <= count:
+                continue
+            if number in seen:
+                evaluations[number - 1] = None  # Ambiguous: judge it on its own
+                continue
+            seen.add(number)
+            if not self._is_valid_verdict(entry):
+                continue
+            evaluation = self._evaluation_from_verdict(entry)
+            evaluation.raw_response = json.dumps(entry)
+            evaluations[number - 1] = evaluation
+        return evaluations
+
+    @staticmethod
+    def _is_valid_verdict(entry: Any) -> bool:
+        """Check a verdict object has in-range scores and a justification."""
+        if not isinstance(entry, dict) or not isinstance(entry.get("justification"), str):
+            return False
+        scores = [entry.get(name) for name in ("accuracy_score", "completeness_score", "alignment_score")]
+        return all(
+            isinstance(score, int) and not isinstance(score, bool) and 1 <= score <= 5
+            for score in scores
+        )
+
+    @staticmethod
+    def _extract_json(response: str) -> str:
+        """Extract JSON from a response (handle markdown code blocks)."""
+        json_str = response.strip()
+        if "```json" in json_str:
+            json_str = json_str.split("```json")[1].split("```")[0].strip()
+        elif "```" in json_str:
+            json_str = json_str.split("```")[1].split("```")[0].strip()
+        return json_str
+
     def _parse_judge_response(self, response: str) -> JudgeEvaluation:
         """
         Parse JSON response from Claude judge.
@@ -172,15 +371,12 @@ Only return the JSON, nothing else."""
             json.JSONDecodeError: If response is not valid JSON
             KeyError: If required fields are missing
         """
-        # Extract JSON from response (handle markdown code blocks)
-        json_str = response.strip()
-        if "```json" in json_str:
-            json_str = json_str.split("```json")[1].split("```")[0].strip()
-        elif "```" in json_str:
-            json_str = json_str.split("```")[1].split("```")[0].strip()
-
-        data = json.loads(json_str)
+        data = json.loads(self._extract_json(response))
+        return self._evaluation_from_verdict(data)
 
+    @staticmethod
+    def _evaluation_from_verdict(data: Dict[str, Any]) -> JudgeEvaluation:
+        """Build a JudgeEvaluation from a verdict object."""
         # Normalize to 0-1 scale
         overall = (
             data["accuracy_score"] +
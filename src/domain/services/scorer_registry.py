@@ -0,0 +1,211 @@
+"""
+Scorer Registry
+
+Maps benchmarks to the functions that score them. Scorers register with a
+decorator declaring the benchmarks they score, their scoring tier and the
+TestCase fields they rely on; a scorer may also register a batch variant
+that scores a whole group of tests in one go (one embedding batch, one
+judge dispatch). Dispatch is a single dict lookup by benchmark number.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.evaluation_metric import EvaluationMetric
+
+ScoreFunction = Callable[[TestCase, ModelResponse], List[EvaluationMetric]]
+BatchScoreFunction = Callable[
+    [Sequence[Tuple[TestCase, ModelResponse]], int], List[List[EvaluationMetric]]
+]
+
+# TestCase fields read through accessors rather than attributes
+_FIELD_ACCESSORS: Dict[str, Callable[[TestCase], Any]] = {
+    "key_terminology": TestCase.get_key_terminology,
+    "expected_violations": TestCase.get_expected_violations,
+    "domain": lambda test_case: test_case.get_metadata_field("domain"),
+}
+
+
+@dataclass(frozen=True)
+class ScorerSpec:
+    """
+    A registered scorer.
+
+    Attributes:
+        name: Scorer function name
+        benchmarks: Benchmark numbers it scores
+        tier: Scoring tier (1: rule-based, 2: semantic similarity, 3: LLM judge)
+        requires: TestCase fields the scorer relies on (scoring falls back
+            to a weaker method when one is empty; ScoringService.score_responses
+            reports such test cases)
+        score: Scores one (test case, response) pair
+        score_batch: Scores a group of pairs at once (None: pair by pair)
+    """
+
+    name: str
+    benchmarks: Tuple[int, ...]
+    tier: int
+    requires: Tuple[str, ...]
+    score: ScoreFunction
+    score_batch: Optional[BatchScoreFunction] = None
+
+    @property
+    def batchable(self) -> bool:
+        """Whether the scorer has a batch variant."""
+        return self.score_batch is not None
+
+    def missing_fields(self, test_case: TestCase) -> List[str]:
+        """
+        Get the required fields a test case leaves empty.
+
+        Args:
+            test_case: Test case scored by this scorer
+
+        Returns:
+            Names of empty required fields
+        """
+        missing = []
+        for field_name in self.requires:
+            accessor = _FIELD_ACCESSORS.get(field_name)
+            value = accessor(test_case) if accessor else getattr(test_case, field_name, None)
+            if not value:
+                missing.append(field_name)
+        return missing
+
+
+class ScorerRegistry:
+    """Registry of scorers, keyed by benchmark number."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._by_benchmark: Dict[int, ScorerSpec] = {}
+
+    def register(
+        self,
+        *benchmarks: str,
+        tier: int,
+        requires: Sequence[str] = (),
+    ) -> Callable[[ScoreFunction], ScoreFunction]:
+        """
+        Decorator registering a scorer for benchmarks.
+
+        Apply below @staticmethod; the function is returned unchanged.
+
+        Args:
+            *benchmarks: Benchmark identifiers (e.g., "B1", "B21")
+            tier: Scoring tier (1, 2 or 3)
+            requires: TestCase fields the scorer relies on
+
+        Returns:
+            Decorator
+
+        Raises:
+            ValueError: If a benchmark already has a scorer
+        """
+        numbers = tuple(BenchmarkType.from_string(b).benchmark_number for b in benchmarks)
+
+        def decorator(function: ScoreFunction) -> ScoreFunction:
+            taken = [f"B{n}" for n in numbers if n in self._by_benchmark]
+            if taken:
+                raise ValueError(f"Benchmarks already have a scorer: {', '.join(taken)}")
+            spec = ScorerSpec(
+                name=function.__name__,
+                benchmarks=numbers,
+                tier=tier,
+                requires=tuple(requires),
+                score=function,
+            )
+            for number in numbers:
+                self._by_benchmark[number] = spec
+            return function
+
+        return decorator
+
+    def register_batch(self, scorer: Any) -> Callable[[BatchScoreFunction], BatchScoreFunction]:
+        """
+        Decorator registering the batch variant of a registered scorer.
+
+        Args:
+            scorer: The registered scorer (function or staticmethod)
+
+        Returns:
+            Decorator
+
+        Raises:
+            ValueError: If the scorer is not registered
+        """
+        function = getattr(scorer, "__func__", scorer)
+
+        def decorator(batch_function: BatchScoreFunction) -> BatchScoreFunction:
+            numbers = [n for n, spec in self._by_benchmark.items() if spec.score is function]
+            if not numbers:
+                raise ValueError(f"Scorer {function.__name__} is not registered")
+            spec = replace(self._by_benchmark[numbers[0]], score_batch=batch_function)
+            for number in numbers:
+                self._by_benchmark[number] = spec
+            return batch_function
+
+        return decorator
+
+    def get(self, benchmark_type: BenchmarkType) -> Optional[ScorerSpec]:
+        """
+        Get the scorer of a benchmark.
+
+        Args:
+            benchmark_type: Benchmark type
+
+        Returns:
+            Scorer spec, or None if the benchmark has no scorer
+        """
+        return self._by_benchmark.get(benchmark_type.benchmark_number)
+
+    def benchmarks(self, tier: Optional[int] = None) -> List[str]:
+        """
+        List benchmarks with a scorer.
+
+        Args:
+            tier: Only benchmarks of this tier (None: all)
+
+        Returns:
+            Benchmark short names in numeric order (e.g., ["B1", "B2"])
+        """
+        return [
+            f"B{number}" for number, spec in sorted(self._by_benchmark.items())
+            if tier is None or spec.tier == tier
+        ]
+
+    def group(
+        self,
+        pairs: Sequence[Tuple[TestCase, ModelResponse]]
+    ) -> List[Tuple[ScorerSpec, List[int]]]:
+        """
+        Group pairs by scorer.
+
+        Args:
+            pairs: (test case, model response) pairs
+
+        Returns:
+            (scorer, pair indices) in order of first appearance
+
+        Raises:
+            NotImplementedError: If a benchmark has no scorer
+        """
+        groups: Dict[str, Tuple[ScorerSpec, List[int]]] = {}
+        for index, (test_case, _) in enumerate(pairs):
+            spec = self.get(test_case.benchmark_type)
+            if spec is None:
+                raise self.not_implemented(test_case.benchmark_type)
+            groups.setdefault(spec.name, (spec, []))[1].append(index)
+        return list(groups.values())
+
+    def not_implemented(self, benchmark_type: BenchmarkType) -> NotImplementedError:
+        """Build the error raised for a benchmark without a scorer."""
+        # No fallback: forces explicit implementation for B7, B10, B14, B16
+        return NotImplementedError(
+            f"Benchmark {benchmark_type.value} requires Tier 2 Expert Rubric "
+            f"(not yet implemented). "
+            f"Implemented benchmarks: {', '.join(self.benchmarks())}"
+        )
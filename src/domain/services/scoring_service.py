@@ -2,15 +2,19 @@
 Scoring Service
 
 Domain service containing business logic for scoring model responses.
-Stateless service with pure functions (no external dependencies).
+Tier 1 scorers are pure functions. Tier 2 and Tier 3 scorers use the
+process-wide embedding registry and judge dispatcher, which the
+composition root configures (SemanticSimilarityService.configure_registry,
+JudgeDispatcher.configure_shared); this service holds no state itself.
 """
 
-import re
-from typing import Any, List
+from typing import AbstractSet, Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from domain.entities.model_response import ModelResponse
 from domain.entities.test_case import TestCase
-from domain.services.llm_judge_service import LLMJudgeService
+from domain.services.judge_dispatcher import JudgeDispatcher
+from domain.services.llm_judge_service import JudgeEvaluation
+from domain.services.scorer_registry import ScorerRegistry
 from domain.services.semantic_similarity_service import SemanticSimilarityService
 from domain.value_objects.benchmark_type import BenchmarkType
 from domain.value_objects.evaluation_metric import (
@@ -25,6 +29,16 @@ from domain.value_objects.evaluation_metric import (
 )
 
 
+# Tier 2 reasoning-track benchmarks (scored by semantic similarity)
+REASONING_TRACK_BENCHMARKS = ("B8", "B9", "B11", "B15", "B17", "B18", "B19")
+
+# Tier 3 benchmarks (scored by an LLM judge)
+LLM_JUDGE_BENCHMARKS = ("B12", "B13", "B20")
+
+# Benchmark scorers, filled in by the @SCORERS.register decorators below
+SCORERS = ScorerRegistry()
+
+
 class ScoringService:
     """
     Domain service for scoring model responses against test cases.
@@ -50,47 +64,94 @@ class ScoringService:
         Returns:
             List of evaluation metrics
         """
-        # Map benchmark short names to scoring functions
-        # BenchmarkType supports string comparison via __eq__
-        benchmark_scorers = {
-            # Tier 1: Fully implemented benchmarks
-            "B1": ScoringService._score_b1_interpretation,
-            "B2": ScoringService._score_b2_citation,
-            "B3": ScoringService._score_b3_hallucination,
-            "B4": ScoringService._score_b4_terminology,
-            "B5": ScoringService._score_b5_classification,
-            "B6": ScoringService._score_b6_violation_detection,
-            "B21": ScoringService._score_b3_hallucination,  # Uses B3 hallucination detection
-
-            # Tier 2: Reasoning track (semantic similarity)
-            "B8": ScoringService._score_reasoning_track,
-            "B9": ScoringService._score_reasoning_track,
-            "B11": ScoringService._score_reasoning_track,
-            "B15": ScoringService._score_reasoning_track,
-            "B17": ScoringService._score_reasoning_track,
-            "B18": ScoringService._score_reasoning_track,
-            "B19": ScoringService._score_reasoning_track,
-
-            # Tier 3: LLM-as-Judge (subjective evaluation)
-            "B12": ScoringService._score_tier3_llm_judge,
-            "B13": ScoringService._score_tier3_llm_judge,
-            "B20": ScoringService._score_tier3_llm_judge,
-        }
+        spec = SCORERS.get(test_case.benchmark_type)
+        if spec is None:
+            raise SCORERS.not_implemented(test_case.benchmark_type)
+        return spec.score(test_case, response)
 
-        # Find scorer by checking if benchmark type matches each key
-        for benchmark_key, scorer in benchmark_scorers.items():
-            if test_case.benchmark_type == benchmark_key:
-                return scorer(test_case, response)
-
-        # No fallback: Raise error for unimplemented benchmarks
-        # This forces explicit implementation for B7, B10, B14, B16
-        raise NotImplementedError(
-            f"Benchmark {test_case.benchmark_type.value} requires Tier 2 Expert Rubric "
-            f"(not yet implemented). "
-            f"Implemented benchmarks: B1-B6, B8, B9, B11-B13, B15, B17-B21"
-        )
+    @staticmethod
+    def score_responses(
+        pairs: Sequence[Tuple[TestCase, ModelResponse]],
+        batch_size: int = 64,
+        on_missing_fields: Optional[Callable[[str, str, List[str]], None]] = None
+    ) -> List[List[EvaluationMetric]]:
+        """
+        Score many responses, one scorer group at a time.
+
+        Pairs are grouped by scorer; scorers with a batch variant score their
+        whole group at once (Tier 2: one batched encode and matrix operation;
+        Tier 3: one concurrent, cached and rate-limited judge dispatch), the
+        others pair by pair as in score_response.
+
+        Each group is checked against its scorer's required fields. A test
+        case leaving one empty is still scored (the scorer falls back to a
+        weaker method) and is reported to on_missing_fields.
+
+        Args:
+            pairs: (test case, model response) pairs
+            batch_size: Encoder batch size
+            on_missing_fields: Called as (scorer name, field, test IDs) for each
+                required field some test cases of a group leave empty
+
+        Returns:
+            List of evaluation metrics per pair (same order)
+
+        Raises:
+            NotImplementedError: If a benchmark has no scorer
+        """
+        results: List[List[EvaluationMetric]] = [[] for _ in pairs]
+        for spec, indices in SCORERS.group(pairs):
+            group = [pairs[i] for i in indices]
+            if on_missing_fields is not None and spec.requires:
+                missing: Dict[str, List[str]] = {}
+                for test_case, _ in group:
+                    for field_name in spec.missing_fields(test_case):
+                        missing.setdefault(field_name, []).append(test_case.test_id)
+                for field_name, test_ids in missing.items():
+                    on_missing_fields(spec.name, field_name, test_ids)
+            if spec.batchable:
+                metrics = spec.score_batch(group, batch_size)
+            else:
+                metrics = [
+                    ScoringService.score_response(test_case, response)
+                    for test_case, response in group
+                ]
+            for i, pair_metrics in zip(indices, metrics):
+                results[i] = pair_metrics
+        return results
+
+    @staticmethod
+    def is_reasoning_track(test_case: TestCase) -> bool:
+        """Check if a test case is scored by Tier 2 semantic similarity."""
+        spec = SCORERS.get(test_case.benchmark_type)
+        return spec is not None and spec.tier == 2
 
     @staticmethod
+    def is_llm_judged(test_case: TestCase) -> bool:
+        """Check if a test case is scored by the Tier 3 LLM judge."""
+        spec = SCORERS.get(test_case.benchmark_type)
+        return spec is not None and spec.tier == 3
+
+    @staticmethod
+    def llm_judge_requests(
+        pairs: Sequence[Tuple[TestCase, ModelResponse]]
+    ) -> List[Tuple[TestCase, ModelResponse, Dict[str, str]]]:
+        """
+        Build judge requests for Tier 3 pairs.
+
+        Args:
+            pairs: (test case, model response) pairs of LLM-judged benchmarks
+
+        Returns:
+            (test case, model response, rubric) triples for JudgeDispatcher
+        """
+        return [
+            (test_case, response, ScoringService._get_tier3_rubric(test_case.benchmark_type))
+            for test_case, response in pairs
+        ]
+
+    @staticmethod
+    @SCORERS.register("B1", tier=1, requires=("expected_label", "key_facts", "forbidden_claims"))
     def _score_b1_interpretation(
         test_case: TestCase,
         response: ModelResponse
@@ -118,6 +179,7 @@ class ScoringService:
         return [accuracy, completeness, grounding]
 
     @staticmethod
+    @SCORERS.register("B2", tier=1, requires=("expected_label", "key_facts", "forbidden_claims"))
     def _score_b2_citation(
         test_case: TestCase,
         response: ModelResponse
@@ -146,6 +208,7 @@ class ScoringService:
         return [accuracy, completeness, grounding]
 
     @staticmethod
+    @SCORERS.register("B3", "B21", tier=1, requires=("expected_response",))  # B21 uses B3 hallucination detection
     def _score_b3_hallucination(
         test_case: TestCase,
         response: ModelResponse
@@ -167,19 +230,21 @@ class ScoringService:
         ]
 
     @staticmethod
+    @SCORERS.register("B4", tier=1, requires=("key_terminology",))
     def _score_b4_terminology(
         test_case: TestCase,
         response: ModelResponse
     ) -> List[EvaluationMetric]:
         """Score B4 (Singapore Terminology) test case."""
-        key_terms = test_case.get_key_terminology()
+        artifacts = test_case.scoring_artifacts
+        key_terms = artifacts.key_terminology
         if not key_terms:
             return [ScoringService._calculate_basic_accuracy(test_case, response)]
 
-        response_lower = response.content.lower()
+        matches = artifacts.matcher.find(response.normalized_content)
         found_terms = sum(
             1 for term in key_terms
-            if term.lower() in response_lower
+            if term in matches
         )
 
         terminology_score = found_terms / len(key_terms) if key_terms else 0.0
@@ -191,13 +256,14 @@ class ScoringService:
         ]
 
     @staticmethod
+    @SCORERS.register("B5", tier=1, requires=("domain",))
     def _score_b5_classification(
         test_case: TestCase,
         response: ModelResponse
     ) -> List[EvaluationMetric]:
         """Score B5 (IT/OT Classification) test case."""
         expected_domain = test_case.domain
-        response_lower = response.content.lower()
+        response_lower = response.normalized_content
 
         classification_score = 0.0
 
@@ -235,19 +301,21 @@ class ScoringService:
         ]
 
     @staticmethod
+    @SCORERS.register("B6", tier=1, requires=("expected_violations",))
     def _score_b6_violation_detection(
         test_case: TestCase,
         response: ModelResponse
     ) -> List[EvaluationMetric]:
         """Score B6 (Code Violation Detection) test case."""
-        expected_violations = test_case.get_expected_violations()
+        artifacts = test_case.scoring_artifacts
+        expected_violations = artifacts.expected_violations
         if not expected_violations:
             return [ScoringService._calculate_basic_accuracy(test_case, response)]
 
-        response_lower = response.content.lower()
+        matches = artifacts.matcher.find(response.normalized_content)
         detected_violations = sum(
             1 for violation in expected_violations
-            if violation.lower() in response_lower
+            if violation in matches
         )
 
         detection_score = (
@@ -264,9 +332,13 @@ class ScoringService:
         ]
 
     @staticmethod
+    @SCORERS.register(
+        *REASONING_TRACK_BENCHMARKS, tier=2, requires=("expected_response", "key_facts", "forbidden_claims")
+    )
     def _score_reasoning_track(
         test_case: TestCase,
-        response: ModelResponse
+        response: ModelResponse,
+        semantic_score: Optional[float] = None
     ) -> List[EvaluationMetric]:
         """
         Tier 2: Semantic similarity + key-fact recall for reasoning track.
@@ -274,16 +346,15 @@ class ScoringService:
         Benchmarks: B8, B9, B11, B15, B17, B18, B19
 
         Uses sentence embeddings instead of Jaccard word overlap to better
-        capture semantic meaning in reasoning-heavy responses.
+        capture semantic meaning in reasoning-heavy responses. A precomputed
+        similarity (from score_responses) skips the per-test encode.
         """
-        # Initialize semantic service (singleton)
-        semantic_service = SemanticSimilarityService()
-
         # 1. Semantic similarity (replaces Jaccard)
-        semantic_score = semantic_service.calculate_similarity(
-            test_case.expected_response,
-            response.content
-        )
+        if semantic_score is None:
+            semantic_score = SemanticSimilarityService().calculate_similarity(
+                test_case.expected_response,
+                response.content
+            )
 
         # Apply penalty for low semantic similarity (Option A fix)
         # Addresses score inflation from partial answers scoring too high
@@ -307,9 +378,28 @@ class ScoringService:
         return [accuracy, completeness, grounding]
 
     @staticmethod
+    @SCORERS.register_batch(_score_reasoning_track)
+    def _score_reasoning_track_batch(
+        pairs: Sequence[Tuple[TestCase, ModelResponse]],
+        batch_size: int
+    ) -> List[List[EvaluationMetric]]:
+        """Tier 2 for a group: one batched encode and similarity matrix operation."""
+        scores = SemanticSimilarityService().calculate_pairwise_similarity(
+            [test_case.expected_response for test_case, _ in pairs],
+            [response.content for _, response in pairs],
+            batch_size=batch_size,
+        )
+        return [
+            ScoringService._score_reasoning_track(test_case, response, score)
+            for (test_case, response), score in zip(pairs, scores)
+        ]
+
+    @staticmethod
+    @SCORERS.register(*LLM_JUDGE_BENCHMARKS, tier=3, requires=("expected_response",))
     def _score_tier3_llm_judge(
         test_case: TestCase,
-        response: ModelResponse
+        response: ModelResponse,
+        evaluation: Optional[JudgeEvaluation] = None
     ) -> List[EvaluationMetric]:
         """
         Tier 3: LLM-as-Judge evaluation for subjective benchmarks.
@@ -317,14 +407,15 @@ class ScoringService:
         Benchmarks: B12, B13, B20
 
         Uses Claude as an expert judge to evaluate complex compliance reasoning
-        that requires human-like judgment.
+        that requires human-like judgment. A verdict obtained up front (from
+        score_responses) skips the per-test judgement.
         """
-        # Define rubric based on benchmark type
-        rubric = ScoringService._get_tier3_rubric(test_case.benchmark_type)
+        if evaluation is None:
+            # Define rubric based on benchmark type
+            rubric = ScoringService._get_tier3_rubric(test_case.benchmark_type)
 
-        # Use Claude as judge
-        judge_service = LLMJudgeService()
-        evaluation = judge_service.evaluate_response(test_case, response, rubric)
+            # Use Claude as judge (cached, rate-limited)
+            evaluation = JudgeDispatcher.shared().evaluate(test_case, response, rubric)
 
         # Convert judge scores to metrics
         accuracy_metric_obj = EvaluationMetric(
@@ -350,6 +441,19 @@ class ScoringService:
 
         return [accuracy_metric_obj, completeness_metric_obj, alignment_metric_obj]
 
+    @staticmethod
+    @SCORERS.register_batch(_score_tier3_llm_judge)
+    def _score_tier3_llm_judge_batch(
+        pairs: Sequence[Tuple[TestCase, ModelResponse]],
+        batch_size: int
+    ) -> List[List[EvaluationMetric]]:
+        """Tier 3 for a group: one concurrent dispatch through the shared JudgeDispatcher."""
+        verdicts = JudgeDispatcher.shared().evaluate_many(ScoringService.llm_judge_requests(pairs))
+        return [
+            ScoringService._score_tier3_llm_judge(test_case, response, evaluation)
+            for (test_case, response), evaluation in zip(pairs, verdicts)
+        ]
+
     @staticmethod
     def _get_tier3_rubric(benchmark_type: Any) -> dict[str, str]:
         """
@@ -396,21 +500,27 @@ class ScoringService:
         if response.is_empty():
             return accuracy_metric(0.0)
 
-        expected_words = set(
-            re.findall(r'\w+', test_case.expected_response.lower())
-        )
-        response_words = set(
-            re.findall(r'\w+', response.content.lower())
+        return accuracy_metric(
+            ScoringService.jaccard_similarity(test_case.scoring_artifacts.expected_words, response.word_set)
         )
 
-        if not expected_words and not response_words:
-            return accuracy_metric(0.0)
+    @staticmethod
+    def jaccard_similarity(expected_words: AbstractSet[str], response_words: AbstractSet[str]) -> float:
+        """
+        Jaccard similarity of two word sets.
 
-        intersection = len(expected_words & response_words)
-        union = len(expected_words | response_words)
+        The union size comes from inclusion-exclusion, so no union set is built.
 
-        similarity = intersection / union if union > 0 else 0.0
-        return accuracy_metric(similarity)
+        Args:
+            expected_words: Word set of the expected response
+            response_words: Word set of the model response
+
+        Returns:
+            |A & B| / |A | B| (0.0 if both are empty)
+        """
+        intersection = len(expected_words & response_words)
+        union = len(expected_words) + len(response_words) - intersection
+        return intersection / union if union > 0 else 0.0
 
     @staticmethod
     def _calculate_completeness(
@@ -442,25 +552,23 @@ class ScoringService:
 
         Measures coverage of required regulatory facts.
         """
-        key_facts = test_case.key_facts
-        if not key_facts:
+        artifacts = test_case.scoring_artifacts
+        key_fact_terms = artifacts.key_fact_terms
+        if not key_fact_terms:
             return completeness_metric(0.0)
 
-        response_lower = response.content.lower()
+        matches = artifacts.matcher.find(response.normalized_content)
         covered_facts = 0
 
-        for fact in key_facts:
-            # Extract key terms (words > 4 chars)
-            key_terms = [w for w in re.findall(r'\w+', fact.lower()) if len(w) > 4]
-
+        for key_terms in key_fact_terms:
             # Check if majority of key terms present (70% threshold - Option A fix)
             # Raised from 60% to reduce score inflation, balanced at 70% to avoid over-strictness
             if key_terms:
-                matches = sum(1 for term in key_terms if term in response_lower)
-                if matches / len(key_terms) >= 0.70:
+                found = sum(1 for term in key_terms if term in matches)
+                if found / len(key_terms) >= 0.70:
                     covered_facts += 1
 
-        completeness_score = covered_facts / len(key_facts)
+        completeness_score = covered_facts / len(key_fact_terms)
         return completeness_metric(completeness_score)
 
     @staticmethod
@@ -468,30 +576,22 @@ class ScoringService:
         test_case: TestCase,
         response: ModelResponse
     ) -> EvaluationMetric:
-        """Legacy: Sentence-based completeness (backward compatible)."""
-        expected_sentences = [
-            s.strip()
-            for s in re.split(r'[.!?]', test_case.expected_response)
-            if s.strip()
-        ]
+        """Legacy: Sentence-based completeness (backward compatible; only without key facts)."""
+        artifacts = test_case.scoring_artifacts
+        expected_sentences = artifacts.sentence_terms
 
         if not expected_sentences:
             return completeness_metric(0.5)
 
-        response_lower = response.content.lower()
+        matches = artifacts.matcher.find(response.normalized_content)
         covered_points = 0
 
-        for sentence in expected_sentences:
-            key_words = [
-                w for w in re.findall(r'\w+', sentence.lower())
-                if len(w) > 4
-            ]
-
+        for key_words in expected_sentences:
             # Require majority (60%) of keywords, not just ANY keyword (Option A fix)
             # Fixes broken OR logic that inflated scores
             if key_words:
-                matches = sum(1 for word in key_words if word in response_lower)
-                if matches / len(key_words) >= 0.6:
+                found = sum(1 for word in key_words if word in matches)
+                if found / len(key_words) >= 0.6:
                     covered_points += 1
 
         completeness_score = covered_points / len(expected_sentences) if expected_sentences else 0.0
@@ -507,31 +607,28 @@ class ScoringService:
 
         Checks if response contains the expected classification label.
         """
-        expected_label = test_case.expected_label
-        if not expected_label:
+        artifacts = test_case.scoring_artifacts
+        if artifacts.expected_label is None:
             # Fallback to Jaccard if no label provided
             return ScoringService._calculate_basic_accuracy(test_case, response)
 
-        response_lower = response.content.lower()
-        expected_lower = expected_label.lower()
+        matches = artifacts.matcher.find(response.normalized_content)
 
         # Exact match
-        if expected_lower in response_lower:
+        if artifacts.expected_label in matches:
             return accuracy_metric(1.0)
 
-        # Check for partial match (key components)
-        # Split by semicolon, colon, or "and"
-        label_components = re.split(r'[;:]|\band\b', expected_label)
-        label_components = [comp.strip() for comp in label_components if comp.strip()]
+        # Check for partial match (key components split by semicolon, colon, or "and")
+        label_components = artifacts.label_components
 
         if not label_components:
             return accuracy_metric(0.0)
 
-        matches = sum(1 for comp in label_components if comp.strip().lower() in response_lower)
+        found = sum(1 for comp in label_components if comp in matches)
 
-        if matches == len(label_components):
+        if found == len(label_components):
             return accuracy_metric(1.0)  # All components present
-        elif matches / len(label_components) >= 0.6:
+        elif found / len(label_components) >= 0.6:
             return accuracy_metric(0.7)  # Partial credit (60%+ components)
         else:
             return accuracy_metric(0.0)  # Incorrect
@@ -550,25 +647,19 @@ class ScoringService:
         if response.is_empty():
             return EvaluationMetric(name="grounding", value=1.0, weight=1.0)
 
-        response_lower = response.content.lower()
+        artifacts = test_case.scoring_artifacts
+        response_lower = response.normalized_content
+        matches = artifacts.matcher.find(response_lower)
         violations = 0
 
         # Check forbidden claims from test case
-        for claim in test_case.forbidden_claims:
-            if claim.lower() in response_lower:
+        for claim in artifacts.forbidden_claims:
+            if claim in matches:
                 violations += 1
 
         # Check for common hallucination patterns (from B1 analysis)
-        hallucination_patterns = [
-            r"cryptography.*implementation.*officer",
-            r"cryptography.*incident.*reporting.*officer",
-            r"cybersecurity classification guide",
-            r"ciio.*stands for.*cryptography",
-            r"ccop.*requires.*\w+.*that does not exist",
-        ]
-
-        for pattern in hallucination_patterns:
-            if re.search(pattern, response_lower):
+        for pattern in artifacts.grounding_patterns:
+            if pattern.search(response_lower):
                 violations += 1
 
         # Scoring
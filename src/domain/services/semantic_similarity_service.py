@@ -3,12 +3,26 @@ Semantic Similarity Service using sentence embeddings.
 
 Tier 2 scoring methodology for reasoning track benchmarks (B8, B9, B11, B15, B17, B18, B19).
 Uses sentence transformers to compute semantic similarity instead of Jaccard word overlap.
+
+sentence-transformers (and torch) are imported when the service is first
+constructed, i.e. only when a reasoning-track benchmark is scored.
 """
 
-from typing import List
+from typing import List, Optional, Protocol, Sequence
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
+
+from domain.services.embedding_model_registry import EmbeddingModelRegistry
+
+
+class EmbeddingStore(Protocol):
+    """Persistent store of reference-text embeddings (see EmbeddingCache)."""
+
+    def get(self, model_name: str, text: str) -> Optional[np.ndarray]:
+        ...
+
+    def put(self, model_name: str, text: str, embedding: np.ndarray) -> None:
+        ...
 
 
 class SemanticSimilarityService:
@@ -17,38 +31,82 @@ class SemanticSimilarityService:
 
     Implements Tier 2 scoring for reasoning track benchmarks.
     Uses all-MiniLM-L6-v2 model for efficient semantic similarity computation.
-    Singleton pattern to cache model across evaluations.
+    Services are lightweight; models are loaded once and shared through an
+    EmbeddingModelRegistry, so services for different models can be used
+    side by side (e.g., to compare embedding models in one run).
+    Reference (expected-response) embeddings are served from an optional
+    persistent store, so only model responses are encoded on repeat runs.
     """
 
-    _instance = None
-    _model = None
-    _model_name = None
+    _registry: Optional[EmbeddingModelRegistry] = None
+    _embedding_store: Optional[EmbeddingStore] = None
 
-    def __new__(cls, model_name: str = "all-MiniLM-L6-v2") -> "SemanticSimilarityService":
-        """Singleton pattern for model caching."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2") -> None:
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        registry: Optional[EmbeddingModelRegistry] = None
+    ) -> None:
         """
         Initialize semantic similarity service.
 
         Args:
             model_name: HuggingFace model name (default: all-MiniLM-L6-v2)
+            registry: Registry holding the model (default: the process-wide registry)
+        """
+        self._model_name = model_name
+        self._models = registry or self.registry()
+        # Load up front so load failures surface at construction, as before
+        self._models.get(model_name)
+
+    @classmethod
+    def registry(cls) -> EmbeddingModelRegistry:
+        """
+        Get the process-wide model registry (created on first use).
+
+        Returns:
+            Registry used by services constructed without one
         """
-        # Only initialize model once (singleton behavior)
-        if self._model is None or self._model_name != model_name:
-            self._model = SentenceTransformer(model_name)
-            self._model_name = model_name
+        if cls._registry is None:
+            cls._registry = EmbeddingModelRegistry()
+        return cls._registry
+
+    @classmethod
+    def configure_registry(cls, registry: Optional[EmbeddingModelRegistry]) -> None:
+        """
+        Set the process-wide model registry (None: a default PyTorch registry).
+
+        Args:
+            registry: Registry with the configured backend and model cap
+        """
+        cls._registry = registry
+
+    @classmethod
+    def configure_embedding_store(cls, store: Optional[EmbeddingStore]) -> None:
+        """
+        Set the persistent store for reference embeddings (None disables it).
+
+        Args:
+            store: Embedding store shared by all scoring threads
+        """
+        cls._embedding_store = store
+
+    @property
+    def model_name(self) -> str:
+        """Embedding model name."""
+        return self._model_name
+
+    @property
+    def _model(self):
+        """The resident model (reloaded if it was evicted)."""
+        return self._models.get(self._model_name)
 
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """
         Calculate cosine similarity between two texts.
 
         Args:
-            text1: First text
-            text2: Second text
+            text1: Reference text (e.g., expected response; embedding is cached)
+            text2: Text to compare (e.g., model response)
 
         Returns:
             Cosine similarity score (0.0 to 1.0)
@@ -56,7 +114,8 @@ class SemanticSimilarityService:
         if not text1 or not text2:
             return 0.0
 
-        embeddings = self._model.encode([text1, text2])
+        model = self._model
+        embeddings = [self._encode_reference(model, text1), model.encode(text2)]
         similarity = np.dot(embeddings[0], embeddings[1]) / (
             np.linalg.norm(embeddings[0]) * np.linalg.norm(embeddings[1])
         )
@@ -82,11 +141,12 @@ class SemanticSimilarityService:
         if not expected or not responses:
             return [0.0] * len(responses)
 
-        # Encode expected text once
-        expected_embedding = self._model.encode(expected)
+        # Encode expected text once (or load it from the embedding store)
+        model = self._model
+        expected_embedding = self._encode_reference(model, expected)
 
         # Batch encode all responses
-        response_embeddings = self._model.encode(responses)
+        response_embeddings = model.encode(responses)
 
         # Calculate cosine similarity for each response
         similarities = [
@@ -97,3 +157,100 @@ class SemanticSimilarityService:
         ]
         # Clamp to [0, 1] range (cosine similarity can be negative for very dissimilar texts)
         return [float(max(0.0, min(1.0, s))) for s in similarities]
+
+    def calculate_pairwise_similarity(
+        self,
+        references: Sequence[str],
+        responses: Sequence[str],
+        batch_size: int = 64,
+    ) -> List[float]:
+        """
+        Calculate similarity for many (reference, response) pairs at once.
+
+        All texts are encoded in large batches (references through the
+        embedding store) and every cosine comes from one normalized row-wise
+        product, instead of a 2-item encode per pair.
+
+        Args:
+            references: Reference texts (e.g., expected responses)
+            responses: Texts to compare, aligned with references
+            batch_size: Encoder batch size
+
+        Returns:
+            Similarity score per pair (0.0 to 1.0; 0.0 if either text is empty)
+
+        Raises:
+            ValueError: If references and responses differ in length
+        """
+        if len(references) != len(responses):
+            raise ValueError(
+                f"Got {len(references)} references but {len(responses)} responses"
+            )
+
+        scores = [0.0] * len(references)
+        valid = [i for i in range(len(references)) if references[i] and responses[i]]
+        if not valid:
+            return scores
+
+        model = self._model
+        reference_embeddings = self._encode_references(
+            model, [references[i] for i in valid], batch_size
+        )
+        response_embeddings = np.asarray(
+            model.encode([responses[i] for i in valid], batch_size=batch_size)
+        )
+
+        similarities = np.einsum(
+            "ij,ij->i",
+            self._normalize(reference_embeddings),
+            self._normalize(response_embeddings),
+        )
+        # Clamp to [0, 1] range (cosine similarity can be negative for very dissimilar texts)
+        for i, similarity in zip(valid, np.clip(similarities, 0.0, 1.0)):
+            scores[i] = float(similarity)
+        return scores
+
+    @staticmethod
+    def _normalize(embeddings: np.ndarray) -> np.ndarray:
+        """Scale each row to unit length."""
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        return embeddings / np.maximum(norms, np.finfo(embeddings.dtype).tiny)
+
+    def _encode_references(self, model, texts: List[str], batch_size: int) -> np.ndarray:
+        """Encode reference texts, reading the store and batch-encoding the misses."""
+        store = self._embedding_store
+        unique = list(dict.fromkeys(texts))
+        embeddings = {}
+        if store is not None:
+            for text in unique:
+                cached = store.get(model.cache_key, text)
+                if cached is not None:
+                    embeddings[text] = cached
+
+        missing = [text for text in unique if text not in embeddings]
+        if missing:
+            encoded = model.encode(missing, batch_size=batch_size)
+            for text, embedding in zip(missing, encoded):
+                embeddings[text] = embedding
+                if store is not None:
+                    try:
+                        store.put(model.cache_key, text, embedding)
+                    except OSError:
+                        pass  # A read-only or full cache only costs a re-encode next time
+
+        return np.stack([np.asarray(embeddings[text], dtype=np.float32) for text in texts])
+
+    def _encode_reference(self, model, text: str) -> np.ndarray:
+        """Encode a reference text, reading and filling the embedding store."""
+        store = self._embedding_store
+        if store is None:
+            return model.encode(text)
+
+        embedding = store.get(model.cache_key, text)
+        if embedding is None:
+            embedding = model.encode(text)
+            try:
+                store.put(model.cache_key, text, embedding)
+            except OSError:
+                pass  # A read-only or full cache only costs a re-encode next time
+        return embedding
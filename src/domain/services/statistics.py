@@ -0,0 +1,30 @@
+"""
+Statistics
+
+Pure summary statistics shared by the application and infrastructure
+layers (latency percentiles of runs, streamed inter-token gaps).
+"""
+
+from typing import Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """
+    Calculate a percentile using linear interpolation.
+
+    Args:
+        values: Sample values
+        pct: Percentile in the range 0-100
+
+    Returns:
+        Percentile value (0.0 for an empty sample)
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    fraction = rank - lower
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
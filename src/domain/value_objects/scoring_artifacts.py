@@ -0,0 +1,233 @@
+"""
+Scoring Artifacts Value Object
+
+Everything the rule-based scorers derive from a test case alone (token
+sets, key terms, lowercased labels and claims, compiled patterns), built
+once per test case so that scoring a response only tokenizes the response.
+
+All terms the scorers look up in a response (key-fact terms, label parts,
+forbidden claims, B4 terms, B6 violations) go into one TermMatcher, so a
+response is searched once per distinct term however many scorers and
+facts share it.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, FrozenSet, Iterable, List, Optional, Pattern, Tuple
+
+# Word tokenizer shared by all lexical scorers
+WORD_PATTERN = re.compile(r"\w+")
+
+# Minimum length of a word counted as a key term (key facts, expected sentences)
+KEY_TERM_MIN_LENGTH = 5
+
+# Common hallucination patterns (from B1 analysis), matched against lowercased responses
+HALLUCINATION_PATTERNS: Tuple[Pattern[str], ...] = tuple(
+    re.compile(pattern) for pattern in (
+        r"cryptography.*implementation.*officer",
+        r"cryptography.*incident.*reporting.*officer",
+        r"cybersecurity classification guide",
+        r"ciio.*stands for.*cryptography",
+        r"ccop.*requires.*\w+.*that does not exist",
+    )
+)
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    """Lowercased word set of a text."""
+    return frozenset(WORD_PATTERN.findall(text.lower()))
+
+
+def key_terms(text: str) -> Tuple[str, ...]:
+    """Lowercased words long enough to count as key terms (in order, with repeats)."""
+    return tuple(w for w in WORD_PATTERN.findall(text.lower()) if len(w) >= KEY_TERM_MIN_LENGTH)
+
+
+class TermMatcher:
+    """
+    Finds which of a fixed set of terms occur (as substrings) in a text.
+
+    Each distinct term is searched once per text, with CPython's substring
+    search. A single-state automaton (Aho-Corasick) in pure Python walks
+    the text one character at a time and is an order of magnitude slower
+    at the few dozen terms of a test case.
+
+    The match set of the last text is remembered, so scorers sharing a
+    response's normalized_content search it only once. A different text
+    object is searched afresh.
+    """
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        """
+        Initialize matcher.
+
+        Args:
+            terms: Terms to look for (duplicates are searched once)
+        """
+        self._terms: Tuple[str, ...] = tuple(dict.fromkeys(terms))
+        self._last: Tuple[Optional[str], FrozenSet[str]] = (None, frozenset())
+
+    @property
+    def terms(self) -> Tuple[str, ...]:
+        """Distinct terms, in first-seen order."""
+        return self._terms
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """
+        Get the terms occurring in a text.
+
+        Args:
+            text: Text to search (lowercased by the caller, like the terms)
+
+        Returns:
+            Set of terms found
+        """
+        last_text, last_matches = self._last
+        if last_text is text:
+            return last_matches
+        matches = frozenset(term for term in self._terms if term in text)
+        self._last = (text, matches)  # One tuple store: safe across scoring threads
+        return matches
+
+
+@dataclass(frozen=True)
+class ScoringArtifacts:
+    """
+    Precompiled, response-independent scoring inputs of one test case.
+
+    Attributes:
+        expected_words: Word set of the expected response (Jaccard accuracy)
+        key_fact_terms: Key terms per key fact (key-fact recall)
+        sentence_terms: Key terms per expected-response sentence (legacy completeness,
+            matched only when there are no key facts)
+        expected_label: Lowercased expected label (None: no string label)
+        label_components: Lowercased label components for partial credit
+        forbidden_claims: Lowercased fabricated claims (grounding)
+        grounding_patterns: Compiled hallucination patterns (grounding)
+        key_terminology: Lowercased B4 terms
+        expected_violations: Lowercased B6 violations
+        matcher: Matcher over every term above that is looked up in responses
+    """
+
+    expected_words: FrozenSet[str]
+    key_fact_terms: Tuple[Tuple[str, ...], ...]
+    sentence_terms: Tuple[Tuple[str, ...], ...]
+    expected_label: Optional[str]
+    label_components: Tuple[str, ...]
+    forbidden_claims: Tuple[str, ...]
+    grounding_patterns: Tuple[Pattern[str], ...]
+    key_terminology: Tuple[str, ...]
+    expected_violations: Tuple[str, ...]
+    matcher: TermMatcher = field(compare=False, repr=False)
+
+    @classmethod
+    def build(
+        cls,
+        expected_response: str,
+        key_facts: List[str],
+        expected_label: Any,
+        forbidden_claims: List[str],
+        key_terminology: List[str],
+        expected_violations: List[str],
+    ) -> "ScoringArtifacts":
+        """
+        Compile the scoring inputs of a test case.
+
+        Args:
+            expected_response: Expected/reference answer
+            key_facts: Atomic facts for completeness scoring
+            expected_label: Expected classification label (non-strings are ignored)
+            forbidden_claims: Fabricated claims to penalize
+            key_terminology: B4 key terms
+            expected_violations: B6 expected violations
+
+        Returns:
+            Compiled artifacts
+        """
+        label = expected_label if isinstance(expected_label, str) and expected_label else None
+        components: Tuple[str, ...] = ()
+        if label is not None:
+            components = tuple(
+                component.strip().lower()
+                for component in re.split(r"[;:]|\band\b", label)
+                if component.strip()
+            )
+
+        key_fact_terms = tuple(key_terms(fact) for fact in key_facts)
+        # Sentence terms only score completeness when there are no key facts
+        sentence_terms = tuple(
+            key_terms(sentence)
+            for sentence in re.split(r"[.!?]", expected_response)
+            if sentence.strip()
+        )
+        lowered_label = label.lower() if label is not None else None
+        claims = tuple(claim.lower() for claim in forbidden_claims)
+        terminology = tuple(term.lower() for term in key_terminology)
+        violations = tuple(violation.lower() for violation in expected_violations)
+
+        matched_terms: List[str] = []
+        for terms in key_fact_terms or sentence_terms:
+            matched_terms.extend(terms)
+        if lowered_label is not None:
+            matched_terms.append(lowered_label)
+        matched_terms.extend(components + claims + terminology + violations)
+
+        return cls(
+            expected_words=tokenize(expected_response),
+            key_fact_terms=key_fact_terms,
+            sentence_terms=sentence_terms,
+            expected_label=lowered_label,
+            label_components=components,
+            forbidden_claims=claims,
+            grounding_patterns=HALLUCINATION_PATTERNS,
+            key_terminology=terminology,
+            expected_violations=violations,
+            matcher=TermMatcher(matched_terms),
+        )
+
+    def to_state(self) -> Tuple[Any, ...]:
+        """
+        Get the artifacts as plain values (tuples, frozensets, strings).
+
+        Compiled patterns are module constants and are not included.
+
+        Returns:
+            State accepted by from_state
+        """
+        return (
+            self.expected_words,
+            self.key_fact_terms,
+            self.sentence_terms,
+            self.expected_label,
+            self.label_components,
+            self.forbidden_claims,
+            self.key_terminology,
+            self.expected_violations,
+            self.matcher.terms,
+        )
+
+    @classmethod
+    def from_state(cls, state: Tuple[Any, ...]) -> "ScoringArtifacts":
+        """
+        Rebuild artifacts from to_state() values without recompiling them.
+
+        Args:
+            state: Values from to_state
+
+        Returns:
+            Artifacts equal to the ones the state was taken from
+        """
+        (expected_words, key_fact_terms, sentence_terms, expected_label, label_components,
+         forbidden_claims, key_terminology, expected_violations, matched_terms) = state
+        return cls(
+            expected_words=frozenset(expected_words),
+            key_fact_terms=tuple(tuple(terms) for terms in key_fact_terms),
+            sentence_terms=tuple(tuple(terms) for terms in sentence_terms),
+            expected_label=expected_label,
+            label_components=tuple(label_components),
+            forbidden_claims=tuple(forbidden_claims),
+            grounding_patterns=HALLUCINATION_PATTERNS,
+            key_terminology=tuple(key_terminology),
+            expected_violations=tuple(expected_violations),
+            matcher=TermMatcher(matched_terms),
+        )
@@ -0,0 +1,239 @@
+"""
+Embedding Cache
+
+Persistent store of sentence embeddings keyed by model name and text hash.
+Each embedding model gets an append-only float32 matrix that is memory
+mapped for lookups, plus a line-per-row index, so ground-truth embeddings
+are computed once per dataset version and shared across runs and processes.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+class _ModelStore:
+    """
+    Embeddings of a single model.
+
+    Layout of `<cache_dir>/<model>/`:
+        meta.json    - model name and embedding dimension
+        vectors.f32  - row-major float32 matrix (one row per text)
+        index.txt    - "<text sha256> <row>" per line
+
+    Rows are appended before their index line, so an interrupted write
+    leaves at most an unindexed (ignored) row behind.
+    """
+
+    def __init__(self, directory: Path, model_name: str) -> None:
+        self._dir = directory
+        self._model_name = model_name
+        self._meta_path = directory / "meta.json"
+        self._vectors_path = directory / "vectors.f32"
+        self._index_path = directory / "index.txt"
+
+        self._dim: Optional[int] = None
+        self._rows: Dict[str, int] = {}
+        self._index_offset = 0
+        self._vectors: Optional[np.memmap] = None
+
+        self._refresh()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Look up an embedding, picking up rows written by other processes on a miss."""
+        if key not in self._rows:
+            self._refresh()
+        row = self._rows.get(key)
+        if row is None or self._vectors is None or row >= len(self._vectors):
+            return None
+        return np.array(self._vectors[row])
+
+    def put(self, key: str, embedding: np.ndarray) -> None:
+        """Append an embedding (no-op if the key is already stored)."""
+        vector = np.ascontiguousarray(embedding, dtype=np.float32).reshape(-1)
+        self._refresh()
+        if self._dim is None:
+            self._init_meta(len(vector))
+        elif len(vector) != self._dim:
+            raise ValueError(
+                f"Embedding dimension {len(vector)} does not match "
+                f"{self._dim} stored for model '{self._model_name}'"
+            )
+
+        with open(self._index_path, "a", encoding="utf-8") as index_file:
+            if fcntl is not None:
+                fcntl.flock(index_file, fcntl.LOCK_EX)
+            try:
+                self._refresh()
+                if key in self._rows:
+                    return
+
+                row_bytes = self._dim * 4
+                with open(self._vectors_path, "ab") as vectors_file:
+                    size = os.fstat(vectors_file.fileno()).st_size
+                    row = size // row_bytes
+                    if size % row_bytes:
+                        # Drop a partial row left by an interrupted write
+                        os.ftruncate(vectors_file.fileno(), row * row_bytes)
+                    vectors_file.write(vector.tobytes())
+
+                # Terminate a partial line left by an interrupted write
+                index_size = os.fstat(index_file.fileno()).st_size
+                prefix = "\n" if index_size > self._index_offset else ""
+                index_file.write(f"{prefix}{key} {row}\n")
+                index_file.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(index_file, fcntl.LOCK_UN)
+
+        self._refresh()
+
+    def _init_meta(self, dim: int) -> None:
+        """Create the store directory and record the embedding dimension."""
+        self._dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._meta_path.with_suffix(f".tmp{os.getpid()}")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"model": self._model_name, "dim": dim, "dtype": "float32"}, f)
+        os.replace(tmp_path, self._meta_path)
+        self._dim = dim
+
+    def _refresh(self) -> None:
+        """Read index lines appended since the last refresh and re-map the matrix."""
+        if self._dim is None:
+            if not self._meta_path.exists():
+                return
+            with open(self._meta_path, "r", encoding="utf-8") as f:
+                self._dim = json.load(f)["dim"]
+
+        if not self._index_path.exists():
+            return
+
+        if self._index_path.stat().st_size != self._index_offset:
+            with open(self._index_path, "rb") as f:
+                f.seek(self._index_offset)
+                data = f.read()
+            complete = data[:data.rfind(b"\n") + 1]  # Ignore a partially written line
+            for line in complete.decode("utf-8").splitlines():
+                fields = line.split()
+                if len(fields) == 2 and len(fields[0]) == 64 and fields[1].isdigit():
+                    self._rows.setdefault(fields[0], int(fields[1]))
+            self._index_offset += len(complete)
+
+        rows = self._vectors_path.stat().st_size // (self._dim * 4) if self._vectors_path.exists() else 0
+        if rows and (self._vectors is None or len(self._vectors) != rows):
+            self._vectors = np.memmap(
+                self._vectors_path,
+                dtype=np.float32,
+                mode="r",
+                shape=(rows, self._dim),
+            )
+
+
+class EmbeddingCache:
+    """
+    Disk-backed embedding cache shared by the Tier 2 similarity scorers.
+
+    Keys are the SHA-256 of the text, so an edited ground-truth answer is
+    simply a miss; stale rows are never served.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        """
+        Initialize embedding cache.
+
+        Args:
+            cache_dir: Directory holding one sub-directory per embedding model
+        """
+        self._cache_dir = Path(cache_dir)
+        self._lock = threading.Lock()
+        self._stores: Dict[str, _ModelStore] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @staticmethod
+    def make_key(text: str) -> str:
+        """
+        Build the cache key of a text.
+
+        Args:
+            text: Embedded text
+
+        Returns:
+            SHA-256 hex digest of the UTF-8 text
+        """
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, model_name: str, text: str) -> Optional[np.ndarray]:
+        """
+        Look up the embedding of a text.
+
+        Args:
+            model_name: Embedding model name
+            text: Embedded text
+
+        Returns:
+            Embedding (float32 copy), or None on a miss
+        """
+        with self._lock:
+            embedding = self._store(model_name).get(self.make_key(text))
+            if embedding is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return embedding
+
+    def put(self, model_name: str, text: str, embedding: np.ndarray) -> None:
+        """
+        Store the embedding of a text.
+
+        Args:
+            model_name: Embedding model name
+            text: Embedded text
+            embedding: 1-D embedding vector
+
+        Raises:
+            ValueError: If the dimension differs from the model's stored embeddings
+        """
+        with self._lock:
+            self._store(model_name).put(self.make_key(text), embedding)
+            self.writes += 1
+
+    def stats(self) -> Dict[str, any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, writes and entries (loaded models)
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "writes": self.writes,
+                "entries": sum(len(store) for store in self._stores.values()),
+            }
+
+    def _store(self, model_name: str) -> _ModelStore:
+        """Get (opening on first use) the store of a model."""
+        if model_name not in self._stores:
+            directory = self._cache_dir / re.sub(r"[^A-Za-z0-9._-]+", "__", model_name)
+            self._stores[model_name] = _ModelStore(directory, model_name)
+        return self._stores[model_name]
@@ -0,0 +1,178 @@
+"""
+Response Cache
+
+Content-addressed on-disk cache of model responses.
+One JSON file per entry, evicted least-recently-used once the cache
+exceeds its size cap.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class ResponseCache:
+    """
+    On-disk LRU cache of generated responses keyed by content hash.
+
+    Entries are stored as `<cache_dir>/<key[:2]>/<key>.json`. Recency is the
+    file mtime (touched on every hit), so LRU order survives restarts.
+    """
+
+    def __init__(self, cache_dir: Path, max_size_mb: int = 512) -> None:
+        """
+        Initialize response cache.
+
+        Args:
+            cache_dir: Directory holding cache entries
+            max_size_mb: Size cap in megabytes (oldest entries evicted beyond it)
+
+        Raises:
+            ValueError: If max_size_mb is less than 1
+        """
+        if max_size_mb < 1:
+            raise ValueError(f"max_size_mb must be >= 1, got {max_size_mb}")
+
+        self._cache_dir = Path(cache_dir)
+        self._max_bytes = max_size_mb * 1024 * 1024
+        self._lock = threading.Lock()
+        self._entries: Optional[OrderedDict] = None  # key -> size in bytes (LRU order)
+        self._total_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(**fields: any) -> str:
+        """
+        Build a content-addressed key from the fields that determine a response.
+
+        Args:
+            **fields: Key fields (model, digest, prompts, sampling parameters)
+
+        Returns:
+            SHA-256 hex digest of the canonical JSON encoding
+        """
+        canonical = json.dumps(fields, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, any]]:
+        """
+        Look up an entry and mark it most recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached entry, or None on a miss
+        """
+        with self._lock:
+            entries = self._load_index()
+            path = self._path(key)
+            if key not in entries:
+                self.misses += 1
+                return None
+
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+                os.utime(path)
+            except (OSError, json.JSONDecodeError):
+                # Entry removed or corrupted out from under us
+                self._forget(key)
+                self.misses += 1
+                return None
+
+            entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: Dict[str, any]) -> None:
+        """
+        Store an entry (atomically) and evict LRU entries beyond the size cap.
+
+        Args:
+            key: Cache key
+            entry: JSON-serializable entry
+        """
+        data = json.dumps(entry, ensure_ascii=False, default=str).encode("utf-8")
+        path = self._path(key)
+
+        with self._lock:
+            entries = self._load_index()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+            self._forget(key, delete=False)
+            entries[key] = len(data)
+            self._total_bytes += len(data)
+            self.writes += 1
+            self._evict()
+
+    def stats(self) -> Dict[str, any]:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate, writes, evictions, entries, size_bytes
+        """
+        with self._lock:
+            entries = self._load_index()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "entries": len(entries),
+                "size_bytes": self._total_bytes,
+            }
+
+    def _load_index(self) -> OrderedDict:
+        """Scan the cache directory once, ordering entries by mtime (oldest first)."""
+        if self._entries is None:
+            found = []
+            if self._cache_dir.exists():
+                for path in self._cache_dir.glob("*/*.json"):
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    found.append((stat.st_mtime, path.stem, stat.st_size))
+
+            found.sort()
+            self._entries = OrderedDict((key, size) for _, key, size in found)
+            self._total_bytes = sum(size for _, _, size in found)
+        return self._entries
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until under the size cap."""
+        while self._total_bytes > self._max_bytes and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            self._forget(key)
+            self.evictions += 1
+
+    def _forget(self, key: str, delete: bool = True) -> None:
+        """Drop an entry from the index (and from disk if delete is set)."""
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+        if delete:
+            try:
+                self._path(key).unlink()
+            except FileNotFoundError:
+                pass
+
+    def _path(self, key: str) -> Path:
+        """Get the file path of an entry."""
+        return self._cache_dir / key[:2] / f"{key}.json"
@@ -0,0 +1,244 @@
+"""
+Embedding Encoders
+
+Pluggable sentence-embedding backends for Tier 2 scoring:
+
+- torch: sentence-transformers on PyTorch (fp32), the reference backend
+- onnx:  the same model exported to ONNX and run by ONNX Runtime, optionally
+         with dynamic int8 quantization, for CPU-only scoring hosts
+
+Heavy dependencies (torch, sentence-transformers, onnxruntime/optimum) are
+imported when an encoder is built, never at module import.
+"""
+
+import re
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+# Dynamic int8 quantization targets supported by sentence-transformers' ONNX export
+ONNX_QUANTIZATION_CONFIGS = ("arm64", "avx2", "avx512", "avx512_vnni")
+
+
+class EmbeddingBackend(str, Enum):
+    """Embedding inference backend."""
+
+    TORCH = "torch"
+    ONNX = "onnx"
+
+
+class SentenceTransformerEncoder:
+    """Encoder backed by a sentence-transformers model (PyTorch or ONNX Runtime)."""
+
+    def __init__(self, model, cache_key: str) -> None:
+        """
+        Initialize encoder.
+
+        Args:
+            model: Loaded SentenceTransformer
+            cache_key: Identity used for cached embeddings (model + backend + precision)
+        """
+        self._model = model
+        self.cache_key = cache_key
+
+    def encode(self, texts, batch_size: int = 32) -> np.ndarray:
+        """Encode one text (1-D result) or a list of texts (2-D result)."""
+        return self._model.encode(texts, batch_size=batch_size)
+
+
+class EmbeddingEncoderFactory:
+    """
+    Builds encoders for the configured backend.
+
+    Used by EmbeddingModelRegistry to load an embedding model by name.
+    """
+
+    def __init__(
+        self,
+        backend: EmbeddingBackend | str = EmbeddingBackend.TORCH,
+        threads: Optional[int] = None,
+        quantization: Optional[str] = None,
+        export_dir: Optional[Path] = None,
+    ) -> None:
+        """
+        Initialize encoder factory.
+
+        Args:
+            backend: torch or onnx
+            threads: Intra-op CPU threads (None: library default)
+            quantization: ONNX only: int8 target (arm64, avx2, avx512, avx512_vnni)
+            export_dir: ONNX only: where locally exported (quantized) models are kept
+
+        Raises:
+            ValueError: If the quantization target is unknown or used without onnx
+        """
+        self._backend = EmbeddingBackend(backend)
+        if quantization is not None:
+            if quantization not in ONNX_QUANTIZATION_CONFIGS:
+                raise ValueError(
+                    f"Unknown quantization '{quantization}' "
+                    f"(expected one of {', '.join(ONNX_QUANTIZATION_CONFIGS)})"
+                )
+            if self._backend != EmbeddingBackend.ONNX:
+                raise ValueError("Quantization requires the onnx embedding backend")
+
+        self._threads = threads
+        self._quantization = quantization
+        self._export_dir = Path(export_dir or Path.home() / ".cache" / "ccop-onnx")
+
+    @property
+    def backend(self) -> EmbeddingBackend:
+        """Configured backend."""
+        return self._backend
+
+    def cache_key(self, model_name: str) -> str:
+        """
+        Identity of embeddings produced for a model by this backend.
+
+        PyTorch embeddings keep the bare model name (the reference); ONNX and
+        quantized embeddings get their own key so they never mix.
+        """
+        if self._backend == EmbeddingBackend.TORCH:
+            return model_name
+        if self._quantization:
+            return f"{model_name}@onnx-qint8-{self._quantization}"
+        return f"{model_name}@onnx"
+
+    def __call__(self, model_name: str) -> SentenceTransformerEncoder:
+        """
+        Load an encoder for a model.
+
+        Args:
+            model_name: sentence-transformers model name (e.g., all-MiniLM-L6-v2)
+
+        Returns:
+            Encoder with a `cache_key` identifying its embeddings
+
+        Raises:
+            ImportError: If the onnx backend's dependencies are not installed
+                (pip install "sentence-transformers[onnx]")
+        """
+        if self._backend == EmbeddingBackend.TORCH:
+            model = self._load_torch(model_name)
+        else:
+            model = self._load_onnx(model_name)
+        return SentenceTransformerEncoder(model, cache_key=self.cache_key(model_name))
+
+    def _load_torch(self, model_name: str):
+        """Load the PyTorch model on CPU threads from settings."""
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        if self._threads:
+            torch.set_num_threads(self._threads)
+        return SentenceTransformer(model_name)
+
+    def _load_onnx(self, model_name: str):
+        """
+        Load the ONNX model, exporting (and quantizing) it locally if needed.
+
+        Pre-exported files on the Hub (onnx/model.onnx, onnx/model_qint8_<target>.onnx)
+        are used directly; otherwise the model is exported into export_dir once.
+        """
+        from sentence_transformers import SentenceTransformer
+
+        model_kwargs = {"provider": "CPUExecutionProvider"}
+        if self._threads:
+            import onnxruntime
+
+            session_options = onnxruntime.SessionOptions()
+            session_options.intra_op_num_threads = self._threads
+            model_kwargs["session_options"] = session_options
+
+        if not self._quantization:
+            return SentenceTransformer(model_name, backend="onnx", model_kwargs=model_kwargs)
+
+        file_name = f"onnx/model_qint8_{self._quantization}.onnx"
+        local_dir = self._export_dir / re.sub(r"[^A-Za-z0-9._-]+", "__", model_name)
+        if (local_dir / file_name).exists():
+            return SentenceTransformer(
+                str(local_dir), backend="onnx", model_kwargs={**model_kwargs, "file_name": file_name}
+            )
+
+        try:
+            return SentenceTransformer(
+                model_name, backend="onnx", model_kwargs={**model_kwargs, "file_name": file_name}
+            )
+        except (OSError, ValueError):
+            pass  # Not published on the Hub; export and quantize locally
+
+        from sentence_transformers.backend import export_dynamic_quantized_onnx_model
+
+        fp32_model = SentenceTransformer(model_name, backend="onnx", model_kwargs=model_kwargs)
+        fp32_model.save_pretrained(str(local_dir))
+        export_dynamic_quantized_onnx_model(fp32_model, self._quantization, str(local_dir))
+        return SentenceTransformer(
+            str(local_dir), backend="onnx", model_kwargs={**model_kwargs, "file_name": file_name}
+        )
+
+
+@dataclass
+class EmbeddingParityReport:
+    """Cosine-score drift of a candidate backend against the PyTorch baseline."""
+
+    pairs: int
+    max_abs_diff: float
+    mean_abs_diff: float
+    tolerance: float
+
+    @property
+    def passed(self) -> bool:
+        """Whether every score stays within tolerance of the baseline."""
+        return self.max_abs_diff <= self.tolerance
+
+
+def check_embedding_parity(
+    candidate,
+    baseline,
+    references: Sequence[str],
+    responses: Sequence[str],
+    tolerance: float = 0.02,
+    batch_size: int = 64,
+) -> EmbeddingParityReport:
+    """
+    Compare cosine scores of two encoders over the same text pairs.
+
+    Args:
+        candidate: Encoder under test (e.g., ONNX int8)
+        baseline: Reference encoder (PyTorch fp32)
+        references: Reference texts (e.g., expected responses)
+        responses: Texts compared against them
+        tolerance: Maximum allowed absolute cosine difference
+        batch_size: Encoder batch size
+
+    Returns:
+        Parity report (check `passed`)
+
+    Raises:
+        ValueError: If no pairs are given or lengths differ
+    """
+    if not references or len(references) != len(responses):
+        raise ValueError("Parity check needs equally many (non-zero) references and responses")
+
+    candidate_scores = _cosines(candidate, references, responses, batch_size)
+    baseline_scores = _cosines(baseline, references, responses, batch_size)
+    diffs = np.abs(candidate_scores - baseline_scores)
+
+    return EmbeddingParityReport(
+        pairs=len(references),
+        max_abs_diff=float(diffs.max()),
+        mean_abs_diff=float(diffs.mean()),
+        tolerance=tolerance,
+    )
+
+
+def _cosines(encoder, references: Sequence[str], responses: Sequence[str], batch_size: int) -> np.ndarray:
+    """Row-wise cosine similarity of aligned text pairs."""
+    def normalized(texts: List[str]) -> np.ndarray:
+        embeddings = np.asarray(encoder.encode(list(texts), batch_size=batch_size), dtype=np.float64)
+        return embeddings / np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+
+    return np.einsum("ij,ij->i", normalized(references), normalized(responses))
@@ -0,0 +1,216 @@
+"""
+Caching Model Gateway
+
+IModelGateway decorator that serves repeated generations from a
+content-addressed ResponseCache, so re-scoring a suite after a scoring
+change does not regenerate every answer.
+"""
+
+import asyncio
+from enum import Enum
+from typing import Dict, Optional
+
+from application.ports.output.i_logger import ILogger
+from application.ports.output.i_model_gateway import IModelGateway
+from domain.entities.model_response import ModelResponse
+from infrastructure.adapters.cache.response_cache import ResponseCache
+from infrastructure.external.ollama_client import OllamaClient
+
+
+class CacheMode(str, Enum):
+    """Response cache behaviour for a run."""
+
+    READ_WRITE = "read-write"  # Serve hits, store misses
+    READ_ONLY = "read-only"    # Serve hits, never store
+    REFRESH = "refresh"        # Always generate, overwrite entries
+    OFF = "off"                # Bypass the cache entirely
+
+
+class CachingModelGateway(IModelGateway):
+    """
+    Model gateway decorator with an on-disk response cache.
+
+    The cache key hashes the model name and its Ollama digest (so a
+    re-created model never serves stale answers), the system prompt, the
+    prompt and all sampling parameters.
+
+    A hit replays the stored answer with its original latency and server
+    timings, so the cache is off unless enabled: use it for re-scoring or
+    deterministic (temperature 0) runs, not to measure a model.
+    """
+
+    def __init__(
+        self,
+        gateway: IModelGateway,
+        cache: ResponseCache,
+        logger: ILogger,
+        mode: CacheMode | str = CacheMode.OFF,
+        ollama_client: Optional[OllamaClient] = None,
+    ) -> None:
+        """
+        Initialize caching gateway.
+
+        Args:
+            gateway: Gateway that generates responses on a cache miss
+            cache: Response cache
+            logger: Logger
+            mode: Cache mode (read-write, read-only, refresh, off)
+            ollama_client: Optional Ollama client used to resolve model digests
+        """
+        self._gateway = gateway
+        self._cache = cache
+        self._logger = logger
+        self._mode = CacheMode(mode)
+        self._ollama_client = ollama_client
+        self._digests: Dict[str, str] = {}
+
+    @property
+    def cache_mode(self) -> CacheMode:
+        """Current cache mode."""
+        return self._mode
+
+    @cache_mode.setter
+    def cache_mode(self, mode: CacheMode | str) -> None:
+        self._mode = CacheMode(mode)
+
+    def cache_stats(self) -> Dict[str, any]:
+        """
+        Get response cache counters.
+
+        Returns:
+            Dictionary with mode, hits, misses, hit_rate, writes, evictions, entries, size_bytes
+        """
+        return {"mode": self._mode.value, **self._cache.stats()}
+
+    def reset_retry_budget(self) -> None:
+        """Give the wrapped gateway its full retry budget (no-op if it does not retry)."""
+        reset = getattr(self._gateway, "reset_retry_budget", None)
+        if reset is not None:
+            reset()
+
+    async def generate_response(
+        self,
+        prompt: str,
+        model_name: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+        top_p: float = 0.9,
+        top_k: int = 40,
+        system_prompt: Optional[str] = None,
+        metadata: Optional[Dict[str, any]] = None,
+    ) -> ModelResponse:
+        """Generate a response, serving it from the cache when possible."""
+        if self._mode == CacheMode.OFF:
+            return await self._gateway.generate_response(
+                prompt=prompt,
+                model_name=model_name,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                top_k=top_k,
+                system_prompt=system_prompt,
+                metadata=metadata,
+            )
+
+        key = ResponseCache.make_key(
+            model=model_name,
+            digest=await self._model_digest(model_name),
+            system_prompt=system_prompt,
+            prompt=prompt,
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            max_tokens=max_tokens,
+        )
+
+        # Cache reads and writes hit the disk: keep them off the event loop
+        if self._mode != CacheMode.REFRESH:
+            entry = await asyncio.to_thread(self._cache.get, key)
+            if entry is not None:
+                return self._from_entry(entry, metadata)
+
+        response = await self._gateway.generate_response(
+            prompt=prompt,
+            model_name=model_name,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            top_k=top_k,
+            system_prompt=system_prompt,
+            metadata=metadata,
+        )
+
+        if self._mode != CacheMode.READ_ONLY:
+            await asyncio.to_thread(self._cache.put, key, self._to_entry(response))
+
+        return response
+
+    async def is_model_available(self, model_name: str) -> bool:
+        """Check if a model is available for inference."""
+        return await self._gateway.is_model_available(model_name)
+
+    async def list_available_models(self) -> list[str]:
+        """List all available models."""
+        return await self._gateway.list_available_models()
+
+    async def get_model_info(self, model_name: str) -> Dict[str, any]:
+        """Get information about a specific model."""
+        return await self._gateway.get_model_info(model_name)
+
+    async def _model_digest(self, model_name: str) -> str:
+        """
+        Resolve (and memoize) the Ollama digest of a model.
+
+        Returns an empty string if the digest cannot be resolved; entries are
+        then keyed on the model name alone.
+        """
+        if model_name in self._digests:
+            return self._digests[model_name]
+
+        digest = ""
+        if self._ollama_client is not None:
+            try:
+                for model in await self._ollama_client.list_models():
+                    if model.get("name") in (model_name, f"{model_name}:latest"):
+                        digest = model.get("digest", "")
+                        break
+            except Exception as e:
+                self._logger.warning(
+                    f"Could not resolve digest for model '{model_name}': {e}"
+                )
+                return digest
+
+        self._digests[model_name] = digest
+        return digest
+
+    def _to_entry(self, response: ModelResponse) -> Dict[str, any]:
+        """Serialize a response for the cache."""
+        return {
+            "content": response.content,
+            "model_name": response.model_name,
+            "tokens_used": response.tokens_used,
+            "latency_ms": response.latency_ms,
+            "temperature": response.temperature,
+            "created_at": response.created_at.isoformat(),
+            "metadata": response.metadata,
+            "server_timings": response.server_timings,
+        }
+
+    def _from_entry(
+        self,
+        entry: Dict[str, any],
+        metadata: Optional[Dict[str, any]]
+    ) -> ModelResponse:
+        """Rebuild a response from a cache entry (new identity, original timings)."""
+        response_metadata = {**entry.get("metadata", {}), **(metadata or {})}
+        response_metadata["cache_hit"] = True
+
+        return ModelResponse(
+            content=entry["content"],
+            model_name=entry["model_name"],
+            tokens_used=entry.get("tokens_used", 0),
+            latency_ms=entry.get("latency_ms", 0),
+            temperature=entry.get("temperature", 0.7),
+            metadata=response_metadata,
+            server_timings=entry.get("server_timings"),
+        )
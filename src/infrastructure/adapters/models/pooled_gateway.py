@@ -0,0 +1,320 @@
+"""
+Pooled Model Gateway
+
+IModelGateway spreading generations across several Ollama hosts.
+Each request goes to the healthy host with the fewest requests in flight;
+hosts that keep failing (connection errors, timeouts, 5xx) are ejected and re-admitted once a health check
+(/api/tags) succeeds again. Generations go through the host's OllamaClient,
+so every ModelResponse carries Ollama's server timings and, when
+streaming, its TTFT and inter-token latency.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+from application.ports.output.i_logger import ILogger
+from application.ports.output.i_model_gateway import IModelGateway, ModelGatewayError
+from domain.entities.model_response import ModelResponse
+from infrastructure.adapters.models.retrying_gateway import is_retryable_error
+from infrastructure.external.ollama_client import OllamaClient
+
+
+def is_host_failure(error: BaseException) -> bool:
+    """
+    Classify an error as a sign the host is unhealthy.
+
+    Only transient failures of the host itself count: connection errors,
+    timeouts and 5xx responses. Permanent client errors (unknown model,
+    bad request) and retryable 4xx such as 429 mean the host answered.
+
+    Args:
+        error: Error raised by a call to the host
+
+    Returns:
+        True if the error should count toward ejecting the host
+    """
+    if not is_retryable_error(error):
+        return False
+    current: Optional[BaseException] = error
+    while current is not None:
+        if isinstance(current, httpx.HTTPStatusError):
+            return current.response.status_code >= 500
+        if isinstance(current, (httpx.TransportError, TimeoutError, ConnectionError)):
+            return True
+        current = current.__cause__ or current.__context__
+    return True
+
+
+@dataclass
+class PooledHost:
+    """Routing and health state of one host in the pool."""
+
+    host: str
+    client: OllamaClient
+    gateway: IModelGateway
+    in_flight: int = 0
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    ejections: int = 0
+    ejected_until: Optional[float] = None
+    probing: bool = False
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the host is currently admitted for routing."""
+        return self.ejected_until is None
+
+
+class PooledModelGateway(IModelGateway):
+    """
+    Model gateway routing across multiple Ollama hosts.
+
+    Routing is least-outstanding-requests, so throughput scales with the
+    number of hosts as long as the concurrency limit covers them all
+    (e.g., hosts x OLLAMA_NUM_PARALLEL).
+    """
+
+    def __init__(
+        self,
+        hosts: List[str],
+        client_factory: Callable[..., OllamaClient],
+        gateway_factory: Callable[..., IModelGateway],
+        logger: ILogger,
+        failure_threshold: int = 3,
+        ejection_seconds: float = 30.0,
+    ) -> None:
+        """
+        Initialize gateway pool.
+
+        Args:
+            hosts: Ollama endpoints (e.g., http://gpu-1:11434)
+            client_factory: Called as client_factory(host=...) to build a host's client
+                (generations are sent through it)
+            gateway_factory: Called as gateway_factory(client=...) to build a host's gateway
+                (model availability, listing and info)
+            logger: Logger
+            failure_threshold: Consecutive failures before a host is ejected
+            ejection_seconds: Time before an ejected host is health-checked again
+
+        Raises:
+            ValueError: If no hosts are given or thresholds are invalid
+        """
+        if not hosts:
+            raise ValueError("At least one host is required")
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be >= 1, got {failure_threshold}")
+
+        self._logger = logger
+        self._failure_threshold = failure_threshold
+        self._ejection_seconds = ejection_seconds
+        self._hosts: List[PooledHost] = []
+        for host in dict.fromkeys(hosts):
+            client = client_factory(host=host)
+            self._hosts.append(PooledHost(
+                host=host,
+                client=client,
+                gateway=gateway_factory(client=client),
+            ))
+
+    @property
+    def hosts(self) -> List[PooledHost]:
+        """Pool members (routing order is decided per request)."""
+        return list(self._hosts)
+
+    def pool_stats(self) -> Dict[str, Dict[str, any]]:
+        """
+        Get per-host routing counters.
+
+        Returns:
+            Dictionary mapping host to healthy, in_flight, requests, failures,
+            ejections and the client's connection/model-load counters
+        """
+        return {
+            h.host: {
+                "healthy": h.healthy,
+                "in_flight": h.in_flight,
+                "requests": h.requests,
+                "failures": h.failures,
+                "ejections": h.ejections,
+                "connections": h.client.connection_stats(),
+            }
+            for h in self._hosts
+        }
+
+    async def generate_response(
+        self,
+        prompt: str,
+        model_name: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+        top_p: float = 0.9,
+        top_k: int = 40,
+        system_prompt: Optional[str] = None,
+        metadata: Optional[Dict[str, any]] = None,
+    ) -> ModelResponse:
+        """Generate a response on the least-loaded healthy host."""
+        host = await self._select_host()
+        host.in_flight += 1
+        host.requests += 1
+        started = time.perf_counter()
+        try:
+            raw = await host.client.generate(
+                model=model_name,
+                prompt=prompt,
+                system=system_prompt,
+                temperature=temperature,
+                top_p=top_p,
+                top_k=top_k,
+                max_tokens=max_tokens,
+            )
+        except Exception as e:
+            self._record_failure(host, e)
+            raise
+        finally:
+            host.in_flight -= 1
+
+        host.consecutive_failures = 0
+        return self._to_response(
+            raw,
+            model_name=model_name,
+            temperature=temperature,
+            latency_ms=int((time.perf_counter() - started) * 1000),
+            metadata={**(metadata or {}), "host": host.host},
+        )
+
+    @staticmethod
+    def _to_response(
+        raw: Dict[str, any],
+        model_name: str,
+        temperature: float,
+        latency_ms: int,
+        metadata: Dict[str, any],
+    ) -> ModelResponse:
+        """
+        Build a ModelResponse from an Ollama generate response.
+
+        Args:
+            raw: Response from OllamaClient.generate
+            model_name: Model that generated it
+            temperature: Sampling temperature used
+            latency_ms: Client-side latency
+            metadata: Request metadata (plus the serving host)
+
+        Returns:
+            Response with server timings and, if streamed, metadata["streaming"]
+            (TTFT, inter-token latency, tokens/sec, cancellation)
+        """
+        if raw.get("streaming_metrics"):
+            metadata = {**metadata, "streaming": raw["streaming_metrics"]}
+        return ModelResponse(
+            content=raw.get("response", ""),
+            model_name=model_name,
+            tokens_used=raw.get("eval_count") or 0,
+            latency_ms=latency_ms,
+            temperature=temperature,
+            metadata=metadata,
+            server_timings=OllamaClient.server_timings(raw),
+        )
+
+    async def is_model_available(self, model_name: str) -> bool:
+        """Check if a model is available on any healthy host."""
+        for host in await self._routable_hosts():
+            try:
+                if await host.gateway.is_model_available(model_name):
+                    return True
+            except Exception as e:
+                self._logger.warning(f"Availability check failed on {host.host}: {e}")
+                self._record_failure(host, e)
+        return False
+
+    async def list_available_models(self) -> list[str]:
+        """List models available on any healthy host."""
+        models: Dict[str, None] = {}
+        for host in await self._routable_hosts():
+            try:
+                models.update(dict.fromkeys(await host.gateway.list_available_models()))
+            except Exception as e:
+                self._logger.warning(f"Listing models failed on {host.host}: {e}")
+                self._record_failure(host, e)
+        return list(models)
+
+    async def get_model_info(self, model_name: str) -> Dict[str, any]:
+        """Get model information from the least-loaded healthy host."""
+        host = await self._select_host()
+        return await host.gateway.get_model_info(model_name)
+
+    async def _select_host(self) -> PooledHost:
+        """Pick the routable host with the fewest in-flight requests."""
+        candidates = await self._routable_hosts()
+        if not candidates:
+            raise ModelGatewayError("No Ollama hosts configured")
+        return min(candidates, key=lambda h: (h.in_flight, h.requests))
+
+    async def _routable_hosts(self) -> List[PooledHost]:
+        """
+        Get healthy hosts, first re-checking ejected hosts that are due.
+
+        A host already being checked by another request is not checked
+        again; it stays out of routing until that check re-admits it. If
+        every host is ejected, the one due back soonest is returned so
+        requests keep probing instead of failing without trying.
+        """
+        now = time.monotonic()
+        for host in self._hosts:
+            if not host.healthy and not host.probing and host.ejected_until <= now:
+                await self._probe(host)
+
+        healthy = [h for h in self._hosts if h.healthy]
+        if healthy:
+            return healthy
+        return [min(self._hosts, key=lambda h: h.ejected_until)]
+
+    async def _probe(self, host: PooledHost) -> None:
+        """Health-check a host through /api/tags (one check per host at a time)."""
+        host.probing = True
+        try:
+            await host.client.list_models()
+        except Exception as e:
+            self._logger.debug(f"Health check of Ollama host {host.host} failed: {e}")
+            host.ejected_until = time.monotonic() + self._ejection_seconds
+            return
+        finally:
+            host.probing = False
+
+        if not host.healthy:
+            self._logger.info(f"Re-admitted Ollama host {host.host}")
+        host.ejected_until = None
+        host.consecutive_failures = 0
+
+    def _record_failure(self, host: PooledHost, error: BaseException) -> None:
+        """
+        Count a failed request, ejecting the host past the threshold.
+
+        Errors caused by the request rather than the host (see
+        is_host_failure) do not count, and the host having answered
+        resets its consecutive failures.
+        """
+        if not is_host_failure(error):
+            host.consecutive_failures = 0
+            return
+
+        host.failures += 1
+        host.consecutive_failures += 1
+        if host.healthy and host.consecutive_failures >= self._failure_threshold:
+            self._eject(
+                host,
+                reason=f"{host.consecutive_failures} consecutive failures"
+            )
+
+    def _eject(self, host: PooledHost, reason: str) -> None:
+        """Remove a host from routing until its next successful health check."""
+        host.ejected_until = time.monotonic() + self._ejection_seconds
+        host.ejections += 1
+        self._logger.warning(
+            f"Ejected Ollama host {host.host} ({reason}); "
+            f"re-checking in {self._ejection_seconds:.0f}s"
+        )
@@ -0,0 +1,396 @@
+"""
+Retrying Model Gateway
+
+IModelGateway decorator that retries transient backend failures with
+exponential backoff and full jitter, bounded by a per-run retry budget,
+and trips a circuit breaker that pauses dispatch while the backend is
+clearly down instead of burning through the remaining test cases.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+import httpx
+
+from application.ports.output.i_logger import ILogger
+from application.ports.output.i_model_gateway import IModelGateway, ModelGatewayError
+from domain.entities.model_response import ModelResponse
+
+T = TypeVar("T")
+
+# HTTP statuses worth retrying: timeouts, throttling and server-side failures
+RETRYABLE_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    Classify an error as transient (worth retrying) or permanent.
+
+    Transport failures (connection refused/reset, timeouts, protocol errors)
+    and throttling/5xx responses are transient. Client errors such as an
+    unknown model (404) or a bad request (400) are permanent. Wrapped errors
+    are classified by their cause.
+
+    Args:
+        error: Error raised by a gateway call
+
+    Returns:
+        True if the call may succeed when retried
+    """
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if isinstance(current, httpx.HTTPStatusError):
+            return current.response.status_code in RETRYABLE_STATUS_CODES
+        if isinstance(current, (httpx.TransportError, TimeoutError, ConnectionError)):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry attempts and backoff schedule for gateway calls."""
+
+    max_attempts: int = 3
+    base_delay_s: float = 0.5
+    max_delay_s: float = 8.0
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError(f"max_attempts must be >= 1, got {self.max_attempts}")
+        if self.base_delay_s < 0 or self.max_delay_s < 0:
+            raise ValueError("Backoff delays must be non-negative")
+
+    def backoff(self, attempt: int, rng: random.Random) -> float:
+        """
+        Delay before retrying after a failed attempt ("full jitter").
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            rng: Random source
+
+        Returns:
+            Delay in seconds, uniform in [0, min(max_delay, base * 2^(attempt-1))]
+        """
+        ceiling = min(self.max_delay_s, self.base_delay_s * (2 ** (attempt - 1)))
+        return rng.uniform(0, ceiling)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"        # Calls flow normally
+    OPEN = "open"            # Backend down; calls wait for the cool-down
+    HALF_OPEN = "half-open"  # One trial call decides whether to close again
+
+
+@dataclass(frozen=True)
+class CircuitTicket:
+    """Admission of one call: the circuit generation it was admitted in and whether it is the trial."""
+
+    generation: int
+    trial: bool = False
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker that pauses callers while the backend is down.
+
+    After `failure_threshold` consecutive transient failures the circuit
+    opens. Callers then wait (rather than fail) until `reset_timeout_s` has
+    passed, when a single trial call is let through: success closes the
+    circuit, failure re-opens it for another cool-down.
+
+    Each opening starts a new generation. The outcome of a call admitted
+    before the circuit opened is ignored, so a slow request that succeeds
+    late cannot close an open circuit and skip the trial call.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout_s: float = 30.0) -> None:
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive transient failures that open the circuit
+            reset_timeout_s: Cool-down before a trial call is let through
+
+        Raises:
+            ValueError: If failure_threshold is less than 1 or reset_timeout_s is negative
+        """
+        if failure_threshold < 1:
+            raise ValueError(f"failure_threshold must be >= 1, got {failure_threshold}")
+        if reset_timeout_s < 0:
+            raise ValueError(f"reset_timeout_s must be >= 0, got {reset_timeout_s}")
+
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_s = reset_timeout_s
+        self._state = CircuitState.CLOSED
+        self._generation = 0
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._trial_done: Optional[asyncio.Event] = None
+
+        self.opens = 0
+        self.paused_seconds = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current circuit state."""
+        return self._state
+
+    async def acquire(self) -> CircuitTicket:
+        """
+        Wait until a call may be dispatched.
+
+        Returns:
+            Ticket to pass to the call's record_success, record_failure or release
+        """
+        paused_since: Optional[float] = None
+        try:
+            while True:
+                if self._state == CircuitState.CLOSED:
+                    return CircuitTicket(self._generation)
+
+                if paused_since is None:
+                    paused_since = time.monotonic()
+
+                if self._state == CircuitState.OPEN:
+                    remaining = self._opened_at + self._reset_timeout_s - time.monotonic()
+                    if remaining > 0:
+                        await asyncio.sleep(remaining)
+                        continue
+                    self._state = CircuitState.HALF_OPEN
+
+                if not self._trial_in_flight:
+                    self._trial_in_flight = True
+                    self._trial_done = asyncio.Event()
+                    return CircuitTicket(self._generation, trial=True)
+
+                await self._trial_done.wait()
+        finally:
+            if paused_since is not None:
+                self.paused_seconds += time.monotonic() - paused_since
+
+    def record_success(self, ticket: Optional[CircuitTicket] = None) -> None:
+        """
+        Record a call that reached the backend; the trial call closes the circuit.
+
+        Args:
+            ticket: The call's ticket from acquire (None: a call admitted now)
+        """
+        if not self._admitted_now(ticket):
+            return
+        self._consecutive_failures = 0
+        self._state = CircuitState.CLOSED
+        self._finish_trial(ticket)
+
+    def record_failure(self, ticket: Optional[CircuitTicket] = None) -> None:
+        """
+        Record a transient failure; opens the circuit past the threshold.
+
+        Args:
+            ticket: The call's ticket from acquire (None: a call admitted now)
+        """
+        if not self._admitted_now(ticket):
+            return
+        self._consecutive_failures += 1
+        if (
+            self._state == CircuitState.HALF_OPEN
+            or self._consecutive_failures >= self._failure_threshold
+        ):
+            if self._state != CircuitState.OPEN:
+                self.opens += 1
+                self._generation += 1
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+        self._finish_trial(ticket)
+
+    def release(self, ticket: Optional[CircuitTicket] = None) -> None:
+        """
+        Release a dispatched call without an outcome (e.g., cancelled).
+
+        Args:
+            ticket: The call's ticket from acquire (None: a call admitted now)
+        """
+        self._finish_trial(ticket)
+
+    def _admitted_now(self, ticket: Optional[CircuitTicket]) -> bool:
+        """Whether a call's outcome counts: it is the trial, or was admitted while closed in this generation."""
+        if ticket is None or ticket.trial:
+            return True
+        return self._state == CircuitState.CLOSED and ticket.generation == self._generation
+
+    def _finish_trial(self, ticket: Optional[CircuitTicket]) -> None:
+        """Wake callers waiting on the half-open trial call (only the trial's own outcome ends it)."""
+        if self._trial_in_flight and (ticket is None or ticket.trial):
+            self._trial_in_flight = False
+            self._trial_done.set()
+
+
+class RetryingModelGateway(IModelGateway):
+    """
+    Model gateway decorator with retries, a retry budget and a circuit breaker.
+
+    The retry budget caps the total number of retries across a run (the
+    gateway is built once per CLI invocation), so a flaky backend degrades
+    into errored test results instead of multiplying the run time.
+    """
+
+    def __init__(
+        self,
+        gateway: IModelGateway,
+        logger: ILogger,
+        policy: Optional[RetryPolicy] = None,
+        retry_budget: int = 50,
+        breaker: Optional[CircuitBreaker] = None,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """
+        Initialize retrying gateway.
+
+        Args:
+            gateway: Gateway whose calls are retried
+            logger: Logger
+            policy: Retry policy (default: 3 attempts, 0.5s base, 8s cap)
+            retry_budget: Maximum retries across the run (0 disables retries)
+            breaker: Circuit breaker (default: opens after 5 failures for 30s)
+            rng: Random source for jitter
+
+        Raises:
+            ValueError: If retry_budget is negative
+        """
+        if retry_budget < 0:
+            raise ValueError(f"retry_budget must be >= 0, got {retry_budget}")
+
+        self._gateway = gateway
+        self._logger = logger
+        self._policy = policy or RetryPolicy()
+        self._retry_budget = retry_budget
+        self._breaker = breaker or CircuitBreaker()
+        self._rng = rng or random.Random()
+
+        self._retries = 0
+        self._failures = 0
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Circuit breaker guarding the wrapped gateway."""
+        return self._breaker
+
+    def reset_retry_budget(self) -> None:
+        """Start a new run with the full retry budget."""
+        self._retries = 0
+
+    def retry_stats(self) -> Dict[str, any]:
+        """
+        Get retry and circuit breaker counters.
+
+        Returns:
+            Dictionary with retries, retry_budget, failures (calls given up on),
+            circuit_state, circuit_opens and paused_seconds
+        """
+        return {
+            "retries": self._retries,
+            "retry_budget": self._retry_budget,
+            "failures": self._failures,
+            "circuit_state": self._breaker.state.value,
+            "circuit_opens": self._breaker.opens,
+            "paused_seconds": self._breaker.paused_seconds,
+        }
+
+    async def generate_response(
+        self,
+        prompt: str,
+        model_name: str,
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+        top_p: float = 0.9,
+        top_k: int = 40,
+        system_prompt: Optional[str] = None,
+        metadata: Optional[Dict[str, any]] = None,
+    ) -> ModelResponse:
+        """Generate a response, retrying transient failures."""
+        return await self._call(
+            "generate",
+            lambda: self._gateway.generate_response(
+                prompt=prompt,
+                model_name=model_name,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                top_k=top_k,
+                system_prompt=system_prompt,
+                metadata=metadata,
+            ),
+        )
+
+    async def is_model_available(self, model_name: str) -> bool:
+        """Check if a model is available for inference."""
+        return await self._call(
+            "availability check",
+            lambda: self._gateway.is_model_available(model_name),
+        )
+
+    async def list_available_models(self) -> list[str]:
+        """List all available models."""
+        return await self._call("list models", self._gateway.list_available_models)
+
+    async def get_model_info(self, model_name: str) -> Dict[str, any]:
+        """Get information about a specific model."""
+        return await self._call("model info", lambda: self._gateway.get_model_info(model_name))
+
+    async def _call(self, operation: str, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a gateway call under the circuit breaker and retry policy.
+
+        Raises:
+            ModelGatewayError: If a transient failure persists past the
+                policy's attempts or the retry budget is spent
+            Exception: Permanent errors are raised unchanged
+        """
+        attempt = 1
+        while True:
+            ticket = await self._breaker.acquire()
+            try:
+                result = await call()
+            except asyncio.CancelledError:
+                self._breaker.release(ticket)
+                raise
+            except Exception as e:
+                if not is_retryable_error(e):
+                    # The backend answered; the request itself is at fault
+                    self._breaker.record_success(ticket)
+                    raise
+
+                self._breaker.record_failure(ticket)
+                if attempt >= self._policy.max_attempts:
+                    self._failures += 1
+                    raise ModelGatewayError(
+                        f"{operation} failed after {attempt} attempts: {e}"
+                    ) from e
+                if self._retries >= self._retry_budget:
+                    self._failures += 1
+                    raise ModelGatewayError(
+                        f"{operation} failed and the retry budget "
+                        f"({self._retry_budget}) is spent: {e}"
+                    ) from e
+
+                delay = self._policy.backoff(attempt, self._rng)
+                self._retries += 1
+                self._logger.warning(
+                    f"Transient {operation} failure (attempt {attempt}/"
+                    f"{self._policy.max_attempts}), retrying in {delay:.2f}s: {e}"
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            self._breaker.record_success(ticket)
+            return result
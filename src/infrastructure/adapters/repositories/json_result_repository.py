@@ -4,7 +4,10 @@ JSON Result Repository
 Saves evaluation results to JSON files.
 """
 
+import asyncio
 import json
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -13,6 +16,9 @@ from uuid import UUID
 from application.ports.output.i_logger import ILogger
 from application.ports.output.i_result_repository import IResultRepository
 from domain.entities.evaluation_result import EvaluationResult
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.value_objects.evaluation_metric import EvaluationMetric
 
 
 class JSONResultRepository(IResultRepository):
@@ -21,7 +27,9 @@ class JSONResultRepository(IResultRepository):
     def __init__(self, results_dir: Path, logger: ILogger) -> None:
         self._results_dir = Path(results_dir)
         self._results_dir.mkdir(parents=True, exist_ok=True)
+        self._journals_dir = self._results_dir / "journals"
         self._logger = logger
+        self._journal_lock = threading.Lock()
 
     async def save(self, result: EvaluationResult) -> None:
         """Save single result."""
@@ -70,6 +78,11 @@ class JSONResultRepository(IResultRepository):
         # Generate filename from parameters
         filename = self._generate_filename(metadata)
         filepath = self._results_dir / filename
+        # Runs saved within the same minute get a numeric suffix instead of overwriting
+        suffix = 2
+        while filepath.exists():
+            filepath = self._results_dir / f"{Path(filename).stem}-{suffix}.json"
+            suffix += 1
 
         # Build output structure with metadata first, then results
         output = {
@@ -84,6 +97,91 @@ class JSONResultRepository(IResultRepository):
         self._logger.info(f"Saved evaluation run to: {filepath}")
         return str(filepath)
 
+    async def create_run_journal(self, run_id: str, request: Dict[str, any]) -> str:
+        """Create run journal with a header line holding the request."""
+        filepath = self._journal_path(run_id)
+        if filepath.exists():
+            return str(filepath)
+
+        self._journals_dir.mkdir(parents=True, exist_ok=True)
+        header = {
+            "type": "run",
+            "run_id": run_id,
+            "created_at": datetime.utcnow().isoformat(),
+            "request": request,
+        }
+        await asyncio.to_thread(self._append_line, filepath, header)
+
+        self._logger.info(f"Created run journal: {filepath}")
+        return str(filepath)
+
+    async def append_to_run_journal(self, run_id: str, result: EvaluationResult) -> None:
+        """Append one finished result to the run journal (flushed to disk off the event loop)."""
+        filepath = self._journal_path(run_id)
+        if not filepath.exists():
+            raise FileNotFoundError(f"No journal for run '{run_id}': {filepath}")
+
+        entry = {"type": "result", **self._serialize_for_journal(result)}
+        await asyncio.to_thread(self._append_line, filepath, entry)
+
+    async def load_run_request(self, run_id: str) -> Dict[str, any]:
+        """Load the request recorded in the journal header."""
+        for entry in self._read_journal(run_id):
+            if entry.get("type") == "run":
+                return entry.get("request", {})
+
+        raise ValueError(f"Journal for run '{run_id}' has no header")
+
+    async def load_run_results(
+        self,
+        run_id: str,
+        test_cases: List[TestCase]
+    ) -> List[EvaluationResult]:
+        """Rebuild journaled results, matched to test cases by test_id."""
+        by_test_id = {case.test_id: case for case in test_cases}
+        results: Dict[str, EvaluationResult] = {}
+
+        for entry in self._read_journal(run_id):
+            if entry.get("type") != "result":
+                continue
+
+            test_case = by_test_id.get(entry.get("test_id"))
+            if test_case is None:
+                self._logger.warning(
+                    f"Journal entry for unknown test case skipped: {entry.get('test_id')}",
+                    run_id=run_id
+                )
+                continue
+
+            results[test_case.test_id] = self._deserialize(entry, test_case)
+
+        return list(results.values())
+
+    async def load_evaluation_run_metadata(self, filepath: str) -> Dict[str, any]:
+        """Load the metadata section of a saved evaluation run."""
+        return self._read_evaluation_run(filepath).get("metadata", {})
+
+    async def load_evaluation_run(
+        self,
+        filepath: str,
+        test_cases: List[TestCase]
+    ) -> List[EvaluationResult]:
+        """Rebuild saved results, matched to test cases by test_id."""
+        by_test_id = {case.test_id: case for case in test_cases}
+        results = []
+
+        for data in self._read_evaluation_run(filepath).get("test_results", []):
+            test_case = by_test_id.get(data.get("test_id"))
+            if test_case is None:
+                self._logger.warning(
+                    f"Saved result for unknown test case skipped: {data.get('test_id')}",
+                    file=str(filepath)
+                )
+                continue
+            results.append(self._deserialize(data, test_case))
+
+        return results
+
     async def load_by_id(self, result_id: UUID) -> Optional[EvaluationResult]:
         """Load result by ID (not implemented - stub)."""
         return None
@@ -119,12 +217,14 @@ class JSONResultRepository(IResultRepository):
             "score": result.overall_score,
             "passed": result.passed,
             "metrics": [
-                {"name": m.name, "value": m.value, "weight": m.weight}
+                {"name": m.name, "value": m.value, "weight": m.weight, "description": m.description}
                 for m in result.metrics
             ],
             "tokens": result.model_response.tokens_used,
             "latency_ms": result.model_response.latency_ms,
+            "server_timings": result.model_response.server_timings,
             "evaluated_at": result.evaluated_at.isoformat(),
+            "metadata": result.metadata,
         }
 
     def _serialize_with_question(self, result: EvaluationResult) -> dict:
@@ -134,11 +234,113 @@ class JSONResultRepository(IResultRepository):
         serialized["question"] = result.test_case.question
         return serialized
 
+    def _serialize_for_journal(self, result: EvaluationResult) -> dict:
+        """Serialize result with the extra fields needed to rebuild it."""
+        serialized = self._serialize_with_question(result)
+        serialized["response_id"] = str(result.model_response.response_id)
+        serialized["temperature"] = result.model_response.temperature
+        serialized["response_metadata"] = result.model_response.metadata
+        serialized["evaluator_notes"] = result.evaluator_notes
+        return serialized
+
+    def _deserialize(self, data: dict, test_case: TestCase) -> EvaluationResult:
+        """
+        Rebuild an EvaluationResult from its serialized form.
+
+        Args:
+            data: Serialized result (journal entry or saved test result)
+            test_case: Test case the result belongs to
+
+        Returns:
+            Evaluation result with its original score and pass/fail
+        """
+        model_response = ModelResponse(
+            response_id=UUID(data["response_id"]) if data.get("response_id") else None,
+            content=data.get("response", ""),
+            model_name=data.get("model", ""),
+            tokens_used=data.get("tokens", 0),
+            latency_ms=data.get("latency_ms", 0),
+            temperature=data.get("temperature", 0.7),
+            metadata=data.get("response_metadata", {}),
+            server_timings=data.get("server_timings"),
+        )
+
+        metrics = [
+            EvaluationMetric(
+                name=m["name"],
+                value=m["value"],
+                weight=m.get("weight", 1.0),
+                description=m.get("description"),
+            )
+            for m in data.get("metrics", [])
+        ]
+
+        return EvaluationResult(
+            test_case=test_case,
+            model_response=model_response,
+            result_id=UUID(data["result_id"]) if data.get("result_id") else None,
+            metrics=metrics,
+            overall_score=data.get("score"),
+            passed=data.get("passed"),
+            evaluator_notes=data.get("evaluator_notes", ""),
+            evaluated_at=(
+                datetime.fromisoformat(data["evaluated_at"])
+                if data.get("evaluated_at") else None
+            ),
+            metadata=data.get("metadata", {}),
+        )
+
+    def _read_evaluation_run(self, filepath: str) -> dict:
+        """Read a saved evaluation run file."""
+        path = Path(filepath)
+        if not path.exists():
+            raise FileNotFoundError(f"Result file not found: {filepath}")
+
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _journal_path(self, run_id: str) -> Path:
+        """Get journal filepath for a run."""
+        return self._journals_dir / f"{run_id}.jsonl"
+
+    def _append_line(self, filepath: Path, entry: dict) -> None:
+        """Append one JSON line and force it to disk (survives crashes; thread-safe)."""
+        line = json.dumps(entry, default=str) + "\n"
+        with self._journal_lock, open(filepath, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _read_journal(self, run_id: str) -> List[dict]:
+        """
+        Read journal entries for a run.
+
+        A truncated final line (crash mid-write) is ignored.
+        """
+        filepath = self._journal_path(run_id)
+        if not filepath.exists():
+            raise FileNotFoundError(f"No journal for run '{run_id}': {filepath}")
+
+        entries = []
+        with open(filepath, "r", encoding="utf-8") as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    self._logger.warning(
+                        f"Skipping unreadable journal line {line_num}",
+                        file=str(filepath)
+                    )
+        return entries
+
     def _generate_filename(self, metadata: Dict[str, any]) -> str:
         """
         Generate filename from evaluation parameters.
 
-        Format: result-{model}-[phase-{phase}]-[tier-{tier}]-[benchmark-{benchmark}]-{timestamp}.json
+        Format: result-{model}-[phase-{phase}]-[tier-{tier}]-[rescored]-[benchmark-{benchmark}]-{timestamp}.json
         Omit optional parts if not available.
 
         Args:
@@ -157,6 +359,9 @@ class JSONResultRepository(IResultRepository):
         if metadata.get("tier"):
             parts.append(f"tier-{metadata['tier']}")
 
+        if metadata.get("rescored_from"):
+            parts.append("rescored")
+
         if metadata.get("benchmarks"):
             # If single benchmark, add it; if multiple, add "multi"
             benchmarks = metadata["benchmarks"]
@@ -3,11 +3,14 @@ JSONL Test Case Repository
 
 Loads test cases from JSONL files with auto-discovery.
 Discovers all b*.jsonl files and builds mapping dynamically.
+Each file is parsed at most once; lookups go through a TestCaseIndex.
+Files unchanged since `dataset compile` are loaded from the compiled
+snapshot (validated records plus scoring artifacts) instead of JSONL.
 """
 
 import json
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from application.ports.output.i_logger import ILogger
 from application.ports.output.i_test_case_repository import ITestCaseRepository
@@ -15,16 +18,35 @@ from domain.entities.test_case import TestCase
 from domain.value_objects.benchmark_type import BenchmarkType
 from domain.value_objects.ccop_section import CCoPSection
 from domain.value_objects.difficulty_level import DifficultyLevel
+from domain.value_objects.scoring_artifacts import ScoringArtifacts
+from infrastructure.adapters.repositories.test_case_index import TestCaseIndex
+from infrastructure.adapters.repositories.test_suite_snapshot import (
+    SnapshotEntry,
+    TestSuiteSnapshot,
+    file_digest,
+)
 
 
 class JSONLTestCaseRepository(ITestCaseRepository):
     """Repository for loading test cases from JSONL files with auto-discovery."""
 
-    def __init__(self, test_cases_dir: Path, logger: ILogger) -> None:
+    def __init__(
+        self,
+        test_cases_dir: Path,
+        logger: ILogger,
+        snapshot_path: Optional[Path] = None,
+        use_snapshot: bool = True,
+    ) -> None:
         self._test_cases_dir = Path(test_cases_dir)
         self._logger = logger
-        self._cache: Optional[List[TestCase]] = None
+        self._snapshot_path = Path(snapshot_path).expanduser() if snapshot_path else None
+        self._use_snapshot = use_snapshot
+        self._snapshot: Optional[TestSuiteSnapshot] = None
+        self._snapshot_read = False
         self._benchmark_files: Optional[Dict[str, Path]] = None
+        self._files_by_number: Dict[int, Path] = {}
+        self._parsed_files: Dict[Path, List[TestCase]] = {}
+        self._index: Optional[TestCaseIndex] = None
         self._discover_benchmark_files()
 
     def _discover_benchmark_files(self) -> None:
@@ -52,6 +74,10 @@ class JSONLTestCaseRepository(ITestCaseRepository):
                         if benchmark_type:
                             # Store mapping: benchmark_type -> filepath
                             self._benchmark_files[benchmark_type] = filepath
+                            # First file wins for a benchmark number, as with a linear scan
+                            self._files_by_number.setdefault(
+                                BenchmarkType.from_string(benchmark_type).benchmark_number, filepath
+                            )
                             self._logger.info(
                                 f"Discovered benchmark file: {filepath.name} -> {benchmark_type}"
                             )
@@ -66,37 +92,127 @@ class JSONLTestCaseRepository(ITestCaseRepository):
 
     async def load_all(self) -> List[TestCase]:
         """Load all test cases."""
-        if self._cache is not None:
-            return self._cache
-
-        all_cases = []
-        # Load from all discovered files
-        for benchmark_type_str in self._benchmark_files.keys():
-            benchmark_type = BenchmarkType.from_string(benchmark_type_str)
-            cases = await self.load_by_benchmark(benchmark_type)
-            all_cases.extend(cases)
-
-        self._cache = all_cases
-        return all_cases
+        return self._full_index().all()
 
     async def load_by_benchmark(self, benchmark_type: BenchmarkType) -> List[TestCase]:
-        """Load test cases for a specific benchmark."""
-        # Find filepath for this benchmark type
-        filepath = None
-        for bt_str, fp in self._benchmark_files.items():
-            if benchmark_type == bt_str or benchmark_type.short_name == BenchmarkType.from_string(bt_str).short_name:
-                filepath = fp
-                break
-
+        """Load test cases for a specific benchmark (parses only its file, once)."""
+        filepath = self._files_by_number.get(benchmark_type.benchmark_number)
         if not filepath:
             self._logger.warning(f"No file found for benchmark: {benchmark_type}")
             return []
 
+        return list(self._parse_file(filepath))
+
+    async def load_by_id(self, test_id: str) -> Optional[TestCase]:
+        """Load test case by ID."""
+        return self._full_index().get(test_id)
+
+    async def load_by_ids(self, test_ids: List[str]) -> List[TestCase]:
+        """Load multiple test cases by IDs."""
+        return self._full_index().get_many(test_ids)
+
+    async def load_by_difficulty(self, difficulty: DifficultyLevel) -> List[TestCase]:
+        """Load test cases of a difficulty level."""
+        return self._full_index().by_difficulty(difficulty)
+
+    async def load_by_section(self, section: CCoPSection) -> List[TestCase]:
+        """Load test cases of a CCoP section."""
+        return self._full_index().by_section(section)
+
+    async def load_by_clause(self, clause_reference: str) -> List[TestCase]:
+        """Load test cases citing a clause reference."""
+        return self._full_index().by_clause(clause_reference)
+
+    async def load_by_domain(self, domain: str) -> List[TestCase]:
+        """Load test cases of a metadata domain."""
+        return self._full_index().by_domain(domain)
+
+    async def count(self) -> int:
+        """Count total test cases."""
+        return len(self._full_index())
+
+    async def exists(self, test_id: str) -> bool:
+        """Check if test case exists."""
+        return test_id in self._full_index()
+
+    def _full_index(self) -> TestCaseIndex:
+        """Get the index over every benchmark file (parsing files not yet parsed)."""
+        if self._index is None:
+            self._index = TestCaseIndex(
+                test_case
+                for filepath in self._benchmark_files.values()
+                for test_case in self._parse_file(filepath)
+            )
+        return self._index
+
+    def compile_snapshot(self, snapshot_path: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Compile every benchmark file into a snapshot.
+
+        Each file is hashed, then parsed from JSONL and validated; records
+        that fail to parse are left out, as they are when loading JSONL.
+
+        Args:
+            snapshot_path: Snapshot file (default: the configured path)
+
+        Returns:
+            Dictionary with path, files, test_cases and bytes written
+
+        Raises:
+            ValueError: If no snapshot path is given or configured
+        """
+        path = Path(snapshot_path).expanduser() if snapshot_path else self._snapshot_path
+        if path is None:
+            raise ValueError("No test suite snapshot path configured")
+
+        entries = {}
+        for filepath in self._benchmark_files.values():
+            # Hash first: a file edited mid-compile then fails the hash check at load
+            digest = file_digest(filepath)
+            entries[filepath.name] = SnapshotEntry(
+                digest=digest,
+                records=[
+                    (record, test_case.scoring_artifacts.to_state())
+                    for record, test_case in self._read_jsonl(filepath)
+                ],
+            )
+
+        TestSuiteSnapshot(entries).write(path)
+        self._logger.info(f"Compiled test suite snapshot: {path}")
+        return {
+            "path": str(path),
+            "files": len(entries),
+            "test_cases": sum(len(entry.records) for entry in entries.values()),
+            "bytes": path.stat().st_size,
+        }
+
+    def _parse_file(self, filepath: Path) -> List[TestCase]:
+        """Parse a benchmark file on first use; later calls return the parsed test cases."""
+        if filepath in self._parsed_files:
+            return self._parsed_files[filepath]
+
         if not filepath.exists():
             self._logger.warning(f"Test case file not found: {filepath}")
             return []
 
-        test_cases = []
+        snapshot = self._load_snapshot()
+        records = snapshot.records_for(filepath) if snapshot else None
+        if records is not None:
+            test_cases = [
+                self._parse_test_case(record, ScoringArtifacts.from_state(state))
+                for record, state in records
+            ]
+        else:
+            if snapshot:
+                self._logger.info(f"{filepath.name} is new or changed since the snapshot; parsing JSONL")
+            test_cases = [test_case for _, test_case in self._read_jsonl(filepath)]
+
+        self._parsed_files[filepath] = test_cases
+        return test_cases
+
+    def _read_jsonl(self, filepath: Path) -> List[Tuple[Dict[str, Any], TestCase]]:
+        """Parse and validate a JSONL file, skipping (and logging) invalid lines."""
+        parsed = []
         with open(filepath, "r", encoding="utf-8") as f:
             for line_num, line in enumerate(f, 1):
                 try:
@@ -105,41 +221,34 @@ class JSONLTestCaseRepository(ITestCaseRepository):
                         continue
                     data = json.loads(line)
                     test_case = self._parse_test_case(data)
-                    test_cases.append(test_case)
+                    test_case.scoring_artifacts  # Compile scoring inputs once, at load
+                    parsed.append((data, test_case))
                 except Exception as e:
                     self._logger.error(
                         f"Error parsing test case at line {line_num}: {e}",
                         file=str(filepath)
                     )
+        return parsed
 
-        return test_cases
-
-    async def load_by_id(self, test_id: str) -> Optional[TestCase]:
-        """Load test case by ID."""
-        all_cases = await self.load_all()
-        for case in all_cases:
-            if case.test_id == test_id:
-                return case
-        return None
-
-    async def load_by_ids(self, test_ids: List[str]) -> List[TestCase]:
-        """Load multiple test cases by IDs."""
-        all_cases = await self.load_all()
-        test_id_set = set(test_ids)
-        return [case for case in all_cases if case.test_id in test_id_set]
-
-    async def count(self) -> int:
-        """Count total test cases."""
-        all_cases = await self.load_all()
-        return len(all_cases)
-
-    async def exists(self, test_id: str) -> bool:
-        """Check if test case exists."""
-        case = await self.load_by_id(test_id)
-        return case is not None
+    def _load_snapshot(self) -> Optional[TestSuiteSnapshot]:
+        """Read the compiled snapshot once (None if disabled, missing or stale)."""
+        if not self._snapshot_read:
+            self._snapshot_read = True
+            if self._use_snapshot and self._snapshot_path and self._snapshot_path.exists():
+                self._snapshot = TestSuiteSnapshot.read(self._snapshot_path)
+                if self._snapshot is None:
+                    self._logger.info(
+                        f"Test suite snapshot is stale or unreadable; parsing JSONL "
+                        f"(run 'dataset compile'): {self._snapshot_path}"
+                    )
+        return self._snapshot
 
-    def _parse_test_case(self, data: dict) -> TestCase:
-        """Parse JSON data to TestCase entity."""
+    def _parse_test_case(
+        self,
+        data: dict,
+        scoring_artifacts: Optional[ScoringArtifacts] = None
+    ) -> TestCase:
+        """Parse JSON data to TestCase entity (with precompiled artifacts, if given)."""
         return TestCase(
             test_id=data["test_id"],
             benchmark_type=BenchmarkType.from_string(data["benchmark_type"]),
@@ -154,4 +263,5 @@ class JSONLTestCaseRepository(ITestCaseRepository):
             key_facts=data.get("key_facts", []),
             expected_label=data.get("expected_label"),
             forbidden_claims=data.get("forbidden_claims", []),
+            scoring_artifacts=scoring_artifacts,
         )
@@ -0,0 +1,112 @@
+"""
+Test Case Index
+
+In-memory index over parsed test cases: a primary index by test ID and
+secondary indexes by benchmark, difficulty, section, clause reference and
+domain, so every lookup is a dict access plus the size of its result.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from domain.entities.test_case import TestCase
+from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.ccop_section import CCoPSection
+from domain.value_objects.difficulty_level import DifficultyLevel
+
+
+class TestCaseIndex:
+    """Parse-once index of test cases (lookups return test cases in load order)."""
+
+    def __init__(self, test_cases: Iterable[TestCase] = ()) -> None:
+        """
+        Initialize index.
+
+        Args:
+            test_cases: Test cases to index, in load order
+        """
+        self._all: List[TestCase] = []
+        self._by_id: Dict[str, TestCase] = {}
+        self._position: Dict[str, int] = {}
+        self._by_benchmark: Dict[int, List[TestCase]] = {}
+        self._by_difficulty: Dict[DifficultyLevel, List[TestCase]] = {}
+        self._by_section: Dict[str, List[TestCase]] = {}
+        self._by_clause: Dict[str, List[TestCase]] = {}
+        self._by_domain: Dict[str, List[TestCase]] = {}
+        self.add_all(test_cases)
+
+    def add_all(self, test_cases: Iterable[TestCase]) -> None:
+        """
+        Add test cases to every index.
+
+        A test ID seen before keeps its first test case in the ID index
+        (as a linear scan would find it) but is still listed everywhere else.
+
+        Args:
+            test_cases: Test cases to add, in load order
+        """
+        for test_case in test_cases:
+            self._position.setdefault(test_case.test_id, len(self._all))
+            self._by_id.setdefault(test_case.test_id, test_case)
+            self._all.append(test_case)
+            self._by_benchmark.setdefault(test_case.benchmark_type.benchmark_number, []).append(test_case)
+            self._by_difficulty.setdefault(test_case.difficulty, []).append(test_case)
+            self._by_section.setdefault(test_case.section.value, []).append(test_case)
+            self._by_clause.setdefault(test_case.clause_reference, []).append(test_case)
+            domain = test_case.get_metadata_field("domain")
+            if domain:
+                self._by_domain.setdefault(domain, []).append(test_case)
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def __contains__(self, test_id: object) -> bool:
+        return test_id in self._by_id
+
+    def all(self) -> List[TestCase]:
+        """All indexed test cases (a new list)."""
+        return list(self._all)
+
+    def get(self, test_id: str) -> Optional[TestCase]:
+        """
+        Get a test case by ID.
+
+        Args:
+            test_id: Test case ID
+
+        Returns:
+            Test case, or None if not indexed
+        """
+        return self._by_id.get(test_id)
+
+    def get_many(self, test_ids: Iterable[str]) -> List[TestCase]:
+        """
+        Get the test cases with the given IDs.
+
+        Args:
+            test_ids: Test case IDs (unknown and repeated IDs are ignored)
+
+        Returns:
+            Matching test cases in load order
+        """
+        positions = sorted({self._position[i] for i in test_ids if i in self._position})
+        return [self._all[position] for position in positions]
+
+    def by_benchmark(self, benchmark_type: BenchmarkType) -> List[TestCase]:
+        """Test cases of a benchmark (matched by benchmark number)."""
+        return list(self._by_benchmark.get(benchmark_type.benchmark_number, ()))
+
+    def by_difficulty(self, difficulty: DifficultyLevel) -> List[TestCase]:
+        """Test cases of a difficulty level."""
+        return list(self._by_difficulty.get(difficulty, ()))
+
+    def by_section(self, section: CCoPSection) -> List[TestCase]:
+        """Test cases of a CCoP section."""
+        return list(self._by_section.get(section.value, ()))
+
+    def by_clause(self, clause_reference: str) -> List[TestCase]:
+        """Test cases citing a clause reference (exact match, e.g. "5.1.5")."""
+        return list(self._by_clause.get(clause_reference, ()))
+
+    def by_domain(self, domain: str) -> List[TestCase]:
+        """Test cases of a metadata domain (e.g., "IT/OT")."""
+        return list(self._by_domain.get(domain, ()))
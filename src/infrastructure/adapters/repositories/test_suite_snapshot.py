@@ -0,0 +1,179 @@
+"""
+Test Suite Snapshot
+
+Compiled, validated snapshot of the JSONL test suite for fast cold starts.
+
+The snapshot holds, per source file, the SHA-256 of the file's bytes, the
+records that parsed into valid test cases and each test case's compiled
+scoring artifacts. It is written with the standard library's marshal
+(tuples, frozensets and dicts load natively, and loading never runs code,
+unlike pickle). A file's entry is only used while its hash matches; a
+changed file is parsed from JSONL again.
+
+The snapshot is tied to the code that compiled it: a different snapshot
+format, Python version or scoring-artifact source makes the whole
+snapshot stale.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import domain.entities.test_case as test_case_module
+import domain.value_objects.scoring_artifacts as scoring_artifacts_module
+
+SNAPSHOT_FORMAT = 1
+
+_MAGIC = b"CCOPSUITE\n"
+
+# (JSONL record, ScoringArtifacts.to_state()) per test case
+SnapshotRecord = Tuple[Dict[str, Any], Tuple[Any, ...]]
+
+
+def file_digest(path: Path) -> str:
+    """
+    Hash a file's bytes.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        SHA-256 hex digest
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def compiler_fingerprint() -> str:
+    """
+    Identify the code a snapshot is compiled with.
+
+    Covers the snapshot format, the Python and marshal versions and the
+    source of the modules that build test cases and scoring artifacts.
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256(
+        f"{SNAPSHOT_FORMAT}:{sys.version_info[:2]}:{marshal.version}".encode("utf-8")
+    )
+    for module in (test_case_module, scoring_artifacts_module):
+        source = getattr(module, "__file__", None)
+        if source and os.path.exists(source):
+            with open(source, "rb") as f:
+                digest.update(f.read())
+        else:
+            digest.update(module.__name__.encode("utf-8"))
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class SnapshotEntry:
+    """
+    Snapshot of one source file.
+
+    Attributes:
+        digest: SHA-256 of the source file when compiled
+        records: Valid records of the file with their scoring artifacts
+    """
+
+    digest: str
+    records: List[SnapshotRecord]
+
+
+class TestSuiteSnapshot:
+    """Compiled test suite, keyed by source file name."""
+
+    def __init__(self, entries: Dict[str, SnapshotEntry], fingerprint: Optional[str] = None) -> None:
+        """
+        Initialize snapshot.
+
+        Args:
+            entries: Entry per source file name
+            fingerprint: Compiler fingerprint (default: the current one)
+        """
+        self._entries = entries
+        self._fingerprint = fingerprint or compiler_fingerprint()
+
+    @property
+    def entries(self) -> Dict[str, SnapshotEntry]:
+        """Entry per source file name."""
+        return self._entries
+
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprint of the code that compiled the snapshot."""
+        return self._fingerprint
+
+    def records_for(self, filepath: Path) -> Optional[List[SnapshotRecord]]:
+        """
+        Get the compiled records of a source file if it is unchanged.
+
+        Args:
+            filepath: Source JSONL file
+
+        Returns:
+            Records, or None if the file is not in the snapshot or its hash changed
+        """
+        entry = self._entries.get(filepath.name)
+        if entry is None or not filepath.exists() or file_digest(filepath) != entry.digest:
+            return None
+        return entry.records
+
+    def write(self, path: Path) -> None:
+        """
+        Write the snapshot atomically.
+
+        Args:
+            path: Snapshot file
+        """
+        payload = {
+            "format": SNAPSHOT_FORMAT,
+            "fingerprint": self._fingerprint,
+            "files": {
+                name: (entry.digest, entry.records) for name, entry in self._entries.items()
+            },
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp{os.getpid()}")
+        with open(tmp_path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(marshal.dumps(payload))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def read(cls, path: Path) -> Optional["TestSuiteSnapshot"]:
+        """
+        Read a snapshot compiled by the current code.
+
+        Args:
+            path: Snapshot file
+
+        Returns:
+            Snapshot, or None if the file is missing, unreadable or stale
+        """
+        try:
+            with open(path, "rb") as f:
+                if f.read(len(_MAGIC)) != _MAGIC:
+                    return None
+                # loads() on the whole file: load() on a file object is far slower
+                payload = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        if not isinstance(payload, dict) or payload.get("format") != SNAPSHOT_FORMAT:
+            return None
+        if payload.get("fingerprint") != compiler_fingerprint():
+            return None
+
+        return cls(
+            {
+                name: SnapshotEntry(digest=digest, records=records)
+                for name, (digest, records) in payload["files"].items()
+            },
+            fingerprint=payload["fingerprint"],
+        )
@@ -9,17 +9,31 @@ from dependency_injector import containers, providers
 from application.use_cases.evaluate_model import EvaluateModelUseCase
 from application.use_cases.generate_report import GenerateReportUseCase
 from application.use_cases.setup_model import SetupModelUseCase
+from domain.services.embedding_model_registry import EmbeddingModelRegistry
+from domain.services.judge_dispatcher import JudgeDispatcher
+from domain.services.llm_judge_service import LLMJudgeService
+from infrastructure.adapters.cache.embedding_cache import EmbeddingCache
+from infrastructure.adapters.cache.response_cache import ResponseCache
 from infrastructure.adapters.converters.gguf_converter import GGUFConverter
+from infrastructure.adapters.embeddings.embedding_encoders import EmbeddingEncoderFactory
 from infrastructure.adapters.logging.console_logger import ConsoleLogger
 from infrastructure.adapters.logging.structlog_adapter import StructlogAdapter
+from infrastructure.adapters.models.caching_gateway import CachingModelGateway
 from infrastructure.adapters.models.mock_gateway import MockModelGateway
 from infrastructure.adapters.models.ollama_gateway import OllamaGateway
+from infrastructure.adapters.models.pooled_gateway import PooledModelGateway
+from infrastructure.adapters.models.retrying_gateway import (
+    CircuitBreaker,
+    RetryingModelGateway,
+    RetryPolicy,
+)
 from infrastructure.adapters.repositories.json_result_repository import JSONResultRepository
 from infrastructure.adapters.repositories.jsonl_test_case_repository import (
     JSONLTestCaseRepository,
 )
 from infrastructure.config.settings import Settings, get_settings
 from infrastructure.external.huggingface_client import HuggingFaceClient
+from infrastructure.external.judge_worker_pool import JudgeWorkerPool
 from infrastructure.external.ollama_client import OllamaClient
 
 
@@ -38,6 +52,18 @@ class Container(containers.DeclarativeContainer):
         OllamaClient,
         host=config.provided.ollama_host,
         timeout=config.provided.ollama_timeout,
+        stream=config.provided.ollama_stream,
+        stop_sequences=config.provided.generation_stop_sequences,
+        time_budget_s=config.provided.generation_time_budget_s,
+        connect_timeout=config.provided.ollama_connect_timeout,
+        read_timeout=config.provided.ollama_read_timeout,
+        write_timeout=config.provided.ollama_write_timeout,
+        pool_timeout=config.provided.ollama_pool_timeout,
+        max_connections=config.provided.ollama_max_connections,
+        max_keepalive_connections=config.provided.ollama_max_keepalive_connections,
+        keepalive_expiry=config.provided.ollama_keepalive_expiry,
+        http2=config.provided.ollama_http2,
+        keep_alive=config.provided.ollama_keep_alive,
     )
 
     huggingface_client = providers.Singleton(
@@ -60,10 +86,115 @@ class Container(containers.DeclarativeContainer):
     )
 
     # Model Gateway (defaults to Ollama, can be overridden with mock_mode=True)
+    # One OllamaClient/OllamaGateway per host in CCOP_OLLAMA_HOSTS (or ollama_host), least-loaded
+    # routing; generations go through the client so responses keep Ollama's timings
+    ollama_gateway = providers.Singleton(
+        PooledModelGateway,
+        hosts=config.provided.ollama_pool_hosts,
+        client_factory=providers.Factory(
+            OllamaClient,
+            timeout=config.provided.ollama_timeout,
+            stream=config.provided.ollama_stream,
+            stop_sequences=config.provided.generation_stop_sequences,
+            time_budget_s=config.provided.generation_time_budget_s,
+            connect_timeout=config.provided.ollama_connect_timeout,
+            read_timeout=config.provided.ollama_read_timeout,
+            write_timeout=config.provided.ollama_write_timeout,
+            pool_timeout=config.provided.ollama_pool_timeout,
+            max_connections=config.provided.ollama_max_connections,
+            max_keepalive_connections=config.provided.ollama_max_keepalive_connections,
+            keepalive_expiry=config.provided.ollama_keepalive_expiry,
+            http2=config.provided.ollama_http2,
+            keep_alive=config.provided.ollama_keep_alive,
+        ).provider,
+        gateway_factory=providers.Factory(
+            OllamaGateway,
+            logger=logger,
+        ).provider,
+        logger=logger,
+        failure_threshold=config.provided.ollama_host_failure_threshold,
+        ejection_seconds=config.provided.ollama_host_ejection_seconds,
+    )
+
+    # Transient failures are retried (budgeted); a circuit breaker pauses dispatch while down
+    resilient_gateway = providers.Singleton(
+        RetryingModelGateway,
+        gateway=ollama_gateway,
+        logger=logger,
+        policy=providers.Factory(
+            RetryPolicy,
+            max_attempts=config.provided.generation_max_attempts,
+            base_delay_s=config.provided.generation_retry_base_delay_s,
+            max_delay_s=config.provided.generation_retry_max_delay_s,
+        ),
+        retry_budget=config.provided.generation_retry_budget,
+        breaker=providers.Factory(
+            CircuitBreaker,
+            failure_threshold=config.provided.circuit_breaker_threshold,
+            reset_timeout_s=config.provided.circuit_breaker_reset_s,
+        ),
+    )
+
+    response_cache = providers.Singleton(
+        ResponseCache,
+        cache_dir=config.provided.response_cache_dir,
+        max_size_mb=config.provided.response_cache_max_mb,
+    )
+
+    embedding_cache = providers.Singleton(
+        EmbeddingCache,
+        cache_dir=config.provided.embedding_cache_dir,
+    )
+
+    # Tier 2 embedding backend (torch or onnx, optionally int8)
+    embedding_encoder_factory = providers.Singleton(
+        EmbeddingEncoderFactory,
+        backend=config.provided.embedding_backend,
+        threads=config.provided.embedding_threads,
+        quantization=config.provided.embedding_quantization,
+        export_dir=config.provided.embedding_onnx_dir,
+    )
+
+    # Resident embedding models shared by all scoring threads
+    embedding_model_registry = providers.Singleton(
+        EmbeddingModelRegistry,
+        factory=embedding_encoder_factory,
+        max_models=config.provided.embedding_max_models,
+    )
+
+    # Pre-started LLM judge sessions for Tier 3 scoring
+    judge_worker_pool = providers.Singleton(
+        JudgeWorkerPool,
+        command=config.provided.judge_worker_command,
+        model=config.provided.judge_model,
+        size=config.provided.judge_workers,
+        timeout_s=config.provided.judge_timeout_s,
+    )
+
+    judge_verdict_cache = providers.Singleton(
+        ResponseCache,
+        cache_dir=config.provided.judge_cache_dir,
+        max_size_mb=config.provided.judge_cache_max_mb,
+    )
+
+    # Concurrent, rate-limited Tier 3 judging (verdict store is set by the CLI)
+    judge_dispatcher = providers.Factory(
+        JudgeDispatcher,
+        judge=providers.Factory(LLMJudgeService, model_name=config.provided.judge_model),
+        max_concurrency=config.provided.judge_max_concurrency,
+        rate_per_minute=config.provided.judge_rate_per_minute,
+        burst=config.provided.judge_rate_burst,
+        batch_size=config.provided.judge_batch_size,
+    )
+
+    # Generations are served through the response cache (mode "off" bypasses it)
     model_gateway = providers.Singleton(
-        OllamaGateway,
-        client=ollama_client,
+        CachingModelGateway,
+        gateway=resilient_gateway,
+        cache=response_cache,
         logger=logger,
+        mode=config.provided.response_cache_mode,
+        ollama_client=ollama_client,
     )
 
     # Repositories
@@ -71,6 +202,8 @@ class Container(containers.DeclarativeContainer):
         JSONLTestCaseRepository,
         test_cases_dir=config.provided.test_cases_dir,
         logger=logger,
+        snapshot_path=config.provided.test_suite_snapshot_path,
+        use_snapshot=config.provided.test_suite_snapshot_enabled,
     )
 
     result_repository = providers.Singleton(
@@ -95,6 +228,11 @@ class Container(containers.DeclarativeContainer):
         test_case_repository=test_case_repository,
         result_repository=result_repository,
         logger=logger,
+        max_concurrent_evaluations=config.provided.max_concurrent_evaluations,
+        max_scoring_workers=config.provided.max_scoring_workers,
+        scoring_queue_size=config.provided.scoring_queue_size,
+        scoring_batch_size=config.provided.scoring_batch_size,
+        rescore_workers=config.provided.rescore_workers,
     )
 
     setup_model_use_case = providers.Factory(
@@ -6,7 +6,7 @@ Reads from environment variables and .env files.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -24,10 +24,110 @@ class Settings(BaseSettings):
         default="http://localhost:11434",
         description="Ollama API endpoint"
     )
+    ollama_hosts: List[str] = Field(
+        default_factory=list,
+        description="Ollama endpoints to pool generations across (if empty, uses ollama_host)"
+    )
+    ollama_host_failure_threshold: int = Field(
+        default=3,
+        ge=1,
+        description="Consecutive failures before a pooled host is ejected"
+    )
+    ollama_host_ejection_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds before an ejected host is health-checked (/api/tags) again"
+    )
     ollama_timeout: int = Field(
         default=300,
         description="Ollama request timeout in seconds"
     )
+    ollama_connect_timeout: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds to establish a connection to Ollama"
+    )
+    ollama_read_timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Seconds to wait for response data (if None, uses ollama_timeout)"
+    )
+    ollama_write_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds to send a request body"
+    )
+    ollama_pool_timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Seconds to wait for a free pooled connection (if None, uses ollama_timeout)"
+    )
+    ollama_max_connections: int = Field(
+        default=32,
+        ge=1,
+        description="Maximum open connections per Ollama host"
+    )
+    ollama_max_keepalive_connections: int = Field(
+        default=32,
+        ge=0,
+        description="Maximum idle connections kept open per Ollama host"
+    )
+    ollama_keepalive_expiry: float = Field(
+        default=120.0,
+        ge=0,
+        description="Seconds an idle connection is kept open"
+    )
+    ollama_http2: bool = Field(
+        default=False,
+        description="Use HTTP/2 to Ollama (requires httpx[http2])"
+    )
+    ollama_keep_alive: Optional[str] = Field(
+        default="30m",
+        description="Ollama keep_alive: how long the model stays loaded after a request (e.g., 30m, -1)"
+    )
+    generation_max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Attempts per gateway call on transient failures (timeouts, 429/5xx, connection errors)"
+    )
+    generation_retry_base_delay_s: float = Field(
+        default=0.5,
+        ge=0,
+        description="Base retry backoff in seconds (doubles per attempt, full jitter)"
+    )
+    generation_retry_max_delay_s: float = Field(
+        default=8.0,
+        ge=0,
+        description="Maximum retry backoff in seconds"
+    )
+    generation_retry_budget: int = Field(
+        default=50,
+        ge=0,
+        description="Maximum retries across a run (further transient failures error the test)"
+    )
+    circuit_breaker_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive transient failures that pause dispatch (circuit opens)"
+    )
+    circuit_breaker_reset_s: float = Field(
+        default=30.0,
+        ge=0,
+        description="Seconds dispatch stays paused before a trial request is let through"
+    )
+    ollama_stream: bool = Field(
+        default=False,
+        description="Stream generations (records TTFT/inter-token latency, enables early cancellation)"
+    )
+    generation_stop_sequences: List[str] = Field(
+        default_factory=list,
+        description="Streaming only: cancel a generation once its output contains any of these"
+    )
+    generation_time_budget_s: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Streaming only: cancel a generation after this many seconds"
+    )
 
     # Model Configuration
     model_name: str = Field(
@@ -52,13 +152,154 @@ class Settings(BaseSettings):
         default=Path("../ground-truth/phase-2/test-suite"),
         description="Test cases directory (Phase 2 ground truth)"
     )
+    test_suite_snapshot_enabled: bool = Field(
+        default=True,
+        description="Load unchanged test case files from the compiled snapshot (see 'dataset compile')"
+    )
+    test_suite_snapshot_path: Path = Field(
+        default=Path.home() / ".cache" / "ccop-suite" / "test-suite.snapshot",
+        description="Compiled test suite snapshot (validated test cases and scoring artifacts)"
+    )
     results_dir: Path = Field(
         default=Path("results/evaluations"),
         description="Evaluation results directory"
     )
     max_concurrent_evaluations: int = Field(
         default=3,
-        description="Maximum concurrent test evaluations"
+        ge=1,
+        description="Maximum concurrent test evaluations (size against OLLAMA_NUM_PARALLEL)"
+    )
+    max_scoring_workers: int = Field(
+        default=2,
+        ge=1,
+        description="Scoring thread pool size (Tier 2 embeddings, Tier 3 judge calls)"
+    )
+    scoring_queue_size: int = Field(
+        default=16,
+        ge=1,
+        description="Maximum generated responses waiting for scoring (backpressure bound)"
+    )
+    scoring_batch_size: int = Field(
+        default=32,
+        ge=1,
+        description="Maximum queued responses scored together (batched Tier 2 embedding encodes)"
+    )
+    rescore_workers: int = Field(
+        default=0,
+        ge=0,
+        description="Processes scoring Tier 1 when re-scoring several runs (0: one per CPU)"
+    )
+
+    # Response Cache Configuration
+    response_cache_dir: Path = Field(
+        default=Path.home() / ".cache" / "ccop-responses",
+        description="Model response cache directory"
+    )
+    response_cache_max_mb: int = Field(
+        default=512,
+        ge=1,
+        description="Response cache size cap in MB (LRU eviction beyond it)"
+    )
+    response_cache_mode: str = Field(
+        default="off",
+        pattern="^(read-write|read-only|refresh|off)$",
+        description=(
+            "Response cache mode: read-write, read-only, refresh, off. Enable it for "
+            "re-scoring or temperature 0 runs; a sampled run served from it replays answers"
+        )
+    )
+
+    # Embedding Cache Configuration (Tier 2 reference embeddings)
+    embedding_cache_enabled: bool = Field(
+        default=True,
+        description="Persist expected-response embeddings across runs"
+    )
+    embedding_cache_dir: Path = Field(
+        default=Path.home() / ".cache" / "ccop-embeddings",
+        description="Embedding cache directory (memory-mapped matrix + index per model)"
+    )
+    embedding_backend: str = Field(
+        default="torch",
+        pattern="^(torch|onnx)$",
+        description="Tier 2 embedding backend: torch (reference) or onnx (CPU-optimized ONNX Runtime)"
+    )
+    embedding_quantization: Optional[str] = Field(
+        default=None,
+        pattern="^(arm64|avx2|avx512|avx512_vnni)$",
+        description="onnx only: dynamic int8 quantization target (None keeps fp32)"
+    )
+    embedding_threads: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="CPU threads for embedding inference (None: library default)"
+    )
+    embedding_onnx_dir: Path = Field(
+        default=Path.home() / ".cache" / "ccop-onnx",
+        description="Locally exported (quantized) ONNX embedding models"
+    )
+    embedding_max_models: int = Field(
+        default=2,
+        ge=1,
+        description="Maximum embedding models resident at once (least recently used is evicted)"
+    )
+    embedding_parity_tolerance: float = Field(
+        default=0.02,
+        gt=0,
+        le=1,
+        description="Maximum cosine-score drift of the embedding backend vs. PyTorch"
+    )
+
+    # LLM Judge Configuration (Tier 3: B12, B13, B20)
+    judge_model: str = Field(
+        default="claude-sonnet-4",
+        description="Judge model for the pre-started judge sessions"
+    )
+    judge_workers: int = Field(
+        default=2,
+        ge=0,
+        description="Pre-started single-use judge sessions (0: start one process per judgement)"
+    )
+    judge_timeout_s: float = Field(
+        default=30.0,
+        gt=0,
+        description="Per-judgement timeout; a worker that exceeds it is restarted"
+    )
+    judge_worker_command: Optional[str] = Field(
+        default=None,
+        description="Judge worker command speaking stream-json (None: claude CLI)"
+    )
+    judge_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum Tier 3 judgements in flight"
+    )
+    judge_rate_per_minute: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Judgement rate limit (token bucket; None: unlimited)"
+    )
+    judge_rate_burst: int = Field(
+        default=4,
+        ge=1,
+        description="Judgements allowed back-to-back under the rate limit"
+    )
+    judge_batch_size: int = Field(
+        default=1,
+        ge=1,
+        description="Tier 3 responses judged per call (calibrate with: ccop-eval evaluate calibrate-judge)"
+    )
+    judge_cache_enabled: bool = Field(
+        default=True,
+        description="Cache judge verdicts on disk (keyed by judge model and prompt)"
+    )
+    judge_cache_dir: Path = Field(
+        default=Path.home() / ".cache" / "ccop-judge",
+        description="Judge verdict cache directory"
+    )
+    judge_cache_max_mb: int = Field(
+        default=64,
+        ge=1,
+        description="Judge verdict cache size cap in megabytes (LRU eviction)"
     )
 
     # Evaluation Phase Configuration (Phase 2)
@@ -145,6 +386,11 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
+    @property
+    def ollama_pool_hosts(self) -> List[str]:
+        """Ollama endpoints used by the gateway pool."""
+        return self.ollama_hosts or [self.ollama_host]
+
     def __init__(self, **kwargs: any) -> None:
         super().__init__(**kwargs)
         # Create directories if they don't exist
@@ -7,8 +7,6 @@ Client for downloading models from HuggingFace Hub.
 from pathlib import Path
 from typing import Optional
 
-from huggingface_hub import snapshot_download
-
 
 class HuggingFaceClient:
     """Client for HuggingFace Hub operations."""
@@ -39,6 +37,9 @@ class HuggingFaceClient:
 
         local_dir.mkdir(parents=True, exist_ok=True)
 
+        # Imported on use: huggingface_hub is slow to import and only setup needs it
+        from huggingface_hub import snapshot_download
+
         # Download model files
         path = snapshot_download(
             repo_id=repo_id,
@@ -0,0 +1,365 @@
+"""
+Judge Worker Pool
+
+Pre-started LLM judge processes for Tier 3 scoring. Instead of starting a
+`claude` process when a judgement is due, the pool keeps sessions started
+ahead of time and exchanges newline-delimited JSON with them over
+stdin/stdout (the CLI's stream-json protocol):
+
+    -> {"type": "user", "message": {"role": "user", "content": "<prompt>"}}
+    <- {"type": "result", "is_error": false, "result": "<judge reply>", ...}
+
+Other output lines (system/assistant events) are ignored. Any executable
+speaking this protocol can stand in for the judge (see judge_worker_command).
+
+Every session serves exactly one judgement and is then stopped, so no
+prompt or verdict is ever in the context of another judgement; a
+replacement is started in the background as soon as a session is taken.
+Requests from all scoring threads are spread over the sessions. A worker
+that crashes or exceeds the per-request timeout is killed and replaced on
+next use.
+"""
+
+import atexit
+import json
+import shlex
+import subprocess
+import threading
+import time
+from collections import deque
+from queue import Empty, Queue
+from typing import Dict, List, Optional, Sequence, Union
+
+_EOF = object()
+
+
+class JudgeWorkerError(RuntimeError):
+    """A judge worker process exited or could not be started."""
+
+
+def claude_judge_command(model: str) -> List[str]:
+    """
+    Build the command of a Claude judge session.
+
+    Args:
+        model: Judge model name
+
+    Returns:
+        Command line (stream-json in and out)
+    """
+    return [
+        "claude", "-p",
+        "--model", model,
+        "--input-format", "stream-json",
+        "--output-format", "stream-json",
+        "--verbose",
+    ]
+
+
+class _JudgeWorker:
+    """One judge process with reader threads for its stdout and stderr."""
+
+    def __init__(self, command: Sequence[str], worker_id: int) -> None:
+        self.worker_id = worker_id
+        try:
+            self._process = subprocess.Popen(
+                list(command),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
+            )
+        except OSError as e:
+            raise JudgeWorkerError(f"Could not start judge worker {command[0]!r}: {e}") from e
+
+        self._results: Queue = Queue()
+        self._stderr_tail: deque = deque(maxlen=20)
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+        threading.Thread(target=self._read_stderr, daemon=True).start()
+
+    @property
+    def alive(self) -> bool:
+        """Whether the process is still running."""
+        return self._process.poll() is None
+
+    def request(self, prompt: str, timeout_s: float) -> str:
+        """
+        Send one prompt and wait for its result.
+
+        Raises:
+            TimeoutError: If no result arrives within timeout_s
+            JudgeWorkerError: If the process exits before replying
+            RuntimeError: If the judge reports an error result
+        """
+        message = {"type": "user", "message": {"role": "user", "content": prompt}}
+        try:
+            self._process.stdin.write(json.dumps(message) + "\n")
+            self._process.stdin.flush()
+        except (BrokenPipeError, OSError, ValueError) as e:
+            raise JudgeWorkerError(self._exit_message()) from e
+
+        try:
+            result = self._results.get(timeout=timeout_s)
+        except Empty:
+            raise TimeoutError(f"Judge worker {self.worker_id} did not reply within {timeout_s:.0f}s")
+
+        if result is _EOF:
+            raise JudgeWorkerError(self._exit_message())
+        if result.get("is_error"):
+            raise RuntimeError(f"Judge error: {result.get('result') or result.get('subtype')}")
+        return result.get("result", "")
+
+    def stop(self) -> None:
+        """Terminate the process."""
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+        if self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+
+    def _exit_message(self) -> str:
+        """Describe why the process is gone."""
+        try:
+            code = self._process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            code = None
+        stderr = " | ".join(self._stderr_tail)
+        return f"Judge worker {self.worker_id} exited (code {code}){': ' + stderr if stderr else ''}"
+
+    def _read_stdout(self) -> None:
+        """Forward result events to the waiting request."""
+        for line in self._process.stdout:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(event, dict) and event.get("type") == "result":
+                self._results.put(event)
+        self._results.put(_EOF)
+
+    def _read_stderr(self) -> None:
+        """Keep the last stderr lines for crash reports (and keep the pipe drained)."""
+        for line in self._process.stderr:
+            self._stderr_tail.append(line.rstrip())
+
+
+class JudgeWorkerPool:
+    """
+    Pool of pre-started, single-use judge sessions shared by all scoring threads.
+
+    Workers are started on first use (runs without Tier 3 benchmarks start
+    none), stopped after one judgement, and stopped by close() or at
+    interpreter exit.
+    """
+
+    def __init__(
+        self,
+        command: Optional[Union[str, Sequence[str]]] = None,
+        model: str = "claude-sonnet-4",
+        size: int = 2,
+        timeout_s: float = 30.0,
+        max_crashes: int = 10,
+    ) -> None:
+        """
+        Initialize judge worker pool.
+
+        Args:
+            command: Worker command line (None: `claude` stream-json session for model)
+            model: Judge model name (used by the default command)
+            size: Maximum number of live workers (busy or pre-started)
+            timeout_s: Default per-request timeout
+            max_crashes: Crashes after which the pool gives up instead of restarting
+
+        Raises:
+            ValueError: If size is less than 1
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+
+        if command is None:
+            command = claude_judge_command(model)
+        elif isinstance(command, str):
+            command = shlex.split(command)
+        self._command = list(command)
+        self._size = size
+        self._timeout_s = timeout_s
+        self._max_crashes = max_crashes
+
+        self._condition = threading.Condition()
+        self._idle: List[_JudgeWorker] = []
+        self._live = 0
+        self._closed = False
+        self._atexit_registered = False
+
+        self.requests = 0
+        self.starts = 0
+        self.crashes = 0
+        self.timeouts = 0
+        self.start_seconds = 0.0
+
+    def judge(self, prompt: str, timeout_s: Optional[float] = None) -> str:
+        """
+        Get the judge's reply to a prompt.
+
+        The judgement runs in a session of its own. A worker that crashes
+        mid-request is replaced and the request is sent once more; a
+        timed-out request is not retried.
+
+        Args:
+            prompt: Judge prompt
+            timeout_s: Per-request timeout (None: pool default)
+
+        Returns:
+            Judge reply text
+
+        Raises:
+            TimeoutError: If the judge does not reply in time
+            JudgeWorkerError: If workers cannot be started or keep crashing
+            RuntimeError: If the judge reports an error
+        """
+        timeout_s = timeout_s or self._timeout_s
+        for attempt in range(2):
+            worker = self._acquire()
+            try:
+                reply = worker.request(prompt, timeout_s)
+            except TimeoutError:
+                self._discard(worker, "timeouts")
+                raise
+            except JudgeWorkerError:
+                crashes = self._discard(worker, "crashes")
+                if attempt or crashes >= self._max_crashes:
+                    raise
+                continue
+            except Exception:
+                self._retire(worker)
+                raise
+
+            self._retire(worker)
+            with self._condition:
+                self.requests += 1
+            return reply
+
+    def stats(self) -> Dict[str, any]:
+        """
+        Get pool counters.
+
+        Returns:
+            Dictionary with workers, requests, starts, restarts, crashes,
+            timeouts and start_seconds
+        """
+        with self._condition:
+            return {
+                "workers": self._live,
+                "requests": self.requests,
+                "starts": self.starts,
+                "restarts": self.crashes + self.timeouts,
+                "crashes": self.crashes,
+                "timeouts": self.timeouts,
+                "start_seconds": self.start_seconds,
+            }
+
+    def close(self) -> None:
+        """Stop all idle workers; busy workers are stopped when retired."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._live -= len(idle)
+            self._condition.notify_all()
+        for worker in idle:
+            worker.stop()
+
+    def _acquire(self) -> _JudgeWorker:
+        """Take an idle worker, start a new one, or wait for one to be released."""
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise JudgeWorkerError("Judge worker pool is closed")
+                if self.crashes >= self._max_crashes:
+                    raise JudgeWorkerError(
+                        f"Judge workers crashed {self.crashes} times; not restarting"
+                    )
+                if self._idle:
+                    worker = self._idle.pop()
+                    if worker.alive:
+                        return worker
+                    # Died while idle: replace it
+                    self.crashes += 1
+                    self._live -= 1
+                    continue
+                if self._live < self._size:
+                    self._live += 1
+                    worker_id = self.starts
+                    self.starts += 1
+                    break
+                self._condition.wait()
+
+        try:
+            return self._start(worker_id)
+        except JudgeWorkerError:
+            with self._condition:
+                self._live -= 1
+                self._condition.notify()
+            raise
+
+    def _start(self, worker_id: int) -> _JudgeWorker:
+        """Start a worker process in a slot already counted in _live."""
+        start = time.perf_counter()
+        worker = _JudgeWorker(self._command, worker_id)
+        with self._condition:
+            self.start_seconds += time.perf_counter() - start
+            if not self._atexit_registered:
+                self._atexit_registered = True
+                atexit.register(self.close)
+        return worker
+
+    def _prestart(self) -> None:
+        """Start a replacement session in the background if a slot is free."""
+        with self._condition:
+            if self._closed or self._live >= self._size or self.crashes >= self._max_crashes:
+                return
+            self._live += 1
+            worker_id = self.starts
+            self.starts += 1
+        threading.Thread(target=self._start_idle, args=(worker_id,), daemon=True).start()
+
+    def _start_idle(self, worker_id: int) -> None:
+        """Start a worker and park it as idle (pre-start thread)."""
+        try:
+            worker = self._start(worker_id)
+        except JudgeWorkerError:
+            with self._condition:
+                self._live -= 1
+                self._condition.notify()
+            return
+        with self._condition:
+            if not self._closed:
+                self._idle.append(worker)
+                self._condition.notify()
+                return
+            self._live -= 1
+        worker.stop()
+
+    def _retire(self, worker: _JudgeWorker) -> None:
+        """Stop a worker whose session has served its judgement and pre-start its replacement."""
+        with self._condition:
+            self._live -= 1
+            self._condition.notify()
+        self._prestart()
+        worker.stop()
+
+    def _discard(self, worker: _JudgeWorker, reason: str) -> int:
+        """Stop a worker, count why, and free its slot for a replacement."""
+        worker.stop()
+        with self._condition:
+            self._live -= 1
+            setattr(self, reason, getattr(self, reason) + 1)
+            self._condition.notify()
+            return getattr(self, reason)
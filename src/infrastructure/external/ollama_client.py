@@ -4,17 +4,119 @@ Ollama Client
 Low-level HTTP client for Ollama API.
 """
 
+import asyncio
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+
 import httpx
-from typing import Any, Dict, List, Optional
+
+from domain.entities.model_response import SERVER_TIMING_FIELDS
+from domain.services.statistics import percentile
 
 
 class OllamaClient:
     """HTTP client for Ollama API."""
 
-    def __init__(self, host: str = "http://localhost:11434", timeout: int = 300) -> None:
+    def __init__(
+        self,
+        host: str = "http://localhost:11434",
+        timeout: int = 300,
+        stream: bool = False,
+        stop_sequences: Optional[List[str]] = None,
+        time_budget_s: Optional[float] = None,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: bool = False,
+        keep_alive: Optional[str] = None,
+        reload_threshold_ms: float = 500.0,
+    ) -> None:
+        """
+        Initialize client.
+
+        Args:
+            host: Ollama API endpoint
+            timeout: Default timeout in seconds (for any phase not set below)
+            stream: Stream generations (NDJSON) to record TTFT and cancel early
+            stop_sequences: Streaming only: cancel once the output contains any of these
+            time_budget_s: Streaming only: cancel once a generation exceeds this wall-clock budget
+            connect_timeout: Seconds to establish a connection
+            read_timeout: Seconds to wait for response data (covers generation time)
+            write_timeout: Seconds to send the request body
+            pool_timeout: Seconds to wait for a free pooled connection
+            max_connections: Maximum open connections (httpx default if None)
+            max_keepalive_connections: Maximum idle connections kept open (httpx default if None)
+            keepalive_expiry: Seconds an idle connection is kept open (httpx default if None)
+            http2: Use HTTP/2 (requires the h2 package: httpx[http2])
+            keep_alive: Ollama keep_alive (e.g., "30m", "-1") so the model stays loaded
+            reload_threshold_ms: load_duration above which a response counts as a model reload
+        """
         self.host = host.rstrip("/")
         self.timeout = timeout
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self.stream = stream
+        self.stop_sequences = list(stop_sequences or [])
+        self.time_budget_s = time_budget_s
+        self.keep_alive = keep_alive
+        self.reload_threshold_ms = reload_threshold_ms
+
+        phase_timeouts = {
+            "connect": connect_timeout,
+            "read": read_timeout,
+            "write": write_timeout,
+            "pool": pool_timeout,
+        }
+        limits = {
+            "max_connections": max_connections,
+            "max_keepalive_connections": max_keepalive_connections,
+            "keepalive_expiry": keepalive_expiry,
+        }
+        self._client = httpx.AsyncClient(
+            # Phases left unset fall back to the overall timeout
+            timeout=httpx.Timeout(
+                timeout, **{k: v for k, v in phase_timeouts.items() if v is not None}
+            ),
+            limits=httpx.Limits(**{
+                "max_connections": 100,
+                "max_keepalive_connections": 20,
+                "keepalive_expiry": 5.0,
+                **{k: v for k, v in limits.items() if v is not None},
+            }),
+            http2=http2,
+        )
+
+        self._requests = 0
+        self._connections_opened = 0
+        self._connect_ms_total = 0.0
+        self._model_loads = 0
+        self._load_ms_total = 0.0
+
+    def connection_stats(self) -> Dict[str, Any]:
+        """
+        Get connection reuse and model reload counters.
+
+        Returns:
+            Dictionary with requests, connections_opened, connection_reuse_rate,
+            connect_ms_total/mean, model_loads and load_ms_total
+        """
+        return {
+            "requests": self._requests,
+            "connections_opened": self._connections_opened,
+            "connection_reuse_rate": (
+                1 - self._connections_opened / self._requests if self._requests else 0.0
+            ),
+            "connect_ms_total": self._connect_ms_total,
+            "connect_ms_mean": (
+                self._connect_ms_total / self._connections_opened
+                if self._connections_opened else 0.0
+            ),
+            "model_loads": self._model_loads,
+            "load_ms_total": self._load_ms_total,
+        }
 
     async def generate(
         self,
@@ -25,8 +127,31 @@ class OllamaClient:
         top_p: float = 0.9,
         top_k: int = 40,
         max_tokens: int = 1024,
+        stream: Optional[bool] = None,
+        stop_condition: Optional[Callable[[str], bool]] = None,
+        time_budget_s: Optional[float] = None,
     ) -> Dict[str, Any]:
-        """Generate completion from Ollama."""
+        """
+        Generate completion from Ollama.
+
+        Streaming returns the same fields as a non-streamed response (with
+        the text re-assembled) plus a `streaming_metrics` dictionary.
+
+        Args:
+            model: Model name
+            prompt: Prompt
+            system: Optional system prompt
+            temperature: Sampling temperature
+            top_p: Top-p sampling
+            top_k: Top-k sampling
+            max_tokens: Maximum tokens to generate (num_predict)
+            stream: Override the client's streaming mode
+            stop_condition: Streaming only: called with the text so far; True cancels
+            time_budget_s: Streaming only: override the client's wall-clock budget
+
+        Returns:
+            Ollama generate response
+        """
         url = f"{self.host}/api/generate"
         payload = {
             "model": model,
@@ -41,10 +166,185 @@ class OllamaClient:
         }
         if system:
             payload["system"] = system
+        if self.keep_alive is not None:
+            payload["keep_alive"] = self.keep_alive
 
-        response = await self._client.post(url, json=payload)
+        if stream if stream is not None else self.stream:
+            payload["stream"] = True
+            return await self._generate_streaming(
+                url,
+                payload,
+                stop_condition=stop_condition,
+                time_budget_s=time_budget_s if time_budget_s is not None else self.time_budget_s,
+            )
+
+        self._requests += 1
+        response = await self._client.post(url, json=payload, extensions={"trace": self._tracer()})
         response.raise_for_status()
-        return response.json()
+        result = response.json()
+        self._record_load(result)
+        return result
+
+    @staticmethod
+    def server_timings(response: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Extract Ollama's server-side timing breakdown from a generate response.
+
+        Args:
+            response: Ollama generate response (streamed or not)
+
+        Returns:
+            Dictionary of total/load/prompt_eval/eval counts and durations (ns)
+            suitable for ModelResponse(server_timings=...)
+        """
+        return {
+            key: response[key] for key in SERVER_TIMING_FIELDS
+            if response.get(key) is not None
+        }
+
+    async def _generate_streaming(
+        self,
+        url: str,
+        payload: Dict[str, Any],
+        stop_condition: Optional[Callable[[str], bool]] = None,
+        time_budget_s: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Iterate Ollama's NDJSON chunks, timing tokens and cancelling early.
+
+        Each chunk carries one token, so the gap between chunks is the
+        inter-token latency. Leaving the stream early closes the connection,
+        which makes Ollama stop generating. The time budget also bounds the
+        wait for the next chunk, so a stream that stalls is cut off too.
+        """
+        started = time.perf_counter()
+        chunk_times: List[float] = []
+        text = ""
+        final: Dict[str, Any] = {}
+        cancel_reason: Optional[str] = None
+        # A stop sequence split across chunks starts in the last len - 1 characters
+        stop_tail_length = max((len(stop) for stop in self.stop_sequences), default=1) - 1
+        stop_tail = ""
+
+        self._requests += 1
+        async with self._client.stream(
+            "POST", url, json=payload, extensions={"trace": self._tracer()}
+        ) as response:
+            response.raise_for_status()
+            lines = response.aiter_lines()
+            while True:
+                try:
+                    if time_budget_s is None:
+                        line = await lines.__anext__()
+                    else:
+                        remaining_s = time_budget_s - (time.perf_counter() - started)
+                        if remaining_s <= 0:
+                            cancel_reason = "time_budget"
+                            break
+                        line = await asyncio.wait_for(lines.__anext__(), remaining_s)
+                except StopAsyncIteration:
+                    break
+                except asyncio.TimeoutError:
+                    cancel_reason = "time_budget"
+                    break
+
+                if not line.strip():
+                    continue
+
+                chunk = json.loads(line)
+                if chunk.get("error"):
+                    raise RuntimeError(f"Ollama streaming error: {chunk['error']}")
+
+                piece = chunk.get("response")
+                if piece:
+                    chunk_times.append(time.perf_counter())
+                    text += piece
+
+                if chunk.get("done"):
+                    final = chunk
+                    break
+
+                if piece and stop_condition is not None and stop_condition(text):
+                    cancel_reason = "stop_condition"
+                elif piece and self.stop_sequences:
+                    # Only new text can complete a stop sequence: scan the chunk plus a tail
+                    window = stop_tail + piece
+                    if any(stop in window for stop in self.stop_sequences):
+                        cancel_reason = "stop_sequence"
+                    stop_tail = window[-stop_tail_length:] if stop_tail_length else ""
+                if cancel_reason:
+                    break
+
+        result = {key: value for key, value in final.items() if key != "response"}
+        result.setdefault("model", payload["model"])
+        result["response"] = text
+        result["done"] = cancel_reason is None and bool(final.get("done"))
+        if cancel_reason:
+            # No final chunk: the token count is the number of chunks received
+            result["eval_count"] = len(chunk_times)
+            result["done_reason"] = "cancelled"
+
+        self._record_load(result)
+        result["streaming_metrics"] = self._streaming_metrics(
+            started, chunk_times, final, cancel_reason
+        )
+        return result
+
+    def _tracer(self) -> Callable:
+        """Build an httpcore trace hook timing new connections for one request."""
+        started: Dict[str, float] = {}
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.started":
+                started["connect"] = time.perf_counter()
+                self._connections_opened += 1
+            elif event_name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+                if "connect" in started:
+                    elapsed_ms = (time.perf_counter() - started["connect"]) * 1000
+                    # TLS completes after TCP: only count the time since the last event
+                    self._connect_ms_total += elapsed_ms
+                    started["connect"] = time.perf_counter()
+
+        return trace
+
+    def _record_load(self, response: Dict[str, Any]) -> None:
+        """Count responses whose load_duration shows the model was (re)loaded."""
+        load_ms = (response.get("load_duration") or 0) / 1e6
+        if load_ms >= self.reload_threshold_ms:
+            self._model_loads += 1
+            self._load_ms_total += load_ms
+
+    def _streaming_metrics(
+        self,
+        started: float,
+        chunk_times: List[float],
+        final: Dict[str, Any],
+        cancel_reason: Optional[str],
+    ) -> Dict[str, Any]:
+        """Compute TTFT, inter-token latency and decode throughput."""
+        gaps = [
+            (later - earlier) * 1000
+            for earlier, later in zip(chunk_times, chunk_times[1:])
+        ]
+
+        # Prefer Ollama's own decode timing; fall back to client-side chunk timing
+        if final.get("eval_count") and final.get("eval_duration"):
+            tokens_per_second = final["eval_count"] / (final["eval_duration"] / 1e9)
+        elif len(chunk_times) > 1:
+            tokens_per_second = (len(chunk_times) - 1) / (chunk_times[-1] - chunk_times[0])
+        else:
+            tokens_per_second = 0.0
+
+        return {
+            "ttft_ms": (chunk_times[0] - started) * 1000 if chunk_times else None,
+            "inter_token_latency_ms": sum(gaps) / len(gaps) if gaps else None,
+            "inter_token_latency_p95_ms": percentile(gaps, 95) if gaps else None,
+            "tokens_per_second": tokens_per_second,
+            "chunks": len(chunk_times),
+            "wall_clock_ms": (time.perf_counter() - started) * 1000,
+            "cancelled": cancel_reason is not None,
+            "cancel_reason": cancel_reason,
+        }
 
     async def list_models(self) -> List[Dict[str, Any]]:
         """List available models."""
@@ -0,0 +1,76 @@
+"""
+Dataset Command
+
+CLI commands for the test suite dataset.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from infrastructure.adapters.repositories.jsonl_test_case_repository import JSONLTestCaseRepository
+
+dataset_app = typer.Typer()
+console = Console()
+
+
+@dataset_app.command("compile")
+def compile_snapshot(
+    ctx: typer.Context,
+    output: Optional[Path] = typer.Option(
+        None, help="Snapshot file. Overrides CCOP_TEST_SUITE_SNAPSHOT_PATH."
+    ),
+) -> None:
+    """Compile the JSONL test suite into a validated snapshot for fast loading."""
+    container = ctx.obj["container"]
+    settings = container.config()
+    snapshot_path = output or settings.test_suite_snapshot_path
+
+    console.print(f"[bold]Compiling test suite:[/bold] {settings.test_cases_dir}")
+
+    try:
+        stats = container.test_case_repository().compile_snapshot(snapshot_path)
+        jsonl_ms, jsonl_count = _time_cold_load(settings.test_cases_dir, container, None)
+        snapshot_ms, snapshot_count = _time_cold_load(settings.test_cases_dir, container, snapshot_path)
+    except Exception as e:
+        console.print(f"[red]Compilation failed: {e}[/red]")
+        if ctx.obj.get("debug"):
+            raise
+        raise typer.Exit(1)
+
+    table = Table(title="Test Suite Snapshot")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="magenta")
+    table.add_row("Saved To", stats["path"])
+    table.add_row("Source Files", str(stats["files"]))
+    table.add_row("Test Cases", str(stats["test_cases"]))
+    table.add_row("Size", f"{stats['bytes'] / 1024:.0f} KB")
+    table.add_row("Cold Load (JSONL)", f"{jsonl_ms:.1f}ms")
+    table.add_row("Cold Load (snapshot)", f"{snapshot_ms:.1f}ms")
+    console.print(table)
+
+    if snapshot_count != jsonl_count:
+        console.print(
+            f"[yellow]Snapshot loaded {snapshot_count} test cases, JSONL {jsonl_count}; "
+            f"a source file changed during compilation. Re-run 'dataset compile'.[/yellow]"
+        )
+    if not settings.test_suite_snapshot_enabled:
+        console.print("[yellow]CCOP_TEST_SUITE_SNAPSHOT_ENABLED is false; runs will not use it.[/yellow]")
+
+
+def _time_cold_load(test_cases_dir: Path, container, snapshot_path: Optional[Path]) -> tuple:
+    """Load the whole suite with a fresh repository; return (milliseconds, test case count)."""
+    started = time.perf_counter()
+    repository = JSONLTestCaseRepository(
+        test_cases_dir,
+        container.logger(),
+        snapshot_path=snapshot_path,
+        use_snapshot=snapshot_path is not None,
+    )
+    test_cases = asyncio.run(repository.load_all())
+    return (time.perf_counter() - started) * 1000, len(test_cases)
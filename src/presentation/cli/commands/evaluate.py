@@ -12,7 +12,12 @@ from rich.console import Console
 from rich.table import Table
 
 from application.dtos.evaluation_request_dto import EvaluationRequestDTO
+from domain.services.judge_dispatcher import JudgeDispatcher, measure_batch_agreement
+from domain.services.llm_judge_service import LLMJudgeService
+from domain.services.scoring_service import ScoringService
+from domain.services.semantic_similarity_service import SemanticSimilarityService
 from domain.value_objects.evaluation_tier import EvaluationTier
+from infrastructure.adapters.models.caching_gateway import CacheMode
 
 evaluate_app = typer.Typer()
 console = Console()
@@ -21,7 +26,7 @@ console = Console()
 @evaluate_app.command()
 def run(
     ctx: typer.Context,
-    model: str = typer.Option(..., help="Model name"),
+    model: Optional[str] = typer.Option(None, help="Model name (required unless --resume)"),
     benchmarks: Optional[List[str]] = typer.Option(
         None, help="Benchmarks to run (can specify multiple times, e.g., --benchmarks B1 --benchmarks B2)"
     ),
@@ -43,11 +48,40 @@ def run(
         max=1.0,
         help="Pass threshold override (0.0-1.0). Overrides phase-specific threshold."
     ),
+    concurrency: Optional[int] = typer.Option(
+        None,
+        min=1,
+        help="Max test evaluations in flight. Overrides CCOP_MAX_CONCURRENT_EVALUATIONS."
+    ),
+    cache_mode: Optional[CacheMode] = typer.Option(
+        None,
+        help="Response cache mode. Overrides CCOP_RESPONSE_CACHE_MODE."
+    ),
+    resume: Optional[str] = typer.Option(
+        None,
+        help="Resume an interrupted run by run ID (skips journaled tests; other options are restored from the run)"
+    ),
 ) -> None:
     """Run model evaluation."""
     container = ctx.obj["container"]
     use_case = container.evaluate_model_use_case()
 
+    _configure_semantic_scoring(container)
+    _configure_llm_judge(container)
+
+    model_gateway = container.model_gateway()
+    if cache_mode is not None and hasattr(model_gateway, "cache_mode"):
+        model_gateway.cache_mode = cache_mode
+
+    if resume:
+        console.print(f"[bold]Resuming run:[/bold] {resume}")
+        _execute_and_display(ctx, use_case.resume(resume, max_concurrency=concurrency), resume)
+        return
+
+    if not model:
+        console.print("[red]--model is required (unless resuming with --resume).[/red]")
+        raise typer.Exit(1)
+
     # Handle --tier argument (takes precedence over --benchmarks)
     if tier is not None:
         if tier not in [1, 2, 3]:
@@ -83,6 +117,13 @@ def run(
     console.print(f"[bold]Benchmarks:[/bold] {', '.join(benchmarks)}")
     console.print(f"[bold]Evaluation Phase:[/bold] {phase}")
 
+    effective_cache_mode = getattr(model_gateway, "cache_mode", CacheMode.OFF)
+    if temperature > 0 and effective_cache_mode in (CacheMode.READ_WRITE, CacheMode.READ_ONLY):
+        console.print(
+            f"[yellow]Response cache is {effective_cache_mode.value} at temperature {temperature}: "
+            f"cached answers (and their timings) are replayed, not sampled.[/yellow]"
+        )
+
     # Display threshold being used
     if threshold is not None:
         console.print(f"[bold]Pass Threshold:[/bold] {threshold:.0%} (override)")
@@ -99,11 +140,345 @@ def run(
         save_results=save,
         evaluation_phase=phase,
         pass_threshold=threshold,
+        max_concurrency=concurrency,
+    )
+
+    console.print(f"[bold]Run ID:[/bold] {request.run_id}")
+    # --no-save writes no journal, so there is nothing to resume
+    _execute_and_display(ctx, use_case.execute(request), request.run_id, resumable=save)
+
+
+@evaluate_app.command()
+def rescore(
+    ctx: typer.Context,
+    result_files: List[str] = typer.Argument(
+        ..., help="Saved evaluation run file(s) (results/evaluations/*.json)"
+    ),
+    save: bool = typer.Option(True, help="Save each re-scored run as a new result file"),
+    workers: Optional[int] = typer.Option(
+        None,
+        min=0,
+        help="Processes scoring several runs (0: one per CPU). Overrides CCOP_RESCORE_WORKERS."
+    ),
+) -> None:
+    """Re-score saved runs with the current scorers (no model calls)."""
+    container = ctx.obj["container"]
+    use_case = container.evaluate_model_use_case()
+
+    _configure_semantic_scoring(container)
+    _configure_llm_judge(container)
+
+    if len(result_files) > 1:
+        _rescore_archive(ctx, use_case, result_files, save, workers)
+        return
+
+    [result_file] = result_files
+    console.print(f"[bold]Re-scoring:[/bold] {result_file}")
+
+    try:
+        rescored = asyncio.run(use_case.rescore(result_file, save_results=save))
+    except Exception as e:
+        console.print(f"[red]Re-scoring failed: {e}[/red]")
+        if ctx.obj.get("debug"):
+            raise
+        raise typer.Exit(1)
+
+    summary = rescored.summary
+    console.print("\n[bold green]Re-scoring Complete![/bold green]\n")
+
+    table = Table(title="Re-score Summary")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="magenta")
+    table.add_row("Model", summary.model_name)
+    table.add_row("Re-scored Tests", str(summary.total_tests))
+    if rescored.skipped_tests:
+        table.add_row("Skipped Tests", str(rescored.skipped_tests))
+    table.add_row(
+        "Overall Score",
+        f"{rescored.previous_overall_score:.2%} -> {summary.overall_score:.2%}"
+    )
+    table.add_row("Duration", f"{summary.total_duration_seconds:.1f}s")
+    if rescored.output_file:
+        table.add_row("Saved To", rescored.output_file)
+    console.print(table)
+
+    if rescored.score_diff:
+        console.print("\n[bold]Score Changes by Benchmark:[/bold]")
+        diff_table = Table()
+        diff_table.add_column("Benchmark")
+        diff_table.add_column("Previous")
+        diff_table.add_column("Current")
+        diff_table.add_column("Delta")
+        diff_table.add_column("Passed")
+        diff_table.add_column("Flipped")
+
+        for benchmark, diff in rescored.score_diff.items():
+            delta_style = "green" if diff["delta"] > 0 else "red" if diff["delta"] < 0 else "white"
+            diff_table.add_row(
+                benchmark,
+                f"{diff['previous_score']:.2%}",
+                f"{diff['score']:.2%}",
+                f"[{delta_style}]{diff['delta']:+.2%}[/{delta_style}]",
+                f"{diff['previous_passed']} -> {diff['passed']}",
+                str(len(diff["flipped_tests"])),
+            )
+
+        console.print(diff_table)
+
+
+def _rescore_archive(
+    ctx: typer.Context,
+    use_case,
+    result_files: List[str],
+    save: bool,
+    workers: Optional[int]
+) -> None:
+    """Re-score several runs in one parallel pass and display per-run and per-benchmark tables."""
+    console.print(f"[bold]Re-scoring {len(result_files)} runs[/bold]")
+
+    try:
+        archive = asyncio.run(use_case.rescore_many(result_files, save_results=save, workers=workers))
+    except Exception as e:
+        console.print(f"[red]Re-scoring failed: {e}[/red]")
+        if ctx.obj.get("debug"):
+            raise
+        raise typer.Exit(1)
+
+    console.print("\n[bold green]Re-scoring Complete![/bold green]\n")
+
+    runs_table = Table(title="Re-scored Runs")
+    runs_table.add_column("Run")
+    runs_table.add_column("Model")
+    runs_table.add_column("Tests")
+    runs_table.add_column("Overall Score")
+    runs_table.add_column("Saved To")
+    for rescored in archive.runs:
+        runs_table.add_row(
+            rescored.source_file,
+            rescored.summary.model_name,
+            str(rescored.summary.total_tests),
+            f"{rescored.previous_overall_score:.2%} -> {rescored.summary.overall_score:.2%}",
+            rescored.output_file or "-",
+        )
+    console.print(runs_table)
+
+    diff_table = Table(
+        title=f"All Runs by Benchmark ({archive.total_tests} tests, "
+        f"{archive.workers} workers, {archive.total_duration_seconds:.1f}s)"
     )
+    diff_table.add_column("Benchmark")
+    diff_table.add_column("Previous")
+    diff_table.add_column("Current")
+    diff_table.add_column("Delta")
+    diff_table.add_column("Passed")
+    diff_table.add_column("Flipped")
+    for benchmark, diff in archive.by_benchmark.items():
+        delta_style = "green" if diff["delta"] > 0 else "red" if diff["delta"] < 0 else "white"
+        diff_table.add_row(
+            benchmark,
+            f"{diff['previous_score']:.2%}",
+            f"{diff['score']:.2%}",
+            f"[{delta_style}]{diff['delta']:+.2%}[/{delta_style}]",
+            f"{diff['previous_passed']} -> {diff['passed']}",
+            str(diff["flipped"]),
+        )
+    console.print(diff_table)
+
+
+@evaluate_app.command("calibrate-judge")
+def calibrate_judge(
+    ctx: typer.Context,
+    result_file: str = typer.Argument(..., help="Saved evaluation run with Tier 3 results"),
+    batch_size: int = typer.Option(4, min=2, help="Responses per batched judge call"),
+    limit: Optional[int] = typer.Option(None, min=1, help="Judge at most this many responses"),
+) -> None:
+    """Measure how batched Tier 3 judging agrees with single-item judging."""
+    container = ctx.obj["container"]
+    _configure_llm_judge(container)
+
+    async def load_pairs():
+        test_cases = await container.test_case_repository().load_all()
+        results = await container.result_repository().load_evaluation_run(result_file, test_cases)
+        return [
+            (result.test_case, result.model_response) for result in results
+            if ScoringService.is_llm_judged(result.test_case)
+        ]
 
+    try:
+        pairs = asyncio.run(load_pairs())[:limit]
+        if not pairs:
+            console.print("[yellow]No Tier 3 results in this run[/yellow]")
+            raise typer.Exit(1)
+
+        console.print(f"[bold]Calibrating judge:[/bold] {len(pairs)} responses, batch size {batch_size}")
+        # Fresh judgements on both sides: the verdict cache would hide any disagreement
+        single = container.judge_dispatcher(verdict_store=None, batch_size=1)
+        batched = container.judge_dispatcher(verdict_store=None, batch_size=batch_size)
+        report = measure_batch_agreement(single, batched, ScoringService.llm_judge_requests(pairs))
+        single.close()
+        batched.close()
+    except typer.Exit:
+        raise
+    except Exception as e:
+        console.print(f"[red]Calibration failed: {e}[/red]")
+        if ctx.obj.get("debug"):
+            raise
+        raise typer.Exit(1)
+
+    table = Table(title="Batched vs Single-Item Judging")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="magenta")
+    table.add_row("Compared Responses", str(report.items))
+    if report.excluded:
+        table.add_row("Excluded (judge failed)", str(report.excluded))
+    table.add_row("Batch Size", str(report.batch_size))
+    table.add_row("Exact Agreement", f"{report.exact_agreement:.1%}")
+    table.add_row("Within One Point", f"{report.within_one:.1%}")
+    for criterion, agreement in report.criterion_agreement.items():
+        table.add_row(f"  {criterion.title()} Agreement", f"{agreement:.1%}")
+    table.add_row("Mean |Score Diff|", f"{report.mean_abs_score_diff:.3f}")
+    table.add_row("Max |Score Diff|", f"{report.max_abs_score_diff:.3f}")
+    table.add_row("Judge Calls", f"{report.single_calls} single -> {report.batched_calls} batched")
+    if report.batch_fallbacks:
+        table.add_row("Re-judged Singly", str(report.batch_fallbacks))
+    console.print(table)
+
+
+def _configure_semantic_scoring(container) -> None:
+    """Set the Tier 2 embedding model registry and the persistent embedding cache (if enabled)."""
+    SemanticSimilarityService.configure_registry(container.embedding_model_registry())
+    enabled = container.config().embedding_cache_enabled
+    SemanticSimilarityService.configure_embedding_store(
+        container.embedding_cache() if enabled else None
+    )
+
+
+def _configure_llm_judge(container) -> None:
+    """Set up Tier 3 judging: pre-started sessions, dispatch limits and the verdict cache."""
+    settings = container.config()
+    LLMJudgeService.configure_worker_pool(
+        container.judge_worker_pool() if settings.judge_workers > 0 else None
+    )
+    JudgeDispatcher.configure_shared(container.judge_dispatcher(
+        verdict_store=container.judge_verdict_cache() if settings.judge_cache_enabled else None
+    ))
+
+
+def _judge_summary(container) -> Optional[str]:
+    """Format judge worker counters for the summary table."""
+    if not container.config().judge_workers:
+        return None
+
+    stats = container.judge_worker_pool().stats()
+    if not stats["requests"] and not stats["crashes"] and not stats["timeouts"]:
+        return None
+
+    summary = f"{stats['requests']} judgements on {stats['starts']} sessions"
+    if stats["crashes"] or stats["timeouts"]:
+        summary += f", {stats['crashes']} crashes / {stats['timeouts']} timeouts restarted"
+    return summary
+
+
+def _judge_dispatch_summary() -> Optional[str]:
+    """Format judge dispatch and verdict cache counters for the summary table."""
+    stats = JudgeDispatcher.shared().stats()
+    if not stats["judged"] and not stats["cache_hits"] and not stats["errors"]:
+        return None
+
+    summary = f"{stats['judged']} judged / {stats['cache_hits']} cached"
+    if stats["batches"]:
+        summary += f", {stats['batches']} batches of up to {stats['batch_size']}"
+    if stats["batch_fallbacks"]:
+        summary += f" ({stats['batch_fallbacks']} re-judged singly)"
+    if stats["errors"]:
+        summary += f", {stats['errors']} failed (fallback score)"
+    if stats["rate_limited_seconds"]:
+        summary += f", rate-limited {stats['rate_limited_seconds']:.0f}s"
+    return summary
+
+
+def _embedding_cache_summary(container) -> Optional[str]:
+    """Format embedding cache counters for the summary table."""
+    if not container.config().embedding_cache_enabled:
+        return None
+
+    stats = container.embedding_cache().stats()
+    if not stats["hits"] and not stats["misses"]:
+        return None
+    return f"{stats['hits']} hits / {stats['misses']} misses ({stats['hit_rate']:.0%})"
+
+
+def _embedding_models_summary(container) -> Optional[str]:
+    """Format embedding model load and encode metrics for the summary table."""
+    stats = container.embedding_model_registry().stats()
+    if not stats["loads"]:
+        return None
+
+    models = ", ".join(
+        f"{name} ({model['encoded_texts']} texts, {model['encode_seconds']:.1f}s)"
+        for name, model in stats["models"].items()
+    )
+    summary = f"{stats['loads']} loaded in {stats['load_seconds']:.1f}s: {models}"
+    if stats["evictions"]:
+        summary += f", {stats['evictions']} evicted"
+    return summary
+
+
+def _cache_summary(container) -> Optional[str]:
+    """Format response cache counters for the summary table."""
+    model_gateway = container.model_gateway()
+    if not hasattr(model_gateway, "cache_stats"):
+        return None
+
+    stats = model_gateway.cache_stats()
+    if stats["mode"] == CacheMode.OFF.value:
+        return "off"
+    return (
+        f"{stats['hits']} hits / {stats['misses']} misses "
+        f"({stats['hit_rate']:.0%}, {stats['mode']})"
+    )
+
+
+def _connection_summary(container) -> Optional[str]:
+    """Format Ollama connection reuse and model reload counters for the summary table."""
+    pool = container.ollama_gateway()
+    if not hasattr(pool, "pool_stats"):
+        return None
+
+    connections = [host["connections"] for host in pool.pool_stats().values()]
+    requests = sum(c["requests"] for c in connections)
+    if not requests:
+        return None
+
+    opened = sum(c["connections_opened"] for c in connections)
+    reloads = sum(c["model_loads"] for c in connections)
+    return f"{opened} opened / {requests} requests, {reloads} model reloads"
+
+
+def _retry_summary(container) -> Optional[str]:
+    """Format retry and circuit breaker counters for the summary table."""
+    gateway = container.resilient_gateway()
+    if not hasattr(gateway, "retry_stats"):
+        return None
+
+    stats = gateway.retry_stats()
+    if not stats["retries"] and not stats["circuit_opens"]:
+        return None
+
+    summary = f"{stats['retries']}/{stats['retry_budget']} retries used"
+    if stats["circuit_opens"]:
+        summary += (
+            f", circuit opened {stats['circuit_opens']}x "
+            f"(paused {stats['paused_seconds']:.0f}s)"
+        )
+    return summary
+
+
+def _execute_and_display(ctx: typer.Context, evaluation, run_id: str, resumable: bool = True) -> None:
+    """Run the evaluation coroutine and display its summary (resumable: the run is journaled)."""
     try:
         console.print("\n[yellow]Running evaluation...[/yellow]\n")
-        summary = asyncio.run(use_case.execute(request))
+        summary = asyncio.run(evaluation)
 
         # Display results
         console.print("\n[bold green]Evaluation Complete![/bold green]\n")
@@ -114,11 +489,67 @@ def run(
         table.add_column("Value", style="magenta")
 
         table.add_row("Model", summary.model_name)
+        if summary.run_id:
+            table.add_row("Run ID", summary.run_id)
         table.add_row("Total Tests", str(summary.total_tests))
         table.add_row("Passed", str(summary.passed_tests))
         table.add_row("Failed", str(summary.failed_tests))
+        if summary.errored_tests:
+            hint = " (re-run with --resume)" if resumable else ""
+            table.add_row("Errored", f"[red]{summary.errored_tests}[/red]{hint}")
         table.add_row("Overall Score", f"{summary.overall_score:.2%}")
         table.add_row("Duration", f"{summary.total_duration_seconds:.1f}s")
+        if summary.performance:
+            latency = summary.performance["latency_ms"]
+            table.add_row(
+                "Latency p50/p95/p99",
+                f"{latency['p50']:.0f}ms / {latency['p95']:.0f}ms / {latency['p99']:.0f}ms"
+            )
+            ttft = summary.performance.get("ttft_ms")
+            if ttft:
+                table.add_row(
+                    "TTFT p50/p95/p99",
+                    f"{ttft['p50']:.0f}ms / {ttft['p95']:.0f}ms / {ttft['p99']:.0f}ms"
+                )
+            prefill = summary.performance.get("prefill_tokens_per_second")
+            decode = summary.performance.get("decode_tokens_per_second")
+            if prefill is not None or decode is not None:
+                table.add_row(
+                    "Prefill / Decode tok/s",
+                    f"{prefill or 0:.1f} / {decode or 0:.1f}"
+                )
+        connection_summary = _connection_summary(ctx.obj["container"])
+        if connection_summary:
+            table.add_row("Ollama Connections", connection_summary)
+        retry_summary = _retry_summary(ctx.obj["container"])
+        if retry_summary:
+            table.add_row("Retries", retry_summary)
+        cache_summary = _cache_summary(ctx.obj["container"])
+        if cache_summary:
+            table.add_row("Response Cache", cache_summary)
+        embedding_cache_summary = _embedding_cache_summary(ctx.obj["container"])
+        if embedding_cache_summary:
+            table.add_row("Embedding Cache", embedding_cache_summary)
+        judge_dispatch_summary = _judge_dispatch_summary()
+        if judge_dispatch_summary:
+            table.add_row("LLM Judge", judge_dispatch_summary)
+        judge_summary = _judge_summary(ctx.obj["container"])
+        if judge_summary:
+            table.add_row("Judge Workers", judge_summary)
+        embedding_models_summary = _embedding_models_summary(ctx.obj["container"])
+        if embedding_models_summary:
+            table.add_row("Embedding Models", embedding_models_summary)
+        if summary.scheduling:
+            scheduling = summary.scheduling
+            table.add_row("Concurrency", str(scheduling["max_concurrency"]))
+            table.add_row(
+                "Queue Wait p50/p95",
+                f"{scheduling['queue_wait_ms']['p50']:.0f}ms / {scheduling['queue_wait_ms']['p95']:.0f}ms"
+            )
+            table.add_row(
+                "Service Time p50/p95",
+                f"{scheduling['service_time_ms']['p50']:.0f}ms / {scheduling['service_time_ms']['p95']:.0f}ms"
+            )
 
         console.print(table)
 
@@ -130,19 +561,27 @@ def run(
             bench_table.add_column("Total")
             bench_table.add_column("Passed")
             bench_table.add_column("Score")
+            bench_table.add_column("Latency p95")
+            bench_table.add_column("Decode tok/s")
 
             for benchmark, stats in summary.by_benchmark.items():
+                performance = stats.get("performance") or {}
+                decode = performance.get("decode_tokens_per_second")
                 bench_table.add_row(
                     benchmark,
                     str(stats["total"]),
                     str(stats["passed"]),
-                    f"{stats['score']:.2%}"
+                    f"{stats['score']:.2%}",
+                    f"{performance['latency_ms']['p95']:.0f}ms" if performance else "-",
+                    f"{decode:.1f}" if decode is not None else "-",
                 )
 
             console.print(bench_table)
 
     except Exception as e:
         console.print(f"[red]Evaluation failed: {e}[/red]")
+        if resumable:
+            console.print(f"[yellow]Resume with: ccop-eval evaluate run --resume {run_id}[/yellow]")
         if ctx.obj.get("debug"):
             raise
         raise typer.Exit(1)
@@ -5,12 +5,20 @@ CLI command for setting up models.
 """
 
 import asyncio
+from typing import List, Tuple
 
 import typer
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from application.ports.output.i_model_converter import QuantizationType
+from domain.entities.test_case import TestCase
+from domain.services.scoring_service import REASONING_TRACK_BENCHMARKS
+from domain.value_objects.benchmark_type import BenchmarkType
+from infrastructure.adapters.embeddings.embedding_encoders import (
+    EmbeddingEncoderFactory,
+    check_embedding_parity,
+)
 
 setup_app = typer.Typer()
 console = Console()
@@ -90,3 +98,59 @@ def check(ctx: typer.Context) -> None:
             console.print(f"  Error: {checks['error']}")
         console.print("\n[yellow]Please install and start Ollama:[/yellow]")
         console.print("  Run: ./scripts/setup_ollama.sh")
+
+
+@setup_app.command("check-embeddings")
+def check_embeddings(
+    ctx: typer.Context,
+    model_name: str = typer.Option(
+        "all-MiniLM-L6-v2", help="Embedding model used by Tier 2 scoring"
+    ),
+    tolerance: float = typer.Option(
+        None, help="Maximum cosine drift vs. PyTorch (default: CCOP_EMBEDDING_PARITY_TOLERANCE)"
+    ),
+) -> None:
+    """Check the configured embedding backend against the PyTorch baseline."""
+    container = ctx.obj["container"]
+    settings = container.config()
+    factory = container.embedding_encoder_factory()
+    tolerance = tolerance if tolerance is not None else settings.embedding_parity_tolerance
+
+    references, responses = asyncio.run(_parity_pairs(container.test_case_repository()))
+    if not references:
+        console.print("[red]No reasoning-track test cases found[/red]")
+        raise typer.Exit(1)
+
+    console.print(f"[bold]Backend:[/bold] {factory.cache_key(model_name)}")
+    console.print(f"[bold]Pairs:[/bold] {len(references)} (reasoning-track test cases)")
+
+    with console.status("Encoding with both backends..."):
+        report = check_embedding_parity(
+            candidate=factory(model_name),
+            baseline=EmbeddingEncoderFactory(threads=settings.embedding_threads)(model_name),
+            references=references,
+            responses=responses,
+            tolerance=tolerance,
+        )
+
+    console.print(f"  Max drift:  {report.max_abs_diff:.4f}")
+    console.print(f"  Mean drift: {report.mean_abs_diff:.4f}")
+    if report.passed:
+        console.print(f"[green]✓[/green] Cosine scores within {tolerance} of PyTorch")
+    else:
+        console.print(f"[red]✗ Cosine scores drift more than {tolerance} from PyTorch[/red]")
+        raise typer.Exit(1)
+
+
+async def _parity_pairs(repository) -> Tuple[List[str], List[str]]:
+    """Pair each reasoning-track expected response with its question and key facts."""
+    test_cases: List[TestCase] = []
+    for benchmark in REASONING_TRACK_BENCHMARKS:
+        test_cases.extend(await repository.load_by_benchmark(BenchmarkType.from_string(benchmark)))
+
+    references, responses = [], []
+    for test_case in test_cases:
+        for text in [test_case.question, *test_case.key_facts]:
+            references.append(test_case.expected_response)
+            responses.append(text)
+    return references, responses
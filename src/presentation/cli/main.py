@@ -6,8 +6,10 @@ Typer-based CLI application for CCoP 2.0 evaluation framework.
 
 import typer
 from rich.console import Console
+from rich.table import Table
 
 from infrastructure.config.container import get_container
+from presentation.cli.commands.dataset import dataset_app
 from presentation.cli.commands.evaluate import evaluate_app
 from presentation.cli.commands.report import report_app
 from presentation.cli.commands.setup import setup_app
@@ -23,17 +25,30 @@ app = typer.Typer(
 app.add_typer(setup_app, name="setup", help="Setup models for evaluation")
 app.add_typer(evaluate_app, name="evaluate", help="Evaluate models on test cases")
 app.add_typer(report_app, name="report", help="Generate evaluation reports")
+app.add_typer(dataset_app, name="dataset", help="Manage the test suite dataset")
 
 console = Console()
 
 
-@app.callback()
+@app.callback(invoke_without_command=True)
 def main(
     ctx: typer.Context,
     verbose: bool = typer.Option(False, help="Enable verbose output"),
     debug: bool = typer.Option(False, help="Enable debug mode"),
+    profile_startup: bool = typer.Option(
+        False,
+        "--profile-startup",
+        help="Report per-module import cost of the CLI (then run the command, if any)"
+    ),
 ) -> None:
     """CCoP 2.0 Model Evaluation Framework."""
+    if profile_startup:
+        _print_startup_profile()
+    if ctx.invoked_subcommand is None:
+        if not profile_startup:
+            console.print(ctx.get_help())
+        raise typer.Exit()
+
     # Initialize container
     container = get_container()
 
@@ -44,5 +59,40 @@ def main(
         console.print("[yellow]Debug mode enabled[/yellow]")
 
 
+def _print_startup_profile(top: int = 15) -> None:
+    """Print import cost per module and package, flagging heavy ML imports."""
+    from presentation.cli.startup_profile import profile_startup
+
+    profile = profile_startup()
+    console.print(f"\n[bold]Startup import time:[/bold] {profile.total_ms:.0f}ms\n")
+
+    modules = Table(title=f"Slowest Modules (top {top}, self time)")
+    modules.add_column("Module", style="cyan")
+    modules.add_column("Self", justify="right")
+    modules.add_column("Cumulative", justify="right")
+    for timing in profile.slowest(top):
+        modules.add_row(
+            timing.module,
+            f"{timing.self_us / 1000:.1f}ms",
+            f"{timing.cumulative_us / 1000:.1f}ms",
+        )
+    console.print(modules)
+
+    packages = Table(title=f"Packages (top {top}, self time)")
+    packages.add_column("Package", style="cyan")
+    packages.add_column("Self", justify="right")
+    for timing in profile.by_package(top):
+        packages.add_row(timing.module, f"{timing.self_us / 1000:.1f}ms")
+    console.print(packages)
+
+    if profile.heavy_modules:
+        console.print(
+            f"[red]Heavy modules imported at startup: {', '.join(profile.heavy_modules)} "
+            f"(should load only when reasoning-track benchmarks are scored)[/red]"
+        )
+    else:
+        console.print("[green]No heavy ML modules imported at startup[/green]")
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,115 @@
+"""
+Startup Profile
+
+Per-module import cost of the CLI, measured with `python -X importtime` in a
+fresh interpreter so the numbers are not skewed by modules this process has
+already loaded.
+"""
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+# Modules that must only load when a reasoning-track benchmark is scored
+HEAVY_MODULES = ("torch", "sentence_transformers", "transformers", "onnxruntime")
+
+
+@dataclass
+class ImportTiming:
+    """Import cost of one module (microseconds)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass
+class StartupProfile:
+    """Import timings of a module and everything it pulls in."""
+
+    entry_module: str
+    timings: List[ImportTiming] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        """Total import time of the entry module."""
+        entry = next((t for t in self.timings if t.module == self.entry_module), None)
+        if entry is not None:
+            return entry.cumulative_us / 1000
+        return sum(t.self_us for t in self.timings) / 1000
+
+    @property
+    def heavy_modules(self) -> List[str]:
+        """Heavy ML packages imported at startup (should be empty)."""
+        return [t.module for t in self.timings if t.module in HEAVY_MODULES]
+
+    def slowest(self, top: int = 15) -> List[ImportTiming]:
+        """Modules with the highest self time."""
+        return sorted(self.timings, key=lambda t: t.self_us, reverse=True)[:top]
+
+    def by_package(self, top: int = 15) -> List[ImportTiming]:
+        """Self time summed per top-level package, highest first."""
+        packages: Dict[str, int] = {}
+        for timing in self.timings:
+            package = timing.module.split(".")[0]
+            packages[package] = packages.get(package, 0) + timing.self_us
+        ordered = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+        return [ImportTiming(module=name, self_us=us, cumulative_us=us) for name, us in ordered]
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """
+    Parse `python -X importtime` output.
+
+    Args:
+        output: stderr of the interpreter run
+
+    Returns:
+        Import timings in import order
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Header line
+        timings.append(ImportTiming(
+            module=fields[2].strip(),
+            self_us=int(fields[0]),
+            cumulative_us=int(fields[1]),
+        ))
+    return timings
+
+
+def profile_startup(entry_module: str = "presentation.cli.main") -> StartupProfile:
+    """
+    Measure the import cost of a module in a fresh interpreter.
+
+    Args:
+        entry_module: Module to import (default: the CLI entry point)
+
+    Returns:
+        Startup profile
+
+    Raises:
+        RuntimeError: If the module fails to import
+    """
+    source_root = str(Path(__file__).resolve().parents[2])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [source_root, env.get("PYTHONPATH")]))
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {entry_module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=source_root,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {entry_module} failed:\n{completed.stderr[-2000:]}")
+
+    return StartupProfile(entry_module=entry_module, timings=parse_importtime(completed.stderr))
@@ -0,0 +1,80 @@
+"""
+Stand-in LLM judge speaking the judge workers' stream-json protocol.
+
+Replies to every prompt with a fixed, valid judge verdict (a JSON array of
+them for batch prompts), so Tier 3 runs can be exercised without the
+claude CLI:
+
+    CCOP_JUDGE_WORKER_COMMAND="python scripts/stub_judge.py"
+
+Prompts containing STUB_CRASH make the process exit, STUB_HANG makes it
+stop replying, and STUB_ERROR returns an error result (for testing the
+worker pool's restart and timeout handling). STUB_HISTORY is answered with
+the number of earlier prompts in the session (for testing that judgements
+do not share context). STUB_JUDGE_DELAY_S adds a per-reply delay.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+
+VERDICT = {
+    "accuracy_score": 4,
+    "completeness_score": 4,
+    "alignment_score": 4,
+    "justification": "Stand-in judge verdict.",
+    "confidence": 0.5,
+}
+
+
+def emit(event: dict) -> None:
+    """Write one protocol line."""
+    sys.stdout.write(json.dumps(event) + "\n")
+    sys.stdout.flush()
+
+
+def main() -> int:
+    """Answer prompts until stdin closes."""
+    session_id = f"stub-{os.getpid()}"
+    delay_s = float(os.environ.get("STUB_JUDGE_DELAY_S", "0"))
+    emit({"type": "system", "subtype": "init", "session_id": session_id})
+
+    turns = 0
+    for line in sys.stdin:
+        try:
+            prompt = json.loads(line)["message"]["content"]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            continue
+
+        if "STUB_CRASH" in prompt:
+            print("stub judge crashed on request", file=sys.stderr)
+            return 1
+        if "STUB_HANG" in prompt:
+            time.sleep(3600)
+        time.sleep(delay_s)
+
+        turns += 1
+        if "STUB_HISTORY" in prompt:
+            emit({"type": "result", "subtype": "success", "is_error": False,
+                  "result": str(turns - 1), "session_id": session_id})
+            continue
+        if "STUB_ERROR" in prompt:
+            emit({"type": "result", "subtype": "error_during_execution", "is_error": True,
+                  "result": "stub judge error", "session_id": session_id})
+            continue
+
+        items = re.findall(r"^### Item (\d+)$", prompt, flags=re.MULTILINE)
+        if items:
+            reply = json.dumps([{"item": int(number), **VERDICT} for number in items])
+        else:
+            reply = json.dumps(VERDICT)
+        emit({"type": "assistant", "session_id": session_id})
+        emit({"type": "result", "subtype": "success", "is_error": False,
+              "result": reply, "session_id": session_id})
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+Tests for the generate -> score evaluation pipeline.
+
+Tests:
+1. Scoring runs in the pool, off the event loop thread
+2. Blocking scoring does not stall in-flight generation
+3. The scoring queue is bounded (backpressure instead of unbounded growth)
+4. Results keep input order and failures in either stage propagate
+5. A batch scorer receives queued outputs in batches
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from application.services.evaluation_pipeline import EvaluationPipeline
+
+
+class TestEvaluationPipeline:
+    """Test EvaluationPipeline.run."""
+
+    @pytest.mark.asyncio
+    async def test_scoring_runs_off_event_loop(self):
+        """Score callables execute in pool threads, not the loop thread."""
+        pipeline = EvaluationPipeline(max_concurrency=2, scoring_workers=2)
+        loop_thread = threading.get_ident()
+
+        async def generate(index, item):
+            return item * 2
+
+        def score(item, generated):
+            return (generated, threading.get_ident())
+
+        stats = await pipeline.run([1, 2, 3], generate, score)
+
+        assert [r.value[0] for r in stats.results] == [2, 4, 6]
+        assert all(r.value[1] != loop_thread for r in stats.results)
+
+    @pytest.mark.asyncio
+    async def test_blocking_scoring_does_not_stall_generation(self):
+        """Generations finish while slow scoring is still draining."""
+        pipeline = EvaluationPipeline(max_concurrency=4, scoring_workers=1, scoring_queue_size=16)
+        generated_at = []
+        scored_at = []
+
+        async def generate(index, item):
+            await asyncio.sleep(0.005)
+            generated_at.append(time.perf_counter())
+            return item
+
+        def score(item, generated):
+            time.sleep(0.02)
+            scored_at.append(time.perf_counter())
+            return generated
+
+        stats = await pipeline.run(list(range(8)), generate, score)
+
+        assert max(generated_at) < max(scored_at)
+        assert all(r.timing.backpressure_ms < 5 for r in stats.results)
+        assert all(r.timing.score_time_ms >= 15 for r in stats.results)
+
+    @pytest.mark.asyncio
+    async def test_scoring_queue_is_bounded(self):
+        """A full scoring queue applies backpressure to generation."""
+        pipeline = EvaluationPipeline(max_concurrency=4, scoring_workers=1, scoring_queue_size=1)
+
+        async def generate(index, item):
+            return item
+
+        def score(item, generated):
+            time.sleep(0.01)
+            return generated
+
+        stats = await pipeline.run(list(range(6)), generate, score)
+
+        assert [r.value for r in stats.results] == list(range(6))
+        assert stats.peak_queue_depth <= 1
+        assert max(r.timing.backpressure_ms for r in stats.results) > 0
+
+    @pytest.mark.asyncio
+    async def test_scoring_failure_propagates(self):
+        """A scoring exception aborts the run."""
+        pipeline = EvaluationPipeline(max_concurrency=2, scoring_workers=1, scoring_queue_size=1)
+
+        async def generate(index, item):
+            return item
+
+        def score(item, generated):
+            if item == 2:
+                raise ValueError("scorer crashed")
+            return generated
+
+        with pytest.raises(ValueError, match="scorer crashed"):
+            await pipeline.run(list(range(10)), generate, score)
+
+    @pytest.mark.asyncio
+    async def test_generation_failure_propagates(self):
+        """A generation exception aborts the run."""
+        pipeline = EvaluationPipeline(max_concurrency=2, scoring_workers=2)
+
+        async def generate(index, item):
+            if item == 1:
+                raise ConnectionError("ollama down")
+            return item
+
+        with pytest.raises(ConnectionError):
+            await pipeline.run([0, 1, 2], generate, lambda item, generated: generated)
+
+    @pytest.mark.asyncio
+    async def test_generated_outputs_are_scored_before_generation_error(self):
+        """Outputs generated before a failure still reach on_result."""
+        pipeline = EvaluationPipeline(max_concurrency=1, scoring_workers=1)
+        reported = []
+
+        async def generate(index, item):
+            if item == 2:
+                raise ConnectionError("ollama down")
+            return item
+
+        def score(item, generated):
+            time.sleep(0.02)
+            return generated
+
+        async def on_result(result):
+            reported.append(result.value)
+
+        with pytest.raises(ConnectionError):
+            await pipeline.run([0, 1, 2, 3], generate, score, on_result=on_result)
+
+        assert sorted(reported) == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_batch_scorer_drains_queue_in_batches(self):
+        """Outputs waiting behind a busy scorer are scored together, in order."""
+        pipeline = EvaluationPipeline(
+            max_concurrency=8, scoring_workers=1, scoring_queue_size=32, scoring_batch_size=4
+        )
+        batches = []
+
+        async def generate(index, item):
+            return item * 10
+
+        def score(item, generated):
+            raise AssertionError("per-item scorer must not be used")
+
+        def score_batch(items, generated):
+            batches.append(list(items))
+            time.sleep(0.01)
+            return [g + 1 for g in generated]
+
+        stats = await pipeline.run(list(range(10)), generate, score, score_batch=score_batch)
+
+        assert [r.value for r in stats.results] == [i * 10 + 1 for i in range(10)]
+        assert sorted(i for batch in batches for i in batch) == list(range(10))
+        assert max(len(batch) for batch in batches) == 4
+        assert len(batches) < 10
+
+    def test_rejects_invalid_pool_settings(self):
+        """Scoring workers, queue size and batch size must be positive."""
+        with pytest.raises(ValueError):
+            EvaluationPipeline(scoring_workers=0)
+        with pytest.raises(ValueError):
+            EvaluationPipeline(scoring_queue_size=0)
+        with pytest.raises(ValueError):
+            EvaluationPipeline(scoring_batch_size=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
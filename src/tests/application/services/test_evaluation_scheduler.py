@@ -0,0 +1,129 @@
+"""
+Tests for the bounded-concurrency evaluation scheduler.
+
+Tests:
+1. Results are returned in input order regardless of completion order
+2. In-flight tasks never exceed the concurrency limit
+3. Queue-wait and service-time are recorded per task
+4. Worker failures propagate and cancel remaining tasks
+"""
+
+import asyncio
+
+import pytest
+
+from application.services.evaluation_scheduler import (
+    EvaluationScheduler,
+    TaskTiming,
+    summarize_timings,
+)
+
+
+class TestEvaluationScheduler:
+    """Test EvaluationScheduler.run."""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self):
+        """Later items finishing first must not reorder results."""
+        scheduler = EvaluationScheduler(max_concurrency=4)
+        delays = [0.04, 0.01, 0.03, 0.0, 0.02]
+
+        async def worker(index, delay):
+            await asyncio.sleep(delay)
+            return index
+
+        scheduled = await scheduler.run(delays, worker)
+
+        assert [s.value for s in scheduled] == [0, 1, 2, 3, 4]
+        assert [s.timing.index for s in scheduled] == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_in_flight_never_exceeds_limit(self):
+        """At most max_concurrency workers run at the same time."""
+        scheduler = EvaluationScheduler(max_concurrency=3)
+        in_flight = 0
+        peak = 0
+
+        async def worker(index, item):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return item
+
+        await scheduler.run(list(range(10)), worker)
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_sequential_when_limit_is_one(self):
+        """Concurrency of 1 queues every later task behind the first."""
+        scheduler = EvaluationScheduler(max_concurrency=1)
+
+        async def worker(index, item):
+            await asyncio.sleep(0.02)
+            return item
+
+        scheduled = await scheduler.run(["a", "b"], worker)
+
+        assert scheduled[0].timing.queue_wait_ms < scheduled[1].timing.queue_wait_ms
+        assert scheduled[1].timing.queue_wait_ms >= 15
+        assert all(s.timing.service_time_ms >= 15 for s in scheduled)
+
+    @pytest.mark.asyncio
+    async def test_worker_failure_propagates(self):
+        """First worker exception is raised and other tasks are cancelled."""
+        scheduler = EvaluationScheduler(max_concurrency=2)
+        completed = []
+
+        async def worker(index, item):
+            if item == "boom":
+                raise RuntimeError("generation failed")
+            await asyncio.sleep(0.05)
+            completed.append(item)
+            return item
+
+        with pytest.raises(RuntimeError, match="generation failed"):
+            await scheduler.run(["boom", "slow", "later"], worker)
+
+        assert "later" not in completed
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self):
+        """No items produces no results."""
+        scheduler = EvaluationScheduler(max_concurrency=2)
+
+        async def worker(index, item):
+            return item
+
+        assert await scheduler.run([], worker) == []
+
+    def test_rejects_invalid_concurrency(self):
+        """Concurrency below 1 is rejected."""
+        with pytest.raises(ValueError):
+            EvaluationScheduler(max_concurrency=0)
+
+
+class TestTimingStatistics:
+    """Test the summarize_timings helper."""
+
+    def test_summarize_timings(self):
+        """Summary reports percentiles and slot utilization."""
+        timings = [
+            TaskTiming(index=0, queue_wait_ms=0.0, service_time_ms=100.0),
+            TaskTiming(index=1, queue_wait_ms=0.0, service_time_ms=100.0),
+            TaskTiming(index=2, queue_wait_ms=100.0, service_time_ms=100.0),
+        ]
+
+        summary = summarize_timings(timings, max_concurrency=2, wall_clock_ms=200.0)
+
+        assert summary["tasks"] == 3
+        assert summary["max_concurrency"] == 2
+        assert summary["queue_wait_ms"]["max"] == 100.0
+        assert summary["service_time_ms"]["p50"] == 100.0
+        assert summary["utilization"] == pytest.approx(0.75)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,150 @@
+"""
+Tests for ParallelRescorer.
+
+Verifies:
+1. Scores from the process pool match in-process scoring
+2. Workers get the compiled test-case index once; tasks carry only test IDs
+3. Tier 2/3 pairs are scored in the parent process
+"""
+
+import os
+
+import pytest
+
+import application.services.parallel_rescorer as parallel_rescorer
+from application.services.parallel_rescorer import ParallelRescorer
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.services.scoring_service import ScoringService
+from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.ccop_section import CCoPSection
+from domain.value_objects.difficulty_level import DifficultyLevel
+from domain.value_objects.evaluation_metric import accuracy_metric
+
+
+def make_test_case(number: int, benchmark: str = "B1_CCoP_Applicability_Scope") -> TestCase:
+    """Create a test case with key facts and a label."""
+    return TestCase(
+        test_id=f"{benchmark.split('_')[0]}-{number:03d}",
+        benchmark_type=BenchmarkType.from_string(benchmark),
+        section=CCoPSection.from_string("Section 1: General Provisions"),
+        clause_reference="1.1",
+        difficulty=DifficultyLevel.MEDIUM,
+        question=f"Does CCoP 2.0 apply to the critical information infrastructure in scenario {number}?",
+        expected_response=f"Yes. CCoP 2.0 applies to the designated CII in scenario {number}.",
+        evaluation_criteria={"accuracy": "Must identify applicability"},
+        expected_label="Applicable",
+        key_facts=["CCoP 2.0 applies to designated CII", f"Scenario {number} involves a CIIO"],
+    )
+
+
+def make_pairs(count: int):
+    """Create (test case, response) pairs, two responses per test case."""
+    pairs = []
+    for number in range(1, count + 1):
+        test_case = make_test_case(number)
+        pairs.append((test_case, ModelResponse(content="Applicable: CCoP 2.0 applies to designated CII.")))
+        pairs.append((test_case, ModelResponse(content=f"Not applicable to scenario {number}.")))
+    return pairs
+
+
+class _InlinePool:
+    """Stands in for ProcessPoolExecutor, running tasks in this process."""
+
+    instances = []
+
+    def __init__(self, max_workers, initializer, initargs):
+        self.max_workers = max_workers
+        self.initargs = initargs
+        self.submitted = []
+        initializer(*initargs)
+        _InlinePool.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def submit(self, function, *args):
+        self.submitted.append(args)
+        value = function(*args)
+
+        class _Done:
+            def result(self):
+                return value
+
+        return _Done()
+
+
+class TestParallelRescorer:
+    """Test sharding and merging."""
+
+    def test_pool_matches_in_process_scoring(self):
+        pairs = make_pairs(6)
+
+        parallel = ParallelRescorer(workers=2, shard_size=4).score(pairs)
+
+        assert parallel == ScoringService.score_responses(pairs)
+
+    def test_index_shipped_once_and_tasks_carry_test_ids(self, monkeypatch):
+        monkeypatch.setattr(parallel_rescorer, "ProcessPoolExecutor", _InlinePool)
+        monkeypatch.setattr(parallel_rescorer, "_worker_index", {})
+        _InlinePool.instances.clear()
+        pairs = make_pairs(5)
+
+        results = ParallelRescorer(workers=3, shard_size=4).score(pairs)
+
+        [pool] = _InlinePool.instances
+        [index] = pool.initargs
+        assert pool.max_workers == 3
+        assert sorted(index) == [f"B1-{n:03d}" for n in range(1, 6)]
+        assert all(test_case._scoring_artifacts is not None for test_case in index.values())
+        assert [len(shard) for (shard,) in pool.submitted] == [4, 4, 2]
+        assert all(isinstance(test_id, str) for (shard,) in pool.submitted for test_id, _ in shard)
+        assert results == ScoringService.score_responses(pairs)
+
+    def test_tier2_and_tier3_scored_in_parent(self, monkeypatch):
+        monkeypatch.setattr(parallel_rescorer, "ProcessPoolExecutor", _InlinePool)
+        monkeypatch.setattr(parallel_rescorer, "_worker_index", {})
+        _InlinePool.instances.clear()
+        batched_calls = []
+
+        def fake_score_responses(pairs, batch_size=64):
+            batched_calls.append([test_case.test_id for test_case, _ in pairs])
+            return [[accuracy_metric(0.5)] for _ in pairs]
+
+        monkeypatch.setattr(ScoringService, "score_responses", staticmethod(fake_score_responses))
+        response = ModelResponse(content="Prioritise the access control gaps first.")
+        pairs = make_pairs(3)
+        pairs.insert(1, (make_test_case(1, "B8_Gap_Prioritisation"), response))
+        pairs.append((make_test_case(1, "B12_Stakeholder_Communication"), response))
+
+        results = ParallelRescorer(workers=2, shard_size=2).score(pairs)
+
+        assert batched_calls == [["B8-001", "B12-001"]]
+        assert results[1] == results[-1] == [accuracy_metric(0.5)]
+        [pool] = _InlinePool.instances
+        assert "B8-001" not in pool.initargs[0]
+        assert results[0] == ScoringService.score_response(*pairs[0])
+
+    def test_single_worker_scores_in_process(self, monkeypatch):
+        monkeypatch.setattr(parallel_rescorer, "ProcessPoolExecutor", _InlinePool)
+        _InlinePool.instances.clear()
+        pairs = make_pairs(4)
+
+        results = ParallelRescorer(workers=1, shard_size=2).score(pairs)
+
+        assert _InlinePool.instances == []
+        assert results == ScoringService.score_responses(pairs)
+
+    def test_defaults_and_validation(self):
+        assert ParallelRescorer(workers=0).workers == (os.cpu_count() or 1)
+        with pytest.raises(ValueError):
+            ParallelRescorer(workers=-1)
+        with pytest.raises(ValueError):
+            ParallelRescorer(shard_size=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,108 @@
+"""
+Tests for concurrent test evaluation in EvaluateModelUseCase.
+
+Tests:
+1. Generations overlap up to the configured concurrency
+2. Results and summary keep deterministic test order
+3. Per-test queue-wait/service-time and scheduler statistics are exposed
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.dtos.evaluation_request_dto import EvaluationRequestDTO
+from application.use_cases.evaluate_model import EvaluateModelUseCase
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.ccop_section import CCoPSection
+from domain.value_objects.difficulty_level import DifficultyLevel
+
+
+def make_test_case(number: int) -> TestCase:
+    """Create a B1 test case with a label-free expected response."""
+    return TestCase(
+        test_id=f"B1-{number:03d}",
+        benchmark_type=BenchmarkType.from_string("B1_CCoP_Applicability_Scope"),
+        section=CCoPSection.from_string("Section 1: General"),
+        clause_reference="1.1",
+        difficulty=DifficultyLevel.MEDIUM,
+        question=f"Does CCoP 2.0 apply to the CII described in scenario number {number} of this suite?",
+        expected_response="CCoP 2.0 applies to the designated CII.",
+        evaluation_criteria={"accuracy": "Must identify applicability"},
+    )
+
+
+class TestConcurrentEvaluation:
+    """Test execute() with bounded concurrency."""
+
+    def setup_method(self):
+        """Setup use case with a slow, out-of-order gateway."""
+        self.test_cases = [make_test_case(i) for i in range(1, 7)]
+        self.in_flight = 0
+        self.peak = 0
+
+        async def generate_response(prompt, model_name, **kwargs):
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            # Earlier tests take longer so completion order is reversed
+            index = next(i for i, tc in enumerate(self.test_cases) if tc.question == prompt)
+            await asyncio.sleep(0.01 * (len(self.test_cases) - index))
+            self.in_flight -= 1
+            return ModelResponse(content="CCoP 2.0 applies to the designated CII.", model_name=model_name)
+
+        self.model_gateway = Mock()
+        self.model_gateway.is_model_available = AsyncMock(return_value=True)
+        self.model_gateway.generate_response = AsyncMock(side_effect=generate_response)
+
+        self.test_case_repository = Mock()
+        self.test_case_repository.load_by_benchmark = AsyncMock(return_value=self.test_cases)
+
+        self.use_case = EvaluateModelUseCase(
+            self.model_gateway,
+            self.test_case_repository,
+            Mock(),
+            Mock(),
+            max_concurrent_evaluations=3,
+        )
+
+    @pytest.mark.asyncio
+    async def test_generations_overlap_up_to_limit(self):
+        """Configured concurrency bounds the number of in-flight generations."""
+        request = EvaluationRequestDTO(model_name="m", benchmark_types=["B1"], save_results=False)
+
+        await self.use_case.execute(request)
+
+        assert self.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_request_override_takes_precedence(self):
+        """Request max_concurrency overrides the configured default."""
+        request = EvaluationRequestDTO(
+            model_name="m", benchmark_types=["B1"], save_results=False, max_concurrency=1
+        )
+
+        summary = await self.use_case.execute(request)
+
+        assert self.peak == 1
+        assert summary.scheduling["max_concurrency"] == 1
+
+    @pytest.mark.asyncio
+    async def test_results_in_test_order_with_timings(self):
+        """Results keep test order and carry scheduling timings."""
+        request = EvaluationRequestDTO(model_name="m", benchmark_types=["B1"], save_results=False)
+
+        summary = await self.use_case.execute(request)
+
+        assert [r.test_id for r in summary.results] == [tc.test_id for tc in self.test_cases]
+        for result in summary.results:
+            assert result.metadata["queue_wait_ms"] >= 0
+            assert result.metadata["service_time_ms"] > 0
+        assert summary.scheduling["tasks"] == len(self.test_cases)
+        assert summary.scheduling["service_time_ms"]["p95"] > 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,139 @@
+"""
+Tests for latency and throughput aggregation in EvaluateModelUseCase.
+
+Tests:
+1. Latency and TTFT p50/p95/p99 and token-weighted prefill/decode tok/s overall
+2. The same statistics per benchmark and per difficulty
+3. Responses without server timings report None throughput
+4. Saved runs record the effective response cache mode
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.dtos.evaluation_request_dto import EvaluationRequestDTO
+from application.use_cases.evaluate_model import EvaluateModelUseCase
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.ccop_section import CCoPSection
+from domain.value_objects.difficulty_level import DifficultyLevel
+from infrastructure.adapters.models.caching_gateway import CacheMode
+
+
+def make_test_case(number: int, difficulty: DifficultyLevel) -> TestCase:
+    """Create a B1 test case with a label-free expected response."""
+    return TestCase(
+        test_id=f"B1-{number:03d}",
+        benchmark_type=BenchmarkType.from_string("B1_CCoP_Applicability_Scope"),
+        section=CCoPSection.from_string("Section 1: General"),
+        clause_reference="1.1",
+        difficulty=difficulty,
+        question=f"Does CCoP 2.0 apply to the CII described in scenario number {number} of this suite?",
+        expected_response="CCoP 2.0 applies to the designated CII.",
+        evaluation_criteria={"accuracy": "Must identify applicability"},
+    )
+
+
+class TestPerformanceStatistics:
+    """Test summary performance statistics."""
+
+    def setup_method(self):
+        """Setup gateway whose latency and timings grow with the test number."""
+        self.test_cases = [
+            make_test_case(1, DifficultyLevel.LOW),
+            make_test_case(2, DifficultyLevel.LOW),
+            make_test_case(3, DifficultyLevel.HIGH),
+            make_test_case(4, DifficultyLevel.HIGH),
+        ]
+
+        async def generate_response(prompt, model_name, **kwargs):
+            number = next(i for i, tc in enumerate(self.test_cases, 1) if tc.question == prompt)
+            return ModelResponse(
+                content="CCoP 2.0 applies to the designated CII.",
+                model_name=model_name,
+                latency_ms=number * 100,
+                metadata={"streaming": {"ttft_ms": number * 10.0}},
+                server_timings={
+                    "load_duration": number * 1_000_000,
+                    "prompt_eval_count": 100,
+                    "prompt_eval_duration": 100_000_000,
+                    "eval_count": 50 * number,
+                    "eval_duration": 1_000_000_000,
+                },
+            )
+
+        self.model_gateway = Mock()
+        self.model_gateway.is_model_available = AsyncMock(return_value=True)
+        self.model_gateway.generate_response = AsyncMock(side_effect=generate_response)
+
+        self.test_case_repository = Mock()
+        self.test_case_repository.load_by_benchmark = AsyncMock(return_value=self.test_cases)
+
+        self.use_case = EvaluateModelUseCase(
+            self.model_gateway,
+            self.test_case_repository,
+            Mock(),
+            Mock(),
+        )
+        self.request = EvaluationRequestDTO(model_name="m", benchmark_types=["B1"], save_results=False)
+
+    @pytest.mark.asyncio
+    async def test_overall_latency_percentiles_and_throughput(self):
+        """Summary reports percentiles and token-weighted throughput."""
+        summary = await self.use_case.execute(self.request)
+
+        performance = summary.performance
+        assert performance["latency_ms"]["p50"] == pytest.approx(250)
+        assert performance["latency_ms"]["p99"] == pytest.approx(397)
+        assert performance["ttft_ms"]["p50"] == pytest.approx(25)
+        assert performance["load_ms"]["p95"] == pytest.approx(3.85)
+        assert performance["prefill_tokens_per_second"] == pytest.approx(1000.0)
+        assert performance["decode_tokens_per_second"] == pytest.approx(125.0)
+
+    @pytest.mark.asyncio
+    async def test_statistics_per_benchmark_and_difficulty(self):
+        """Each benchmark and difficulty group carries its own statistics."""
+        summary = await self.use_case.execute(self.request)
+
+        [benchmark] = summary.by_benchmark.values()
+        assert benchmark["performance"]["decode_tokens_per_second"] == pytest.approx(125.0)
+        assert summary.by_difficulty["low"]["performance"]["decode_tokens_per_second"] == pytest.approx(75.0)
+        assert summary.by_difficulty["high"]["performance"]["latency_ms"]["p50"] == pytest.approx(350)
+        assert summary.results[0].server_timings["eval_count"] == 50
+
+    @pytest.mark.asyncio
+    async def test_missing_server_timings(self):
+        """Backends without timings still get latency percentiles."""
+        self.model_gateway.generate_response = AsyncMock(
+            return_value=ModelResponse(content="CCoP 2.0 applies.", model_name="m", latency_ms=100)
+        )
+
+        summary = await self.use_case.execute(self.request)
+
+        assert summary.performance["latency_ms"]["p95"] == pytest.approx(100)
+        assert summary.performance["load_ms"] is None
+        assert summary.performance["ttft_ms"] is None
+        assert summary.performance["decode_tokens_per_second"] is None
+
+    @pytest.mark.asyncio
+    async def test_run_metadata_records_response_cache_mode(self):
+        """Saved runs state whether answers may have been replayed from the response cache."""
+        result_repository = Mock()
+        result_repository.create_run_journal = AsyncMock()
+        result_repository.append_to_run_journal = AsyncMock()
+        result_repository.save_evaluation_run = AsyncMock(return_value="results.json")
+        self.model_gateway.cache_mode = CacheMode.READ_ONLY
+        use_case = EvaluateModelUseCase(self.model_gateway, self.test_case_repository, result_repository, Mock())
+
+        await use_case.execute(EvaluationRequestDTO(model_name="m", benchmark_types=["B1"]))
+        self.model_gateway.cache_mode = None
+        await use_case.execute(EvaluationRequestDTO(model_name="m", benchmark_types=["B1"]))
+
+        modes = [call.args[1]["response_cache_mode"] for call in result_repository.save_evaluation_run.call_args_list]
+        assert modes == ["read-only", "off"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
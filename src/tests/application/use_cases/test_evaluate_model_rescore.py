@@ -0,0 +1,159 @@
+"""
+Tests for re-scoring saved runs in EvaluateModelUseCase.
+
+Tests:
+1. Saved responses are replayed without calling the model
+2. A new run file is written with a per-benchmark score diff
+3. Saved results without a matching test case are skipped
+4. Several runs re-scored together keep per-run results and merge exactly
+"""
+
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.dtos.evaluation_request_dto import EvaluationRequestDTO
+from application.use_cases.evaluate_model import EvaluateModelUseCase
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.services.scoring_service import ScoringService
+from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.ccop_section import CCoPSection
+from domain.value_objects.difficulty_level import DifficultyLevel
+from domain.value_objects.evaluation_metric import accuracy_metric
+from infrastructure.adapters.repositories.json_result_repository import JSONResultRepository
+
+
+def make_test_case(number: int) -> TestCase:
+    """Create a B1 test case with a label-free expected response."""
+    return TestCase(
+        test_id=f"B1-{number:03d}",
+        benchmark_type=BenchmarkType.from_string("B1_CCoP_Applicability_Scope"),
+        section=CCoPSection.from_string("Section 1: General"),
+        clause_reference="1.1",
+        difficulty=DifficultyLevel.MEDIUM,
+        question=f"Does CCoP 2.0 apply to the CII described in scenario number {number} of this suite?",
+        expected_response="CCoP 2.0 applies to the designated CII.",
+        evaluation_criteria={"accuracy": "Must identify applicability"},
+    )
+
+
+class TestRescore:
+    """Test rescore() against a real JSON result repository."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path, monkeypatch):
+        """Save a scored run with a fixed 0.2 score per test."""
+        self.monkeypatch = monkeypatch
+        self.test_cases = [make_test_case(i) for i in range(1, 5)]
+
+        self.model_gateway = Mock()
+        self.model_gateway.is_model_available = AsyncMock(return_value=True)
+        self.model_gateway.generate_response = AsyncMock(
+            side_effect=lambda prompt, model_name, **kwargs: ModelResponse(
+                content="CCoP 2.0 applies to the designated CII.", model_name=model_name
+            )
+        )
+
+        self.test_case_repository = Mock()
+        self.test_case_repository.load_by_benchmark = AsyncMock(return_value=self.test_cases)
+
+        self.result_repository = JSONResultRepository(tmp_path, Mock())
+        self.use_case = EvaluateModelUseCase(
+            self.model_gateway,
+            self.test_case_repository,
+            self.result_repository,
+            Mock(),
+        )
+        self.score_with(lambda test_case: 0.2)
+
+    def score_with(self, score_for):
+        self.monkeypatch.setattr(
+            ScoringService,
+            "score_response",
+            staticmethod(lambda test_case, response: [accuracy_metric(score_for(test_case))]),
+        )
+
+    async def save_run(self) -> str:
+        existing = set(self.result_repository._results_dir.glob("result-*.json"))
+        request = EvaluationRequestDTO(
+            model_name="m", benchmark_types=["B1"], pass_threshold=0.5, evaluation_phase="finetuned"
+        )
+        await self.use_case.execute(request)
+        [filepath] = set(self.result_repository._results_dir.glob("result-*.json")) - existing
+        return str(filepath)
+
+    @pytest.mark.asyncio
+    async def test_rescore_replays_saved_responses(self):
+        """Re-scoring uses current scorers and never calls the model."""
+        filepath = await self.save_run()
+        self.model_gateway.generate_response.reset_mock()
+        self.model_gateway.is_model_available.reset_mock()
+        self.score_with(lambda test_case: 0.9 if test_case.test_id in ("B1-001", "B1-002") else 0.2)
+
+        rescored = await self.use_case.rescore(filepath)
+
+        self.model_gateway.generate_response.assert_not_called()
+        self.model_gateway.is_model_available.assert_not_called()
+        assert rescored.summary.overall_score > rescored.previous_overall_score
+        diff = rescored.score_diff[self.test_cases[0].benchmark_type.value]
+        assert (diff["previous_score"], diff["score"]) == (pytest.approx(0.2), pytest.approx(0.55))
+        assert diff["delta"] == pytest.approx(0.35)
+        assert (diff["previous_passed"], diff["passed"]) == (0, 2)
+        assert diff["flipped_tests"] == ["B1-001", "B1-002"]
+
+    @pytest.mark.asyncio
+    async def test_rescore_writes_new_run_file(self):
+        """The re-scored run is saved with its source and score diff."""
+        filepath = await self.save_run()
+
+        rescored = await self.use_case.rescore(filepath)
+
+        assert rescored.output_file != filepath
+        with open(rescored.output_file) as f:
+            saved = json.load(f)
+        assert saved["metadata"]["rescored_from"] == filepath
+        assert saved["metadata"]["pass_threshold"] == 0.5
+        assert "score_diff" in saved["metadata"]
+        assert [r["test_id"] for r in saved["test_results"]] == [tc.test_id for tc in self.test_cases]
+
+    @pytest.mark.asyncio
+    async def test_unknown_test_cases_are_skipped(self):
+        """Saved results whose test case no longer exists are not re-scored."""
+        filepath = await self.save_run()
+        self.test_case_repository.load_by_benchmark.return_value = self.test_cases[:3]
+
+        rescored = await self.use_case.rescore(filepath, save_results=False)
+
+        assert rescored.summary.total_tests == 3
+        assert rescored.skipped_tests == 1
+        assert rescored.output_file is None
+
+    @pytest.mark.asyncio
+    async def test_rescore_many_matches_single_rescores(self):
+        """Each run re-scored together matches re-scoring it alone; totals are exact."""
+        first = await self.save_run()
+        self.test_case_repository.load_by_benchmark.return_value = self.test_cases[:2]
+        second = await self.save_run()
+        self.test_case_repository.load_by_benchmark.return_value = self.test_cases
+        self.score_with(lambda test_case: 0.9 if test_case.test_id == "B1-001" else 0.2)
+
+        archive = await self.use_case.rescore_many([first, second], save_results=False, workers=1)
+        singles = [await self.use_case.rescore(f, save_results=False) for f in (first, second)]
+
+        assert [run.source_file for run in archive.runs] == [first, second]
+        for run, single in zip(archive.runs, singles):
+            assert run.summary.overall_score == single.summary.overall_score
+            assert run.score_diff == single.score_diff
+        totals = archive.by_benchmark[self.test_cases[0].benchmark_type.value]
+        # Mean over all 6 results, not the mean of the two runs' means (0.375, 0.55)
+        assert archive.total_tests == totals["total"] == 6
+        assert totals["score"] == pytest.approx((0.9 + 0.2 * 3 + 0.9 + 0.2) / 6)
+        assert totals["previous_score"] == pytest.approx(0.2)
+        assert (totals["previous_passed"], totals["passed"], totals["flipped"]) == (0, 2, 2)
+        self.model_gateway.generate_response.assert_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
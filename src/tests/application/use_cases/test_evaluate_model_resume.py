@@ -0,0 +1,116 @@
+"""
+Tests for resumable evaluation runs in EvaluateModelUseCase.
+
+Tests:
+1. Each finished result is journaled under the run ID
+2. Resume restores the request, skips journaled tests and re-runs errored ones
+3. The resumed summary covers all test cases in order
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from application.dtos.evaluation_request_dto import EvaluationRequestDTO
+from application.use_cases.evaluate_model import EvaluateModelUseCase
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.ccop_section import CCoPSection
+from domain.value_objects.difficulty_level import DifficultyLevel
+from infrastructure.adapters.repositories.json_result_repository import JSONResultRepository
+
+
+def make_test_case(number: int) -> TestCase:
+    """Create a B1 test case with a label-free expected response."""
+    return TestCase(
+        test_id=f"B1-{number:03d}",
+        benchmark_type=BenchmarkType.from_string("B1_CCoP_Applicability_Scope"),
+        section=CCoPSection.from_string("Section 1: General"),
+        clause_reference="1.1",
+        difficulty=DifficultyLevel.MEDIUM,
+        question=f"Does CCoP 2.0 apply to the CII described in scenario number {number} of this suite?",
+        expected_response="CCoP 2.0 applies to the designated CII.",
+        evaluation_criteria={"accuracy": "Must identify applicability"},
+    )
+
+
+class TestResumableRuns:
+    """Test journaling and resume() against a real JSON result repository."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup use case whose gateway fails on the fourth test case."""
+        self.test_cases = [make_test_case(i) for i in range(1, 7)]
+        self.generated = []
+        self.fail_on = "B1-004"
+
+        async def generate_response(prompt, model_name, **kwargs):
+            test_case = next(tc for tc in self.test_cases if tc.question == prompt)
+            if test_case.test_id == self.fail_on:
+                raise ConnectionError("Ollama went away")
+            self.generated.append(test_case.test_id)
+            return ModelResponse(content="CCoP 2.0 applies to the designated CII.", model_name=model_name)
+
+        self.model_gateway = Mock()
+        self.model_gateway.is_model_available = AsyncMock(return_value=True)
+        self.model_gateway.generate_response = AsyncMock(side_effect=generate_response)
+
+        self.test_case_repository = Mock()
+        self.test_case_repository.load_by_benchmark = AsyncMock(return_value=self.test_cases)
+
+        self.result_repository = JSONResultRepository(tmp_path, Mock())
+        self.use_case = EvaluateModelUseCase(
+            self.model_gateway,
+            self.test_case_repository,
+            self.result_repository,
+            Mock(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_resume_reruns_errored_tests(self):
+        """A failed generation is journaled as errored and re-run on resume."""
+        request = EvaluationRequestDTO(model_name="m", benchmark_types=["B1"], run_id="run-1")
+
+        first = await self.use_case.execute(request)
+
+        assert first.errored_tests == 1
+        assert self.generated == ["B1-001", "B1-002", "B1-003", "B1-005", "B1-006"]
+        journaled = await self.result_repository.load_run_results("run-1", self.test_cases)
+        errored = [r.test_case.test_id for r in journaled if r.metadata.get("errored")]
+        assert errored == ["B1-004"]
+
+        self.fail_on = None
+        self.generated.clear()
+        summary = await self.use_case.resume("run-1")
+
+        assert self.generated == ["B1-004"]
+        assert summary.run_id == "run-1"
+        assert summary.total_tests == 6
+        assert summary.errored_tests == 0
+        assert [r.test_id for r in summary.results] == [tc.test_id for tc in self.test_cases]
+
+    @pytest.mark.asyncio
+    async def test_resume_of_finished_run_generates_nothing(self):
+        """Resuming a complete run rebuilds the summary without the model."""
+        self.fail_on = None
+        request = EvaluationRequestDTO(model_name="m", benchmark_types=["B1"], run_id="run-2")
+        first = await self.use_case.execute(request)
+
+        self.generated.clear()
+        self.model_gateway.is_model_available.reset_mock()
+        summary = await self.use_case.resume("run-2")
+
+        assert self.generated == []
+        self.model_gateway.is_model_available.assert_not_called()
+        assert summary.overall_score == pytest.approx(first.overall_score)
+
+    @pytest.mark.asyncio
+    async def test_resume_unknown_run_raises(self):
+        """Resuming without a journal raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            await self.use_case.resume("missing")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,228 @@
+"""
+Tests for batched Tier 3 judging.
+
+Verifies:
+1. Batch replies are parsed per item; malformed or duplicate verdicts are dropped
+2. N responses sharing a rubric are judged in ceil(N / K) calls
+3. Items with a malformed batched verdict are re-judged on their own
+4. Only verdicts judged on their own are cached and served from the cache
+5. The calibration report compares batched with single-item verdicts
+"""
+
+import json
+import re
+import threading
+
+import pytest
+
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.services.judge_dispatcher import JudgeDispatcher, measure_batch_agreement
+from domain.services.llm_judge_service import LLMJudgeService
+from domain.services.scoring_service import ScoringService
+from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.ccop_section import CCoPSection
+from domain.value_objects.difficulty_level import DifficultyLevel
+from infrastructure.adapters.cache.response_cache import ResponseCache
+
+BATCH_ITEM = re.compile(r"^### Item (\d+)$", re.MULTILINE)
+
+VERDICT = json.dumps({
+    "accuracy_score": 4,
+    "completeness_score": 3,
+    "alignment_score": 5,
+    "justification": "Matches auditor expectations.",
+    "confidence": 0.8,
+})
+
+
+def verdict(item: int, accuracy: int = 4) -> dict:
+    """Build one batch verdict."""
+    return {"item": item, **json.loads(VERDICT), "accuracy_score": accuracy}
+
+
+class BatchJudge(LLMJudgeService):
+    """Judge answering single and batch prompts, with configurable bad items."""
+
+    def __init__(self, malformed_items=(), batch_accuracy=4):
+        super().__init__("claude-sonnet-4")
+        self.malformed_items = set(malformed_items)
+        self.batch_accuracy = batch_accuracy
+        self.single_calls = 0
+        self.batch_calls = 0
+        self._counter_lock = threading.Lock()
+
+    def _call_claude_agent(self, prompt):
+        items = [int(number) for number in BATCH_ITEM.findall(prompt)]
+        with self._counter_lock:
+            if not items:
+                self.single_calls += 1
+                return VERDICT
+            self.batch_calls += 1
+        reply = []
+        for number in items:
+            entry = verdict(number, self.batch_accuracy)
+            if number in self.malformed_items:
+                entry["accuracy_score"] = "high"
+            reply.append(entry)
+        return "```json\n" + json.dumps(reply) + "\n```"
+
+
+def make_test_case(number: int) -> TestCase:
+    """Create a B12 test case."""
+    return TestCase(
+        test_id=f"B12-{number:03d}",
+        benchmark_type=BenchmarkType.from_string("B12_Audit_Perspective_Alignment"),
+        section=CCoPSection.from_string("Section 3: Governance"),
+        clause_reference="3.1.1",
+        difficulty=DifficultyLevel.from_string("medium"),
+        question=f"What audit evidence would demonstrate compliance with Clause 3.1.{number}?",
+        expected_response="Documented policies, approval records and evidence of implementation.",
+        evaluation_criteria={"accuracy": "Must align with audit expectations"},
+    )
+
+
+def requests(count: int):
+    """Build distinct judge requests sharing the B12 rubric."""
+    return ScoringService.llm_judge_requests([
+        (make_test_case(i), ModelResponse(content=f"Board-approved policy and audit logs {i}."))
+        for i in range(count)
+    ])
+
+
+class TestBatchResponseParsing:
+    """Test parsing of JSON array replies."""
+
+    def test_valid_array(self):
+        judge = LLMJudgeService()
+        reply = json.dumps([verdict(2, accuracy=5), verdict(1)])
+
+        evaluations = judge._parse_batch_judge_response(reply, 2)
+
+        assert [e.accuracy_score for e in evaluations] == [4, 5]
+        assert all(not e.errored for e in evaluations)
+
+    def test_malformed_missing_and_duplicate_items_are_none(self):
+        judge = LLMJudgeService()
+        bad_score = {**verdict(1), "completeness_score": 9}
+        reply = json.dumps([bad_score, verdict(2), verdict(2), verdict(7)])
+
+        assert judge._parse_batch_judge_response(reply, 3) == [None, None, None]
+
+    def test_non_array_reply(self):
+        judge = LLMJudgeService()
+
+        assert judge._parse_batch_judge_response(VERDICT, 2) == [None, None]
+        assert judge._parse_batch_judge_response("not json", 2) == [None, None]
+
+    def test_batch_prompt_includes_rubric_once(self):
+        judge = LLMJudgeService()
+        items = [(test_case, response) for test_case, response, _ in requests(3)]
+        rubric = requests(1)[0][2]
+
+        prompt = judge._build_batch_judge_prompt(items, rubric)
+
+        assert BATCH_ITEM.findall(prompt) == ["1", "2", "3"]
+        assert prompt.count(rubric["accuracy"]) == 1
+
+
+class TestBatchedDispatch:
+    """Test JudgeDispatcher in batched mode."""
+
+    def test_judges_in_ceil_n_over_k_calls(self):
+        judge = BatchJudge()
+        dispatcher = JudgeDispatcher(judge=judge, max_concurrency=2, batch_size=4)
+
+        evaluations = dispatcher.evaluate_many(requests(9))
+
+        assert len(evaluations) == 9
+        assert judge.batch_calls == 2
+        assert judge.single_calls == 1  # The last chunk holds a single item
+        assert dispatcher.stats()["judged"] == 9
+        dispatcher.close()
+
+    def test_malformed_item_is_rejudged_singly(self):
+        judge = BatchJudge(malformed_items={2})
+        dispatcher = JudgeDispatcher(judge=judge, batch_size=3)
+
+        evaluations = dispatcher.evaluate_many(requests(3))
+
+        assert judge.batch_calls == 1
+        assert judge.single_calls == 1
+        assert dispatcher.stats()["batch_fallbacks"] == 1
+        assert all(not e.errored for e in evaluations)
+        dispatcher.close()
+
+    def test_failed_batch_call_scores_fallback(self):
+        class FailingJudge(BatchJudge):
+            def _call_claude_agent(self, prompt):
+                raise RuntimeError("judge unavailable")
+
+        dispatcher = JudgeDispatcher(judge=FailingJudge(), batch_size=2)
+
+        evaluations = dispatcher.evaluate_many(requests(2))
+
+        assert all(e.errored and e.confidence == 0.0 for e in evaluations)
+        assert dispatcher.stats()["errors"] == 2
+        dispatcher.close()
+
+    def test_batched_verdicts_not_served_from_cache(self, tmp_path):
+        """A verdict judged inside a batch is never reused; single verdicts are."""
+        store = ResponseCache(tmp_path)
+        first = JudgeDispatcher(judge=BatchJudge(), batch_size=2, verdict_store=store)
+        first.evaluate_many(requests(3))  # One batch of two, one item on its own
+        first.close()
+        assert store.stats()["entries"] == 1
+
+        judge = BatchJudge()
+        second = JudgeDispatcher(judge=judge, batch_size=2, verdict_store=store)
+        second.evaluate_many(requests(3))
+
+        assert second.stats()["cache_hits"] == 1
+        assert judge.batch_calls == 1
+        second.close()
+
+    def test_batch_size_must_be_positive(self):
+        with pytest.raises(ValueError):
+            JudgeDispatcher(judge=BatchJudge(), batch_size=0)
+
+
+class TestBatchAgreement:
+    """Test the batched vs single-item calibration report."""
+
+    def test_full_agreement(self):
+        report = measure_batch_agreement(
+            JudgeDispatcher(judge=BatchJudge()),
+            JudgeDispatcher(judge=BatchJudge(), batch_size=4),
+            requests(8),
+        )
+
+        assert report.items == 8
+        assert report.exact_agreement == 1.0
+        assert report.max_abs_score_diff == 0.0
+        assert report.single_calls == 8
+        assert report.batched_calls == 2
+
+    def test_disagreement_is_measured(self):
+        report = measure_batch_agreement(
+            JudgeDispatcher(judge=BatchJudge()),
+            JudgeDispatcher(judge=BatchJudge(batch_accuracy=2), batch_size=4),
+            requests(4),
+        )
+
+        assert report.exact_agreement == 0.0
+        assert report.within_one == 0.0
+        assert report.criterion_agreement == {"accuracy": 0.0, "completeness": 1.0, "alignment": 1.0}
+        assert report.mean_abs_score_diff == pytest.approx(2 / 15)
+
+    def test_empty_calibration_set(self):
+        with pytest.raises(ValueError):
+            measure_batch_agreement(
+                JudgeDispatcher(judge=BatchJudge()),
+                JudgeDispatcher(judge=BatchJudge(), batch_size=2),
+                [],
+            )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
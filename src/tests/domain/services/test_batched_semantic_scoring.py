@@ -0,0 +1,130 @@
+"""
+Tests for batched Tier 2 semantic scoring.
+
+Verifies:
+1. Pairwise similarity matches per-pair similarity
+2. All pairs are encoded in one batch per side
+3. ScoringService.score_responses matches score_response per test
+"""
+
+import numpy as np
+import pytest
+
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.services.embedding_model_registry import EmbeddingModelRegistry
+from domain.services.scoring_service import ScoringService
+from domain.services.semantic_similarity_service import SemanticSimilarityService
+from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.ccop_section import CCoPSection
+from domain.value_objects.difficulty_level import DifficultyLevel
+
+
+class FakeEncoder:
+    """Bag-of-characters encoder (similar texts get similar vectors); records encode calls."""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size=32):
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        self.calls.append(len(batch))
+        vectors = np.zeros((len(batch), 64), dtype=np.float32)
+        for row, text in enumerate(batch):
+            for char in text.lower():
+                vectors[row, ord(char) % 64] += 1.0
+        return vectors[0] if single else vectors
+
+
+@pytest.fixture
+def encoder(monkeypatch):
+    """Serve a fake encoder from the process-wide model registry."""
+    encoder = FakeEncoder()
+    registry = EmbeddingModelRegistry(factory=lambda model_name: encoder)
+    monkeypatch.setattr(SemanticSimilarityService, "_registry", registry)
+    monkeypatch.setattr(SemanticSimilarityService, "_embedding_store", None)
+    return encoder
+
+
+def make_test_case(number: int, benchmark: str = "B8_Gap_Prioritisation") -> TestCase:
+    """Create a test case with a distinct expected response."""
+    return TestCase(
+        test_id=f"{benchmark.split('_')[0]}-{number:03d}",
+        benchmark_type=BenchmarkType(benchmark),
+        section=CCoPSection("Section 5: Protection"),
+        clause_reference="5.1.1",
+        difficulty=DifficultyLevel("medium"),
+        question="Test question with at least fifty characters for validation to pass successfully",
+        expected_response=f"CIIOs must enforce multi-factor authentication for privileged access {number}.",
+        evaluation_criteria={"accuracy": "test"},
+        key_facts=["CIIOs must enforce multi-factor authentication"],
+    )
+
+
+class TestPairwiseSimilarity:
+    """Test SemanticSimilarityService.calculate_pairwise_similarity."""
+
+    def test_matches_per_pair_similarity(self, encoder):
+        """Batched cosines equal the per-pair cosines."""
+        service = SemanticSimilarityService()
+        references = ["security monitoring", "patch within two weeks", "incident reporting", ""]
+        responses = ["monitoring of security", "apply patches quickly", "zzz", "anything"]
+
+        batched = service.calculate_pairwise_similarity(references, responses)
+        single = [service.calculate_similarity(r, s) for r, s in zip(references, responses)]
+
+        assert batched == pytest.approx(single, abs=1e-6)
+        assert batched[3] == 0.0
+
+    def test_encodes_each_side_in_one_batch(self, encoder):
+        """N pairs cost two encode calls, not N."""
+        service = SemanticSimilarityService()
+        references = [f"reference text {i}" for i in range(50)]
+        responses = [f"response text {i}" for i in range(50)]
+
+        service.calculate_pairwise_similarity(references, responses)
+
+        assert encoder.calls == [50, 50]
+
+    def test_length_mismatch_rejected(self, encoder):
+        """References and responses must align."""
+        with pytest.raises(ValueError):
+            SemanticSimilarityService().calculate_pairwise_similarity(["a"], ["a", "b"])
+
+
+class TestScoreResponses:
+    """Test ScoringService.score_responses."""
+
+    def test_matches_individual_scoring(self, encoder):
+        """Batched scoring yields the same metrics as per-test scoring."""
+        pairs = [
+            (make_test_case(i), ModelResponse(
+                content=f"Privileged access requires multi-factor authentication {i}.",
+                model_name="m",
+            ))
+            for i in range(6)
+        ]
+        pairs.append((
+            make_test_case(7, "B1_CCoP_Applicability_Scope"),
+            ModelResponse(content="CCoP 2.0 applies to the designated CII.", model_name="m"),
+        ))
+
+        batched = ScoringService.score_responses(pairs)
+        encoder.calls.clear()
+        individual = [ScoringService.score_response(tc, r) for tc, r in pairs]
+
+        for batch_metrics, single_metrics in zip(batched, individual):
+            assert [m.name for m in batch_metrics] == [m.name for m in single_metrics]
+            assert [m.value for m in batch_metrics] == pytest.approx(
+                [m.value for m in single_metrics], abs=1e-6
+            )
+
+    def test_reasoning_track_detection(self):
+        """Only B8/B9/B11/B15/B17/B18/B19 use semantic similarity."""
+        assert ScoringService.is_reasoning_track(make_test_case(1, "B8_Gap_Prioritisation"))
+        assert not ScoringService.is_reasoning_track(make_test_case(1, "B1_CCoP_Applicability_Scope"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
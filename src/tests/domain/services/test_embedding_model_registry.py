@@ -0,0 +1,174 @@
+"""
+Tests for EmbeddingModelRegistry.
+
+Verifies:
+1. Models are loaded once and shared, also under concurrent first use
+2. The least recently used model is evicted beyond the cap
+3. Encode calls on one model are serialized; load and encode metrics are recorded
+4. Services for different models coexist (A/B comparison in one process)
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from domain.services.embedding_model_registry import EmbeddingModelRegistry
+from domain.services.semantic_similarity_service import SemanticSimilarityService
+
+
+class FakeEncoder:
+    """Encoder that detects overlapping encode calls."""
+
+    def __init__(self, name: str, delay: float = 0.0):
+        self.name = name
+        self.delay = delay
+        self.active = 0
+        self.overlapped = False
+
+    def encode(self, texts, batch_size=32):
+        self.active += 1
+        self.overlapped = self.overlapped or self.active > 1
+        time.sleep(self.delay)
+        self.active -= 1
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        offset = sum(map(ord, self.name)) % 7
+        vectors = np.array(
+            [[len(text), (len(text) + offset) % 5 + 1, 1.0] for text in batch],
+            dtype=np.float32,
+        )
+        return vectors[0] if single else vectors
+
+
+class CountingFactory:
+    """Factory that records loads."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.loaded = []
+
+    def __call__(self, model_name):
+        time.sleep(self.delay)
+        self.loaded.append(model_name)
+        return FakeEncoder(model_name, delay=0.01)
+
+
+class TestEmbeddingModelRegistry:
+    """Test model lifetime and metrics."""
+
+    def test_model_loaded_once_and_shared(self):
+        """Repeated gets return the same resident model."""
+        factory = CountingFactory()
+        registry = EmbeddingModelRegistry(factory=factory)
+
+        assert registry.get("a") is registry.get("a")
+        assert factory.loaded == ["a"]
+
+    def test_concurrent_first_use_loads_once(self):
+        """Threads racing on a cold model trigger a single load."""
+        factory = CountingFactory(delay=0.05)
+        registry = EmbeddingModelRegistry(factory=factory)
+        models = []
+
+        threads = [threading.Thread(target=lambda: models.append(registry.get("a"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert factory.loaded == ["a"]
+        assert all(model is models[0] for model in models)
+
+    def test_lru_eviction(self):
+        """Beyond the cap, the least recently used model is released."""
+        factory = CountingFactory()
+        registry = EmbeddingModelRegistry(factory=factory, max_models=2)
+
+        registry.get("a")
+        registry.get("b")
+        registry.get("a")  # b is now least recently used
+        registry.get("c")
+
+        assert registry.resident_models == ["a", "c"]
+        assert registry.stats()["evictions"] == 1
+
+        registry.get("b")
+        assert factory.loaded == ["a", "b", "c", "b"]
+
+    def test_unload_and_clear(self):
+        """Models can be released explicitly."""
+        registry = EmbeddingModelRegistry(factory=CountingFactory())
+        registry.get("a")
+        registry.get("b")
+
+        assert registry.unload("a")
+        assert not registry.unload("a")
+        assert registry.resident_models == ["b"]
+        registry.clear()
+        assert registry.resident_models == []
+
+    def test_invalid_cap_rejected(self):
+        """At least one model must fit."""
+        with pytest.raises(ValueError):
+            EmbeddingModelRegistry(max_models=0)
+
+    def test_encode_calls_serialized(self):
+        """Concurrent encodes with one model never overlap."""
+        registry = EmbeddingModelRegistry(factory=CountingFactory())
+        model = registry.get("a")
+
+        threads = [threading.Thread(target=model.encode, args=(["x", "y"],)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not model.encoder.overlapped
+        assert model.encode_calls == 6
+        assert model.encoded_texts == 12
+
+    def test_metrics(self):
+        """Load time and per-model encode counters are reported."""
+        registry = EmbeddingModelRegistry(factory=CountingFactory(delay=0.02))
+        registry.get("a").encode("text")
+
+        stats = registry.stats()
+        assert stats["loads"] == 1
+        assert stats["load_seconds"] >= 0.02
+        assert stats["models"]["a"]["encoded_texts"] == 1
+        assert stats["models"]["a"]["cache_key"] == "a"
+
+
+class TestSemanticSimilarityWithRegistry:
+    """Test services backed by a shared registry."""
+
+    def test_services_for_different_models_coexist(self):
+        """Comparing two embedding models does not reload either."""
+        factory = CountingFactory()
+        registry = EmbeddingModelRegistry(factory=factory, max_models=2)
+        model_a = SemanticSimilarityService("model-a", registry=registry)
+        model_b = SemanticSimilarityService("model-b", registry=registry)
+
+        for _ in range(3):
+            model_a.calculate_similarity("expected answer", "some response")
+            model_b.calculate_similarity("expected answer", "some response")
+
+        assert factory.loaded == ["model-a", "model-b"]
+        assert model_a.model_name == "model-a"
+
+    def test_default_registry_configurable(self, monkeypatch):
+        """Services constructed without a registry use the configured one."""
+        registry = EmbeddingModelRegistry(factory=CountingFactory())
+        monkeypatch.setattr(SemanticSimilarityService, "_registry", None)
+        SemanticSimilarityService.configure_registry(registry)
+
+        SemanticSimilarityService("model-a")
+
+        assert SemanticSimilarityService.registry() is registry
+        assert registry.resident_models == ["model-a"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,243 @@
+"""
+Tests for concurrent, rate-limited, cached Tier 3 judging.
+
+Verifies:
+1. The token bucket allows a burst, then paces callers
+2. Judgements run concurrently up to the limit
+3. Verdicts are cached on disk by judge model and prompt; failures are not
+4. ScoringService.score_responses judges all Tier 3 tests in one dispatch
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.services.judge_dispatcher import JudgeDispatcher, TokenBucket
+from domain.services.llm_judge_service import LLMJudgeService
+from domain.services.scoring_service import ScoringService
+from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.ccop_section import CCoPSection
+from domain.value_objects.difficulty_level import DifficultyLevel
+from infrastructure.adapters.cache.response_cache import ResponseCache
+
+VERDICT = json.dumps({
+    "accuracy_score": 4,
+    "completeness_score": 3,
+    "alignment_score": 5,
+    "justification": "Matches auditor expectations.",
+    "confidence": 0.8,
+})
+
+
+class FakeJudge(LLMJudgeService):
+    """Judge that records calls and concurrency instead of starting claude."""
+
+    def __init__(self, model_name="claude-sonnet-4", delay=0.0, fail=False):
+        super().__init__(model_name)
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self._counter_lock = threading.Lock()
+
+    def _call_claude_agent(self, prompt):
+        with self._counter_lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._counter_lock:
+            self.active -= 1
+        if self.fail:
+            raise RuntimeError("judge unavailable")
+        return VERDICT
+
+
+def make_test_case(number: int, benchmark: str = "B12_Audit_Perspective_Alignment") -> TestCase:
+    """Create a Tier 3 test case."""
+    return TestCase(
+        test_id=f"{benchmark.split('_')[0]}-{number:03d}",
+        benchmark_type=BenchmarkType.from_string(benchmark),
+        section=CCoPSection.from_string("Section 3: Governance"),
+        clause_reference="3.1.1",
+        difficulty=DifficultyLevel.from_string("medium"),
+        question=f"What audit evidence would demonstrate compliance with Clause 3.1.{number}?",
+        expected_response="Documented policies, approval records and evidence of implementation.",
+        evaluation_criteria={"accuracy": "Must align with audit expectations"},
+    )
+
+
+def requests(count: int):
+    """Build distinct judge requests."""
+    rubric = ScoringService._get_tier3_rubric(make_test_case(1).benchmark_type)
+    return [
+        (make_test_case(i), ModelResponse(content=f"Policy documents and board approvals {i}."), rubric)
+        for i in range(count)
+    ]
+
+
+class TestTokenBucket:
+    """Test TokenBucket pacing."""
+
+    def test_burst_then_paced(self):
+        """A full bucket admits `burst` callers, then one per 1/rate seconds."""
+        now = [0.0]
+        sleeps = []
+        bucket = TokenBucket(rate_per_s=2.0, burst=2, clock=lambda: now[0], sleep=sleeps.append)
+
+        waits = [bucket.acquire() for _ in range(4)]
+
+        assert waits == pytest.approx([0.0, 0.0, 0.5, 1.0])
+        assert sleeps == pytest.approx([0.5, 1.0])
+
+    def test_refills_over_time(self):
+        """Idle time refills the bucket up to its capacity."""
+        now = [0.0]
+        bucket = TokenBucket(rate_per_s=1.0, burst=2, clock=lambda: now[0], sleep=lambda s: None)
+        bucket.acquire()
+        bucket.acquire()
+
+        now[0] = 10.0
+
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == 0.0
+        assert bucket.acquire() == pytest.approx(1.0)
+
+    def test_invalid_rate_rejected(self):
+        """Rate must be positive."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate_per_s=0)
+
+
+class TestJudgeDispatcher:
+    """Test JudgeDispatcher."""
+
+    def test_judgements_run_concurrently(self):
+        """Independent judgements overlap up to max_concurrency."""
+        judge = FakeJudge(delay=0.1)
+        dispatcher = JudgeDispatcher(judge=judge, max_concurrency=3)
+
+        start = time.perf_counter()
+        evaluations = dispatcher.evaluate_many(requests(6))
+        elapsed = time.perf_counter() - start
+        dispatcher.close()
+
+        assert len(evaluations) == 6
+        assert all(e.alignment_score == 5 for e in evaluations)
+        assert judge.peak == 3
+        assert elapsed < 0.5  # Serial judging would take 0.6s
+
+    def test_verdicts_cached_across_runs(self, tmp_path):
+        """Re-running unchanged tests never calls the judge again."""
+        first_judge = FakeJudge()
+        JudgeDispatcher(judge=first_judge, verdict_store=ResponseCache(tmp_path)).evaluate_many(requests(3))
+
+        second_judge = FakeJudge()
+        dispatcher = JudgeDispatcher(judge=second_judge, verdict_store=ResponseCache(tmp_path))
+        evaluations = dispatcher.evaluate_many(requests(3))
+
+        assert first_judge.calls == 3
+        assert second_judge.calls == 0
+        assert dispatcher.stats()["cache_hits"] == 3
+        assert evaluations[0].overall_score == pytest.approx(12 / 15)
+        assert evaluations[0].raw_response == VERDICT
+
+    def test_cache_keyed_by_judge_model(self, tmp_path):
+        """Another judge model does not reuse verdicts."""
+        JudgeDispatcher(judge=FakeJudge("claude-sonnet-4"), verdict_store=ResponseCache(tmp_path)).evaluate_many(requests(1))
+
+        other_judge = FakeJudge("claude-opus-4")
+        JudgeDispatcher(judge=other_judge, verdict_store=ResponseCache(tmp_path)).evaluate_many(requests(1))
+
+        assert other_judge.calls == 1
+
+    def test_failures_fall_back_and_are_not_cached(self, tmp_path):
+        """A failed judgement scores conservatively and is retried next run."""
+        store = ResponseCache(tmp_path)
+        dispatcher = JudgeDispatcher(judge=FakeJudge(fail=True), verdict_store=store)
+
+        evaluation = dispatcher.evaluate(*requests(1)[0])
+
+        assert evaluation.confidence == 0.0
+        assert "error" in evaluation.justification.lower()
+        assert dispatcher.stats()["errors"] == 1
+        assert store.stats()["writes"] == 0
+
+    def test_identical_prompts_judged_once(self):
+        """Duplicate judgements in flight share one judge call."""
+        judge = FakeJudge(delay=0.1)
+        dispatcher = JudgeDispatcher(judge=judge, max_concurrency=4)
+
+        evaluations = dispatcher.evaluate_many(requests(1) * 3)
+
+        assert judge.calls == 1
+        assert dispatcher.stats()["deduplicated"] == 2
+        assert len(evaluations) == 3
+
+    def test_rate_limit_paces_judgements(self):
+        """Judgements beyond the burst wait for tokens."""
+        dispatcher = JudgeDispatcher(
+            judge=FakeJudge(), max_concurrency=4, rate_per_minute=600, burst=1
+        )
+
+        dispatcher.evaluate_many(requests(3))
+
+        assert dispatcher.stats()["rate_limited_seconds"] == pytest.approx(0.3, abs=0.05)
+
+    def test_shared_dispatcher_created_once_across_threads(self, monkeypatch):
+        """Concurrent first calls to shared() get the same dispatcher."""
+        created = []
+
+        def slow_init(self, *args, **kwargs):
+            time.sleep(0.02)
+            created.append(self)
+
+        monkeypatch.setattr(JudgeDispatcher, "_shared", None)
+        monkeypatch.setattr(JudgeDispatcher, "__init__", slow_init)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            dispatchers = list(pool.map(lambda _: JudgeDispatcher.shared(), range(8)))
+
+        assert len(created) == 1
+        assert all(dispatcher is created[0] for dispatcher in dispatchers)
+
+
+class TestScoreResponsesTier3:
+    """Test batched Tier 3 scoring through the shared dispatcher."""
+
+    @pytest.fixture
+    def judge(self, monkeypatch):
+        judge = FakeJudge(delay=0.05)
+        monkeypatch.setattr(
+            JudgeDispatcher, "_shared", JudgeDispatcher(judge=judge, max_concurrency=4)
+        )
+        return judge
+
+    def test_batch_matches_individual_scoring(self, judge):
+        """Concurrent judging yields the same metrics as per-test scoring."""
+        pairs = [(tc, response) for tc, response, _ in requests(4)]
+        pairs.append((make_test_case(9, "B20_Compliance_Reasoning"), ModelResponse(content="Answer.")))
+
+        batched = ScoringService.score_responses(pairs)
+        individual = [ScoringService.score_response(tc, r) for tc, r in pairs]
+
+        assert judge.peak > 1
+        for batch_metrics, single_metrics in zip(batched, individual):
+            assert [(m.name, m.value) for m in batch_metrics] == [
+                (m.name, m.value) for m in single_metrics
+            ]
+
+    def test_llm_judged_detection(self):
+        """Only B12/B13/B20 use the LLM judge."""
+        assert ScoringService.is_llm_judged(make_test_case(1))
+        assert not ScoringService.is_llm_judged(make_test_case(1, "B1_CCoP_Applicability_Scope"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,70 @@
+"""
+Tests for Jaccard word-overlap scoring.
+
+Verifies:
+1. Responses are tokenized once and share their word set
+2. Inclusion-exclusion Jaccard is bit-identical to the set-union formula
+"""
+
+import random
+import re
+
+import pytest
+
+from domain.entities.model_response import ModelResponse
+from domain.services.scoring_service import ScoringService
+
+WORDS = ["CIIO", "ciio", "audit", "auditor", "risk", "öt", "ÖT", "naïve", "5.1.2", "it's", "_x_", "ÆØÅ"]
+
+
+def reference_jaccard(expected: str, response: str) -> float:
+    """Per-test formula before word sets were cached (two sets and a union set)."""
+    expected_words = set(re.findall(r"\w+", expected.lower()))
+    response_words = set(re.findall(r"\w+", response.lower()))
+    if not expected_words and not response_words:
+        return 0.0
+    union = len(expected_words | response_words)
+    return len(expected_words & response_words) / union if union > 0 else 0.0
+
+
+def random_text(rng: random.Random) -> str:
+    """Random text with unicode words, punctuation and repeats."""
+    separators = [" ", ", ", ". ", "-", "\n", " (", ") "]
+    return "".join(rng.choice(WORDS) + rng.choice(separators) for _ in range(rng.randint(0, 30)))
+
+
+class TestResponseWordSet:
+    """Test the cached response word set."""
+
+    def test_lowercased_words(self):
+        response = ModelResponse(content="The CIIO's Audit: CIIO audit, 5.1.2!")
+
+        assert response.word_set == frozenset({"the", "ciio", "s", "audit", "5", "1", "2"})
+
+    def test_tokenized_once(self):
+        response = ModelResponse(content="The CIIO must report incidents.")
+
+        assert response.word_set is response.word_set
+
+
+class TestJaccardSimilarity:
+    """Test Jaccard similarity against the set-union formula."""
+
+    def test_empty_sets(self):
+        assert ScoringService.jaccard_similarity(frozenset(), frozenset()) == 0.0
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_bit_identical_to_per_test_formula(self, seed):
+        rng = random.Random(seed)
+        for _ in range(500):
+            expected, content = random_text(rng), random_text(rng)
+            response = ModelResponse(content=content)
+            words = frozenset(re.findall(r"\w+", expected.lower()))
+
+            assert ScoringService.jaccard_similarity(words, response.word_set) == reference_jaccard(
+                expected, content
+            )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,154 @@
+"""
+Tests for the scorer registry.
+
+Verifies:
+1. Scorers register by decorator and are found by benchmark number
+2. Batch variants attach to their scorer; duplicates are rejected
+3. score_responses groups a run by scorer and uses batch variants
+4. score_responses reports test cases missing a scorer's required fields
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.services.scorer_registry import ScorerRegistry
+from domain.services.scoring_service import SCORERS, ScoringService
+from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.ccop_section import CCoPSection
+from domain.value_objects.difficulty_level import DifficultyLevel
+from domain.value_objects.evaluation_metric import accuracy_metric
+
+
+def make_test_case(number: int, benchmark: str, **overrides) -> TestCase:
+    """Create a test case for a benchmark."""
+    fields = dict(
+        test_id=f"{benchmark.split('_')[0]}-{number:03d}",
+        benchmark_type=BenchmarkType.from_string(benchmark),
+        section=CCoPSection.from_string("Section 1: General Provisions"),
+        clause_reference="1.1",
+        difficulty=DifficultyLevel.from_string("medium"),
+        question="Which CCoP 2.0 obligations apply to this critical information infrastructure?",
+        expected_response="The CIIO must report incidents to the Commissioner.",
+        evaluation_criteria={"accuracy": "Must cite the reporting duty"},
+    )
+    fields.update(overrides)
+    return TestCase(**fields)
+
+
+class TestScorerRegistry:
+    """Test registration and lookup."""
+
+    def test_register_and_get_by_number(self):
+        registry = ScorerRegistry()
+
+        @registry.register("B1", "B21", tier=1, requires=("key_facts",))
+        def score(test_case, response):
+            return [accuracy_metric(1.0)]
+
+        spec = registry.get(BenchmarkType.from_string("B21_Whatever_Description"))
+
+        assert spec.score is score
+        assert spec.benchmarks == (1, 21)
+        assert not spec.batchable
+        assert registry.get(BenchmarkType.from_string("B2")) is None
+        assert registry.benchmarks() == ["B1", "B21"]
+
+    def test_batch_variant_attaches_to_all_benchmarks(self):
+        registry = ScorerRegistry()
+
+        @registry.register("B8", "B9", tier=2)
+        def score(test_case, response):
+            return []
+
+        @registry.register_batch(staticmethod(score))
+        def score_batch(pairs, batch_size):
+            return [[] for _ in pairs]
+
+        for benchmark in ("B8", "B9"):
+            spec = registry.get(BenchmarkType.from_string(benchmark))
+            assert spec.batchable and spec.score_batch is score_batch
+
+    def test_duplicate_and_unknown_registrations_rejected(self):
+        registry = ScorerRegistry()
+        registry.register("B1", tier=1)(lambda test_case, response: [])
+
+        with pytest.raises(ValueError):
+            registry.register("B1", tier=1)(lambda test_case, response: [])
+        with pytest.raises(ValueError):
+            registry.register_batch(lambda test_case, response: [])(lambda pairs, batch_size: [])
+
+    def test_missing_fields(self):
+        spec = SCORERS.get(BenchmarkType.from_string("B4"))
+
+        assert spec.missing_fields(make_test_case(1, "B4_Singapore_Terminology")) == ["key_terminology"]
+        assert spec.missing_fields(make_test_case(
+            1, "B4_Singapore_Terminology", metadata={"key_terminology": ["CIIO"]}
+        )) == []
+
+
+class TestScoringServiceDispatch:
+    """Test ScoringService dispatch through the registry."""
+
+    def test_all_implemented_benchmarks_registered(self):
+        assert SCORERS.benchmarks() == [
+            "B1", "B2", "B3", "B4", "B5", "B6", "B8", "B9", "B11",
+            "B12", "B13", "B15", "B17", "B18", "B19", "B20", "B21",
+        ]
+        assert SCORERS.benchmarks(tier=3) == ["B12", "B13", "B20"]
+
+    def test_unimplemented_benchmark_raises(self):
+        test_case = make_test_case(1, "B7_Code_Violation_Detection")
+        response = ModelResponse(content="Hardcoded credentials violate access control.")
+
+        with pytest.raises(NotImplementedError, match="B7"):
+            ScoringService.score_response(test_case, response)
+        with pytest.raises(NotImplementedError):
+            ScoringService.score_responses([(test_case, response)])
+
+    def test_score_responses_groups_by_scorer(self, monkeypatch):
+        calls = []
+        spec = SCORERS.get(BenchmarkType.from_string("B8"))
+
+        def fake_batch(pairs, batch_size):
+            calls.append([test_case.test_id for test_case, _ in pairs])
+            return [[accuracy_metric(0.5)] for _ in pairs]
+
+        patched = replace(spec, score_batch=fake_batch)
+        for number in spec.benchmarks:
+            monkeypatch.setitem(SCORERS._by_benchmark, number, patched)
+        response = ModelResponse(content="The CIIO must report incidents.")
+        pairs = [
+            (make_test_case(1, "B8_Gap_Prioritisation"), response),
+            (make_test_case(1, "B3_Hallucination_Rate"), response),
+            (make_test_case(2, "B8_Gap_Prioritisation"), response),
+        ]
+
+        results = ScoringService.score_responses(pairs)
+
+        assert results[0] == results[2] == [accuracy_metric(0.5)]
+        assert results[1] == ScoringService.score_response(pairs[1][0], response)
+        assert calls == [["B8-001", "B8-002"]]
+
+    def test_score_responses_reports_missing_required_fields(self):
+        reports = []
+        response = ModelResponse(content="The CIIO must report incidents.")
+        pairs = [
+            (make_test_case(1, "B4_Singapore_Terminology"), response),
+            (make_test_case(2, "B4_Singapore_Terminology", metadata={"key_terminology": ["CIIO"]}), response),
+            (make_test_case(3, "B4_Singapore_Terminology"), response),
+            (make_test_case(1, "B3_Hallucination_Rate"), response),
+        ]
+
+        results = ScoringService.score_responses(
+            pairs, on_missing_fields=lambda *report: reports.append(report)
+        )
+
+        assert reports == [("_score_b4_terminology", "key_terminology", ["B4-001", "B4-003"])]
+        assert results == ScoringService.score_responses(pairs)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,27 @@
+"""
+Tests for shared summary statistics.
+
+Tests:
+1. Percentiles interpolate linearly between ranks
+"""
+
+import pytest
+
+from domain.services.statistics import percentile
+
+
+class TestPercentile:
+    """Test percentile."""
+
+    def test_percentile_interpolates(self):
+        """Percentile uses linear interpolation between ranks."""
+        values = [40.0, 10.0, 30.0, 20.0]
+
+        assert percentile(values, 0) == 10.0
+        assert percentile(values, 50) == 25.0
+        assert percentile(values, 100) == 40.0
+        assert percentile([], 95) == 0.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
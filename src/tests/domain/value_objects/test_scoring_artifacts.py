@@ -0,0 +1,122 @@
+"""
+Tests for precompiled scoring artifacts.
+
+Verifies:
+1. Artifacts hold the test case's tokens, key terms, labels and claims
+2. Artifacts are compiled once per test case
+3. Scorers read the artifacts instead of re-deriving them per response
+"""
+
+import pytest
+
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.services.scoring_service import ScoringService
+from domain.value_objects import scoring_artifacts
+from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.ccop_section import CCoPSection
+from domain.value_objects.difficulty_level import DifficultyLevel
+from domain.value_objects.scoring_artifacts import HALLUCINATION_PATTERNS, ScoringArtifacts
+
+
+def make_test_case(**overrides) -> TestCase:
+    """Create a B1 test case with Phase 2 fields."""
+    fields = dict(
+        test_id="B1-001",
+        benchmark_type=BenchmarkType.from_string("B1_CCoP_Applicability_Scope"),
+        section=CCoPSection.from_string("Section 1: General Provisions"),
+        clause_reference="1.1",
+        difficulty=DifficultyLevel.from_string("medium"),
+        question="Does CCoP 2.0 apply to a CII owner's outsourced operations and vendors?",
+        expected_response="Yes. The CIIO remains accountable! Vendors must comply.",
+        evaluation_criteria={"scoring_strategy": "label_based"},
+        key_facts=["CIIO remains accountable", "Vendors must comply with controls", "Yes"],
+        expected_label="Applicable; CIIO accountable and vendors bound",
+        forbidden_claims=["Cybersecurity Implementation Officer"],
+        metadata={"key_terminology": ["CIIO", "CSA"]},
+    )
+    fields.update(overrides)
+    return TestCase(**fields)
+
+
+class TestScoringArtifacts:
+    """Test artifact compilation."""
+
+    def test_contents(self):
+        artifacts = make_test_case().scoring_artifacts
+
+        assert artifacts.expected_words == frozenset(
+            {"yes", "the", "ciio", "remains", "accountable", "vendors", "must", "comply"}
+        )
+        assert artifacts.key_fact_terms == (
+            ("remains", "accountable"), ("vendors", "comply", "controls"), ()
+        )
+        assert artifacts.sentence_terms == ((), ("remains", "accountable"), ("vendors", "comply"))
+        assert artifacts.expected_label == "applicable; ciio accountable and vendors bound"
+        assert artifacts.label_components == ("applicable", "ciio accountable", "vendors bound")
+        assert artifacts.forbidden_claims == ("cybersecurity implementation officer",)
+        assert artifacts.key_terminology == ("ciio", "csa")
+        assert artifacts.grounding_patterns is HALLUCINATION_PATTERNS
+
+    def test_non_string_label_is_ignored(self):
+        artifacts = make_test_case(expected_label={"IT_examples": ["workstations"]}).scoring_artifacts
+
+        assert artifacts.expected_label is None
+        assert artifacts.label_components == ()
+
+    def test_compiled_once_per_test_case(self, monkeypatch):
+        builds = []
+        original = ScoringArtifacts.build.__func__
+        monkeypatch.setattr(
+            ScoringArtifacts, "build",
+            classmethod(lambda cls, **kwargs: builds.append(1) or original(cls, **kwargs)),
+        )
+        test_case = make_test_case()
+
+        first = test_case.scoring_artifacts
+        for _ in range(3):
+            ScoringService.score_response(test_case, ModelResponse(content="The CIIO remains accountable."))
+
+        assert test_case.scoring_artifacts is first
+        assert len(builds) == 1
+
+
+class TestScorersUseArtifacts:
+    """Test that scoring only tokenizes the response."""
+
+    def test_expected_response_is_not_retokenized(self, monkeypatch):
+        test_case = make_test_case(expected_label=None)
+        test_case.scoring_artifacts
+        tokenized = []
+        original = scoring_artifacts.WORD_PATTERN
+
+        class RecordingPattern:
+            def findall(self, text):
+                tokenized.append(text)
+                return original.findall(text)
+
+        monkeypatch.setattr("domain.entities.model_response.WORD_PATTERN", RecordingPattern())
+        response = ModelResponse(content="Yes, the CIIO remains accountable and vendors must comply.")
+
+        ScoringService.score_response(test_case, response)
+
+        assert tokenized == [response.content.lower()]
+
+    def test_scores(self):
+        test_case = make_test_case()
+        response = ModelResponse(
+            content="Applicable. The CIIO accountable; vendors must comply with controls."
+        )
+
+        accuracy, completeness, grounding = ScoringService.score_response(test_case, response)
+
+        assert accuracy.value == 0.7  # 2 of 3 label components
+        assert completeness.value == pytest.approx(1 / 3)  # Only the vendor fact is covered
+        assert grounding.value == 1.0
+
+        fabricated = ModelResponse(content="Appoint a Cybersecurity Implementation Officer.")
+        assert ScoringService._calculate_grounding_score(test_case, fabricated).value == 0.7
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
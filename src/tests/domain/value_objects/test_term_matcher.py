@@ -0,0 +1,193 @@
+"""
+Property tests for single-pass term matching in the rule-based scorers.
+
+Verifies, over seeded random test cases and responses built from an
+overlapping vocabulary (shared prefixes, terms inside other terms, case
+variants), that scorers reading TermMatcher match sets score exactly like
+the previous per-term substring scans of the lowercased response.
+"""
+
+import random
+import re
+
+import pytest
+
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.services.scoring_service import ScoringService
+from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.ccop_section import CCoPSection
+from domain.value_objects.difficulty_level import DifficultyLevel
+from domain.value_objects.scoring_artifacts import TermMatcher
+
+EXAMPLES = 400
+
+VOCABULARY = [
+    "audit", "auditor", "auditors", "Audit", "comply", "compliance", "compliant",
+    "ciio", "CIIOs", "vendor", "vendors", "and", "band", "officer", "report",
+    "reporting", "incident", "Incidents", "control", "controls", "ot", "it",
+    "applicable", "not applicable", "risk", "risks", "cryptography",
+]
+
+
+def random_phrase(rng: random.Random, max_words: int = 4) -> str:
+    """Build a phrase from the overlapping vocabulary."""
+    return " ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(1, max_words)))
+
+
+def random_test_case(rng: random.Random, benchmark: str) -> TestCase:
+    """Build a test case with random Phase 2 fields and metadata terms."""
+    separators = ["; ", ": ", " and ", " ", ";;"]
+    label = rng.choice(separators).join(random_phrase(rng, 2) for _ in range(rng.randint(1, 3)))
+    return TestCase(
+        test_id=f"{benchmark.split('_')[0]}-001",
+        benchmark_type=BenchmarkType.from_string(benchmark),
+        section=CCoPSection.from_string("Section 1: General Provisions"),
+        clause_reference="1.1",
+        difficulty=DifficultyLevel.from_string("medium"),
+        question="Which CCoP 2.0 obligations apply to this critical information infrastructure?",
+        expected_response=". ".join(random_phrase(rng, 6) for _ in range(rng.randint(1, 4))),
+        evaluation_criteria={"scoring_strategy": "label_based"},
+        key_facts=[random_phrase(rng) for _ in range(rng.randint(0, 5))],
+        expected_label=rng.choice([label, None]),
+        forbidden_claims=[random_phrase(rng, 2) for _ in range(rng.randint(0, 3))],
+        metadata={
+            "key_terminology": [rng.choice(VOCABULARY) for _ in range(rng.randint(0, 4))],
+            "expected_violations": [random_phrase(rng, 2) for _ in range(rng.randint(0, 3))],
+        },
+    )
+
+
+def random_response(rng: random.Random) -> ModelResponse:
+    """Build a response, sometimes gluing words together to create embedded matches."""
+    glue = rng.choice([" ", "", ", ", "-"])
+    return ModelResponse(content="Answer: " + glue.join(random_phrase(rng, 8) for _ in range(3)))
+
+
+# Reference implementation: per-term substring scans, as before TermMatcher
+
+def reference_key_fact_completeness(test_case: TestCase, response: ModelResponse) -> float:
+    response_lower = response.content.lower()
+    covered = 0
+    for fact in test_case.key_facts:
+        terms = [w for w in re.findall(r"\w+", fact.lower()) if len(w) > 4]
+        if terms and sum(1 for t in terms if t in response_lower) / len(terms) >= 0.70:
+            covered += 1
+    return covered / len(test_case.key_facts)
+
+
+def reference_sentence_completeness(test_case: TestCase, response: ModelResponse) -> float:
+    sentences = [s.strip() for s in re.split(r"[.!?]", test_case.expected_response) if s.strip()]
+    if not sentences:
+        return 0.5
+    response_lower = response.content.lower()
+    covered = 0
+    for sentence in sentences:
+        words = [w for w in re.findall(r"\w+", sentence.lower()) if len(w) > 4]
+        if words and sum(1 for w in words if w in response_lower) / len(words) >= 0.6:
+            covered += 1
+    return covered / len(sentences)
+
+
+def reference_label_accuracy(test_case: TestCase, response: ModelResponse) -> float:
+    response_lower = response.content.lower()
+    label = test_case.expected_label
+    if label.lower() in response_lower:
+        return 1.0
+    components = [c.strip() for c in re.split(r"[;:]|\band\b", label) if c.strip()]
+    if not components:
+        return 0.0
+    found = sum(1 for c in components if c.strip().lower() in response_lower)
+    if found == len(components):
+        return 1.0
+    return 0.7 if found / len(components) >= 0.6 else 0.0
+
+
+def reference_grounding(test_case: TestCase, response: ModelResponse) -> float:
+    response_lower = response.content.lower()
+    violations = sum(1 for claim in test_case.forbidden_claims if claim.lower() in response_lower)
+    patterns = [
+        r"cryptography.*implementation.*officer",
+        r"cryptography.*incident.*reporting.*officer",
+        r"cybersecurity classification guide",
+        r"ciio.*stands for.*cryptography",
+        r"ccop.*requires.*\w+.*that does not exist",
+    ]
+    violations += sum(1 for pattern in patterns if re.search(pattern, response_lower))
+    return 1.0 if violations == 0 else 0.7 if violations <= 2 else 0.0
+
+
+def reference_found(terms, response: ModelResponse) -> int:
+    response_lower = response.content.lower()
+    return sum(1 for term in terms if term.lower() in response_lower)
+
+
+class TestTermMatcher:
+    """Test the matcher itself."""
+
+    def test_finds_overlapping_and_embedded_terms(self):
+        matcher = TermMatcher(["audit", "auditor", "ditor", "and", "and", "missing"])
+
+        assert matcher.terms == ("audit", "auditor", "ditor", "and", "missing")
+        assert matcher.find("the auditors band") == frozenset({"audit", "auditor", "ditor", "and"})
+
+    def test_same_text_is_searched_once(self):
+        matcher = TermMatcher(["audit"])
+        text = "an audit"
+
+        first = matcher.find(text)
+
+        assert matcher.find(text) is first
+        assert matcher.find("no match here") == frozenset()
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_matches_equal_substring_scans(self, seed):
+        rng = random.Random(seed)
+        for _ in range(EXAMPLES):
+            terms = [random_phrase(rng, 2).lower() for _ in range(rng.randint(0, 8))]
+            text = random_response(rng).content.lower()
+
+            assert TermMatcher(terms).find(text) == {t for t in terms if t in text}
+
+
+class TestScorerEquivalence:
+    """Scorers using match sets agree with the per-term substring scans."""
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_b1_metrics(self, seed):
+        rng = random.Random(seed)
+        for _ in range(EXAMPLES):
+            test_case = random_test_case(rng, "B1_CCoP_Applicability_Scope")
+            response = random_response(rng)
+
+            accuracy, completeness, grounding = ScoringService.score_response(test_case, response)
+
+            if test_case.expected_label:
+                assert accuracy.value == reference_label_accuracy(test_case, response)
+            if test_case.key_facts:
+                assert completeness.value == reference_key_fact_completeness(test_case, response)
+            else:
+                assert completeness.value == reference_sentence_completeness(test_case, response)
+            assert grounding.value == reference_grounding(test_case, response)
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_b4_and_b6_metrics(self, seed):
+        rng = random.Random(seed)
+        for _ in range(EXAMPLES):
+            response = random_response(rng)
+
+            b4 = random_test_case(rng, "B4_Singapore_Terminology")
+            terms = b4.get_key_terminology()
+            if terms:
+                terminology = ScoringService.score_response(b4, response)[0]
+                assert terminology.value == reference_found(terms, response) / len(terms)
+
+            b6 = random_test_case(rng, "B6_Code_Violation_Detection")
+            violations = b6.get_expected_violations()
+            if violations:
+                detection = ScoringService.score_response(b6, response)[0]
+                assert detection.value == reference_found(violations, response) / len(violations)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
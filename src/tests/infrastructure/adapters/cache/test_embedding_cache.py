@@ -0,0 +1,133 @@
+"""
+Tests for the persistent embedding cache.
+
+Tests:
+1. Embeddings round-trip exactly and persist across instances
+2. Models are isolated and dimensions are validated
+3. Interrupted writes are recovered from
+4. SemanticSimilarityService encodes each reference text only once
+"""
+
+import numpy as np
+import pytest
+
+from domain.services.embedding_model_registry import EmbeddingModelRegistry
+from domain.services.semantic_similarity_service import SemanticSimilarityService
+from infrastructure.adapters.cache.embedding_cache import EmbeddingCache
+
+
+class FakeEncoder:
+    """Deterministic stand-in for SentenceTransformer that counts encoded texts."""
+
+    def __init__(self):
+        self.encoded = []
+
+    def encode(self, texts):
+        single = isinstance(texts, str)
+        batch = [texts] if single else texts
+        self.encoded.extend(batch)
+        vectors = np.stack([
+            np.random.default_rng(sum(map(ord, t))).standard_normal(8).astype(np.float32)
+            for t in batch
+        ])
+        return vectors[0] if single else vectors
+
+
+class TestEmbeddingCache:
+    """Test EmbeddingCache storage."""
+
+    def test_round_trip_and_persistence(self, tmp_path):
+        """Stored embeddings are served bit-exact, also by a new instance."""
+        cache = EmbeddingCache(tmp_path)
+        embedding = np.arange(384, dtype=np.float32) / 7
+
+        assert cache.get("all-MiniLM-L6-v2", "expected") is None
+        cache.put("all-MiniLM-L6-v2", "expected", embedding)
+
+        np.testing.assert_array_equal(cache.get("all-MiniLM-L6-v2", "expected"), embedding)
+        reopened = EmbeddingCache(tmp_path)
+        np.testing.assert_array_equal(reopened.get("all-MiniLM-L6-v2", "expected"), embedding)
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_rows_from_other_instances_are_picked_up(self, tmp_path):
+        """A second process's writes become visible on the next miss."""
+        first = EmbeddingCache(tmp_path)
+        second = EmbeddingCache(tmp_path)
+        first.put("m", "a", np.ones(4))
+        second.put("m", "b", np.full(4, 2.0))
+
+        np.testing.assert_array_equal(first.get("m", "b"), np.full(4, 2.0, dtype=np.float32))
+        np.testing.assert_array_equal(second.get("m", "a"), np.ones(4, dtype=np.float32))
+
+    def test_models_are_isolated(self, tmp_path):
+        """The same text under another model is a miss."""
+        cache = EmbeddingCache(tmp_path)
+        cache.put("sentence-transformers/all-MiniLM-L6-v2", "text", np.ones(4))
+
+        assert cache.get("all-mpnet-base-v2", "text") is None
+
+    def test_dimension_mismatch_rejected(self, tmp_path):
+        """A model's embeddings must keep one dimension."""
+        cache = EmbeddingCache(tmp_path)
+        cache.put("m", "a", np.ones(4))
+
+        with pytest.raises(ValueError, match="dimension"):
+            cache.put("m", "b", np.ones(8))
+
+    def test_recovers_from_interrupted_write(self, tmp_path):
+        """A partial row and a partial index line are ignored and overwritten."""
+        cache = EmbeddingCache(tmp_path)
+        cache.put("m", "a", np.ones(4))
+        store_dir = next(tmp_path.iterdir())
+        with open(store_dir / "vectors.f32", "ab") as f:
+            f.write(b"\x00" * 6)
+        with open(store_dir / "index.txt", "a") as f:
+            f.write("deadbeef 1")
+
+        reopened = EmbeddingCache(tmp_path)
+        reopened.put("m", "b", np.full(4, 3.0))
+
+        again = EmbeddingCache(tmp_path)
+        np.testing.assert_array_equal(again.get("m", "a"), np.ones(4, dtype=np.float32))
+        np.testing.assert_array_equal(again.get("m", "b"), np.full(4, 3.0, dtype=np.float32))
+
+
+class TestSemanticSimilarityEmbeddingStore:
+    """Test reference embeddings served from the store."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        encoder = FakeEncoder()
+        registry = EmbeddingModelRegistry(factory=lambda model_name: encoder)
+        service = SemanticSimilarityService("fake-encoder", registry=registry)
+        service.encoder = encoder
+        SemanticSimilarityService.configure_embedding_store(EmbeddingCache(tmp_path))
+        yield service
+        SemanticSimilarityService.configure_embedding_store(None)
+
+    def test_reference_encoded_once_across_runs(self, service, tmp_path):
+        """Repeat runs only encode the model responses."""
+        expected = "CCoP 2.0 requires CIIOs to implement security monitoring"
+        first = service.calculate_similarity(expected, "response one")
+
+        SemanticSimilarityService.configure_embedding_store(EmbeddingCache(tmp_path))
+        service.encoder.encoded.clear()
+        second = service.calculate_similarity(expected, "response one")
+        batch = service.calculate_batch_similarity(expected, ["response one", "response two"])
+
+        assert service.encoder.encoded == ["response one", "response one", "response two"]
+        assert second == first
+        assert batch[0] == pytest.approx(first)
+
+    def test_scores_unchanged_without_store(self, service):
+        """Cached and uncached reference embeddings score identically."""
+        expected = "Security monitoring is mandatory for CII"
+        cached = service.calculate_similarity(expected, "monitoring is required")
+
+        SemanticSimilarityService.configure_embedding_store(None)
+        assert service.calculate_similarity(expected, "monitoring is required") == cached
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,75 @@
+"""
+Tests for the on-disk response cache.
+
+Tests:
+1. Content-addressed keys are stable and parameter-sensitive
+2. Hit/miss/write counters
+3. LRU eviction beyond the size cap (recency survives restarts)
+"""
+
+import os
+
+import pytest
+
+from infrastructure.adapters.cache.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test ResponseCache get/put, counters and eviction."""
+
+    def test_key_is_stable_and_parameter_sensitive(self):
+        """Same fields give the same key; any changed field gives a new key."""
+        fields = {"model": "m", "prompt": "p", "temperature": 0.7, "top_k": 40}
+
+        assert ResponseCache.make_key(**fields) == ResponseCache.make_key(**dict(reversed(fields.items())))
+        assert ResponseCache.make_key(**fields) != ResponseCache.make_key(**{**fields, "temperature": 0.8})
+
+    def test_counts_hits_misses_and_writes(self, tmp_path):
+        """Lookups are counted and stored entries round-trip."""
+        cache = ResponseCache(tmp_path)
+
+        assert cache.get("ab" * 32) is None
+        cache.put("ab" * 32, {"content": "answer"})
+
+        assert cache.get("ab" * 32) == {"content": "answer"}
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["writes"], stats["entries"]) == (1, 1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_evicts_least_recently_used_beyond_cap(self, tmp_path):
+        """Oldest untouched entries are evicted once the size cap is exceeded."""
+        cache = ResponseCache(tmp_path, max_size_mb=1)
+        payload = {"content": "x" * 400_000}
+
+        cache.put("aa" * 32, payload)
+        cache.put("bb" * 32, payload)
+        cache.get("aa" * 32)  # aa becomes most recently used
+        cache.put("cc" * 32, payload)
+
+        assert cache.get("bb" * 32) is None
+        assert cache.get("aa" * 32) is not None
+        assert cache.stats()["evictions"] == 1
+        assert not (tmp_path / "bb" / f"{'bb' * 32}.json").exists()
+
+    def test_recency_survives_restart(self, tmp_path):
+        """A new instance rebuilds LRU order from file mtimes."""
+        cache = ResponseCache(tmp_path, max_size_mb=1)
+        payload = {"content": "x" * 400_000}
+        cache.put("aa" * 32, payload)
+        cache.put("bb" * 32, payload)
+        os.utime(tmp_path / "aa" / f"{'aa' * 32}.json", (1, 1))
+
+        reopened = ResponseCache(tmp_path, max_size_mb=1)
+        reopened.put("cc" * 32, payload)
+
+        assert reopened.get("aa" * 32) is None
+        assert reopened.get("bb" * 32) is not None
+
+    def test_rejects_invalid_size_cap(self, tmp_path):
+        """Size cap must be positive."""
+        with pytest.raises(ValueError):
+            ResponseCache(tmp_path, max_size_mb=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,148 @@
+"""
+Tests for pluggable embedding backends.
+
+Tests:
+1. Factory validation and backend-specific cache keys
+2. Parity check passes within tolerance and fails beyond it
+3. SemanticSimilarityService keys cached embeddings by backend
+"""
+
+import numpy as np
+import pytest
+
+from domain.services.embedding_model_registry import EmbeddingModelRegistry
+from domain.services.semantic_similarity_service import SemanticSimilarityService
+from infrastructure.adapters.cache.embedding_cache import EmbeddingCache
+from infrastructure.adapters.embeddings.embedding_encoders import (
+    EmbeddingBackend,
+    EmbeddingEncoderFactory,
+    check_embedding_parity,
+)
+
+
+class FakeEncoder:
+    """Bag-of-characters encoder with optional noise (stands in for a quantized model)."""
+
+    def __init__(self, noise: float = 0.0, cache_key: str = "fake"):
+        self.noise = noise
+        self.cache_key = cache_key
+        self.encoded = []
+
+    def encode(self, texts, batch_size=32):
+        single = isinstance(texts, str)
+        batch = [texts] if single else list(texts)
+        self.encoded.extend(batch)
+        vectors = np.zeros((len(batch), 64), dtype=np.float32)
+        for row, text in enumerate(batch):
+            for char in text.lower():
+                vectors[row, ord(char) % 64] += 1.0
+        if self.noise:
+            vectors += np.random.default_rng(0).standard_normal(vectors.shape) * self.noise
+        return vectors[0] if single else vectors
+
+
+REFERENCES = [
+    "CIIOs must report cybersecurity incidents within two hours",
+    "Privileged accounts require multi-factor authentication",
+    "Patches must be applied within a defined timeframe",
+]
+RESPONSES = [
+    "Incidents are reported to the Commissioner within 2 hours",
+    "MFA is required for privileged access",
+    "Unrelated text",
+]
+
+
+class TestEmbeddingEncoderFactory:
+    """Test EmbeddingEncoderFactory configuration."""
+
+    def test_default_is_torch(self):
+        """PyTorch stays the reference backend and keeps the bare model name."""
+        factory = EmbeddingEncoderFactory()
+
+        assert factory.backend == EmbeddingBackend.TORCH
+        assert factory.cache_key("all-MiniLM-L6-v2") == "all-MiniLM-L6-v2"
+
+    def test_onnx_cache_keys_are_distinct(self):
+        """ONNX and quantized embeddings never share cache rows with PyTorch."""
+        fp32 = EmbeddingEncoderFactory(backend="onnx")
+        int8 = EmbeddingEncoderFactory(backend="onnx", quantization="avx2")
+
+        assert fp32.cache_key("m") == "m@onnx"
+        assert int8.cache_key("m") == "m@onnx-qint8-avx2"
+
+    def test_unknown_quantization_rejected(self):
+        """Only sentence-transformers' int8 targets are accepted."""
+        with pytest.raises(ValueError, match="Unknown quantization"):
+            EmbeddingEncoderFactory(backend="onnx", quantization="int4")
+
+    def test_quantization_requires_onnx(self):
+        """Quantization is an ONNX export option."""
+        with pytest.raises(ValueError, match="onnx"):
+            EmbeddingEncoderFactory(backend="torch", quantization="avx2")
+
+    def test_unknown_backend_rejected(self):
+        """Backends are torch or onnx."""
+        with pytest.raises(ValueError):
+            EmbeddingEncoderFactory(backend="tensorflow")
+
+
+class TestEmbeddingParity:
+    """Test check_embedding_parity."""
+
+    def test_identical_encoders_pass(self):
+        """The same model has zero drift."""
+        report = check_embedding_parity(FakeEncoder(), FakeEncoder(), REFERENCES, RESPONSES)
+
+        assert report.pairs == 3
+        assert report.max_abs_diff == pytest.approx(0.0, abs=1e-9)
+        assert report.passed
+
+    def test_small_drift_within_tolerance(self):
+        """Slight numeric noise stays within tolerance."""
+        report = check_embedding_parity(
+            FakeEncoder(noise=0.001), FakeEncoder(), REFERENCES, RESPONSES, tolerance=0.02
+        )
+
+        assert 0 < report.max_abs_diff <= 0.02
+        assert report.mean_abs_diff <= report.max_abs_diff
+        assert report.passed
+
+    def test_large_drift_fails(self):
+        """A backend that changes scores beyond tolerance fails the check."""
+        report = check_embedding_parity(
+            FakeEncoder(noise=2.0), FakeEncoder(), REFERENCES, RESPONSES, tolerance=0.02
+        )
+
+        assert report.max_abs_diff > 0.02
+        assert not report.passed
+
+    def test_misaligned_pairs_rejected(self):
+        """References and responses must align."""
+        with pytest.raises(ValueError):
+            check_embedding_parity(FakeEncoder(), FakeEncoder(), REFERENCES, RESPONSES[:2])
+
+
+class TestSemanticSimilarityBackendKey:
+    """Test SemanticSimilarityService with a non-PyTorch encoder."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        encoder = FakeEncoder(cache_key="all-MiniLM-L6-v2@onnx-qint8-avx2")
+        registry = EmbeddingModelRegistry(factory=lambda model_name: encoder)
+        yield SemanticSimilarityService(registry=registry)
+        SemanticSimilarityService.configure_embedding_store(None)
+
+    def test_store_keyed_by_backend(self, service, tmp_path):
+        """Reference embeddings are cached under the backend's cache key."""
+        cache = EmbeddingCache(tmp_path)
+        SemanticSimilarityService.configure_embedding_store(cache)
+
+        service.calculate_similarity(REFERENCES[0], RESPONSES[0])
+
+        assert cache.get("all-MiniLM-L6-v2@onnx-qint8-avx2", REFERENCES[0]) is not None
+        assert cache.get("all-MiniLM-L6-v2", REFERENCES[0]) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
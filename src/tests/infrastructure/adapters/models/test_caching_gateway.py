@@ -0,0 +1,148 @@
+"""
+Tests for the caching model gateway.
+
+Tests:
+1. Repeated generations are served from the cache
+2. Cache key covers model digest and sampling parameters
+3. read-only, refresh and off modes
+4. Cache reads and writes run off the event loop
+"""
+
+import threading
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from domain.entities.model_response import ModelResponse
+from infrastructure.adapters.cache.response_cache import ResponseCache
+from infrastructure.adapters.models.caching_gateway import CacheMode, CachingModelGateway
+
+
+class TestCachingModelGateway:
+    """Test CachingModelGateway cache modes."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """Setup inner gateway returning a numbered answer per call."""
+        self.calls = 0
+
+        async def generate_response(prompt, model_name, **kwargs):
+            self.calls += 1
+            return ModelResponse(
+                content=f"answer {self.calls}",
+                model_name=model_name,
+                tokens_used=42,
+                latency_ms=900,
+                server_timings={"eval_count": 42, "eval_duration": 800_000_000},
+            )
+
+        self.inner = Mock()
+        self.inner.generate_response = AsyncMock(side_effect=generate_response)
+        self.ollama_client = Mock()
+        self.ollama_client.list_models = AsyncMock(
+            return_value=[{"name": "primus:latest", "digest": "sha256:one"}]
+        )
+        self.cache = ResponseCache(tmp_path)
+
+    def make_gateway(self, mode: CacheMode) -> CachingModelGateway:
+        return CachingModelGateway(self.inner, self.cache, Mock(), mode=mode, ollama_client=self.ollama_client)
+
+    @pytest.mark.asyncio
+    async def test_repeated_generation_is_served_from_cache(self):
+        """Second identical request is a hit with the original content and timings."""
+        gateway = self.make_gateway(CacheMode.READ_WRITE)
+
+        first = await gateway.generate_response("q", "primus", system_prompt="s")
+        second = await gateway.generate_response("q", "primus", system_prompt="s")
+
+        assert self.calls == 1
+        assert second.content == first.content
+        assert second.tokens_used == 42 and second.latency_ms == 900
+        assert second.server_timings == first.server_timings
+        assert second.metadata["cache_hit"] is True
+        assert gateway.cache_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_is_off_by_default(self):
+        """Without an explicit mode every request is generated (sampled answers are not replayed)."""
+        gateway = CachingModelGateway(self.inner, self.cache, Mock(), ollama_client=self.ollama_client)
+
+        await gateway.generate_response("q", "primus")
+        await gateway.generate_response("q", "primus")
+
+        assert gateway.cache_mode == CacheMode.OFF
+        assert self.calls == 2
+        assert self.cache.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_sampling_params_and_digest_are_part_of_key(self):
+        """Changing a sampling parameter or the model digest misses."""
+        gateway = self.make_gateway(CacheMode.READ_WRITE)
+
+        await gateway.generate_response("q", "primus", temperature=0.7)
+        await gateway.generate_response("q", "primus", temperature=0.0)
+        assert self.calls == 2
+
+        self.ollama_client.list_models.return_value = [{"name": "primus:latest", "digest": "sha256:two"}]
+        recreated = self.make_gateway(CacheMode.READ_WRITE)
+        await recreated.generate_response("q", "primus", temperature=0.7)
+        assert self.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_read_only_does_not_store(self):
+        """read-only serves hits but never writes."""
+        gateway = self.make_gateway(CacheMode.READ_ONLY)
+
+        await gateway.generate_response("q", "primus")
+        await gateway.generate_response("q", "primus")
+
+        assert self.calls == 2
+        assert self.cache.stats()["writes"] == 0
+
+    @pytest.mark.asyncio
+    async def test_refresh_regenerates_and_overwrites(self):
+        """refresh always generates and replaces the stored entry."""
+        await self.make_gateway(CacheMode.READ_WRITE).generate_response("q", "primus")
+        refreshed = await self.make_gateway(CacheMode.REFRESH).generate_response("q", "primus")
+        served = await self.make_gateway(CacheMode.READ_WRITE).generate_response("q", "primus")
+
+        assert self.calls == 2
+        assert served.content == refreshed.content == "answer 2"
+
+    @pytest.mark.asyncio
+    async def test_cache_io_runs_off_the_event_loop(self, monkeypatch):
+        """Disk lookups and writes happen on worker threads, not the loop thread."""
+        io_threads = []
+
+        def recorded(method):
+            def call(*args):
+                io_threads.append(threading.get_ident())
+                return method(*args)
+            return call
+
+        monkeypatch.setattr(self.cache, "get", recorded(self.cache.get))
+        monkeypatch.setattr(self.cache, "put", recorded(self.cache.put))
+        gateway = self.make_gateway(CacheMode.READ_WRITE)
+
+        await gateway.generate_response("q", "primus")
+        await gateway.generate_response("q", "primus")
+
+        assert len(io_threads) == 3  # miss, write, hit
+        assert threading.get_ident() not in io_threads
+        assert self.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_off_bypasses_cache(self):
+        """off never touches the cache."""
+        gateway = self.make_gateway(CacheMode.OFF)
+
+        await gateway.generate_response("q", "primus")
+        await gateway.generate_response("q", "primus")
+
+        assert self.calls == 2
+        assert self.cache.stats()["entries"] == 0
+        self.ollama_client.list_models.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,214 @@
+"""
+Tests for the pooled multi-host model gateway.
+
+Tests:
+1. Least-outstanding-requests routing spreads concurrent load
+2. Failing hosts are ejected and re-admitted after a health check
+   (request errors such as an unknown model do not count; concurrent
+   requests check an ejected host once)
+3. Throughput scales with the number of hosts
+4. Responses carry Ollama's server timings and streaming metrics
+"""
+
+import asyncio
+import time
+from typing import Optional
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from infrastructure.adapters.models.pooled_gateway import PooledModelGateway
+
+
+class FakeHostClient:
+    """OllamaClient for one host: serves one request at a time, like OLLAMA_NUM_PARALLEL=1."""
+
+    def __init__(self, host: str, delay_s: float = 0.02):
+        self.host = host
+        self.delay_s = delay_s
+        self.fail = False
+        self.error: Optional[Exception] = None
+        self.served = 0
+        self.list_models = AsyncMock(return_value=[{"name": "m:latest"}])
+        self.connection_stats = Mock(return_value={})
+        self._lock = asyncio.Lock()
+
+    async def generate(self, model, prompt, **kwargs):
+        if self.fail:
+            raise ConnectionError(f"{self.host} down")
+        if self.error is not None:
+            raise self.error
+        async with self._lock:
+            await asyncio.sleep(self.delay_s)
+        self.served += 1
+        return {
+            "model": model,
+            "response": "answer",
+            "done": True,
+            "load_duration": 5_000_000,
+            "prompt_eval_count": 20,
+            "prompt_eval_duration": 10_000_000,
+            "eval_count": 8,
+            "eval_duration": 40_000_000,
+            "streaming_metrics": {"ttft_ms": 12.5, "chunks": 8, "cancelled": False},
+        }
+
+
+class TestPooledModelGateway:
+    """Test PooledModelGateway routing and health handling."""
+
+    def make_pool(self, hosts, **kwargs) -> PooledModelGateway:
+        def gateway_factory(client):
+            gateway = Mock()
+            gateway.is_model_available = AsyncMock(return_value=True)
+            return gateway
+
+        return PooledModelGateway(
+            hosts=hosts,
+            client_factory=lambda host: FakeHostClient(host),
+            gateway_factory=gateway_factory,
+            logger=Mock(),
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_routes_to_least_outstanding_host(self):
+        """Concurrent requests are spread evenly across hosts."""
+        pool = self.make_pool(["http://a", "http://b", "http://c"])
+
+        responses = await asyncio.gather(*(pool.generate_response("q", "m") for _ in range(9)))
+
+        assert [h.client.served for h in pool.hosts] == [3, 3, 3]
+        assert {r.metadata["host"] for r in responses} == {"http://a", "http://b", "http://c"}
+
+    @pytest.mark.asyncio
+    async def test_response_carries_server_timings_and_streaming_metrics(self):
+        """Ollama's timing breakdown and the client's TTFT reach the ModelResponse."""
+        pool = self.make_pool(["http://a"])
+
+        response = await pool.generate_response("q", "m", temperature=0.2, metadata={"test_id": "B1-001"})
+
+        assert response.content == "answer"
+        assert response.tokens_used == 8 and response.temperature == 0.2
+        assert response.server_timings["load_duration"] == 5_000_000
+        assert response.decode_tokens_per_second() == pytest.approx(200.0)
+        assert response.metadata["streaming"]["ttft_ms"] == 12.5
+        assert response.metadata["test_id"] == "B1-001"
+        assert response.metadata["host"] == "http://a"
+
+    @pytest.mark.asyncio
+    async def test_throughput_scales_with_hosts(self):
+        """Wall clock drops roughly linearly as hosts are added."""
+        async def wall_clock(hosts):
+            pool = self.make_pool(hosts)
+            started = time.perf_counter()
+            await asyncio.gather(*(pool.generate_response("q", "m") for _ in range(8)))
+            return time.perf_counter() - started
+
+        single = await wall_clock(["http://a"])
+        quad = await wall_clock(["http://a", "http://b", "http://c", "http://d"])
+
+        assert quad < single / 2.5
+
+    @pytest.mark.asyncio
+    async def test_failing_host_is_ejected(self):
+        """A host is ejected after consecutive failures and gets no more traffic."""
+        pool = self.make_pool(["http://a", "http://b"], failure_threshold=2)
+        bad, good = pool.hosts
+        bad.client.fail = True
+
+        for _ in range(4):
+            try:
+                await pool.generate_response("q", "m")
+            except ConnectionError:
+                pass
+
+        assert not bad.healthy
+        assert pool.pool_stats()["http://a"]["ejections"] == 1
+        served_before = good.client.served
+        await asyncio.gather(*(pool.generate_response("q", "m") for _ in range(3)))
+        assert good.client.served == served_before + 3
+
+    @pytest.mark.parametrize("status_code, ejected", [(404, False), (400, False), (429, False), (503, True)])
+    @pytest.mark.asyncio
+    async def test_only_host_failures_count_toward_ejection(self, status_code, ejected):
+        """Client errors and throttling come from a host that answered; 5xx count against it."""
+        pool = self.make_pool(["http://a"], failure_threshold=2)
+        [host] = pool.hosts
+        request = httpx.Request("POST", "http://a/api/generate")
+        host.client.error = httpx.HTTPStatusError(
+            "error", request=request, response=httpx.Response(status_code, request=request)
+        )
+
+        for _ in range(3):
+            with pytest.raises(httpx.HTTPStatusError):
+                await pool.generate_response("q", "m")
+
+        assert host.healthy is not ejected
+        assert pool.pool_stats()["http://a"]["failures"] == (3 if ejected else 0)
+
+    @pytest.mark.asyncio
+    async def test_ejected_host_is_readmitted_after_health_check(self):
+        """Once the ejection period passes, a passing /api/tags check re-admits the host."""
+        pool = self.make_pool(["http://a", "http://b"], failure_threshold=1, ejection_seconds=0.01)
+        bad = pool.hosts[0]
+        bad.client.fail = True
+        bad.client.list_models.side_effect = ConnectionError("down")
+
+        with pytest.raises(ConnectionError):
+            await pool.generate_response("q", "m")
+        await asyncio.sleep(0.02)
+        await pool.generate_response("q", "m")
+        assert not bad.healthy  # health check still failing
+
+        bad.client.fail = False
+        bad.client.list_models.side_effect = None
+        await asyncio.sleep(0.02)
+        await pool.generate_response("q", "m")
+
+        assert bad.healthy
+        bad.client.list_models.assert_awaited()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_probe_ejected_host_once(self):
+        """Requests arriving while a host is being checked do not check it again."""
+        pool = self.make_pool(["http://a", "http://b"], failure_threshold=1, ejection_seconds=0.01)
+        bad = pool.hosts[0]
+        bad.client.fail = True
+        with pytest.raises(ConnectionError):
+            await pool.generate_response("q", "m")
+        bad.client.fail = False
+
+        async def slow_check():
+            await asyncio.sleep(0.05)
+            return [{"name": "m:latest"}]
+
+        bad.client.list_models.side_effect = slow_check
+        await asyncio.sleep(0.02)
+        await asyncio.gather(*(pool.generate_response("q", "m") for _ in range(5)))
+
+        assert bad.client.list_models.await_count == 1
+        assert bad.healthy
+
+    @pytest.mark.asyncio
+    async def test_all_hosts_ejected_still_probes(self):
+        """With every host ejected, requests still go to the host due back first."""
+        pool = self.make_pool(["http://a"], failure_threshold=1, ejection_seconds=60)
+        pool.hosts[0].client.fail = True
+        with pytest.raises(ConnectionError):
+            await pool.generate_response("q", "m")
+
+        pool.hosts[0].client.fail = False
+        response = await pool.generate_response("q", "m")
+
+        assert response.content == "answer"
+
+    def test_requires_hosts(self):
+        """An empty host list is rejected."""
+        with pytest.raises(ValueError):
+            self.make_pool([])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,332 @@
+"""
+Tests for the retrying model gateway.
+
+Tests:
+1. Retryable vs permanent error classification
+2. Exponential backoff with full jitter
+3. Transient failures are retried within attempts and the run budget
+4. The circuit breaker pauses dispatch while the backend is down
+5. Failed generations become errored results instead of crashing the run
+6. Every run starts with the full retry budget
+"""
+
+import asyncio
+import random
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from application.dtos.evaluation_request_dto import EvaluationRequestDTO
+from application.ports.output.i_model_gateway import ModelGatewayError
+from application.use_cases.evaluate_model import EvaluateModelUseCase
+from domain.entities.model_response import ModelResponse
+from domain.entities.test_case import TestCase
+from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.ccop_section import CCoPSection
+from domain.value_objects.difficulty_level import DifficultyLevel
+from infrastructure.adapters.models.caching_gateway import CachingModelGateway
+from infrastructure.adapters.models.retrying_gateway import (
+    CircuitBreaker,
+    CircuitState,
+    RetryingModelGateway,
+    RetryPolicy,
+    is_retryable_error,
+)
+
+NO_DELAY = RetryPolicy(max_attempts=3, base_delay_s=0.0, max_delay_s=0.0)
+
+
+def http_status_error(status_code: int) -> httpx.HTTPStatusError:
+    """Build an HTTPStatusError for a given response status."""
+    request = httpx.Request("POST", "http://localhost:11434/api/generate")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError(f"HTTP {status_code}", request=request, response=response)
+
+
+def make_gateway(side_effect, **kwargs) -> RetryingModelGateway:
+    """Wrap a mock gateway whose generate_response follows side_effect."""
+    inner = Mock()
+    inner.generate_response = AsyncMock(side_effect=side_effect)
+    inner.is_model_available = AsyncMock(return_value=True)
+    kwargs.setdefault("policy", NO_DELAY)
+    return RetryingModelGateway(inner, Mock(), **kwargs)
+
+
+def make_test_case(number: int) -> TestCase:
+    """Create a B1 test case."""
+    return TestCase(
+        test_id=f"B1-{number:03d}",
+        benchmark_type=BenchmarkType.from_string("B1_CCoP_Applicability_Scope"),
+        section=CCoPSection.from_string("Section 1: General"),
+        clause_reference="1.1",
+        difficulty=DifficultyLevel.MEDIUM,
+        question=f"Does CCoP 2.0 apply to the CII described in scenario number {number}?",
+        expected_response="CCoP 2.0 applies to the designated CII.",
+        evaluation_criteria={"accuracy": "Must identify applicability"},
+    )
+
+
+class TestErrorClassification:
+    """Test is_retryable_error."""
+
+    @pytest.mark.parametrize("error", [
+        httpx.ConnectError("refused"),
+        httpx.ReadTimeout("slow"),
+        httpx.RemoteProtocolError("reset"),
+        ConnectionError("down"),
+        TimeoutError(),
+        http_status_error(429),
+        http_status_error(503),
+    ])
+    def test_transient_errors_are_retryable(self, error):
+        """Transport failures, throttling and 5xx are retried."""
+        assert is_retryable_error(error)
+
+    @pytest.mark.parametrize("error", [
+        http_status_error(400),
+        http_status_error(404),
+        ValueError("bad prompt"),
+        RuntimeError("Ollama streaming error: model not found"),
+    ])
+    def test_permanent_errors_are_not_retryable(self, error):
+        """Client errors and unknown failures are raised at once."""
+        assert not is_retryable_error(error)
+
+    def test_wrapped_errors_use_their_cause(self):
+        """A wrapper raised from a transient error is retryable."""
+        try:
+            try:
+                raise httpx.ConnectError("refused")
+            except httpx.ConnectError as e:
+                raise RuntimeError("gateway failed") from e
+        except RuntimeError as wrapped:
+            assert is_retryable_error(wrapped)
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy backoff."""
+
+    def test_backoff_is_jittered_below_exponential_ceiling(self):
+        """Delays stay within [0, min(max, base * 2^(n-1))]."""
+        policy = RetryPolicy(base_delay_s=0.5, max_delay_s=3.0)
+        rng = random.Random(7)
+
+        for attempt, ceiling in [(1, 0.5), (2, 1.0), (3, 2.0), (4, 3.0), (8, 3.0)]:
+            delays = [policy.backoff(attempt, rng) for _ in range(200)]
+            assert all(0 <= d <= ceiling for d in delays)
+            assert max(delays) > ceiling * 0.8  # Spread across the whole window
+
+    def test_invalid_attempts_rejected(self):
+        """max_attempts must be at least 1."""
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+class TestRetryingModelGateway:
+    """Test retries and the retry budget."""
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried(self):
+        """A call that fails transiently then succeeds returns the response."""
+        gateway = make_gateway([
+            httpx.ConnectError("refused"),
+            http_status_error(503),
+            ModelResponse(content="ok", model_name="m"),
+        ])
+
+        response = await gateway.generate_response("q", "m")
+
+        assert response.content == "ok"
+        assert gateway.retry_stats()["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_permanent_failure_is_not_retried(self):
+        """A 404 is raised unchanged after one attempt."""
+        gateway = make_gateway([http_status_error(404)])
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await gateway.generate_response("q", "m")
+
+        assert gateway.retry_stats()["retries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        """A persistent transient failure raises ModelGatewayError."""
+        gateway = make_gateway(httpx.ReadTimeout("slow"))
+
+        with pytest.raises(ModelGatewayError, match="after 3 attempts"):
+            await gateway.generate_response("q", "m")
+
+        assert gateway.retry_stats()["retries"] == 2
+        assert gateway.retry_stats()["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_budget_caps_retries_across_calls(self):
+        """Once the run's budget is spent, transient failures are not retried."""
+        gateway = make_gateway(httpx.ConnectError("refused"), retry_budget=3)
+
+        for _ in range(3):
+            with pytest.raises(ModelGatewayError):
+                await gateway.generate_response("q", "m")
+
+        assert gateway.retry_stats()["retries"] == 3
+        assert gateway._gateway.generate_response.await_count == 6  # 3 + 2 + 1 attempts
+
+        gateway.reset_retry_budget()
+        assert gateway.retry_stats()["retries"] == 0
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker state handling."""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_consecutive_failures(self):
+        """The circuit opens at the threshold and a success closes it."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout_s=0.05)
+
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+        await breaker.acquire()  # Waits out the cool-down, then is the trial call
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.paused_seconds >= 0.04
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.opens == 1
+
+    @pytest.mark.asyncio
+    async def test_half_open_admits_single_trial(self):
+        """While the trial call is out, other callers wait for its outcome."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_s=0.0)
+        breaker.record_failure()
+
+        await breaker.acquire()
+        waiter = asyncio.create_task(breaker.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        breaker.record_success()
+        await asyncio.wait_for(waiter, timeout=1)
+        assert breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_late_outcome_of_earlier_call_is_ignored(self):
+        """A call admitted before the circuit opened neither closes it nor ends the trial."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_s=0.05)
+        slow = await breaker.acquire()
+        failing = await breaker.acquire()
+        breaker.record_failure(failing)
+        assert breaker.state == CircuitState.OPEN
+
+        breaker.record_success(slow)
+        assert breaker.state == CircuitState.OPEN
+
+        trial = await breaker.acquire()
+        assert trial.trial and breaker.state == CircuitState.HALF_OPEN
+        breaker.record_failure(slow)  # Stale: must not re-open or end the trial
+        assert breaker.state == CircuitState.HALF_OPEN
+        waiter = asyncio.create_task(breaker.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        breaker.record_success(trial)
+        assert not (await asyncio.wait_for(waiter, timeout=1)).trial
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.opens == 1
+
+    @pytest.mark.asyncio
+    async def test_dispatch_pauses_while_backend_down(self):
+        """Calls wait for the backend instead of all failing while it is down."""
+        backend = {"up": False, "attempts": 0}
+
+        async def generate_response(prompt, model_name, **kwargs):
+            backend["attempts"] += 1
+            if not backend["up"]:
+                raise httpx.ConnectError("refused")
+            return ModelResponse(content="ok", model_name=model_name)
+
+        gateway = make_gateway(
+            generate_response,
+            policy=RetryPolicy(max_attempts=10, base_delay_s=0.0, max_delay_s=0.0),
+            breaker=CircuitBreaker(failure_threshold=2, reset_timeout_s=0.05),
+        )
+
+        async def recover():
+            await asyncio.sleep(0.12)
+            backend["up"] = True
+
+        results = await asyncio.gather(
+            *(gateway.generate_response("q", "m") for _ in range(5)),
+            recover(),
+        )
+
+        assert all(r.content == "ok" for r in results[:5])
+        # Without the breaker the 5 callers would spin through attempts while down
+        assert backend["attempts"] <= 12
+        assert gateway.retry_stats()["circuit_opens"] >= 1
+        assert gateway.breaker.state == CircuitState.CLOSED
+
+
+class TestErroredResults:
+    """Test that failed generations are recorded instead of crashing the run."""
+
+    @pytest.mark.asyncio
+    async def test_failed_generation_recorded_as_errored(self):
+        """The run completes; the failed test scores 0 with its error attached."""
+        test_cases = [make_test_case(i) for i in range(1, 4)]
+
+        async def generate_response(prompt, model_name, **kwargs):
+            if "number 2" in prompt:
+                raise httpx.ReadTimeout("slow")
+            return ModelResponse(content="CCoP 2.0 applies to the designated CII.", model_name=model_name)
+
+        gateway = make_gateway(generate_response)
+        test_case_repository = Mock()
+        test_case_repository.load_by_benchmark = AsyncMock(return_value=test_cases)
+        use_case = EvaluateModelUseCase(gateway, test_case_repository, Mock(), Mock())
+
+        summary = await use_case.execute(
+            EvaluationRequestDTO(model_name="m", benchmark_types=["B1"], save_results=False)
+        )
+
+        assert summary.total_tests == 3
+        assert summary.errored_tests == 1
+        errored = summary.results[1]
+        assert errored.overall_score == 0.0
+        assert errored.passed is False
+        assert errored.metadata["error_type"] == "ModelGatewayError"
+        assert "after 3 attempts" in errored.metadata["error"]
+        assert sum(b["errored"] for b in summary.by_benchmark.values()) == 1
+        assert summary.performance["latency_ms"]["p50"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_each_run_starts_with_full_retry_budget(self):
+        """A run does not inherit the retries an earlier run spent (through the cache layer)."""
+        gateway = make_gateway(
+            httpx.ReadTimeout("slow"),
+            retry_budget=2,
+            breaker=CircuitBreaker(failure_threshold=100),
+        )
+        test_case_repository = Mock()
+        test_case_repository.load_by_benchmark = AsyncMock(return_value=[make_test_case(1)])
+        use_case = EvaluateModelUseCase(
+            CachingModelGateway(gateway, cache=Mock(), logger=Mock()),
+            test_case_repository,
+            Mock(),
+            Mock(),
+        )
+        request = EvaluationRequestDTO(model_name="m", benchmark_types=["B1"], save_results=False)
+
+        await use_case.execute(request)
+        await use_case.execute(request)
+
+        assert gateway._gateway.generate_response.await_count == 6  # 3 attempts per run
+        assert gateway.retry_stats()["retries"] == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
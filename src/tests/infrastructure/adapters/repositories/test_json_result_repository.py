@@ -5,9 +5,13 @@ Tests the new functionality:
 1. Per-run result files with parameterized naming
 2. Question field in test results
 3. Metadata section with benchmark and category scores
+4. Run journal round trip; appends are written off the event loop
 """
 
+import asyncio
 import json
+import os
+import threading
 import pytest
 from datetime import datetime
 from pathlib import Path
@@ -329,6 +333,34 @@ class TestEvaluationRunSaving:
         assert data["test_results"][0]["question"] == "What are the key cybersecurity controls that must be implemented for this CII system?"
         assert "metrics" in data["test_results"][0]
 
+    @pytest.mark.asyncio
+    async def test_runs_saved_in_the_same_minute_do_not_overwrite(self, tmp_path):
+        """A second run with the same filename gets a numeric suffix."""
+        repo = JSONResultRepository(tmp_path, self.logger)
+        test_case = TestCase(
+            test_id="B1-001",
+            benchmark_type=BenchmarkType.from_string("B1"),
+            section="Test",
+            clause_reference="5.1",
+            difficulty=DifficultyLevel.MEDIUM,
+            question="What are the compliance classification requirements for CCoP 2.0 in this scenario?",
+            expected_response="Answer",
+            evaluation_criteria={"accuracy": "Must be correct"},
+        )
+        result = EvaluationResult(
+            test_case=test_case,
+            model_response=ModelResponse(content="Response", model_name="test-model"),
+            metrics=[accuracy_metric(0.5)]
+        )
+        result.calculate_overall_score()
+        metadata = {"model_name": "test-model", "evaluated_at": "2026-01-02T03:04:00"}
+
+        first = await repo.save_evaluation_run([result], metadata)
+        second = await repo.save_evaluation_run([result], metadata)
+
+        assert Path(first).name == "result-test-model-20260102-0304.json"
+        assert Path(second).name == "result-test-model-20260102-0304-2.json"
+
     @pytest.mark.asyncio
     async def test_save_multiple_results(self):
         """Test saving multiple test results in one run."""
@@ -380,5 +412,108 @@ class TestEvaluationRunSaving:
             assert test_result["question"] == f"What are the CCoP 2.0 requirements for test scenario {i+1} regarding CII security controls?"
 
 
+class TestRunJournal:
+    """Test append-only run journal used for resumable runs."""
+
+    def setup_method(self):
+        """Setup test fixtures."""
+        self.logger = Mock()
+
+    def _make_result(self, test_id: str, content: str = "Test response") -> tuple:
+        test_case = TestCase(
+            test_id=test_id,
+            benchmark_type=BenchmarkType.from_string("B1"),
+            section="Test Section",
+            clause_reference="5.1",
+            difficulty=DifficultyLevel.MEDIUM,
+            question="What are the specific cybersecurity requirements for this test case scenario?",
+            expected_response="Expected answer",
+            evaluation_criteria={"accuracy": "Must be correct"},
+            metadata={}
+        )
+        result = EvaluationResult(
+            test_case=test_case,
+            model_response=ModelResponse(
+                content=content,
+                model_name="test-model",
+                tokens_used=100,
+                latency_ms=1000,
+                server_timings={"load_duration": 5_000_000, "eval_count": 100, "eval_duration": 2_000_000_000}
+            ),
+            metrics=[accuracy_metric(0.8), completeness_metric(0.4)]
+        )
+        result.finalize(threshold=0.5)
+        result.add_metadata("service_time_ms", 12.5)
+        return test_case, result
+
+    @pytest.mark.asyncio
+    async def test_journal_round_trip(self, tmp_path):
+        """Journaled results rebuild with original scores, metrics and metadata."""
+        repo = JSONResultRepository(tmp_path, self.logger)
+        test_case, result = self._make_result("B1-001")
+
+        await repo.create_run_journal("run-1", {"model_name": "test-model"})
+        await repo.append_to_run_journal("run-1", result)
+
+        assert await repo.load_run_request("run-1") == {"model_name": "test-model"}
+        [restored] = await repo.load_run_results("run-1", [test_case])
+
+        assert restored.result_id == result.result_id
+        assert restored.test_case is test_case
+        assert restored.overall_score == result.overall_score
+        assert restored.passed == result.passed
+        assert [(m.name, m.value, m.weight, m.description) for m in restored.metrics] == [
+            (m.name, m.value, m.weight, m.description) for m in result.metrics
+        ]
+        assert restored.model_response.content == "Test response"
+        assert restored.model_response.tokens_used == 100
+        assert restored.model_response.server_timings == result.model_response.server_timings
+        assert restored.metadata["service_time_ms"] == 12.5
+
+    @pytest.mark.asyncio
+    async def test_create_is_idempotent_and_skips_truncated_line(self, tmp_path):
+        """Re-creating keeps existing entries; a torn final line is ignored."""
+        repo = JSONResultRepository(tmp_path, self.logger)
+        test_case, result = self._make_result("B1-001")
+
+        await repo.create_run_journal("run-1", {"model_name": "test-model"})
+        await repo.append_to_run_journal("run-1", result)
+        await repo.create_run_journal("run-1", {"model_name": "other"})
+        with open(tmp_path / "journals" / "run-1.jsonl", "a") as f:
+            f.write('{"type": "result", "test_id": "B1-0')
+
+        assert await repo.load_run_request("run-1") == {"model_name": "test-model"}
+        assert len(await repo.load_run_results("run-1", [test_case])) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_appends_run_off_the_event_loop(self, tmp_path, monkeypatch):
+        """Appends are written (and fsynced) on worker threads, one whole line at a time."""
+        repo = JSONResultRepository(tmp_path, self.logger)
+        # Lines larger than one write buffer
+        made = [self._make_result(f"B1-{i:03d}", content="x" * 20_000) for i in range(20)]
+        fsync_threads = []
+        fsync = os.fsync
+        monkeypatch.setattr(
+            "infrastructure.adapters.repositories.json_result_repository.os.fsync",
+            lambda fd: (fsync_threads.append(threading.get_ident()), fsync(fd)),
+        )
+
+        await repo.create_run_journal("run-1", {"model_name": "test-model"})
+        await asyncio.gather(*(repo.append_to_run_journal("run-1", result) for _, result in made))
+
+        assert threading.get_ident() not in fsync_threads
+        restored = await repo.load_run_results("run-1", [test_case for test_case, _ in made])
+        assert len(restored) == 20
+        self.logger.warning.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_journal_raises(self, tmp_path):
+        """Loading an unknown run raises FileNotFoundError."""
+        repo = JSONResultRepository(tmp_path, self.logger)
+
+        with pytest.raises(FileNotFoundError):
+            await repo.load_run_request("missing")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
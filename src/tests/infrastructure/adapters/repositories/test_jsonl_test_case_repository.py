@@ -0,0 +1,136 @@
+"""
+Tests for the indexed JSONLTestCaseRepository.
+
+Verifies:
+1. Each benchmark file is parsed at most once
+2. ID lookups and secondary indexes return test cases in load order
+3. A selective benchmark load parses only that benchmark's file
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from domain.value_objects.benchmark_type import BenchmarkType
+from domain.value_objects.ccop_section import CCoPSection
+from domain.value_objects.difficulty_level import DifficultyLevel
+from infrastructure.adapters.repositories.jsonl_test_case_repository import JSONLTestCaseRepository
+
+
+def make_record(benchmark: str, number: int, difficulty: str, clause: str, domain: str) -> dict:
+    """Build one JSONL test case record."""
+    return {
+        "test_id": f"{benchmark.split('_')[0]}-{number:03d}",
+        "benchmark_type": benchmark,
+        "section": f"Section {clause.split('.')[0]}: Controls",
+        "clause_reference": clause,
+        "difficulty": difficulty,
+        "question": f"Which CCoP 2.0 obligations apply to the CII system in test scenario {number}?",
+        "expected_response": "The CIIO must apply the clause.",
+        "evaluation_criteria": {"accuracy": "Must cite the clause"},
+        "metadata": {"domain": domain},
+    }
+
+
+@pytest.fixture
+def test_cases_dir(tmp_path):
+    """Two benchmark files with mixed difficulties, clauses and domains."""
+    records = {
+        "b01_applicability.jsonl": [
+            make_record("B1_CCoP_Applicability_Scope", 1, "low", "5.1.5", "IT/OT"),
+            make_record("B1_CCoP_Applicability_Scope", 2, "high", "6.1.3", "OT"),
+            make_record("B1_CCoP_Applicability_Scope", 3, "low", "6.1.3", "IT/OT"),
+        ],
+        "b02_classification.jsonl": [
+            make_record("B2_Compliance_Classification_Accuracy", 1, "medium", "5.1.5", "IT"),
+            make_record("B2_Compliance_Classification_Accuracy", 2, "low", "7.1.2", "IT/OT"),
+        ],
+    }
+    for filename, lines in records.items():
+        (tmp_path / filename).write_text("\n".join(json.dumps(line) for line in lines) + "\n")
+    return tmp_path
+
+
+@pytest.fixture
+def repo(test_cases_dir, monkeypatch):
+    """Repository that counts parsed records."""
+    repository = JSONLTestCaseRepository(test_cases_dir=test_cases_dir, logger=Mock())
+    repository.parsed = 0
+    parse = repository._parse_test_case
+
+    def counting_parse(*args):
+        repository.parsed += 1
+        return parse(*args)
+
+    monkeypatch.setattr(repository, "_parse_test_case", counting_parse)
+    return repository
+
+
+def ids(test_cases):
+    return [test_case.test_id for test_case in test_cases]
+
+
+class TestParseOnce:
+    """Test that files are read once."""
+
+    @pytest.mark.asyncio
+    async def test_selective_load_parses_only_its_file(self, repo):
+        first = await repo.load_by_benchmark(BenchmarkType.from_string("B2"))
+        again = await repo.load_by_benchmark(BenchmarkType.from_string("B2_Anything"))
+
+        assert ids(first) == ids(again) == ["B2-001", "B2-002"]
+        assert first[0] is again[0]
+        assert repo.parsed == 2
+
+    @pytest.mark.asyncio
+    async def test_full_index_reuses_parsed_files(self, repo):
+        await repo.load_by_benchmark(BenchmarkType.from_string("B2"))
+
+        all_cases = await repo.load_all()
+        await repo.load_by_id("B1-003")
+        await repo.load_by_ids(["B2-001"])
+        await repo.count()
+
+        assert ids(all_cases) == ["B1-001", "B1-002", "B1-003", "B2-001", "B2-002"]
+        assert repo.parsed == 5
+
+    @pytest.mark.asyncio
+    async def test_returned_lists_are_copies(self, repo):
+        (await repo.load_all()).clear()
+        (await repo.load_by_benchmark(BenchmarkType.from_string("B1"))).clear()
+
+        assert await repo.count() == 5
+        assert len(await repo.load_by_benchmark(BenchmarkType.from_string("B1"))) == 3
+
+
+class TestLookups:
+    """Test primary and secondary indexes."""
+
+    @pytest.mark.asyncio
+    async def test_id_lookups(self, repo):
+        assert (await repo.load_by_id("B2-001")).test_id == "B2-001"
+        assert await repo.load_by_id("B9-001") is None
+        assert await repo.exists("B1-002")
+        assert not await repo.exists("B1-009")
+        # Load order, unknown and repeated IDs ignored
+        assert ids(await repo.load_by_ids(["B2-002", "B1-001", "B7-001", "B1-001"])) == ["B1-001", "B2-002"]
+
+    @pytest.mark.asyncio
+    async def test_secondary_indexes(self, repo):
+        assert ids(await repo.load_by_difficulty(DifficultyLevel.LOW)) == ["B1-001", "B1-003", "B2-002"]
+        assert ids(await repo.load_by_section(CCoPSection.from_string("Section 6: Controls"))) == [
+            "B1-002", "B1-003"
+        ]
+        assert ids(await repo.load_by_clause("5.1.5")) == ["B1-001", "B2-001"]
+        assert ids(await repo.load_by_domain("IT/OT")) == ["B1-001", "B1-003", "B2-002"]
+        assert await repo.load_by_clause("9.9.9") == []
+
+    @pytest.mark.asyncio
+    async def test_unknown_benchmark(self, repo):
+        assert await repo.load_by_benchmark(BenchmarkType.from_string("B5")) == []
+        assert repo.parsed == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
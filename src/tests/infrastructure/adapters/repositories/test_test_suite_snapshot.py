@@ -0,0 +1,175 @@
+"""
+Tests for the compiled test suite snapshot.
+
+Verifies:
+1. A compiled snapshot loads the same test cases without parsing JSONL
+2. Only files whose hash changed are parsed from JSONL again
+3. Stale, corrupt or disabled snapshots fall back to JSONL
+"""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+import infrastructure.adapters.repositories.test_suite_snapshot as test_suite_snapshot
+from domain.value_objects.scoring_artifacts import ScoringArtifacts
+from infrastructure.adapters.repositories.jsonl_test_case_repository import JSONLTestCaseRepository
+from infrastructure.adapters.repositories.test_suite_snapshot import TestSuiteSnapshot
+
+
+def make_record(benchmark: str, number: int) -> dict:
+    """Build one JSONL test case record with scoring inputs."""
+    return {
+        "test_id": f"{benchmark.split('_')[0]}-{number:03d}",
+        "benchmark_type": benchmark,
+        "section": "Section 5: Protection",
+        "clause_reference": "5.1.5",
+        "difficulty": "medium",
+        "question": f"Which CCoP 2.0 obligations apply to the CII system in test scenario {number}?",
+        "expected_response": f"The CIIO must apply clause 5.1.5 to scenario {number}.",
+        "evaluation_criteria": {"accuracy": "Must cite the clause"},
+        "expected_label": "Applicable",
+        "key_facts": ["Clause 5.1.5 applies", f"Scenario {number} involves a CIIO"],
+        "metadata": {"domain": "IT/OT"},
+    }
+
+
+def write_file(path, records) -> None:
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n")
+
+
+@pytest.fixture
+def test_cases_dir(tmp_path):
+    """Two benchmark files and one invalid line."""
+    suite = tmp_path / "suite"
+    suite.mkdir()
+    write_file(
+        suite / "b01_applicability.jsonl",
+        [make_record("B1_CCoP_Applicability_Scope", n) for n in (1, 2)],
+    )
+    write_file(
+        suite / "b02_classification.jsonl",
+        [make_record("B2_Compliance_Classification_Accuracy", 1), {"test_id": "B2-002"}],
+    )
+    return suite
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return tmp_path / "cache" / "suite.snapshot"
+
+
+def make_repo(test_cases_dir, snapshot_path, use_snapshot=True):
+    """Repository that records which files it parses from JSONL."""
+    repository = JSONLTestCaseRepository(
+        test_cases_dir, Mock(), snapshot_path=snapshot_path, use_snapshot=use_snapshot
+    )
+    repository.jsonl_files = []
+    read_jsonl = repository._read_jsonl
+
+    def recording_read_jsonl(filepath):
+        repository.jsonl_files.append(filepath.name)
+        return read_jsonl(filepath)
+
+    repository._read_jsonl = recording_read_jsonl
+    return repository
+
+
+def describe(test_cases):
+    return [
+        (tc.test_id, tc.question, tc.key_facts, tc.expected_label, tc.scoring_artifacts.to_state())
+        for tc in test_cases
+    ]
+
+
+class TestCompileAndLoad:
+    """Test compiling and loading the snapshot."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_loads_same_test_cases_without_jsonl(self, test_cases_dir, snapshot_path):
+        stats = make_repo(test_cases_dir, snapshot_path).compile_snapshot()
+        from_jsonl = await make_repo(test_cases_dir, snapshot_path, use_snapshot=False).load_all()
+
+        repository = make_repo(test_cases_dir, snapshot_path)
+        from_snapshot = await repository.load_all()
+
+        assert stats["files"] == 2 and stats["test_cases"] == 3
+        assert stats["bytes"] == snapshot_path.stat().st_size
+        assert repository.jsonl_files == []
+        assert describe(from_snapshot) == describe(from_jsonl)
+        assert [tc.test_id for tc in from_snapshot] == ["B1-001", "B1-002", "B2-001"]
+
+    @pytest.mark.asyncio
+    async def test_changed_file_is_parsed_from_jsonl(self, test_cases_dir, snapshot_path):
+        make_repo(test_cases_dir, snapshot_path).compile_snapshot()
+        write_file(
+            test_cases_dir / "b01_applicability.jsonl",
+            [make_record("B1_CCoP_Applicability_Scope", n) for n in (1, 2, 3)],
+        )
+
+        repository = make_repo(test_cases_dir, snapshot_path)
+        test_cases = await repository.load_all()
+
+        assert repository.jsonl_files == ["b01_applicability.jsonl"]
+        assert [tc.test_id for tc in test_cases] == ["B1-001", "B1-002", "B1-003", "B2-001"]
+
+    def test_compile_requires_a_path(self, test_cases_dir):
+        with pytest.raises(ValueError):
+            make_repo(test_cases_dir, None).compile_snapshot()
+
+
+class TestFallback:
+    """Test falling back to JSONL."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_snapshot_is_ignored(self, test_cases_dir, snapshot_path):
+        make_repo(test_cases_dir, snapshot_path).compile_snapshot()
+
+        repository = make_repo(test_cases_dir, snapshot_path, use_snapshot=False)
+        await repository.load_all()
+
+        assert sorted(repository.jsonl_files) == ["b01_applicability.jsonl", "b02_classification.jsonl"]
+
+    @pytest.mark.asyncio
+    async def test_stale_fingerprint_falls_back(self, test_cases_dir, snapshot_path, monkeypatch):
+        make_repo(test_cases_dir, snapshot_path).compile_snapshot()
+        monkeypatch.setattr(test_suite_snapshot, "compiler_fingerprint", lambda: "changed")
+
+        repository = make_repo(test_cases_dir, snapshot_path)
+        assert len(await repository.load_all()) == 3
+
+        assert TestSuiteSnapshot.read(snapshot_path) is None
+        assert len(repository.jsonl_files) == 2
+
+    @pytest.mark.asyncio
+    async def test_corrupt_snapshot_falls_back(self, test_cases_dir, snapshot_path):
+        make_repo(test_cases_dir, snapshot_path).compile_snapshot()
+        snapshot_path.write_bytes(snapshot_path.read_bytes()[:200])
+
+        repository = make_repo(test_cases_dir, snapshot_path)
+        assert len(await repository.load_all()) == 3
+
+        assert TestSuiteSnapshot.read(snapshot_path) is None
+        assert TestSuiteSnapshot.read(snapshot_path.with_name("missing")) is None
+        assert len(repository.jsonl_files) == 2
+
+
+class TestScoringArtifactsState:
+    """Test ScoringArtifacts state round trip."""
+
+    def test_round_trip(self, test_cases_dir, snapshot_path):
+        repository = make_repo(test_cases_dir, snapshot_path, use_snapshot=False)
+        [(_, test_case), _] = repository._read_jsonl(test_cases_dir / "b01_applicability.jsonl")
+        artifacts = test_case.scoring_artifacts
+
+        rebuilt = ScoringArtifacts.from_state(artifacts.to_state())
+
+        assert rebuilt.to_state() == artifacts.to_state()
+        assert rebuilt.matcher.terms == artifacts.matcher.terms
+        response = "The CIIO applies clause 5.1.5 in scenario 1."
+        assert rebuilt.matcher.find(response) == artifacts.matcher.find(response)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
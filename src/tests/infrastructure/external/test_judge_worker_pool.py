@@ -0,0 +1,191 @@
+"""
+Tests for the judge worker pool.
+
+Runs against the stand-in judge (scripts/stub_judge.py):
+1. Every judgement runs in a fresh session; sessions are pre-started
+2. Concurrent requests are spread over the workers
+3. Timeouts and crashes restart the worker; error results do not
+4. No context is carried from one judgement to the next
+5. LLMJudgeService routes judgements through a configured pool
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from domain.services.llm_judge_service import LLMJudgeService
+from infrastructure.external.judge_worker_pool import (
+    JudgeWorkerError,
+    JudgeWorkerPool,
+    claude_judge_command,
+)
+
+STUB_JUDGE = [sys.executable, str(Path(__file__).parents[3] / "scripts" / "stub_judge.py")]
+
+
+@pytest.fixture
+def make_pool():
+    """Create pools running the stand-in judge; closed after the test."""
+    pools = []
+
+    def factory(**kwargs):
+        pool = JudgeWorkerPool(command=STUB_JUDGE, **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield factory
+    for pool in pools:
+        pool.close()
+
+
+class TestJudgeWorkerPool:
+    """Test JudgeWorkerPool against the stand-in judge."""
+
+    def test_each_judgement_gets_a_fresh_session(self, make_pool):
+        """Sequential judgements never share a session."""
+        pool = make_pool(size=2)
+
+        replies = [pool.judge(f"prompt {i}") for i in range(5)]
+
+        assert json.loads(replies[0])["accuracy_score"] == 4
+        stats = pool.stats()
+        assert stats["requests"] == 5
+        assert stats["starts"] >= 5
+
+    def test_worker_does_not_carry_context_between_requests(self, make_pool):
+        """A judgement's session has seen no earlier prompt."""
+        pool = make_pool(size=1)
+
+        pool.judge("first prompt")
+        pool.judge("second prompt")
+
+        assert pool.judge("STUB_HISTORY") == "0"
+
+    def test_replacement_session_is_prestarted(self, make_pool):
+        """A replacement starts in the background once a session is used."""
+        pool = make_pool(size=1)
+
+        pool.judge("prompt")
+        deadline = time.monotonic() + 5
+        while pool.stats()["starts"] < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert pool.stats()["starts"] == 2
+        assert pool.stats()["workers"] == 1
+
+    def test_concurrent_requests_use_all_workers(self, make_pool, monkeypatch):
+        """Parallel scoring threads are multiplexed over the pool."""
+        monkeypatch.setenv("STUB_JUDGE_DELAY_S", "0.2")
+        pool = make_pool(size=3)
+
+        threads = [threading.Thread(target=pool.judge, args=(f"prompt {i}",)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = pool.stats()
+        assert stats["requests"] == 6
+        assert stats["starts"] >= 6
+        assert stats["workers"] <= 3
+
+    def test_timeout_restarts_worker(self, make_pool):
+        """A hung judge times out and is replaced on the next request."""
+        pool = make_pool(size=1)
+
+        with pytest.raises(TimeoutError):
+            pool.judge("STUB_HANG", timeout_s=0.5)
+        reply = pool.judge("next prompt")
+
+        assert json.loads(reply)["alignment_score"] == 4
+        assert pool.stats()["timeouts"] == 1
+        assert pool.stats()["restarts"] == 1
+
+    def test_crash_restarts_and_retries_once(self, make_pool):
+        """A crashing judge is restarted; the retry crashes again and is raised."""
+        pool = make_pool(size=1)
+
+        with pytest.raises(JudgeWorkerError, match="crashed on request"):
+            pool.judge("STUB_CRASH")
+        pool.judge("recovered")
+
+        stats = pool.stats()
+        assert stats["crashes"] == 2
+        assert stats["starts"] >= 3
+        assert stats["restarts"] == 2
+
+    def test_gives_up_after_max_crashes(self, make_pool):
+        """A judge that keeps crashing is not restarted forever."""
+        pool = make_pool(size=1, max_crashes=2)
+
+        with pytest.raises(JudgeWorkerError):
+            pool.judge("STUB_CRASH")
+        with pytest.raises(JudgeWorkerError, match="not restarting"):
+            pool.judge("fine")
+
+    def test_error_result_is_not_a_crash(self, make_pool):
+        """A judge-side error is raised without counting a restart."""
+        pool = make_pool(size=1)
+
+        with pytest.raises(RuntimeError, match="stub judge error"):
+            pool.judge("STUB_ERROR")
+        pool.judge("fine")
+
+        assert pool.stats()["crashes"] == 0
+        assert pool.stats()["restarts"] == 0
+
+    def test_missing_executable(self):
+        """A judge command that cannot start raises JudgeWorkerError."""
+        pool = JudgeWorkerPool(command="/nonexistent/judge --flag", size=1)
+
+        with pytest.raises(JudgeWorkerError, match="Could not start"):
+            pool.judge("prompt")
+        assert pool.stats()["workers"] == 0
+
+    def test_default_command_is_claude_stream_json_session(self):
+        """Without a command, workers run claude in stream-json mode."""
+        command = claude_judge_command("claude-sonnet-4")
+
+        assert command[0] == "claude"
+        assert command[command.index("--model") + 1] == "claude-sonnet-4"
+        assert command[command.index("--input-format") + 1] == "stream-json"
+
+
+class TestLLMJudgeServiceWorkerPool:
+    """Test LLMJudgeService with a configured worker pool."""
+
+    @pytest.fixture(autouse=True)
+    def reset_pool(self):
+        yield
+        LLMJudgeService.configure_worker_pool(None)
+
+    def test_judgement_routed_to_pool(self, monkeypatch):
+        """No process is spawned per judgement when a pool is configured."""
+        pool = Mock()
+        pool.judge.return_value = "reply"
+        run = Mock()
+        monkeypatch.setattr("domain.services.llm_judge_service.subprocess.run", run)
+        LLMJudgeService.configure_worker_pool(pool)
+
+        assert LLMJudgeService()._call_claude_agent("prompt") == "reply"
+        pool.judge.assert_called_once_with("prompt")
+        run.assert_not_called()
+
+    def test_stub_judge_end_to_end(self, make_pool):
+        """A full evaluation parses the stand-in judge's verdict."""
+        LLMJudgeService.configure_worker_pool(make_pool(size=1))
+        service = LLMJudgeService()
+
+        reply = service._call_claude_agent("Rate this response")
+        evaluation = service._parse_judge_response(reply)
+
+        assert evaluation.overall_score == pytest.approx(12 / 15)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
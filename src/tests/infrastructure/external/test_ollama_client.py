@@ -0,0 +1,217 @@
+"""
+Tests for OllamaClient streaming and connection tuning.
+
+Tests:
+1. NDJSON chunks are re-assembled with Ollama's final stats
+2. TTFT, inter-token latency and tokens/sec are recorded
+3. Early cancellation on stop condition, stop sequence and time budget
+4. Pool limits, phase timeouts, keep_alive and connection/reload metrics
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from infrastructure.external.ollama_client import OllamaClient
+
+
+def ndjson_stream(tokens, delay_s=0.0, final=None):
+    """Build an async NDJSON body yielding one token per chunk."""
+    async def body():
+        for token in tokens:
+            if delay_s:
+                await asyncio.sleep(delay_s)
+            yield (json.dumps({"model": "m", "response": token, "done": False}) + "\n").encode()
+        if final is not None:
+            yield (json.dumps({"model": "m", "response": "", "done": True, **final}) + "\n").encode()
+    return body()
+
+
+class TestStreamingGenerate:
+    """Test OllamaClient.generate in streaming mode."""
+
+    def make_client(self, tokens, delay_s=0.0, final=None, **kwargs) -> OllamaClient:
+        self.payloads = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.payloads.append(json.loads(request.content))
+            return httpx.Response(200, content=ndjson_stream(tokens, delay_s, final))
+
+        client = OllamaClient(stream=True, **kwargs)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    @pytest.mark.asyncio
+    async def test_reassembles_chunks_with_final_stats(self):
+        """Streamed text and final eval stats match a non-streamed response."""
+        client = self.make_client(
+            ["CCoP ", "2.0 ", "applies"],
+            final={"eval_count": 3, "eval_duration": 1_500_000_000, "total_duration": 2_000_000_000},
+        )
+
+        result = await client.generate("m", "q")
+
+        assert self.payloads[0]["stream"] is True
+        assert result["response"] == "CCoP 2.0 applies"
+        assert result["done"] is True
+        assert result["total_duration"] == 2_000_000_000
+        metrics = result["streaming_metrics"]
+        assert metrics["chunks"] == 3
+        assert metrics["tokens_per_second"] == pytest.approx(2.0)
+        assert metrics["cancelled"] is False
+
+    @pytest.mark.asyncio
+    async def test_records_ttft_and_inter_token_latency(self):
+        """TTFT and inter-token gaps reflect chunk arrival times."""
+        client = self.make_client(["a", "b", "c", "d"], delay_s=0.02, final={})
+
+        metrics = (await client.generate("m", "q"))["streaming_metrics"]
+
+        assert metrics["ttft_ms"] >= 15
+        assert metrics["inter_token_latency_ms"] >= 15
+        assert metrics["inter_token_latency_p95_ms"] >= metrics["inter_token_latency_ms"] * 0.5
+        assert metrics["tokens_per_second"] > 0
+
+    @pytest.mark.asyncio
+    async def test_stop_condition_cancels_early(self):
+        """A stop condition ends the stream before the model finishes."""
+        client = self.make_client(["one ", "two ", "STOP ", "three ", "four"], final={"eval_count": 5})
+
+        result = await client.generate("m", "q", stop_condition=lambda text: "STOP" in text)
+
+        assert result["response"] == "one two STOP "
+        assert result["done"] is False
+        assert result["done_reason"] == "cancelled"
+        assert result["eval_count"] == 3
+        assert result["streaming_metrics"]["cancel_reason"] == "stop_condition"
+
+    @pytest.mark.asyncio
+    async def test_stop_sequence_from_settings_cancels_early(self):
+        """Configured stop sequences cancel like a stop condition."""
+        client = self.make_client(["a", "</answer>", "b"], final={}, stop_sequences=["</answer>"])
+
+        result = await client.generate("m", "q")
+
+        assert result["response"] == "a</answer>"
+        assert result["streaming_metrics"]["cancel_reason"] == "stop_sequence"
+
+    @pytest.mark.asyncio
+    async def test_stop_sequence_split_across_chunks(self):
+        """A stop sequence spanning several short chunks is found from the carried tail."""
+        client = self.make_client(
+            ["x" * 20, "</", "ans", "w", "er>", "b"], final={}, stop_sequences=["<end>", "</answer>"]
+        )
+
+        result = await client.generate("m", "q")
+
+        assert result["response"] == "x" * 20 + "</answer>"
+        assert result["streaming_metrics"]["cancel_reason"] == "stop_sequence"
+
+    @pytest.mark.asyncio
+    async def test_time_budget_cancels_runaway_generation(self):
+        """A wall-clock budget aborts a slow generation."""
+        client = self.make_client(["x"] * 50, delay_s=0.01, final={}, time_budget_s=0.05)
+
+        result = await client.generate("m", "q")
+
+        assert result["streaming_metrics"]["cancel_reason"] == "time_budget"
+        assert result["streaming_metrics"]["chunks"] < 50
+
+    @pytest.mark.asyncio
+    async def test_time_budget_cuts_off_stalled_stream(self):
+        """A server that stops sending mid-stream is cut off at the budget."""
+        async def stalled_body():
+            yield (json.dumps({"model": "m", "response": "a", "done": False}) + "\n").encode()
+            await asyncio.sleep(3600)
+
+        client = OllamaClient(stream=True, time_budget_s=0.1)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, content=stalled_body())
+        ))
+
+        result = await asyncio.wait_for(client.generate("m", "q"), timeout=5)
+
+        assert result["response"] == "a"
+        assert result["done"] is False
+        assert result["streaming_metrics"]["cancel_reason"] == "time_budget"
+
+    @pytest.mark.asyncio
+    async def test_non_streaming_is_default(self):
+        """Without streaming, the whole JSON body is returned as before."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert json.loads(request.content)["stream"] is False
+            return httpx.Response(200, json={"response": "answer", "done": True})
+
+        client = OllamaClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = await client.generate("m", "q")
+
+        assert result == {"response": "answer", "done": True}
+
+
+class TestConnectionTuning:
+    """Test pool limits, phase timeouts, keep_alive and connection metrics."""
+
+    def test_separate_phase_timeouts_and_pool_limits(self):
+        """Unset phases fall back to the overall timeout."""
+        client = OllamaClient(
+            timeout=300,
+            connect_timeout=5,
+            write_timeout=30,
+            max_connections=8,
+            max_keepalive_connections=8,
+            keepalive_expiry=90,
+        )
+
+        timeout = client._client.timeout
+        assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (5, 300, 30, 300)
+        pool = client._client._transport._pool
+        assert pool._max_connections == 8
+        assert pool._max_keepalive_connections == 8
+        assert pool._keepalive_expiry == 90
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_is_sent_and_reloads_are_counted(self):
+        """keep_alive rides on every generate; long load_duration counts as a reload."""
+        payloads = []
+        load_durations = iter([2_000_000_000, 1_000_000, 1_000_000])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            payloads.append(json.loads(request.content))
+            return httpx.Response(200, json={"response": "a", "load_duration": next(load_durations)})
+
+        client = OllamaClient(keep_alive="30m")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        for _ in range(3):
+            await client.generate("m", "q")
+
+        assert all(payload["keep_alive"] == "30m" for payload in payloads)
+        stats = client.connection_stats()
+        assert stats["requests"] == 3
+        assert stats["model_loads"] == 1
+        assert stats["load_ms_total"] == pytest.approx(2000)
+
+    @pytest.mark.asyncio
+    async def test_trace_counts_new_connections(self):
+        """Connection setup events are counted and timed per request."""
+        client = OllamaClient()
+        client._requests = 2
+
+        trace = client._tracer()
+        await trace("connection.connect_tcp.started", {})
+        await asyncio.sleep(0.01)
+        await trace("connection.connect_tcp.complete", {})
+        await client._tracer()("http11.send_request_headers.started", {})
+
+        stats = client.connection_stats()
+        assert stats["connections_opened"] == 1
+        assert stats["connection_reuse_rate"] == 0.5
+        assert stats["connect_ms_mean"] >= 5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
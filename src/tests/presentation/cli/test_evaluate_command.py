@@ -0,0 +1,49 @@
+"""
+Tests for the evaluate command's run display.
+
+Tests:
+1. A failed journaled run prints how to resume it
+2. A run saved with --no-save (no journal) prints no resume hint
+"""
+
+import io
+from unittest.mock import Mock
+
+import pytest
+import typer
+from rich.console import Console
+
+import presentation.cli.commands.evaluate as evaluate
+
+
+async def failing_evaluation():
+    raise RuntimeError("Ollama unreachable")
+
+
+class TestResumeHint:
+    """Test the --resume hint after a failed run."""
+
+    def run_failing(self, monkeypatch, resumable: bool) -> str:
+        output = io.StringIO()
+        monkeypatch.setattr(evaluate, "console", Console(file=output, width=200))
+        ctx = Mock(obj={"debug": False})
+
+        with pytest.raises(typer.Exit):
+            evaluate._execute_and_display(ctx, failing_evaluation(), "run-1", resumable=resumable)
+        return output.getvalue()
+
+    def test_journaled_run_suggests_resume(self, monkeypatch):
+        output = self.run_failing(monkeypatch, resumable=True)
+
+        assert "Ollama unreachable" in output
+        assert "--resume run-1" in output
+
+    def test_unsaved_run_has_no_resume_hint(self, monkeypatch):
+        output = self.run_failing(monkeypatch, resumable=False)
+
+        assert "Ollama unreachable" in output
+        assert "--resume" not in output
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,53 @@
+"""
+Tests for the CLI startup profile.
+
+Tests:
+1. `python -X importtime` output is parsed
+2. The CLI entry point does not import torch / sentence-transformers
+"""
+
+import pytest
+
+from presentation.cli.startup_profile import StartupProfile, parse_importtime, profile_startup
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   numpy._core
+import time:       300 |        420 | numpy
+import time:        50 |         50 |     domain.entities
+import time:        80 |        550 | presentation.cli.main
+"""
+
+
+class TestStartupProfile:
+    """Test startup import profiling."""
+
+    def test_parse_importtime(self):
+        """Each timing line becomes an ImportTiming; the header is skipped."""
+        timings = parse_importtime(IMPORTTIME_OUTPUT)
+
+        assert [t.module for t in timings] == [
+            "numpy._core", "numpy", "domain.entities", "presentation.cli.main"
+        ]
+        assert (timings[1].self_us, timings[1].cumulative_us) == (300, 420)
+
+    def test_aggregates(self):
+        """Totals come from the entry module; packages sum self time."""
+        profile = StartupProfile("presentation.cli.main", parse_importtime(IMPORTTIME_OUTPUT))
+
+        assert profile.total_ms == pytest.approx(0.55)
+        assert profile.slowest(1)[0].module == "numpy"
+        assert [(p.module, p.self_us) for p in profile.by_package(2)] == [
+            ("numpy", 420), ("presentation", 80)
+        ]
+
+    def test_cli_startup_does_not_import_ml_stack(self):
+        """Regression guard: heavy ML modules load only when Tier 2 scoring runs."""
+        profile = profile_startup()
+
+        assert profile.timings
+        assert profile.heavy_modules == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
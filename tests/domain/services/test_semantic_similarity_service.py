@@ -12,12 +12,11 @@ from domain.services.semantic_similarity_service import SemanticSimilarityServic
 class TestSemanticSimilarityService:
     """Test suite for SemanticSimilarityService."""
 
-    def test_singleton_pattern(self) -> None:
-        """Test that service uses singleton pattern for model caching."""
+    def test_model_shared_across_services(self) -> None:
+        """Test that services share the loaded model through the registry."""
         service1 = SemanticSimilarityService()
         service2 = SemanticSimilarityService()
 
-        assert service1 is service2
         assert service1._model is service2._model
 
     def test_calculate_similarity_identical_texts(self) -> None:
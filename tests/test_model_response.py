@@ -47,3 +47,24 @@ class TestModelResponse:
         )
         has_hallucination_clean = clean_response.contains_hallucination_indicators()
         assert has_hallucination_clean is False
+
+    def test_server_timings_throughput(self):
+        """Prefill/decode throughput come from the backend timing breakdown."""
+        response = ModelResponse(
+            content="CCoP 2.0 applies.",
+            model_name="test-model",
+            server_timings={
+                "total_duration": 3_000_000_000,
+                "load_duration": 500_000_000,
+                "prompt_eval_count": 200,
+                "prompt_eval_duration": 250_000_000,
+                "eval_count": 100,
+                "eval_duration": 2_000_000_000,
+                "unrelated": 1,
+            },
+        )
+
+        assert "unrelated" not in response.server_timings
+        assert response.prefill_tokens_per_second() == pytest.approx(800.0)
+        assert response.decode_tokens_per_second() == pytest.approx(50.0)
+        assert ModelResponse(content="x").decode_tokens_per_second() is None